@@ -187,6 +187,20 @@ export function useJobProgress(
           }));
           break;
 
+        case 'batch_progress':
+          setProgress((prev) => ({
+            ...prev,
+            total: typedEvent.data.total_rows || prev.total,
+            processed: typedEvent.data.processed,
+            successful: typedEvent.data.successful,
+            failed: typedEvent.data.failed,
+            totalCostCents: typedEvent.data.total_cost_cents,
+            lastTrackingNumber:
+              typedEvent.data.last_tracking_number ?? prev.lastTrackingNumber,
+            currentRow: typedEvent.data.current_row ?? null,
+          }));
+          break;
+
         case 'row_failed':
           setProgress((prev) => ({
             ...prev,
@@ -366,6 +366,26 @@ export interface RowCompletedEvent {
   };
 }
 
+/**
+ * SSE event carrying cumulative batch counters.
+ *
+ * The server coalesces bursts of row completions into these periodic
+ * frames, so values are absolute totals, not increments.
+ */
+export interface BatchProgressEvent {
+  event: 'batch_progress';
+  data: {
+    job_id: string;
+    total_rows: number;
+    processed: number;
+    successful: number;
+    failed: number;
+    total_cost_cents: number;
+    last_tracking_number: string | null;
+    current_row?: number | null;
+  };
+}
+
 /** SSE event when a row fails. */
 export interface RowFailedEvent {
   event: 'row_failed';
@@ -414,6 +434,7 @@ export type ProgressEvent =
   | BatchStartedEvent
   | RowStartedEvent
   | RowCompletedEvent
+  | BatchProgressEvent
   | RowFailedEvent
   | BatchCompletedEvent
   | BatchFailedEvent
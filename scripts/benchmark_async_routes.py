@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Benchmark SSE delivery latency while the jobs list is hammered.
+
+Serves the jobs and progress routers with uvicorn in a subprocess against a
+temporary, seeded database. Inside the server a publisher emits a progress
+event for one job every ``--interval-ms``, stamped with its send time. This
+process holds an SSE connection to that job and records how long each event
+took to arrive, while worker threads hammer a job list endpoint:
+
+- ``idle``: no list traffic.
+- ``async``: ``GET /api/v1/jobs`` (AsyncSession, awaits the database).
+- ``legacy``: the previous sync-session handler, mounted for comparison.
+
+Reports SSE latency percentiles and list throughput per phase:
+
+    python scripts/benchmark_async_routes.py
+    python scripts/benchmark_async_routes.py --clients 32 --phase-s 10
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(args: argparse.Namespace) -> None:
+    """Seed the database and serve the routers (runs in the subprocess)."""
+    import asyncio
+    from contextlib import asynccontextmanager
+
+    import uvicorn
+    from fastapi import Depends, FastAPI
+    from sqlalchemy.orm import Session
+
+    from src.api.routes import jobs, progress
+    from src.api.schemas import JobListResponse, JobSummaryResponse
+    from src.db.connection import SessionLocal, get_db, init_db
+    from src.db.models import Job
+    from src.services.job_service import JobService
+
+    init_db()
+    with SessionLocal() as db:
+        service = JobService(db)
+        for i in range(args.jobs):
+            service.create_job(name=f"bench-{i}", original_command="benchmark")
+        stream_job_id = service.create_job(name="stream", original_command="benchmark").id
+
+    async def _publish() -> None:
+        row = 0
+        while True:
+            row += 1
+            await progress.sse_observer.on_row_failed(
+                stream_job_id, row, "BENCH", repr(time.time()),
+            )
+            await asyncio.sleep(args.interval_ms / 1000)
+
+    @asynccontextmanager
+    async def _lifespan(_: FastAPI):
+        publisher = asyncio.create_task(_publish())
+        yield
+        publisher.cancel()
+
+    app = FastAPI(lifespan=_lifespan)
+    app.include_router(jobs.router, prefix="/api/v1")
+    app.include_router(progress.router, prefix="/api/v1")
+
+    @app.get("/bench/legacy-jobs")
+    def legacy_list_jobs(limit: int = 50, db: Session = Depends(get_db)) -> JobListResponse:
+        # The list_jobs handler as it was before the AsyncSession migration.
+        query = db.query(Job)
+        total = query.count()
+        rows = query.order_by(Job.created_at.desc()).limit(limit).all()
+        return JobListResponse(
+            jobs=[JobSummaryResponse.model_validate(j) for j in rows],
+            total=total,
+            limit=limit,
+            offset=0,
+        )
+
+    print(json.dumps({"job_id": stream_job_id}), flush=True)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+def _read_sse(base: str, job_id: str, phase: list[str], latencies: dict, stop: threading.Event):
+    with httpx.Client(timeout=None) as client:
+        with client.stream("GET", f"{base}/api/v1/jobs/{job_id}/progress/stream") as response:
+            for line in response.iter_lines():
+                if stop.is_set():
+                    return
+                if not line.startswith("data:"):
+                    continue
+                payload = json.loads(line[5:])
+                if payload.get("event") != "row_failed":
+                    continue
+                sent = float(payload["data"]["error_message"])
+                latencies.setdefault(phase[0], []).append((time.time() - sent) * 1000)
+
+
+def _hammer(url: str, stop: threading.Event, counts: list[int]) -> None:
+    with httpx.Client(timeout=30) as client:
+        while not stop.is_set():
+            client.get(url, params={"limit": 50}).raise_for_status()
+            counts.append(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=2000, help="Jobs seeded for the list")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent list clients")
+    parser.add_argument("--phase-s", type=float, default=5.0, help="Seconds per phase")
+    parser.add_argument("--interval-ms", type=float, default=20.0, help="SSE event interval")
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args)
+        return
+
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        env["SSE_PROGRESS_COALESCE_MS"] = "0"
+        env.setdefault("PYTHONPATH", str(Path(__file__).resolve().parents[1]))
+        cmd = [
+            sys.executable, __file__, "--serve", "--port", str(port),
+            "--jobs", str(args.jobs), "--interval-ms", str(args.interval_ms),
+        ]
+        server = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, text=True)
+        try:
+            job_id = json.loads(server.stdout.readline())["job_id"]
+            for _ in range(100):
+                try:
+                    httpx.get(f"{base}/api/v1/jobs/{job_id}/progress", timeout=1)
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+
+            phase = ["warmup"]
+            latencies: dict[str, list[float]] = {}
+            stop_reader = threading.Event()
+            reader = threading.Thread(
+                target=_read_sse,
+                args=(base, job_id, phase, latencies, stop_reader),
+                daemon=True,
+            )
+            reader.start()
+            time.sleep(1.0)
+
+            targets = {
+                "idle": None,
+                "async": f"{base}/api/v1/jobs",
+                "legacy": f"{base}/bench/legacy-jobs",
+            }
+            for name, url in targets.items():
+                stop = threading.Event()
+                counts: list[int] = []
+                workers = [
+                    threading.Thread(target=_hammer, args=(url, stop, counts))
+                    for _ in range(args.clients if url else 0)
+                ]
+                for worker in workers:
+                    worker.start()
+                phase[0] = name
+                time.sleep(args.phase_s)
+                phase[0] = "drain"
+                stop.set()
+                for worker in workers:
+                    worker.join()
+                samples = latencies.get(name, [])
+                print(json.dumps({
+                    "phase": name,
+                    "list_req_per_s": round(len(counts) / args.phase_s, 1),
+                    "sse_events": len(samples),
+                    "sse_p50_ms": round(statistics.median(samples), 2) if samples else 0.0,
+                    "sse_p95_ms": round(_percentile(samples, 95), 2),
+                    "sse_p99_ms": round(_percentile(samples, 99), 2),
+                    "sse_max_ms": round(max(samples, default=0.0), 2),
+                }))
+            stop_reader.set()
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
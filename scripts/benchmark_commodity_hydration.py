@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark commodity import and hydration for a large international batch.
+
+Imports commodities for N orders into DuckDB, then hydrates every order the
+way BatchEngine does: chunked get_commodities_bulk calls (JSON round-tripped
+to stand in for the MCP transport) recorded in the per-job commodity cache,
+followed by a second pass that execute would serve from the cache. The
+previous single-query lookup (one bound parameter per order ID) is timed for
+comparison; --legacy-import also times the previous row-by-row import.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import duckdb
+
+from src.mcp.data_source.tools.commodity_tools import (
+    COMMODITIES_TABLE,
+    COMMODITY_COLUMNS,
+    get_commodities_bulk_sync,
+    import_commodities_sync,
+)
+from src.services import commodity_cache
+from src.services.batch_engine import BatchEngine
+from src.services.commodity_cache import JobCommodityCache
+
+
+def _commodities(orders: int, per_order: int) -> list[dict]:
+    return [
+        {
+            "order_id": f"ORD-{i:06d}",
+            "description": f"Item {j} for order {i}",
+            "commodity_code": "090111",
+            "origin_country": "CO",
+            "quantity": j + 1,
+            "unit_value": "12.50",
+        }
+        for i in range(orders)
+        for j in range(per_order)
+    ]
+
+
+def _legacy_import(db: duckdb.DuckDBPyConnection, commodities: list[dict]) -> None:
+    col_defs = ", ".join(f"{name} {dtype}" for name, dtype in COMMODITY_COLUMNS)
+    db.execute(f"CREATE OR REPLACE TABLE {COMMODITIES_TABLE} ({col_defs})")
+    for comm in commodities:
+        db.execute(
+            f"INSERT INTO {COMMODITIES_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                comm["order_id"], comm["description"][:35], comm["commodity_code"],
+                comm["origin_country"], comm["quantity"], comm["unit_value"], "PCS",
+            ],
+        )
+
+
+def _legacy_lookup(db: duckdb.DuckDBPyConnection, order_ids: list[str]) -> int:
+    placeholders = ", ".join("?" for _ in order_ids)
+    rows = db.execute(
+        f"SELECT * FROM {COMMODITIES_TABLE} WHERE order_id IN ({placeholders})",
+        order_ids,
+    ).fetchall()
+    return len(rows)
+
+
+class _DuckDBGateway:
+    """Gateway stand-in that serves lookups from DuckDB over a JSON hop."""
+
+    def __init__(self, db: duckdb.DuckDBPyConnection) -> None:
+        self._db = db
+        self.calls = 0
+
+    async def get_commodities_bulk(self, order_ids: list[str]) -> dict:
+        self.calls += 1
+        return json.loads(json.dumps(get_commodities_bulk_sync(self._db, order_ids)))
+
+
+async def _hydrate(db: duckdb.DuckDBPyConnection, order_ids: list[str]) -> None:
+    engine = BatchEngine(ups_service=None, db_session=None, account_number="BENCH")
+    plan = SimpleNamespace(
+        order_data=lambda row: {"order_id": row.order_id},
+        resolve_lane=lambda od: SimpleNamespace(
+            requirements=SimpleNamespace(requires_commodities=True),
+        ),
+    )
+    rows = [SimpleNamespace(row_number=i, order_id=oid) for i, oid in enumerate(order_ids)]
+    gateway = _DuckDBGateway(db)
+    commodity_cache._cache = JobCommodityCache()
+
+    with patch("src.services.batch_engine.get_data_gateway", return_value=gateway):
+        start = time.perf_counter()
+        found, unavailable = await engine._prefetch_commodities("bench", plan, rows)
+        preview_s = time.perf_counter() - start
+        start = time.perf_counter()
+        cached, _ = await engine._prefetch_commodities("bench", plan, rows)
+        execute_s = time.perf_counter() - start
+
+    assert not unavailable and found == cached
+    print(
+        f"hydrate preview : {preview_s:.3f}s ({gateway.calls} chunked calls, "
+        f"{len(found)} orders)"
+    )
+    print(f"hydrate execute : {execute_s:.3f}s (served from job cache)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--per-order", type=int, default=3)
+    parser.add_argument("--legacy-import", action="store_true")
+    args = parser.parse_args()
+
+    commodities = _commodities(args.orders, args.per_order)
+    order_ids = [f"ORD-{i:06d}" for i in range(args.orders)]
+
+    if args.legacy_import:
+        legacy_db = duckdb.connect(":memory:")
+        start = time.perf_counter()
+        _legacy_import(legacy_db, commodities)
+        print(f"import legacy   : {time.perf_counter() - start:.3f}s")
+
+    db = duckdb.connect(":memory:")
+    start = time.perf_counter()
+    import_commodities_sync(db, commodities)
+    print(
+        f"import indexed  : {time.perf_counter() - start:.3f}s "
+        f"({len(commodities)} commodities)"
+    )
+
+    start = time.perf_counter()
+    matched = _legacy_lookup(db, order_ids)
+    print(f"lookup legacy   : {time.perf_counter() - start:.3f}s ({matched} rows)")
+
+    asyncio.run(_hydrate(db, order_ids))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark streaming EDI import on a synthetic X12 850 interchange.
+
+Writes an interchange of roughly --mb megabytes (one ST/SE envelope per
+purchase order), then measures:
+
+- segment tokenizing: whole-string split versus the chunked tokenizer,
+- parsing plus staging normalized orders (EDIAdapter.stage_orders),
+- the bulk DuckDB load (EDIAdapter.load_staged),
+
+reporting throughput for each step, and peak Python heap (tracemalloc)
+with --trace-memory. Run from the repo root with PYTHONPATH=.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import duckdb
+
+from src.mcp.data_source.adapters.edi_adapter import EDIAdapter
+from src.mcp.data_source.edi.tokenizer import iter_x12_segments
+
+ISA = (
+    "ISA*00*          *00*          *ZZ*SENDER         *ZZ*RECEIVER       "
+    "*260126*1200*U*00401*000000001*0*P*>~\nGS*PO*SENDER*RECEIVER*20260126*1200*1*X*004010~\n"
+)
+
+
+def _transaction(i: int) -> str:
+    return (
+        f"ST*850*{i:09d}~\nBEG*00*NE*PO-{i:09d}**20260126~\n"
+        f"N1*ST*Customer {i}*92*SHIP{i}~\nN3*{i} Main Street*Suite 200~\n"
+        "N4*Springfield*IL*62701*US~\n"
+        f"PO1*1*5*EA*15.00**UP*012345678901*VP*SKU-{i % 500:04d}~\nPID*F****Widget Blue~\n"
+        f"PO1*2*3*EA*25.00**UP*012345678902*VP*SKU-{(i + 1) % 500:04d}~\nPID*F****Gadget Red~\n"
+        f"CTT*2~\nSE*11*{i:09d}~\n"
+    )
+
+
+def _write_interchange(path: str, target_bytes: int) -> int:
+    written = 0
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(ISA)
+        while written < target_bytes:
+            text = _transaction(count)
+            f.write(text)
+            written += len(text)
+            count += 1
+        f.write(f"GE*{count}*1~\nIEA*1*000000001~\n")
+    return count
+
+
+def _measure(label: str, size_mb: float, fn, trace_memory: bool):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    line = f"{label:<28} {elapsed:7.2f}s  {size_mb / elapsed:7.1f} MB/s"
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"  peak heap {peak / 1e6:8.1f} MB"
+    print(line)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=100.0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Report peak Python heap (slows every step considerably)",
+    )
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".edi")
+    os.close(fd)
+    try:
+        orders = _write_interchange(path, int(args.mb * 1e6))
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{size_mb:.1f} MB interchange, {orders} purchase orders")
+
+        def whole_string_split() -> int:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            segments = [s.strip() for s in content.split("~") if s.strip()]
+            parsed = [s.split("*") for s in segments]
+            return sum(1 for s in parsed if s[0] == "SE")
+
+        def streaming_tokenize() -> int:
+            with open(path, encoding="utf-8") as f:
+                return sum(1 for seg_id, _ in iter_x12_segments(f) if seg_id == "SE")
+
+        trace = args.trace_memory
+        _measure("tokenize: whole string", size_mb, whole_string_split, trace)
+        _measure("tokenize: streaming", size_mb, streaming_tokenize, trace)
+
+        adapter = EDIAdapter()
+        staged_path, count = _measure(
+            "parse + stage orders", size_mb, lambda: adapter.stage_orders(path), trace
+        )
+        conn = duckdb.connect(":memory:")
+        try:
+            result = _measure(
+                "bulk load into DuckDB",
+                size_mb,
+                lambda: adapter.load_staged(conn, staged_path, count, path),
+                trace,
+            )
+        finally:
+            conn.close()
+        print(f"loaded {result.row_count} rows ({count / 1e3:.0f}k orders)")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark fixed-width import on a synthetic carrier manifest.
+
+Writes a --lines manifest, then times column auto-detection (sampled
+prefix) and the DuckDB substr projection import. The previous path
+(Python slicing plus per-row inserts) is timed on --legacy-lines rows and
+extrapolated, since running it on the full manifest takes far too long.
+Run from the repo root with PYTHONPATH=.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import duckdb
+
+from src.mcp.data_source.adapters.fixed_width_adapter import (
+    FixedWidthAdapter,
+    detect_fixed_width_layout,
+)
+from src.mcp.data_source.utils import coerce_records, load_flat_records_to_duckdb
+
+HEADER = (
+    f"{'TRACKING':<20}{'SHIP_DATE':<12}{'NAME':<24}{'CITY':<16}{'ST':<4}"
+    f"{'ZIP':<8}{'WT_LBS':<8}{'SERVICE':<14}{'PKGS':<5}\n"
+)
+SERVICES = ("Ground", "Next Day Air", "2nd Day Air", "3 Day Select")
+
+
+def _line(i: int) -> str:
+    return (
+        f"{f'1Z999AA1{i:012d}':<20}{'2026-02-20':<12}{f'Customer {i}':<24}"
+        f"{'Springfield':<16}{'IL':<4}{62701 + i % 90:<8}{(i % 700) / 10:<8.1f}"
+        f"{SERVICES[i % 4]:<14}{1 + i % 3:<5}\n"
+    )
+
+
+def _write_manifest(path: str, lines: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        for i in range(lines):
+            f.write(_line(i))
+
+
+def _legacy_import(conn, path, col_specs, names) -> int:
+    """Python slicing plus executemany, as before the SQL projection."""
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    records = [
+        {names[i]: line[s:e].strip() for i, (s, e) in enumerate(col_specs)}
+        for line in lines[1:]
+        if line.strip()
+    ]
+    return load_flat_records_to_duckdb(
+        conn, coerce_records(records), source_type="fixed_width"
+    ).row_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=500_000)
+    parser.add_argument("--legacy-lines", type=int, default=2_000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".fwf")
+    os.close(fd)
+    fd, legacy_path = tempfile.mkstemp(suffix=".fwf")
+    os.close(fd)
+    try:
+        _write_manifest(path, args.lines)
+        _write_manifest(legacy_path, args.legacy_lines)
+        print(f"{args.lines} lines, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        detected, _, line_count = detect_fixed_width_layout(path)
+        detect_s = time.perf_counter() - start
+        assert detected is not None, "auto-detection failed"
+        col_specs, names = detected
+        print(f"detect (sampled): {detect_s:.3f}s, {len(names)} columns, {line_count} lines")
+
+        conn = duckdb.connect(":memory:")
+        start = time.perf_counter()
+        result = FixedWidthAdapter().import_data(
+            conn, file_path=path, col_specs=col_specs, names=names, header=True,
+        )
+        sql_s = time.perf_counter() - start
+        print(
+            f"import (SQL projection): {sql_s:.2f}s for {result.row_count} rows "
+            f"({result.row_count / sql_s:,.0f} rows/s)"
+        )
+
+        start = time.perf_counter()
+        rows = _legacy_import(conn, legacy_path, col_specs, names)
+        legacy_s = time.perf_counter() - start
+        rate = rows / legacy_s
+        print(
+            f"import (legacy, {rows} rows): {legacy_s:.2f}s ({rate:,.0f} rows/s, "
+            f"~{args.lines / rate:,.0f}s extrapolated to {args.lines} lines)"
+        )
+        conn.close()
+    finally:
+        os.unlink(path)
+        os.unlink(legacy_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark per-row international lane rule evaluation.
+
+Measures get_requirements() + validate_international_readiness() over a
+synthetic mix of lanes, comparing cold (cache cleared every row) and warm
+(compiled requirements reused) lookups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from src.services.international_rules import (
+    clear_requirements_cache,
+    get_requirements,
+    validate_international_readiness,
+)
+
+LANES = [
+    ("US", "US", "03"),
+    ("US", "CA", "11"),
+    ("US", "MX", "07"),
+    ("US", "PR", "03"),
+    ("US", "GB", "65"),
+    ("DE", "FR", "11"),
+]
+
+
+def _order(destination: str) -> dict:
+    return {
+        "ship_to_country": destination,
+        "ship_to_phone": "5551234567",
+        "ship_to_attention_name": "Receiving",
+        "shipper_phone": "5557654321",
+        "shipper_attention_name": "Dock",
+        "description": "Widgets",
+        "commodities": [
+            {
+                "description": "Widget",
+                "commodity_code": "847130",
+                "origin_country": "US",
+                "quantity": 1,
+                "unit_value": "10.00",
+            }
+        ],
+    }
+
+
+def _run(rows: int, cold: bool) -> float:
+    orders = {dest: _order(dest) for _, dest, _ in LANES}
+    start = time.perf_counter()
+    for i in range(rows):
+        origin, dest, service = LANES[i % len(LANES)]
+        if cold:
+            clear_requirements_cache()
+        req = get_requirements(origin, dest, service)
+        validate_international_readiness(orders[dest], req)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("INTERNATIONAL_ENABLED_LANES", "*")
+
+    for label, cold in (("cold", True), ("warm", False)):
+        elapsed = _run(args.rows, cold)
+        per_row_us = elapsed / args.rows * 1_000_000
+        print(f"{label:>4}: {args.rows} rows in {elapsed:.3f}s ({per_row_us:.2f} us/row)")
+
+
+if __name__ == "__main__":
+    main()
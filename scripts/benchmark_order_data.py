@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark JobRow.order_data encoding size and decode cost.
+
+Compares the previous encoding (json.dumps with default separators) against
+encode_order_data(), and measures decoding a job's rows four times (commodity
+prefetch, preview, execute, write-back) uncached versus through the per-job
+decode cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+
+from src.services import order_data_codec
+from src.services.order_data_codec import (
+    ParsedOrderCache,
+    decode_order_data,
+    encode_order_data,
+)
+
+DECODE_PASSES = 4
+
+
+def _order(i: int) -> dict:
+    return {
+        "order_id": f"ORD-{i:06d}",
+        "order_number": f"#{1000 + i}",
+        "ship_to_name": f"Customer {i}",
+        "ship_to_company": "Acme Receiving",
+        "ship_to_address1": f"{i} Main Street",
+        "ship_to_address2": "Suite 200",
+        "ship_to_city": "Los Angeles",
+        "ship_to_state": "CA",
+        "ship_to_postal_code": "90001",
+        "ship_to_country": "US",
+        "ship_to_phone": "5551234567",
+        "weight": 2.5,
+        "length": 10,
+        "width": 8,
+        "height": 4,
+        "packaging_type": "02",
+        "service_code": "03",
+        "reference": f"REF-{i}",
+        "description": "Widgets",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    orders = [_order(i) for i in range(args.rows)]
+
+    start = time.perf_counter()
+    legacy = []
+    for o in orders:
+        text = json.dumps(o, sort_keys=True, default=str)
+        hashlib.md5(text.encode()).hexdigest()
+        legacy.append(text)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact = [encode_order_data(o)[0] for o in orders]
+    compact_s = time.perf_counter() - start
+
+    legacy_bytes = sum(len(t) for t in legacy)
+    compact_bytes = sum(len(t) for t in compact)
+    print(f"encode legacy : {legacy_bytes / 1e6:.2f} MB in {legacy_s:.3f}s")
+    print(
+        f"encode compact: {compact_bytes / 1e6:.2f} MB in {compact_s:.3f}s "
+        f"({100 * (1 - compact_bytes / legacy_bytes):.1f}% smaller)"
+    )
+
+    start = time.perf_counter()
+    for _ in range(DECODE_PASSES):
+        for text in compact:
+            json.loads(text)
+    uncached_s = time.perf_counter() - start
+
+    order_data_codec._cache = ParsedOrderCache(max_rows=args.rows)
+    start = time.perf_counter()
+    for _ in range(DECODE_PASSES):
+        for text in compact:
+            decode_order_data(text, job_id="bench")
+    cached_s = time.perf_counter() - start
+
+    print(f"decode x{DECODE_PASSES} uncached: {uncached_s:.3f}s")
+    print(f"decode x{DECODE_PASSES} cached  : {cached_s:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
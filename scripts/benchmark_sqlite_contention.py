@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark SQLite write contention between batch execution and chat traffic.
+
+Runs concurrent batch workers — each walking its own job's rows through the
+in-flight and completed commits BatchEngine makes per row, plus a
+write-back enqueue, with a simulated UPS call in between — alongside chat
+workers that append conversation messages and audit log entries. Reports
+batch rows/s, chat write latency percentiles and "database is locked"
+failures.
+
+Each profile runs in a fresh subprocess against a temporary database,
+because the engine and its pragmas are fixed at import time:
+
+    python scripts/benchmark_sqlite_contention.py                # both profiles
+    python scripts/benchmark_sqlite_contention.py --profile performance
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _run_profile(args: argparse.Namespace) -> dict:
+    from sqlalchemy.exc import OperationalError
+
+    from src.db.connection import SessionLocal, init_db
+    from src.db.models import JobRow, RowStatus
+    from src.db.write_queue import get_write_queue, shutdown_write_queue, writer_lock
+    from src.services.audit_service import AuditService, EventType
+    from src.services.conversation_persistence_service import (
+        ConversationPersistenceService,
+    )
+    from src.services.job_service import JobService
+    from src.services.write_back_worker import enqueue_write_back
+
+    init_db()
+    locked_errors = 0
+    errors_lock = threading.Lock()
+
+    def _count_locked(exc: Exception) -> None:
+        nonlocal locked_errors
+        if "locked" not in str(exc):
+            raise exc
+        with errors_lock:
+            locked_errors += 1
+
+    job_ids = []
+    with SessionLocal() as db:
+        jobs = JobService(db)
+        for b in range(args.batches):
+            job = jobs.create_job(name=f"bench-{b}", original_command="benchmark")
+            jobs.create_rows(
+                job.id,
+                [
+                    {"row_number": i + 1, "row_checksum": f"{b}-{i}"}
+                    for i in range(args.rows)
+                ],
+            )
+            job_ids.append(job.id)
+        chat_ids = []
+        conversations = ConversationPersistenceService(db)
+        for c in range(args.chats):
+            chat_ids.append(conversations.create_session(f"bench-chat-{c}-{os.getpid()}").id)
+
+    batch_done = threading.Event()
+    rows_done = 0
+    rows_lock = threading.Lock()
+    chat_latencies: list[float] = []
+
+    def _batch_worker(job_id: str) -> None:
+        nonlocal rows_done
+        with SessionLocal() as db:
+            rows = (
+                db.query(JobRow).filter(JobRow.job_id == job_id)
+                .order_by(JobRow.row_number).all()
+            )
+            for row in rows:
+                try:
+                    row.status = RowStatus.in_flight.value
+                    with writer_lock():
+                        db.commit()
+                    time.sleep(args.ups_ms / 1000)
+                    row.status = RowStatus.completed.value
+                    row.tracking_number = f"1Z{row.id[:16].upper()}"
+                    row.job.processed_rows += 1
+                    row.job.successful_rows += 1
+                    with writer_lock():
+                        db.commit()
+                    enqueue_write_back(
+                        db, job_id, row.row_number, row.tracking_number, "2026-01-01T00:00:00Z",
+                    )
+                except OperationalError as exc:
+                    db.rollback()
+                    _count_locked(exc)
+                    continue
+                with rows_lock:
+                    rows_done += 1
+
+    def _chat_worker(session_id: str) -> None:
+        samples = []
+        while not batch_done.is_set():
+            started = time.perf_counter()
+            try:
+                with SessionLocal() as db:
+                    ConversationPersistenceService(db).save_message(
+                        session_id, "user", "ship the pending orders",
+                    )
+                with SessionLocal() as db:
+                    AuditService(db).log_info(
+                        job_id=job_ids[0],
+                        event_type=EventType.api_call,
+                        message="chat_turn",
+                        details={"session_id": session_id},
+                    )
+            except OperationalError as exc:
+                _count_locked(exc)
+            else:
+                samples.append((time.perf_counter() - started) * 1000)
+            time.sleep(args.chat_think_ms / 1000)
+        with rows_lock:
+            chat_latencies.extend(samples)
+
+    batch_threads = [threading.Thread(target=_batch_worker, args=(j,)) for j in job_ids]
+    chat_threads = [threading.Thread(target=_chat_worker, args=(c,)) for c in chat_ids]
+    started = time.perf_counter()
+    for thread in (*batch_threads, *chat_threads):
+        thread.start()
+    for thread in batch_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    batch_done.set()
+    for thread in chat_threads:
+        thread.join()
+
+    write_queue = get_write_queue()
+    groups = write_queue.groups_committed if write_queue else 0
+    queued = write_queue.writes_committed if write_queue else 0
+    shutdown_write_queue()
+    return {
+        "profile": os.environ.get("SQLITE_PROFILE") or "default",
+        "batch_rows_per_s": round(rows_done / elapsed, 1),
+        "rows_done": rows_done,
+        "chat_writes": len(chat_latencies),
+        "chat_p50_ms": round(statistics.median(chat_latencies), 2) if chat_latencies else 0.0,
+        "chat_p95_ms": round(_percentile(chat_latencies, 95), 2),
+        "chat_p99_ms": round(_percentile(chat_latencies, 99), 2),
+        "locked_errors": locked_errors,
+        "queued_writes_per_group": round(queued / groups, 2) if groups else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=("default", "performance"))
+    parser.add_argument("--batches", type=int, default=4, help="Concurrent batch jobs")
+    parser.add_argument("--rows", type=int, default=200, help="Rows per batch job")
+    parser.add_argument("--chats", type=int, default=8, help="Concurrent chat sessions")
+    parser.add_argument("--ups-ms", type=float, default=2.0, help="Simulated UPS latency")
+    parser.add_argument("--chat-think-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    if args.profile is not None:
+        print(json.dumps(_run_profile(args)))
+        return
+
+    for profile in ("default", "performance"):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ)
+            env["DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            env["SQLITE_PROFILE"] = "" if profile == "default" else profile
+            env.setdefault("PYTHONPATH", str(Path(__file__).resolve().parents[1]))
+            cmd = [
+                sys.executable, __file__, "--profile", profile,
+                "--batches", str(args.batches), "--rows", str(args.rows),
+                "--chats", str(args.chats), "--ups-ms", str(args.ups_ms),
+                "--chat-think-ms", str(args.chat_think_ms),
+            ]
+            output = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
+            print(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
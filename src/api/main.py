@@ -31,7 +31,7 @@ logging.basicConfig(
 # Ensure our application loggers are captured
 logging.getLogger("src").setLevel(logging.INFO)
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
-from fastapi.responses import FileResponse, JSONResponse  # noqa: E402
+from fastapi.responses import FileResponse, JSONResponse, Response  # noqa: E402
 from fastapi.staticfiles import StaticFiles  # noqa: E402
 
 from src.api.middleware.auth import (  # noqa: E402
@@ -54,9 +54,19 @@ from src.api.routes import (  # noqa: E402
     saved_data_sources,
 )
 from src.db.connection import init_db  # noqa: E402
-from src.db.models import JobStatus  # noqa: E402
+from src.db.models import JobStatus, RowStatus  # noqa: E402
+from src.db.write_queue import shutdown_write_queue  # noqa: E402
 from src.errors import ShipAgentError  # noqa: E402
 from src.services.batch_engine import BatchEngine  # noqa: E402
+from src.services.job_lease import (  # noqa: E402
+    acquire_lease,
+    lease_expiries,
+    release_lease,
+    resolve_lease_ttl,
+    worker_id,
+)
+from src.services.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE  # noqa: E402
+from src.services.metrics import REGISTRY as METRICS_REGISTRY  # noqa: E402
 from src.services.ups_mcp_client import UPSMCPClient  # noqa: E402
 from src.utils.redaction import sanitize_error_message  # noqa: E402
 
@@ -67,6 +77,12 @@ logger = logging.getLogger(__name__)
 # Module-level state for health endpoint and watchdog
 _startup_time: float = 0.0
 _watchdog_service = None  # Set by watchdog startup in lifespan
+_recovery_task: asyncio.Task | None = None  # Background crash recovery
+_tracking_refresher = None  # Set when TRACKING_REFRESH_ENABLED is on
+# Startup recovery progress surfaced by /readyz.
+_recovery_status: dict[str, Any] = {"status": "pending"}
+# Slack past a lease's expiry before reclaiming it, absorbing clock jitter.
+_LEASE_EXPIRY_MARGIN_S = 0.5
 
 
 def _parse_allowed_origins() -> list[str]:
@@ -346,6 +362,10 @@ async def run_startup_recovery(db: object, job_service: object) -> None:
     may need staging labels for verification. Cleanup only removes staging
     files for jobs with no in_flight/needs_review rows.
 
+    Only in_flight rows of running jobs are loaded (one query), and tracking
+    lookups within a job run with bounded concurrency. Progress is published
+    to ``_recovery_status`` for the readiness endpoint.
+
     Creates a temporary UPSMCPClient for recovery so track_package works.
     Falls back gracefully if UPS MCP is unavailable (rows stay in_flight
     for next restart attempt).
@@ -357,6 +377,17 @@ async def run_startup_recovery(db: object, job_service: object) -> None:
     from src.services.job_service import JobService
 
     js: JobService = job_service  # type: ignore[assignment]
+    _recovery_status.clear()
+    _recovery_status.update(
+        status="running",
+        started_at=datetime.now(UTC).isoformat(),
+        jobs_total=0,
+        jobs_done=0,
+        rows_total=0,
+        recovered=0,
+        needs_review=0,
+        unresolved=0,
+    )
 
     # 0. Reap stale zero-row pending jobs (created before crash, never populated).
     try:
@@ -366,22 +397,21 @@ async def run_startup_recovery(db: object, job_service: object) -> None:
     except Exception as e:
         logger.warning("Orphan pending job reaper failed (non-blocking): %s", e)
 
-    # 1. Find interrupted jobs (running or paused)
-    interrupted: list = []
-    for st in (JobStatus.running,):
-        try:
-            interrupted.extend(js.list_jobs(status=st, limit=500))
-        except Exception:
-            pass  # Status may not exist in older schemas
+    # 1. Find in_flight rows of interrupted (running) jobs
+    try:
+        jobs_needing_recovery = js.get_rows_for_jobs_in_status(
+            JobStatus.running, (RowStatus.in_flight,),
+        )
+    except Exception as e:
+        logger.error("Failed querying in-flight rows (non-blocking): %s", e)
+        jobs_needing_recovery = {}
 
-    # 2. Recover in-flight rows for each interrupted job
-    jobs_needing_recovery = []
-    for job in interrupted:
-        rows = js.get_rows(job.id)
-        in_flight = [r for r in rows if r.status == "in_flight"]
-        if in_flight:
-            jobs_needing_recovery.append((job, rows))
+    _recovery_status["jobs_total"] = len(jobs_needing_recovery)
+    _recovery_status["rows_total"] = sum(
+        len(rows) for rows in jobs_needing_recovery.values()
+    )
 
+    # 2. Recover in-flight rows for each interrupted job
     if jobs_needing_recovery:
         # Create a real UPS MCP client for recovery (track_package needs it)
         ups_client = None
@@ -395,43 +425,20 @@ async def run_startup_recovery(db: object, job_service: object) -> None:
             )
             ups_client = None
 
-        for job, rows in jobs_needing_recovery:
-            try:
-                engine = BatchEngine(
-                    ups_service=ups_client,
-                    db_session=db,
-                    account_number="",
-                )
-                recovery_result = await engine.recover_in_flight_rows(
-                    job.id,
-                    rows,
-                )
-                logger.info(
-                    "Job %s recovery: %d recovered, %d needs_review, %d unresolved",
-                    job.id,
-                    recovery_result["recovered"],
-                    recovery_result["needs_review"],
-                    recovery_result["unresolved"],
-                )
-                if recovery_result.get("details"):
-                    logger.warning(
-                        "Rows requiring operator review for job %s: %s",
-                        job.id,
-                        recovery_result["details"],
-                    )
-            except Exception as e:
-                logger.error(
-                    "Recovery failed for job %s (non-blocking): %s",
-                    job.id,
-                    e,
-                )
-
-        # Clean up the temporary UPS client
-        if ups_client is not None:
-            try:
-                await ups_client.disconnect()
-            except Exception:
-                pass
+        try:
+            # Jobs leased by another worker are still executing there, or
+            # their owner crashed and the lease runs out on its own.
+            deferred = await _recover_leased_jobs(
+                db, ups_client, jobs_needing_recovery,
+            )
+            await _recover_after_lease_expiry(db, ups_client, deferred)
+        finally:
+            # Clean up the temporary UPS client
+            if ups_client is not None:
+                try:
+                    await ups_client.disconnect()
+                except Exception:
+                    pass
 
     # 3. Clean up orphaned staging labels (skips jobs with unresolved rows)
     try:
@@ -441,15 +448,138 @@ async def run_startup_recovery(db: object, job_service: object) -> None:
     except Exception as e:
         logger.error("Staging cleanup failed (non-blocking): %s", e)
 
+    _recovery_status["status"] = "completed"
+    _recovery_status["finished_at"] = datetime.now(UTC).isoformat()
+
+
+async def _recover_leased_jobs(
+    db: object,
+    ups_client: UPSMCPClient | None,
+    jobs: dict[str, list],
+) -> dict[str, list]:
+    """Recover in-flight rows of each job whose lease this worker can claim.
+
+    Args:
+        db: Database session.
+        ups_client: Connected UPS client, or None when unavailable.
+        jobs: Mapping of job_id to its in-flight rows.
+
+    Returns:
+        The subset of jobs leased by another worker (not recovered).
+    """
+    owner = worker_id()
+    deferred: dict[str, list] = {}
+    for job_id, rows in jobs.items():
+        if not acquire_lease(db, job_id, owner):
+            deferred[job_id] = rows
+            continue
+        try:
+            engine = BatchEngine(
+                ups_service=ups_client,
+                db_session=db,
+                account_number="",
+            )
+            recovery_result = await engine.recover_in_flight_rows(
+                job_id,
+                rows,
+            )
+            for key in ("recovered", "needs_review", "unresolved"):
+                _recovery_status[key] += recovery_result[key]
+            logger.info(
+                "Job %s recovery: %d recovered, %d needs_review, %d unresolved",
+                job_id,
+                recovery_result["recovered"],
+                recovery_result["needs_review"],
+                recovery_result["unresolved"],
+            )
+            if recovery_result.get("details"):
+                logger.warning(
+                    "Rows requiring operator review for job %s: %s",
+                    job_id,
+                    recovery_result["details"],
+                )
+        except Exception as e:
+            logger.error(
+                "Recovery failed for job %s (non-blocking): %s",
+                job_id,
+                e,
+            )
+        finally:
+            release_lease(db, job_id, owner)
+        _recovery_status["jobs_done"] += 1
+    return deferred
+
+
+async def _recover_after_lease_expiry(
+    db: object,
+    ups_client: UPSMCPClient | None,
+    deferred: dict[str, list],
+) -> None:
+    """Retry each deferred job once, as soon as its current lease expires.
+
+    A crashed worker's leases stop being renewed, so they expire at the
+    recorded lease_expires_at. Waiting for that time, instead of a full
+    TTL, lets a restarted single worker resume its own interrupted jobs
+    promptly. A job whose lease was renewed in the meantime belongs to a
+    live worker and is skipped.
+
+    Args:
+        db: Database session.
+        ups_client: Connected UPS client, or None when unavailable.
+        deferred: Jobs whose lease was held during the first pass.
+    """
+    max_wait = resolve_lease_ttl()
+    pending = dict(deferred)
+    while pending:
+        expiries = lease_expiries(db, list(pending))
+        now = datetime.now(UTC)
+        waits = {
+            job_id: min(max_wait, max(0.0, (expires - now).total_seconds()))
+            if (expires := expiries.get(job_id)) is not None else 0.0
+            for job_id in pending
+        }
+        wait = min(waits.values())
+        if wait > 0:
+            logger.info(
+                "Waiting %.1fs for a lease to expire before recovering %d job(s)",
+                wait,
+                len(pending),
+            )
+            await asyncio.sleep(wait + _LEASE_EXPIRY_MARGIN_S)
+        due = {job_id: pending.pop(job_id) for job_id, w in waits.items() if w <= wait}
+        for job_id in await _recover_leased_jobs(db, ups_client, due):
+            logger.info(
+                "Job %s is still leased by a live worker; skipping recovery",
+                job_id,
+            )
+            _recovery_status["jobs_done"] += 1
+
+
+async def _run_startup_recovery_in_background() -> None:
+    """Run startup recovery with its own DB session, off the startup path."""
+    from src.db.connection import get_db_context
+    from src.services.job_service import JobService
+
+    try:
+        with get_db_context() as db:
+            js = JobService(db)
+            await run_startup_recovery(db, js)
+    except asyncio.CancelledError:
+        _recovery_status["status"] = "cancelled"
+        raise
+    except Exception as e:
+        _recovery_status["status"] = "failed"
+        _recovery_status["error"] = str(e)
+        logger.error("Startup recovery failed (non-blocking): %s", e)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Async lifespan: startup recovery + shutdown cleanup."""
-    global _startup_time, _watchdog_service
+    global _startup_time, _watchdog_service, _recovery_task, _tracking_refresher
 
     from src.db.connection import get_db_context
     from src.services.gateway_provider import shutdown_gateways
-    from src.services.job_service import JobService
 
     # --- Startup ---
     _startup_time = _time.time()
@@ -521,6 +651,8 @@ async def lifespan(app: FastAPI):
             exc_info=True,
         )
 
+    # Batch jobs are arbitrated by DB leases on every worker; progress events
+    # only reach other workers through a shared PROGRESS_BUS_FACTORY bus.
     allow_multi_worker = os.environ.get("SHIPAGENT_ALLOW_MULTI_WORKER", "false").lower()
     if allow_multi_worker not in {"1", "true", "yes", "on"}:
         logger.warning(
@@ -529,6 +661,13 @@ async def lifespan(app: FastAPI):
             "shared state is configured. Set SHIPAGENT_ALLOW_MULTI_WORKER=true "
             "to suppress this warning."
         )
+    elif not os.environ.get("PROGRESS_BUS_FACTORY", "").strip():
+        logger.warning(
+            "Multi-worker mode with the in-process progress bus: SSE clients "
+            "only see batches executing on the worker they are connected to. "
+            "Set PROGRESS_BUS_FACTORY to a shared bus."
+        )
+    await progress.sse_observer.start()
 
     queue_mode = os.environ.get("CONVERSATION_TASK_QUEUE_MODE", "memory").lower()
     if queue_mode in {"", "memory", "in-memory", "in_memory"}:
@@ -537,13 +676,22 @@ async def lifespan(app: FastAPI):
             "are not crash-durable. Use an external queue for hard-failure durability."
         )
 
-    # Run crash recovery (non-blocking — failures logged, not propagated)
-    try:
-        with get_db_context() as db:
-            js = JobService(db)
-            await run_startup_recovery(db, js)
-    except Exception as e:
-        logger.error("Startup recovery failed (non-blocking): %s", e)
+    # Run crash recovery in the background so the API serves immediately;
+    # progress is reported under /readyz checks.startup_recovery.
+    _recovery_task = asyncio.create_task(_run_startup_recovery_in_background())
+
+    # Pre-start agents for new conversations (opt-in: AGENT_POOL_MAX_SIZE)
+    conversations.warm_agent_pool()
+
+    # Scheduled delivery-status polling (opt-in: it spends UPS API quota)
+    if os.environ.get("TRACKING_REFRESH_ENABLED", "false").lower() in {
+        "1", "true", "yes", "on",
+    }:
+        from src.services.tracking_service import build_tracking_refresher
+
+        _tracking_refresher = build_tracking_refresher()
+        _tracking_refresher.start()
+        logger.info("Tracking refresher started")
 
     # Start watchdog if configured
     config_path = os.environ.get("SHIPAGENT_CONFIG_PATH")
@@ -577,13 +725,28 @@ async def lifespan(app: FastAPI):
     yield
 
     # --- Shutdown ---
+    if _recovery_task is not None and not _recovery_task.done():
+        _recovery_task.cancel()
+        try:
+            await _recovery_task
+        except asyncio.CancelledError:
+            pass
+    _recovery_task = None
+
+    if _tracking_refresher is not None:
+        await _tracking_refresher.stop()
+        _tracking_refresher = None
+
     if _watchdog_service:
         await _watchdog_service.stop()
         _watchdog_service = None
 
     await preview.shutdown_batch_runtime()
+    await progress.sse_observer.close()
     await conversations.shutdown_conversation_runtime()
     await shutdown_gateways()
+    # Last, so writes made during shutdown above are committed.
+    shutdown_write_queue()
 
 
 # Create FastAPI app with async lifespan for startup recovery + shutdown cleanup
@@ -750,7 +913,7 @@ app.include_router(commands.router, prefix="/api/v1")
 
 
 @app.get("/health")
-def health_check() -> dict:
+async def health_check() -> dict:
     """Health check endpoint with system status.
 
     Returns all fields required by the CLI HealthStatus contract:
@@ -759,18 +922,21 @@ def health_check() -> dict:
     Returns:
         Dictionary with health status and metrics.
     """
-    from src.db.connection import get_db as _get_db
+    from sqlalchemy import func, select
+
+    from src.db.connection import get_async_db_context
     from src.db.models import Job, JobStatus
 
     uptime = int(_time.time() - _startup_time) if _startup_time else 0
 
     # Count active (running) jobs
     try:
-        db = next(_get_db())
-        active_jobs = (
-            db.query(Job).filter(Job.status == JobStatus.running.value).count()
-        )
-        db.close()
+        async with get_async_db_context() as db:
+            active_jobs = await db.scalar(
+                select(func.count())
+                .select_from(Job)
+                .where(Job.status == JobStatus.running.value)
+            ) or 0
     except Exception:
         active_jobs = 0
 
@@ -804,15 +970,15 @@ async def readiness_check():
     """Dependency-aware readiness check for local/container deployments."""
     from sqlalchemy import text
 
-    from src.db.connection import get_db_context
+    from src.db.connection import get_async_db_context
 
     uptime = int(_time.time() - _startup_time) if _startup_time else 0
     checks: dict[str, dict[str, Any]] = {}
 
     # DB connectivity gate.
     try:
-        with get_db_context() as db:
-            db.execute(text("SELECT 1"))
+        async with get_async_db_context() as db:
+            await db.execute(text("SELECT 1"))
         checks["database"] = {"status": "ok"}
     except Exception as exc:
         return JSONResponse(
@@ -863,6 +1029,11 @@ async def readiness_check():
         }
         status = "degraded"
 
+    # Background crash recovery progress (does not gate readiness unless failed)
+    checks["startup_recovery"] = dict(_recovery_status)
+    if _recovery_status.get("status") == "failed":
+        status = "degraded"
+
     # MCP gateway health (best-effort, non-blocking)
     try:
         from src.services.gateway_provider import check_gateway_health
@@ -881,6 +1052,16 @@ async def readiness_check():
     }
 
 
+@app.get("/metrics")
+def metrics() -> Response:
+    """Prometheus scrape endpoint for hot-path latency and throughput.
+
+    Returns:
+        Response with the metrics registry in Prometheus text format.
+    """
+    return Response(METRICS_REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/api")
 def api_root() -> dict:
     """API root with links to docs.
@@ -921,7 +1102,7 @@ if FRONTEND_DIR.exists():
         """
         # Check if the path is an API or docs route (should be handled above)
         if full_path.startswith(
-            ("api/", "docs", "redoc", "openapi.json", "health", "readyz")
+            ("api/", "docs", "redoc", "openapi.json", "health", "readyz", "metrics")
         ):
             # This shouldn't be reached as those routes are defined above
             # but return 404 just in case
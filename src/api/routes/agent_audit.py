@@ -3,9 +3,10 @@
 import json
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
+from src.api.streaming import export_response
 from src.services.decision_audit_service import DecisionAuditService
 
 router = APIRouter(prefix="/agent-audit", tags=["agent-audit"])
@@ -73,33 +74,29 @@ def get_job_events(
     )
 
 
-@router.get("/export", response_class=PlainTextResponse)
+@router.get("/export", response_class=StreamingResponse)
 def export_events(
+    request: Request,
     run_id: str | None = Query(None),
     job_id: str | None = Query(None),
     started_after: datetime | None = Query(None),
     started_before: datetime | None = Query(None),
-) -> PlainTextResponse:
-    """Export decision events as JSONL."""
+) -> StreamingResponse:
+    """Export decision events as JSONL, streamed from a server-side cursor."""
     if not run_id and not job_id and not started_after and not started_before:
         raise HTTPException(
             status_code=400,
             detail="Provide at least one filter (run_id, job_id, started_after, started_before).",
         )
 
-    rows = DecisionAuditService.export_events(
+    rows = DecisionAuditService.iter_export_events(
         run_id=run_id,
         job_id=job_id,
         started_after=started_after.isoformat() if started_after else None,
         started_before=started_before.isoformat() if started_before else None,
     )
-    content = "\n".join(
-        json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    lines = (
+        json.dumps(item, sort_keys=True, separators=(",", ":"), default=str) + "\n"
         for item in rows
     )
-    if content:
-        content += "\n"
-    return PlainTextResponse(
-        content=content,
-        media_type="application/jsonl",
-    )
+    return export_response(request, lines, media_type="application/jsonl")
@@ -21,6 +21,7 @@ Endpoints:
 
 import asyncio
 import base64
+import functools
 import json
 import logging
 import os
@@ -30,7 +31,7 @@ from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
 from src.api.schemas_conversations import (
@@ -48,12 +49,14 @@ from src.api.schemas_conversations import (
     UpdateTitleRequest,
     UploadDocumentResponse,
 )
+from src.api.streaming import export_response
 from src.db.models import AgentDecisionRunStatus
 from src.orchestrator.agent.intent_detection import (
     is_batch_shipping_request,
     is_confirmation_response,
     is_shipping_request,
 )
+from src.services.agent_pool import AgentPool
 from src.services.agent_session_manager import AgentSessionManager
 from src.services.conversation_persistence_service import ConversationPersistenceService
 from src.services.decision_audit_context import (
@@ -64,6 +67,11 @@ from src.services.decision_audit_context import (
     set_decision_run_id,
 )
 from src.services.decision_audit_service import DecisionAuditService
+from src.services.metrics import (
+    AGENT_POOL_IDLE,
+    AGENT_STARTUP_SECONDS,
+    AGENT_TIME_TO_FIRST_TOKEN_SECONDS,
+)
 from src.services.paperless_constants import (
     UPS_PAPERLESS_ALLOWED_EXTENSIONS,
     UPS_PAPERLESS_UI_ACCEPTED_FORMATS,
@@ -82,6 +90,10 @@ router = APIRouter(prefix="/conversations", tags=["conversations"])
 # Module-level session manager — shared across all conversation endpoints.
 _session_manager = AgentSessionManager()
 
+# Pre-started agents that new sessions claim instead of spawning their own.
+_agent_pool = AgentPool()
+AGENT_POOL_IDLE.set_function(lambda: _agent_pool.size)
+
 # Event queues for SSE streaming — one queue per session.
 _event_queues: dict[str, asyncio.Queue] = {}
 
@@ -178,6 +190,53 @@ def _build_source_signature(source_info: "DataSourceInfo | None") -> dict[str, A
     }
 
 
+async def _start_agent(
+    source_info: "DataSourceInfo | None",  # noqa: F821
+    interactive_shipping: bool,
+    session_id: str | None = None,
+    prior_conversation: list[dict] | None = None,
+) -> "OrchestrationAgent":  # noqa: F821
+    """Build the system prompt for a source and start an agent on it.
+
+    Args:
+        source_info: Current data source metadata.
+        interactive_shipping: Whether interactive single-shipment mode is on.
+        session_id: Session the agent serves; None for warm pool agents,
+            which are bound to a session when claimed.
+        prior_conversation: Persisted history to replay into the prompt.
+
+    Returns:
+        The started agent.
+    """
+    from src.orchestrator.agent.client import OrchestrationAgent
+    from src.orchestrator.agent.system_prompt import build_system_prompt
+
+    # Fetch column samples for filter grounding (batch mode only).
+    column_samples: dict[str, list] | None = None
+    if source_info is not None and not interactive_shipping:
+        try:
+            from src.services.gateway_provider import get_data_gateway
+
+            gw_for_samples = await get_data_gateway()
+            column_samples = await gw_for_samples.get_column_samples(max_samples=5)
+        except Exception as e:
+            logger.warning("Failed to fetch column samples: %s", e)
+
+    system_prompt = build_system_prompt(
+        source_info=source_info,
+        interactive_shipping=interactive_shipping,
+        column_samples=column_samples,
+        prior_conversation=prior_conversation,
+    )
+    agent = OrchestrationAgent(
+        system_prompt=system_prompt,
+        interactive_shipping=interactive_shipping,
+        session_id=session_id,
+    )
+    await agent.start()
+    return agent
+
+
 async def _ensure_agent(
     session: "AgentSession",  # noqa: F821
     source_info: "DataSourceInfo | None",  # noqa: F821
@@ -189,6 +248,10 @@ async def _ensure_agent(
     persist across messages for the session lifetime, leveraging the
     SDK's internal conversation memory.
 
+    A session with no history to replay claims a pre-started agent from
+    the warm pool when one is ready; either way the pool is topped up in
+    the background for the next session.
+
     Args:
         session: The conversation session.
         source_info: Current data source metadata.
@@ -196,8 +259,7 @@ async def _ensure_agent(
     Returns:
         True if a new agent was started/rebuilt, False if existing reused.
     """
-    from src.orchestrator.agent.client import OrchestrationAgent
-    from src.orchestrator.agent.system_prompt import build_system_prompt
+    from src.services.conversation_handler import _load_prior_conversation
 
     source_hash = _compute_source_hash(source_info)
     combined_hash = f"{source_hash}|interactive={session.interactive_shipping}"
@@ -206,8 +268,9 @@ async def _ensure_agent(
     if session.agent is not None and session.agent_source_hash == combined_hash:
         return False
 
+    rebuilding = session.agent is not None
     # Stop old agent if config changed mid-conversation
-    if session.agent is not None:
+    if rebuilding:
         logger.info(
             "Config changed for session %s, rebuilding agent "
             "(interactive_shipping=%s)",
@@ -221,40 +284,42 @@ async def _ensure_agent(
         # Source changed — invalidate confirmed semantic cache bound to prior schema.
         session.confirmed_resolutions.clear()
 
-    # Fetch column samples for filter grounding (batch mode only).
-    column_samples: dict[str, list] | None = None
-    if source_info is not None and not session.interactive_shipping:
-        try:
-            from src.services.gateway_provider import get_data_gateway
-
-            gw_for_samples = await get_data_gateway()
-            column_samples = await gw_for_samples.get_column_samples(max_samples=5)
-        except Exception as e:
-            logger.warning("Failed to fetch column samples: %s", e)
-
-    # Load prior conversation for resumed sessions
-    from src.services.conversation_handler import _load_prior_conversation
+    # Replay persisted history only when the new agent lacks it: a rebuild
+    # loses the old agent's memory, and a resumed session has messages this
+    # process never saw. Messages this live session recorded before its
+    # first agent (the one being processed) reach the agent as the query.
     prior_conversation = _load_prior_conversation(session.session_id)
-
-    system_prompt = build_system_prompt(
-        source_info=source_info,
-        interactive_shipping=session.interactive_shipping,
-        column_samples=column_samples,
-        prior_conversation=prior_conversation,
-    )
-    agent = OrchestrationAgent(
-        system_prompt=system_prompt,
-        interactive_shipping=session.interactive_shipping,
-        session_id=session.session_id,
+    if not rebuilding and len(prior_conversation or []) <= len(session.history):
+        prior_conversation = None
+
+    pool_key = (source_hash, session.interactive_shipping)
+    agent = None
+    if prior_conversation is None:
+        agent = await _agent_pool.claim(pool_key)
+    session.agent_from_pool = agent is not None
+    if agent is not None:
+        agent.emitter_bridge.session_id = session.session_id
+    else:
+        started = time.perf_counter()
+        agent = await _start_agent(
+            source_info,
+            session.interactive_shipping,
+            session_id=session.session_id,
+            prior_conversation=prior_conversation,
+        )
+        AGENT_STARTUP_SECONDS.labels("cold").observe(time.perf_counter() - started)
+    _agent_pool.refill(
+        pool_key,
+        functools.partial(_start_agent, source_info, session.interactive_shipping),
     )
-    await agent.start()
 
     session.agent = agent
     session.agent_source_hash = combined_hash
     logger.info(
-        "Agent started for session %s interactive_shipping=%s",
+        "Agent started for session %s interactive_shipping=%s from_pool=%s",
         session.session_id,
         session.interactive_shipping,
+        session.agent_from_pool,
     )
     return True
 
@@ -592,6 +657,14 @@ async def _process_agent_message(
 
     elapsed = time.perf_counter() - started_at
     ttfb = (first_event_at - started_at) if first_event_at is not None else -1.0
+    if ttfb >= 0 and first_event_source != "error":
+        if not agent_rebuilt:
+            agent_start = "reused"
+        elif session.agent_from_pool:
+            agent_start = "pool"
+        else:
+            agent_start = "cold"
+        AGENT_TIME_TO_FIRST_TOKEN_SECONDS.labels(agent_start).observe(ttfb)
     agent_turns_count = (
         int(getattr(session.agent, "last_turn_count", 0))
         if session.agent is not None
@@ -1259,35 +1332,38 @@ async def update_conversation(
 
 
 @router.get("/{session_id}/export")
-async def export_conversation(session_id: str) -> Response:
+async def export_conversation(session_id: str, request: Request) -> StreamingResponse:
     """Export a conversation session as JSON download.
 
+    Messages are streamed from a server-side cursor (gzip-encoded when
+    the client accepts it), so long sessions export in constant memory.
+
     Args:
         session_id: Conversation session ID.
+        request: Incoming request (for content negotiation).
 
     Returns:
-        JSON file download.
+        Streamed JSON file download.
 
     Raises:
         HTTPException: 404 if session not found.
     """
-    import json as json_mod
-
     from src.db.connection import get_db_context
 
     with get_db_context() as db:
-        svc = ConversationPersistenceService(db)
-        export = svc.export_session_json(session_id)
-    if export is None:
+        session = ConversationPersistenceService(db).get_session(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    title_slug = (export["session"].get("title") or "conversation").replace(" ", "-").lower()[:30]
+    title_slug = (session.get("title") or "conversation").replace(" ", "-").lower()[:30]
     filename = f"{title_slug}-{session_id[:8]}.json"
 
-    return Response(
-        content=json_mod.dumps(export, indent=2),
-        media_type="application/json",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    def _chunks():
+        with get_db_context() as db:
+            yield from ConversationPersistenceService(db).iter_export_json(session_id)
+
+    return export_response(
+        request, _chunks(), media_type="application/json", filename=filename,
     )
 
 
@@ -1328,6 +1404,19 @@ async def save_artifact(
     return {"session_id": session_id, "status": "saved"}
 
 
+def warm_agent_pool() -> None:
+    """Startup hook: begin warming agents for new batch-mode sessions.
+
+    No data source is connected at startup, so agents are warmed for the
+    no-source template; connecting a source retires them and the next
+    claim refills for that source.
+    """
+    _agent_pool.refill(
+        (_compute_source_hash(None), False),
+        functools.partial(_start_agent, None, False),
+    )
+
+
 async def shutdown_conversation_runtime() -> None:
     """Shutdown hook to stop all session-scoped async work."""
     for session_id in list(_session_manager.list_sessions()):
@@ -1339,3 +1428,4 @@ async def shutdown_conversation_runtime() -> None:
         await _session_manager.stop_session_agent(session_id)
         _session_manager.remove_session(session_id)
         _event_queues.pop(session_id, None)
+    await _agent_pool.close()
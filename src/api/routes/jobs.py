@@ -7,6 +7,8 @@ row retrieval, and summary metrics.
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.schemas import (
@@ -18,10 +20,17 @@ from src.api.schemas import (
     JobUpdate,
     SkipRowsRequest,
 )
-from src.db.connection import get_db
+from src.db.connection import get_async_db, get_db
 from src.db.models import Job, JobRow, JobStatus, RowStatus
-from src.services import AuditService, EventType, InvalidStateTransition, JobService
+from src.services import (
+    AsyncJobService,
+    AuditService,
+    EventType,
+    InvalidStateTransition,
+    JobService,
+)
 from src.services.gateway_provider import get_data_gateway
+from src.services.tracking_service import TrackingService
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -36,6 +45,11 @@ def get_audit_service(db: Session = Depends(get_db)) -> AuditService:
     return AuditService(db)
 
 
+def get_async_job_service(db: AsyncSession = Depends(get_async_db)) -> AsyncJobService:
+    """Dependency to get AsyncJobService instance for read-only routes."""
+    return AsyncJobService(db)
+
+
 @router.post("", response_model=JobResponse, status_code=201)
 async def create_job(
     job_data: JobCreate,
@@ -72,7 +86,7 @@ async def create_job(
 
 
 @router.get("", response_model=JobListResponse)
-def list_jobs(
+async def list_jobs(
     status: str | None = Query(None, description="Filter by status"),
     name: str | None = Query(None, description="Filter by name (partial match)"),
     created_after: date | None = Query(
@@ -83,7 +97,7 @@ def list_jobs(
     ),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JobListResponse:
     """List jobs with optional filters.
 
@@ -102,25 +116,27 @@ def list_jobs(
     Returns:
         Paginated list of jobs.
     """
-    query = db.query(Job)
+    query = select(Job)
 
     if status:
-        query = query.filter(Job.status == JobStatus(status))
+        query = query.where(Job.status == JobStatus(status))
 
     if name:
-        query = query.filter(Job.name.ilike(f"%{name}%"))
+        query = query.where(Job.name.ilike(f"%{name}%"))
 
     if created_after:
-        query = query.filter(Job.created_at >= created_after.isoformat())
+        query = query.where(Job.created_at >= created_after.isoformat())
 
     if created_before:
-        query = query.filter(Job.created_at <= created_before.isoformat() + "T23:59:59")
+        query = query.where(Job.created_at <= created_before.isoformat() + "T23:59:59")
 
     # Get total count before pagination
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # Apply pagination and ordering
-    jobs = query.order_by(Job.created_at.desc()).limit(limit).offset(offset).all()
+    jobs = await db.scalars(
+        query.order_by(Job.created_at.desc()).limit(limit).offset(offset)
+    )
 
     return JobListResponse(
         jobs=[JobSummaryResponse.model_validate(j) for j in jobs],
@@ -131,9 +147,9 @@ def list_jobs(
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(
+async def get_job(
     job_id: str,
-    job_svc: JobService = Depends(get_job_service),
+    job_svc: AsyncJobService = Depends(get_async_job_service),
 ) -> Job:
     """Get a job by ID.
 
@@ -147,7 +163,7 @@ def get_job(
     Raises:
         HTTPException: If job not found (404).
     """
-    job = job_svc.get_job(job_id)
+    job = await job_svc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -213,10 +229,10 @@ def delete_job(
 
 
 @router.get("/{job_id}/rows", response_model=list[JobRowResponse])
-def get_job_rows(
+async def get_job_rows(
     job_id: str,
     status: str | None = Query(None, description="Filter by row status"),
-    job_svc: JobService = Depends(get_job_service),
+    job_svc: AsyncJobService = Depends(get_async_job_service),
 ) -> list:
     """Get all rows for a job, optionally filtered by status.
 
@@ -231,19 +247,19 @@ def get_job_rows(
     Raises:
         HTTPException: If job not found (404).
     """
-    job = job_svc.get_job(job_id)
+    job = await job_svc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     row_status = RowStatus(status) if status else None
-    rows = job_svc.get_rows(job_id, status=row_status)
+    rows = await job_svc.get_rows(job_id, status=row_status)
     return rows
 
 
 @router.get("/{job_id}/summary")
-def get_job_summary(
+async def get_job_summary(
     job_id: str,
-    job_svc: JobService = Depends(get_job_service),
+    job_svc: AsyncJobService = Depends(get_async_job_service),
 ) -> dict:
     """Get job summary with aggregated metrics.
 
@@ -254,6 +270,33 @@ def get_job_summary(
     Returns:
         Dictionary with job metrics.
 
+    Raises:
+        HTTPException: If job not found (404).
+    """
+    job = await job_svc.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return await job_svc.get_job_summary(job_id)
+
+
+@router.get("/{job_id}/tracking")
+def get_job_tracking(
+    job_id: str,
+    job_svc: JobService = Depends(get_job_service),
+) -> dict:
+    """Get stored delivery status for every shipped row of a job.
+
+    Served from the tracking cache maintained by the tracking refresher;
+    no UPS calls are made. Rows not yet refreshed report state "unknown".
+
+    Args:
+        job_id: The job UUID.
+        job_svc: Job service dependency.
+
+    Returns:
+        Dictionary with per-state counts and per-row shipment status.
+
     Raises:
         HTTPException: If job not found (404).
     """
@@ -261,7 +304,7 @@ def get_job_summary(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return job_svc.get_job_summary(job_id)
+    return TrackingService(job_svc.db).job_summary(job_id)
 
 
 @router.patch("/{job_id}/rows/skip")
@@ -1,20 +1,34 @@
 """FastAPI routes for label downloads.
 
 Provides REST API endpoints for downloading individual shipping labels
-and merged PDF downloads of all labels for a job.
+and merged downloads of all labels for a job. Merged PDFs are cached on
+disk per label set; thermal (ZPL/EPL) labels are streamed concatenated.
+
+Merged artifacts are built at most once per label set: concurrent
+downloads of the same set wait on a per-artifact lock and reuse the
+result. Each download holds a reference to its artifact until the
+response has been sent, and eviction of superseded artifacts skips any
+that are still being served.
 """
 
-import io
+import hashlib
 import logging
 import os
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pypdf import PdfWriter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
-from src.db.connection import get_db
+from src.db.connection import get_async_db, get_db
 from src.db.models import Job, JobRow
 from src.services.batch_engine import DEFAULT_LABELS_DIR
 
@@ -27,6 +41,22 @@ _LABELS_BASE_DIR = Path(
     os.environ.get("UPS_LABELS_OUTPUT_DIR", str(DEFAULT_LABELS_DIR))
 ).resolve()
 
+# Thermal-printer label formats that are concatenated rather than PDF-merged.
+_THERMAL_LABEL_MEDIA_TYPES = {
+    ".zpl": "application/x-zpl",
+    ".epl": "application/x-epl",
+}
+
+# Merged-PDF artifacts are cached under this subdirectory of the labels dir.
+_MERGED_CACHE_DIRNAME = "merged"
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Guards the per-artifact build locks and the in-use reference counts.
+_merged_guard = threading.Lock()
+_merged_build_locks: dict[Path, threading.Lock] = {}
+_merged_in_use: Counter[Path] = Counter()
+
 
 def _validate_label_path(raw_path: str) -> Path:
     """Validate that a label path is contained within the labels directory.
@@ -56,9 +86,9 @@ def _validate_label_path(raw_path: str) -> Path:
 
 
 @router.get("/labels/{tracking_number}")
-def get_label(
+async def get_label(
     tracking_number: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> FileResponse:
     """Download an individual shipping label by tracking number.
 
@@ -76,10 +106,8 @@ def get_label(
         HTTPException: If tracking number not found (404) or label file missing (404).
     """
     # Find the job row with this tracking number
-    row = (
-        db.query(JobRow)
-        .filter(JobRow.tracking_number == tracking_number)
-        .first()
+    row = await db.scalar(
+        select(JobRow).where(JobRow.tracking_number == tracking_number).limit(1)
     )
 
     if not row:
@@ -113,28 +141,31 @@ def get_label(
 def download_labels_merged(
     job_id: str,
     db: Session = Depends(get_db),
-) -> StreamingResponse:
-    """Download all labels for a job as a single merged PDF.
+) -> Response:
+    """Download all labels for a job as a single merged document.
 
-    Concatenates all per-row label PDFs into one combined document
-    using pypdf.PdfWriter, streamed via an in-memory buffer.
+    PDF labels are merged with pypdf into an on-disk artifact cached under
+    the labels directory and keyed by the job's label set, so repeat
+    downloads stream straight from disk. Thermal-printer labels (ZPL/EPL)
+    are concatenated directly and streamed without going through pypdf.
 
     Args:
         job_id: The job UUID.
         db: Database session dependency.
 
     Returns:
-        StreamingResponse with the merged PDF.
+        FileResponse with the merged PDF, or StreamingResponse with the
+        concatenated thermal labels.
 
     Raises:
         HTTPException: If job not found (404) or no labels available (404).
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.query(Job.id).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     rows = (
-        db.query(JobRow)
+        db.query(JobRow.row_number, JobRow.label_path)
         .filter(
             JobRow.job_id == job_id,
             JobRow.label_path.isnot(None),
@@ -149,24 +180,201 @@ def download_labels_merged(
             detail="No labels available for this job",
         )
 
-    writer = PdfWriter()
-    pages_added = 0
+    paths = _collect_label_paths(rows, job_id)
+    if not paths:
+        raise HTTPException(
+            status_code=404,
+            detail="No valid label files found for this job",
+        )
+
+    suffix = paths[0].suffix.lower()
+    if suffix in _THERMAL_LABEL_MEDIA_TYPES:
+        return StreamingResponse(
+            _iter_concatenated_labels(paths),
+            media_type=_THERMAL_LABEL_MEDIA_TYPES[suffix],
+            headers={
+                "Content-Disposition": (
+                    f'inline; filename="labels-{job_id[:8]}{suffix}"'
+                )
+            },
+        )
+
+    merged_path = _merged_cache_path(job_id, paths)
+    # Hold the artifact before building so a concurrent download of a newer
+    # label set cannot evict it before this response has been sent.
+    _acquire_merged(merged_path)
+    try:
+        if not _ensure_merged_pdf(paths, merged_path):
+            raise HTTPException(
+                status_code=404,
+                detail="No valid label files found for this job",
+            )
+        _evict_stale_merged(job_id, keep=merged_path)
+    except BaseException:
+        _release_merged(merged_path)
+        raise
+
+    return FileResponse(
+        path=str(merged_path),
+        media_type="application/pdf",
+        filename=f"labels-{job_id[:8]}.pdf",
+        content_disposition_type="inline",
+        background=BackgroundTask(_release_merged, merged_path),
+    )
+
+
+def _collect_label_paths(rows: list, job_id: str) -> list[Path]:
+    """Resolve label files for a job, keeping only one label format.
+
+    Rows with traversal paths or missing files are skipped. The format of
+    the first usable label (PDF or thermal) decides the merge strategy;
+    labels in a different format are skipped with a warning.
 
-    for row in rows:
-        if not row.label_path:
+    Args:
+        rows: ``(row_number, label_path)`` tuples ordered by row number.
+        job_id: The job UUID (for logging).
+
+    Returns:
+        Ordered list of validated, existing label paths.
+    """
+    paths: list[Path] = []
+    fmt: str | None = None
+    for row_number, label_path in rows:
+        if not label_path:
             continue
         try:
-            path = _validate_label_path(row.label_path)
+            path = _validate_label_path(label_path)
         except HTTPException:
             # Skip rows with path traversal — log and continue
             logger.warning(
                 "Skipping label with invalid path for row %s in job %s",
-                row.row_number,
+                row_number,
                 job_id,
             )
             continue
         if not path.exists():
             continue
+        row_fmt = path.suffix.lower()
+        if row_fmt not in _THERMAL_LABEL_MEDIA_TYPES:
+            row_fmt = ".pdf"
+        if fmt is None:
+            fmt = row_fmt
+        elif row_fmt != fmt:
+            logger.warning(
+                "Skipping %s label for row %s in job %s (merging %s labels)",
+                row_fmt,
+                row_number,
+                job_id,
+                fmt,
+            )
+            continue
+        paths.append(path)
+    return paths
+
+
+def _iter_concatenated_labels(paths: list[Path]) -> Iterator[bytes]:
+    """Yield thermal label files back-to-back in fixed-size chunks.
+
+    ZPL/EPL documents are self-delimiting command streams, so printers
+    accept them concatenated without any container format.
+
+    Args:
+        paths: Ordered thermal label paths.
+
+    Yields:
+        Raw label bytes.
+    """
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                while chunk := f.read(_STREAM_CHUNK_SIZE):
+                    yield chunk
+        except OSError:
+            # File vanished or became unreadable mid-stream — skip it
+            logger.warning("Skipping unreadable thermal label %s", path)
+            continue
+
+
+def _merged_cache_path(job_id: str, paths: list[Path]) -> Path:
+    """Return the cache location for a job's merged PDF.
+
+    The key covers every label's path, size and mtime, so any change to
+    the job's label set (new rows completed, a label re-written) yields a
+    new artifact instead of a stale one.
+
+    Args:
+        job_id: The job UUID.
+        paths: Ordered label paths included in the merge.
+
+    Returns:
+        Path of the cached merged PDF (may not exist yet).
+    """
+    digest = hashlib.sha256(job_id.encode())
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode())
+    return (
+        _LABELS_BASE_DIR
+        / _MERGED_CACHE_DIRNAME
+        / f"{job_id}_{digest.hexdigest()[:16]}.pdf"
+    )
+
+
+def _acquire_merged(path: Path) -> None:
+    """Mark a merged artifact as being served."""
+    with _merged_guard:
+        _merged_in_use[path] += 1
+
+
+def _release_merged(path: Path) -> None:
+    """Drop one serving reference to a merged artifact."""
+    with _merged_guard:
+        _merged_in_use[path] -= 1
+        if _merged_in_use[path] <= 0:
+            del _merged_in_use[path]
+
+
+def _ensure_merged_pdf(paths: list[Path], dest: Path) -> bool:
+    """Build ``dest`` unless it exists, at most once across concurrent callers.
+
+    Args:
+        paths: Ordered label PDF paths.
+        dest: Cache path for the merged document.
+
+    Returns:
+        True when the artifact exists afterwards.
+    """
+    if dest.exists():
+        return True
+    with _merged_guard:
+        lock = _merged_build_locks.setdefault(dest, threading.Lock())
+    with lock:
+        try:
+            if dest.exists():
+                return True
+            return _build_merged_pdf(paths, dest) > 0
+        finally:
+            with _merged_guard:
+                if _merged_build_locks.get(dest) is lock:
+                    del _merged_build_locks[dest]
+
+
+def _build_merged_pdf(paths: list[Path], dest: Path) -> int:
+    """Merge label PDFs into ``dest`` via a temp file and atomic rename.
+
+    Concurrent builders for the same key each write their own temp file,
+    so a reader never observes a partially written artifact.
+
+    Args:
+        paths: Ordered label PDF paths.
+        dest: Final cache path for the merged document.
+
+    Returns:
+        Number of labels appended. Nothing is written when zero.
+    """
+    writer = PdfWriter()
+    pages_added = 0
+    for path in paths:
         try:
             writer.append(str(path))
             pages_added += 1
@@ -175,29 +383,45 @@ def download_labels_merged(
             continue
 
     if pages_added == 0:
-        raise HTTPException(
-            status_code=404,
-            detail="No valid label files found for this job",
-        )
+        return 0
 
-    buffer = io.BytesIO()
-    writer.write(buffer)
-    buffer.seek(0)
-
-    return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'inline; filename="labels-{job_id[:8]}.pdf"'
-        },
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dest.parent, prefix=f".{dest.stem}.", suffix=".tmp"
     )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write(f)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    finally:
+        writer.close()
+    return pages_added
+
+
+def _evict_stale_merged(job_id: str, keep: Path) -> None:
+    """Remove superseded merged artifacts for a job.
+
+    Artifacts still being served are kept; a later download evicts them.
+
+    Args:
+        job_id: The job UUID.
+        keep: The current artifact, which is retained.
+    """
+    for stale in keep.parent.glob(f"{job_id}_*.pdf"):
+        with _merged_guard:
+            if stale == keep or _merged_in_use[stale] > 0:
+                continue
+            stale.unlink(missing_ok=True)
 
 
 @router.get("/jobs/{job_id}/labels/{row_number}")
-def get_label_by_row(
+async def get_label_by_row(
     job_id: str,
     row_number: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> FileResponse:
     """Download an individual label by job ID and row number.
 
@@ -215,10 +439,10 @@ def get_label_by_row(
     Raises:
         HTTPException: If job/row not found (404) or label file missing (404).
     """
-    row = (
-        db.query(JobRow)
-        .filter(JobRow.job_id == job_id, JobRow.row_number == row_number)
-        .first()
+    row = await db.scalar(
+        select(JobRow)
+        .where(JobRow.job_id == job_id, JobRow.row_number == row_number)
+        .limit(1)
     )
 
     if not row:
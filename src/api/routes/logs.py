@@ -4,30 +4,34 @@ Provides REST API endpoints for viewing and exporting job audit logs.
 """
 
 import json
+from collections.abc import AsyncIterator
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import PlainTextResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas import AuditLogResponse
-from src.db.connection import get_db
+from src.api.streaming import export_response
+from src.db.connection import get_async_db
 from src.db.models import EventType, LogLevel
-from src.services import AuditService, JobService
+from src.services import AsyncAuditService, AsyncJobService
+from src.services.audit_service import export_filename, parse_details
 
 router = APIRouter(prefix="/jobs/{job_id}/logs", tags=["logs"])
 
 
-def get_job_service(db: Session = Depends(get_db)) -> JobService:
-    """Dependency to get JobService instance."""
-    return JobService(db)
+def get_job_service(db: AsyncSession = Depends(get_async_db)) -> AsyncJobService:
+    """Dependency to get AsyncJobService instance."""
+    return AsyncJobService(db)
 
 
-def get_audit_service(db: Session = Depends(get_db)) -> AuditService:
-    """Dependency to get AuditService instance."""
-    return AuditService(db)
+def get_audit_service(db: AsyncSession = Depends(get_async_db)) -> AsyncAuditService:
+    """Dependency to get AsyncAuditService instance."""
+    return AsyncAuditService(db)
 
 
-def _validate_job_exists(job_id: str, job_svc: JobService) -> None:
+async def _validate_job_exists(job_id: str, job_svc: AsyncJobService) -> None:
     """Verify job exists, raise 404 if not found.
 
     Args:
@@ -37,7 +41,7 @@ def _validate_job_exists(job_id: str, job_svc: JobService) -> None:
     Raises:
         HTTPException: If job not found (404).
     """
-    job = job_svc.get_job(job_id)
+    job = await job_svc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -51,22 +55,17 @@ def _parse_log_details(log_entry: object) -> dict | None:
     Returns:
         Parsed dict or None if no details.
     """
-    if not log_entry.details:
-        return None
-    try:
-        return json.loads(log_entry.details)
-    except json.JSONDecodeError:
-        return {"raw": log_entry.details}
+    return parse_details(log_entry.details)
 
 
 @router.get("", response_model=list[AuditLogResponse])
-def get_job_logs(
+async def get_job_logs(
     job_id: str,
     level: str | None = Query(None, description="Filter by log level"),
     event_type: str | None = Query(None, description="Filter by event type"),
     limit: int = Query(1000, ge=1, le=10000),
-    job_svc: JobService = Depends(get_job_service),
-    audit_svc: AuditService = Depends(get_audit_service),
+    job_svc: AsyncJobService = Depends(get_job_service),
+    audit_svc: AsyncAuditService = Depends(get_audit_service),
 ) -> list:
     """Get audit logs for a job.
 
@@ -86,12 +85,12 @@ def get_job_logs(
     Raises:
         HTTPException: If job not found (404).
     """
-    _validate_job_exists(job_id, job_svc)
+    await _validate_job_exists(job_id, job_svc)
 
     log_level = LogLevel(level) if level else None
     log_event_type = EventType(event_type) if event_type else None
 
-    logs = audit_svc.get_logs(
+    logs = await audit_svc.get_logs(
         job_id,
         level=log_level,
         event_type=log_event_type,
@@ -117,11 +116,11 @@ def get_job_logs(
 
 
 @router.get("/errors", response_model=list[AuditLogResponse])
-def get_job_errors(
+async def get_job_errors(
     job_id: str,
     limit: int = Query(10, ge=1, le=100),
-    job_svc: JobService = Depends(get_job_service),
-    audit_svc: AuditService = Depends(get_audit_service),
+    job_svc: AsyncJobService = Depends(get_job_service),
+    audit_svc: AsyncAuditService = Depends(get_audit_service),
 ) -> list:
     """Get recent error logs for a job.
 
@@ -137,9 +136,9 @@ def get_job_errors(
     Raises:
         HTTPException: If job not found (404).
     """
-    _validate_job_exists(job_id, job_svc)
+    await _validate_job_exists(job_id, job_svc)
 
-    logs = audit_svc.get_recent_errors(job_id, limit=limit)
+    logs = await audit_svc.get_recent_errors(job_id, limit=limit)
 
     result = []
     for log_entry in logs:
@@ -158,35 +157,59 @@ def get_job_errors(
     return result
 
 
-@router.get("/export", response_class=PlainTextResponse)
-def export_job_logs(
-    job_id: str,
-    job_svc: JobService = Depends(get_job_service),
-    audit_svc: AuditService = Depends(get_audit_service),
-) -> PlainTextResponse:
-    """Export all logs for a job as plain text.
+async def _text_lines(audit_svc: AsyncAuditService, job_id: str) -> AsyncIterator[str]:
+    async for line in audit_svc.iter_logs_text(job_id):
+        yield line + "\n"
+
+
+async def _ndjson_lines(audit_svc: AsyncAuditService, job_id: str) -> AsyncIterator[str]:
+    async for record in audit_svc.iter_log_records(job_id):
+        yield json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
 
-    Returns a downloadable text file with formatted log entries.
+@router.get("/export", response_class=StreamingResponse)
+async def export_job_logs(
+    request: Request,
+    job_id: str,
+    format: Literal["text", "ndjson"] = Query("text", description="Export format"),
+    job_svc: AsyncJobService = Depends(get_job_service),
+    audit_svc: AsyncAuditService = Depends(get_audit_service),
+) -> StreamingResponse:
+    """Export all logs for a job as a streamed download.
+
+    Entries are read through a server-side cursor and sent in chunks
+    (gzip-encoded when the client accepts it), so memory stays flat for
+    jobs of any size. ``text`` is the human-readable format; ``ndjson``
+    emits one JSON record per line, shaped like ``GET /logs`` entries.
     Sensitive data is redacted.
 
     Args:
+        request: Incoming request (for content negotiation).
         job_id: The job UUID.
+        format: ``text`` or ``ndjson``.
         job_svc: Job service dependency.
         audit_svc: Audit service dependency.
 
     Returns:
-        Plain text response with Content-Disposition header for download.
+        Streaming response with Content-Disposition header for download.
 
     Raises:
         HTTPException: If job not found (404).
     """
-    job = job_svc.get_job(job_id)
+    job = await job_svc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    filename, content = audit_svc.export_logs_for_download(job_id, job.name)
-
-    return PlainTextResponse(
-        content=content,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    if format == "ndjson":
+        return export_response(
+            request,
+            _ndjson_lines(audit_svc, job_id),
+            media_type="application/x-ndjson",
+            filename=export_filename(job.name, "ndjson"),
+        )
+    return export_response(
+        request,
+        _text_lines(audit_svc, job_id),
+        media_type="text/plain; charset=utf-8",
+        filename=export_filename(job.name),
     )
@@ -13,7 +13,8 @@ import logging
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import update
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.schemas import (
@@ -22,9 +23,11 @@ from src.api.schemas import (
     ConfirmResponse,
     PreviewRowResponse,
 )
-from src.db.connection import get_db
+from src.db.connection import get_async_db, get_db
 from src.db.models import Job, JobRow
 from src.services.decision_audit_service import DecisionAuditService
+from src.services.job_lease import JobLeaseHeldError
+from src.services.order_data_codec import decode_order_data
 from src.services.ups_constants import DEFAULT_ORIGIN_COUNTRY
 from src.services.ups_service_codes import (
     SERVICE_CODE_NAMES,
@@ -37,7 +40,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["preview"])
 
-# Background batch tasks created by confirm endpoint (process-local runtime).
+# Background batch tasks created by confirm endpoint on this worker. Which
+# worker executes a job is arbitrated by its DB lease (job_lease.py).
 _batch_tasks: set[asyncio.Task[None]] = set()
 
 
@@ -71,7 +75,10 @@ async def shutdown_batch_runtime(timeout_seconds: float = 15.0) -> None:
 
 
 @router.get("/jobs/{job_id}/preview", response_model=BatchPreviewResponse)
-def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewResponse:
+async def get_job_preview(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+) -> BatchPreviewResponse:
     """Get batch preview for a job.
 
     Returns preview data including sample rows with estimated costs
@@ -79,7 +86,7 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
 
     Args:
         job_id: The job UUID.
-        db: Database session.
+        db: Async database session.
 
     Returns:
         BatchPreviewResponse with preview data.
@@ -87,16 +94,15 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
     Raises:
         HTTPException: If job not found.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
     # Get all rows for the job
-    rows = (
-        db.query(JobRow)
-        .filter(JobRow.job_id == job_id)
-        .order_by(JobRow.row_number)
-        .all()
+    rows = list(
+        await db.scalars(
+            select(JobRow).where(JobRow.job_id == job_id).order_by(JobRow.row_number)
+        )
     )
 
     if not rows:
@@ -105,6 +111,25 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
             detail="Job has no rows for preview. Command may not have been processed yet.",
         )
 
+    # Decoding order_data is CPU-bound for large jobs; keep it off the event loop.
+    response, preview_hash = await asyncio.to_thread(_build_preview, job_id, rows)
+    job.preview_hash = preview_hash
+    await db.commit()
+    return response
+
+
+def _build_preview(
+    job_id: str, rows: list[JobRow]
+) -> tuple[BatchPreviewResponse, str]:
+    """Build the preview response and integrity hash from loaded job rows.
+
+    Args:
+        job_id: The job UUID.
+        rows: All rows of the job, ordered by row_number.
+
+    Returns:
+        Tuple of (preview response, preview hash to store on the job).
+    """
     # Build preview rows from ALL job rows
     preview_rows: list[PreviewRowResponse] = []
     total_estimated_cost = 0
@@ -123,7 +148,7 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
 
         if row.order_data:
             try:
-                order_data_dict = json.loads(row.order_data)
+                order_data_dict = decode_order_data(row.order_data, job_id=job_id)
                 recipient_name = order_data_dict.get("ship_to_name", recipient_name)
                 city = order_data_dict.get("ship_to_city", "")
                 state = order_data_dict.get("ship_to_state", "")
@@ -132,7 +157,7 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
                     "service_code", ServiceCode.GROUND.value
                 )
                 service = SERVICE_CODE_NAMES.get(service_code, "UPS Ground")
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
 
         estimated_cost = row.cost_cents or 0
@@ -185,10 +210,8 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
         f"{r.row_number}:{r.row_checksum}" for r in rows
     )
     preview_hash = hashlib.sha256(checksum_concat.encode()).hexdigest()
-    job.preview_hash = preview_hash
-    db.commit()
 
-    return BatchPreviewResponse(
+    response = BatchPreviewResponse(
         job_id=job_id,
         total_rows=len(rows),
         preview_rows=preview_rows,
@@ -198,6 +221,7 @@ def get_job_preview(job_id: str, db: Session = Depends(get_db)) -> BatchPreviewR
         total_duties_taxes_cents=total_duties_taxes if total_duties_taxes > 0 else None,
         international_row_count=international_count,
     )
+    return response, preview_hash
 
 
 def _get_sse_observer():
@@ -279,6 +303,10 @@ async def _execute_batch(
                 duties_taxes_cents=result.get("total_duties_taxes_cents", 0),
                 international_row_count=result.get("international_row_count", 0),
             )
+    except JobLeaseHeldError:
+        # Another worker owns this job; its progress reaches subscribers
+        # through the progress bus.
+        logger.info("Job %s is executing on another worker; not starting", job_id)
     except Exception as e:
         logger.exception("Background batch execution failed for job %s: %s", job_id, e)
         await observer.on_batch_failed(
@@ -6,41 +6,89 @@ progress updates to web clients.
 
 import asyncio
 import json
+import logging
+import os
 from collections.abc import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
-from src.db.connection import get_db
+from src.db.connection import get_async_db
 from src.db.models import Job
 from src.orchestrator.batch import SSEProgressObserver
+from src.orchestrator.batch.progress_bus import build_progress_bus
+from src.orchestrator.batch.sse_observer import (
+    DEFAULT_COALESCE_INTERVAL_S,
+    DEFAULT_REPLAY_BUFFER_SIZE,
+    ProgressSubscription,
+)
+from src.services.metrics import SSE_MAX_LAG_EVENTS, SSE_SUBSCRIBERS
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["progress"])
 
+
+def _env_number(key: str, default: float) -> float:
+    """Read a non-negative number from env with safe fallback."""
+    raw = os.environ.get(key, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r, defaulting to %s", key, raw, default)
+        return default
+
+
 # Module-level SSE observer instance
 # This is shared across all SSE connections and can be registered
-# with BatchEventEmitter to receive batch events
-sse_observer = SSEProgressObserver()
+# with BatchEventEmitter to receive batch events. Its progress bus carries
+# events between workers when PROGRESS_BUS_FACTORY names a shared broker.
+sse_observer = SSEProgressObserver(
+    buffer_size=int(
+        _env_number("SSE_REPLAY_BUFFER_SIZE", DEFAULT_REPLAY_BUFFER_SIZE)
+    ),
+    coalesce_interval_s=(
+        _env_number("SSE_PROGRESS_COALESCE_MS", DEFAULT_COALESCE_INTERVAL_S * 1000)
+        / 1000
+    ),
+    bus=build_progress_bus(),
+)
+SSE_SUBSCRIBERS.set_function(sse_observer.total_subscribers)
+SSE_MAX_LAG_EVENTS.set_function(sse_observer.max_subscriber_lag)
+
+
+def _parse_last_event_id(raw: str | None) -> int | None:
+    """Parse an SSE Last-Event-ID header into a sequence number."""
+    if not raw:
+        return None
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return None
 
 
 async def _event_generator(
     request: Request,
     job_id: str,
-    queue: asyncio.Queue,
+    queue: ProgressSubscription,
 ) -> AsyncGenerator[dict, None]:
-    """Generate SSE events from the job's event queue.
+    """Generate SSE events from the job's subscription.
 
-    Yields events from the queue with a 15-second timeout to send
+    Yields events from the subscription with a 15-second timeout to send
     ping events and prevent connection timeouts from load balancers.
+    Each event carries its sequence number as the SSE ``id`` so browsers
+    and the CLI resume via ``Last-Event-ID`` after a reconnect.
 
     Args:
         request: FastAPI request object for disconnect detection.
         job_id: The job UUID for this subscription.
-        queue: Async queue receiving batch events.
+        queue: This client's subscription cursor.
 
     Yields:
-        Event dictionaries with 'event' and 'data' keys.
+        Event dictionaries with 'id' and 'data' keys.
     """
     try:
         while True:
@@ -58,6 +106,7 @@ async def _event_generator(
                 # addEventListener() on the frontend, but the hook uses the
                 # generic onmessage handler instead.
                 yield {
+                    "id": str(event["id"]),
                     "data": json.dumps({
                         "event": event["event"],
                         "data": event["data"],
@@ -70,20 +119,21 @@ async def _event_generator(
                 }
     finally:
         # Always unsubscribe when generator exits
-        sse_observer.unsubscribe(job_id)
+        sse_observer.unsubscribe(job_id, queue)
 
 
 @router.get("/jobs/{job_id}/progress/stream")
 async def stream_progress(
     request: Request,
     job_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EventSourceResponse:
     """Stream batch progress events via Server-Sent Events.
 
     Subscribes to the SSE observer for the specified job and streams
     real-time progress updates. Sends ping events every 15 seconds
-    to prevent connection timeouts.
+    to prevent connection timeouts. Every connection receives every
+    event; clients sending ``Last-Event-ID`` resume after that event.
 
     The connection will automatically clean up when the client disconnects.
 
@@ -99,12 +149,15 @@ async def stream_progress(
         HTTPException: If job not found (404).
     """
     # Verify job exists
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Subscribe to events for this job
-    queue = sse_observer.subscribe(job_id)
+    # Subscribe to events for this job, resuming after Last-Event-ID if sent
+    queue = sse_observer.subscribe(
+        job_id,
+        last_event_id=_parse_last_event_id(request.headers.get("last-event-id")),
+    )
 
     return EventSourceResponse(
         _event_generator(request, job_id, queue),
@@ -113,9 +166,9 @@ async def stream_progress(
 
 
 @router.get("/jobs/{job_id}/progress")
-def get_progress(
+async def get_progress(
     job_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """Get current job progress (fallback for non-SSE clients).
 
@@ -133,7 +186,7 @@ def get_progress(
     Raises:
         HTTPException: If job not found (404).
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -67,6 +67,8 @@ class HttpClient:
         self._base_url = base_url
         self._client = None
         self._api_key = os.environ.get("SHIPAGENT_API_KEY", "").strip()
+        # Last SSE event id seen per job, sent as Last-Event-ID on reconnect.
+        self._progress_cursors: dict[str, str] = {}
 
     async def __aenter__(self):
         """Open httpx async client."""
@@ -345,7 +347,9 @@ class HttpClient:
     async def stream_progress(self, job_id: str) -> AsyncIterator[ProgressEvent]:
         """Stream progress via GET /api/v1/jobs/{id}/progress/stream.
 
-        Parses SSE events into ProgressEvent objects.
+        Parses SSE events into ProgressEvent objects. The id of the last
+        event received is remembered per job, so calling this again after
+        a dropped connection resumes where the previous stream stopped.
 
         Args:
             job_id: The job to stream progress for.
@@ -358,6 +362,8 @@ class HttpClient:
         headers = {}
         if self._api_key:
             headers["X-API-Key"] = self._api_key
+        if job_id in self._progress_cursors:
+            headers["Last-Event-ID"] = self._progress_cursors[job_id]
         async with httpx.AsyncClient(base_url=self._base_url, timeout=None, headers=headers) as stream_client:
             async with stream_client.stream(
                 "GET", f"/api/v1/jobs/{job_id}/progress/stream"
@@ -370,7 +376,9 @@ class HttpClient:
                 event_type = ""
                 async for line in resp.aiter_lines():
                     line = line.strip()
-                    if line.startswith("event:"):
+                    if line.startswith("id:"):
+                        self._progress_cursors[job_id] = line[3:].strip()
+                    elif line.startswith("event:"):
                         event_type = line[6:].strip()
                     elif line.startswith("data:"):
                         data_str = line[5:].strip()
@@ -380,12 +388,17 @@ class HttpClient:
                             continue
                         # SSE payload is envelope-shaped: {"event": "...", "data": {...}}
                         inner = data.get("data", {})
+                        if not isinstance(inner, dict):
+                            inner = {}
                         yield ProgressEvent(
                             job_id=job_id,
                             event_type=event_type or data.get("event", "unknown"),
-                            row_number=inner.get("row_number"),
+                            # Coalesced batch_progress frames report a count
+                            row_number=inner.get("row_number", inner.get("processed")),
                             total_rows=inner.get("total_rows"),
-                            tracking_number=inner.get("tracking_number"),
+                            tracking_number=inner.get(
+                                "tracking_number", inner.get("last_tracking_number"),
+                            ),
                             message=inner.get("message", ""),
                         )
 
@@ -482,6 +495,46 @@ class HttpClient:
                 return events
         return []
 
+    async def iter_job_logs(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream audit logs via GET /api/v1/jobs/{id}/logs/export?format=ndjson.
+
+        Args:
+            job_id: The job to export logs for.
+
+        Yields:
+            Log records as each NDJSON line arrives.
+        """
+        async for record in self._iter_ndjson(
+            f"/api/v1/jobs/{job_id}/logs/export", {"format": "ndjson"},
+        ):
+            yield record
+
+    async def iter_job_audit_events(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream decision events via GET /api/v1/agent-audit/export?job_id=.
+
+        Args:
+            job_id: The job to export decision events for.
+
+        Yields:
+            Decision event dicts as each JSONL line arrives.
+        """
+        async for event in self._iter_ndjson("/api/v1/agent-audit/export", {"job_id": job_id}):
+            yield event
+
+    async def _iter_ndjson(self, path: str, params: dict) -> AsyncIterator[dict]:
+        """Stream a line-delimited JSON export without buffering the body.
+
+        httpx advertises gzip and decodes it transparently, so compressed
+        exports are inflated chunk by chunk as lines are read.
+        """
+        async with self._client.stream("GET", path, params=params) as resp:
+            if resp.status_code >= 400:
+                await resp.aread()
+                self._raise_for_status(resp)
+            async for line in resp.aiter_lines():
+                if line.strip():
+                    yield json.loads(line)
+
     async def get_source_status(self) -> DataSourceStatus:
         """Get current data source connection status via GET /api/v1/data-sources/status."""
         resp = await self._client.get("/api/v1/data-sources/status")
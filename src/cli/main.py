@@ -247,11 +247,15 @@ def job_cancel(
 def job_logs(
     job_id: str = typer.Argument(help="Job ID to stream logs for"),
     follow: bool = typer.Option(False, "--follow", "-f", help="Follow/stream progress in real-time"),
+    export: bool = typer.Option(
+        False, "--export", "-e", help="Print the job's full audit log as it streams in",
+    ),
 ):
     """Stream progress events for a job.
 
     Use -f to follow in real-time (reconnects on daemon restart with backoff).
-    Without -f, prints current progress snapshot and exits.
+    Use -e to stream the complete audit log, oldest entry first.
+    Without either, prints current progress snapshot and exits.
     """
     cfg = load_config(config_path=_config_path)
     client = get_client(standalone=_standalone, config=cfg)
@@ -259,7 +263,16 @@ def job_logs(
     async def _run():
         try:
             async with client:
-                if follow:
+                if export:
+                    # Entries are printed as they arrive; nothing is buffered.
+                    async for record in client.iter_job_logs(job_id):
+                        row = f" [Row {record['row_number']}]" if record.get("row_number") else ""
+                        console.print(
+                            f"{record.get('timestamp', '')} [{record.get('level', '')}] "
+                            f"[{record.get('event_type', '')}]{row} {record.get('message', '')}",
+                            markup=False,
+                        )
+                elif follow:
                     # Stream with reconnect on daemon restart
                     retry_delay = 1.0
                     max_retry_delay = 30.0
@@ -267,7 +280,11 @@ def job_logs(
                         try:
                             async for event in client.stream_progress(job_id):
                                 retry_delay = 1.0  # Reset on success
-                                status_color = "green" if event.event_type == "row_completed" else "red"
+                                status_color = (
+                                    "green"
+                                    if event.event_type in ("row_completed", "batch_progress")
+                                    else "red"
+                                )
                                 row_info = f"Row {event.row_number}/{event.total_rows}" if event.row_number else ""
                                 tracking = f" → {event.tracking_number}" if event.tracking_number else ""
                                 console.print(
@@ -295,31 +312,49 @@ def job_logs(
 @job_app.command("audit")
 def job_audit(
     job_id: str = typer.Argument(help="Job ID to inspect decision audit events"),
-    limit: int = typer.Option(200, "--limit", "-n", help="Maximum events to fetch"),
-    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    limit: int = typer.Option(
+        200, "--limit", "-n", help="Show only the newest N events (0 for all)",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON lines"),
 ):
-    """Show centralized agent decision audit events for a job."""
+    """Show centralized agent decision audit events for a job.
+
+    Events stream from the server oldest first. With --limit 0 each event
+    is printed as it arrives; otherwise only the newest N are kept.
+    """
     cfg = load_config(config_path=_config_path)
     client = get_client(standalone=_standalone, config=cfg)
 
+    def _print(event: dict) -> None:
+        if json_output:
+            import json
+
+            console.print(json.dumps(event, default=str), markup=False, highlight=False)
+            return
+        console.print(
+            f"{event.get('timestamp', '')} "
+            f"[{event.get('phase', '')}] "
+            f"{event.get('event_name', '')} "
+            f"(seq={event.get('seq', '')})",
+            markup=False,
+        )
+
     async def _run():
-        async with client:
-            events = await client.get_job_audit_events(job_id=job_id, limit=limit)
-            if json_output:
-                import json
+        from collections import deque
 
-                console.print(json.dumps(events, indent=2, default=str))
-                return
-            if not events:
+        async with client:
+            newest: deque[dict] = deque(maxlen=limit or None)
+            found = False
+            async for event in client.iter_job_audit_events(job_id):
+                found = True
+                if limit:
+                    newest.append(event)
+                else:
+                    _print(event)
+            for event in newest:
+                _print(event)
+            if not found and not json_output:
                 console.print("[yellow]No audit events found for this job.[/yellow]")
-                return
-            for event in events:
-                console.print(
-                    f"{event.get('timestamp', '')} "
-                    f"[{event.get('phase', '')}] "
-                    f"{event.get('event_name', '')} "
-                    f"(seq={event.get('seq', '')})"
-                )
 
     asyncio.run(_run())
 
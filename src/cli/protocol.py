@@ -400,6 +400,29 @@ class ShipAgentClient(Protocol):
         """Get centralized agent audit events for a job."""
         ...
 
+    async def iter_job_logs(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream every audit log entry for a job, oldest first.
+
+        Args:
+            job_id: The job to export logs for.
+
+        Yields:
+            Log records (id, timestamp, level, event_type, message,
+            details, row_number) as they arrive.
+        """
+        ...
+
+    async def iter_job_audit_events(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream every agent decision audit event for a job, oldest first.
+
+        Args:
+            job_id: The job to export decision events for.
+
+        Yields:
+            Decision event dicts as they arrive.
+        """
+        ...
+
     async def get_source_status(self) -> DataSourceStatus:
         """Get current data source connection status."""
         ...
@@ -623,3 +623,33 @@ class InProcessRunner:
         )
         events = payload.get("events", [])
         return events if isinstance(events, list) else []
+
+    async def iter_job_logs(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream audit log records for a job from the database.
+
+        Args:
+            job_id: The job to export logs for.
+
+        Yields:
+            Log records, fetched from a server-side cursor in batches.
+        """
+        from src.db.connection import get_db_context
+        from src.services.audit_service import AuditService
+
+        with get_db_context() as db:
+            for record in AuditService(db).iter_log_records(job_id):
+                yield record
+
+    async def iter_job_audit_events(self, job_id: str) -> AsyncIterator[dict]:
+        """Stream decision audit events for a job from the database.
+
+        Args:
+            job_id: The job to export decision events for.
+
+        Yields:
+            Decision event dicts, oldest first.
+        """
+        from src.services.decision_audit_service import DecisionAuditService
+
+        for event in DecisionAuditService.iter_export_events(job_id=job_id):
+            yield event
@@ -19,6 +19,7 @@ Usage:
         # ... use async db session
 """
 
+import logging
 import os
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
@@ -33,6 +34,9 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.db.models import Base
+from src.utils.tracing import end_span, start_child_span
+
+logger = logging.getLogger(__name__)
 
 
 # Configuration
@@ -68,6 +72,47 @@ def get_async_database_url() -> str:
     return url
 
 
+_DEFAULT_DB_POOL_SIZE = 10
+_DEFAULT_DB_MAX_OVERFLOW = 20
+_DEFAULT_DB_POOL_RECYCLE_S = 1800
+
+
+def _resolve_env_int(env_key: str, default: int) -> int:
+    raw = os.environ.get(env_key, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using %d", env_key, raw, default)
+        return default
+
+
+def engine_pool_options(url: str) -> dict[str, Any]:
+    """Return connection pool settings for a server database URL.
+
+    SQLite keeps SQLAlchemy's defaults. For Postgres (and other server
+    databases) the pool is sized for concurrent batch workers plus API
+    traffic, connections are pinged before reuse so a restarted server
+    does not surface as a failed request, and they are recycled before
+    typical idle timeouts.
+
+    Args:
+        url: Database URL the engine is created for.
+
+    Returns:
+        Keyword arguments for ``create_engine``/``create_async_engine``.
+    """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": _resolve_env_int("DB_POOL_SIZE", _DEFAULT_DB_POOL_SIZE),
+        "max_overflow": _resolve_env_int("DB_MAX_OVERFLOW", _DEFAULT_DB_MAX_OVERFLOW),
+        "pool_recycle": _resolve_env_int("DB_POOL_RECYCLE_S", _DEFAULT_DB_POOL_RECYCLE_S),
+        "pool_pre_ping": True,
+    }
+
+
 # Engine creation
 DATABASE_URL = get_database_url()
 ASYNC_DATABASE_URL = get_async_database_url()
@@ -79,27 +124,137 @@ engine = create_engine(
     if DATABASE_URL.startswith("sqlite")
     else {},
     echo=os.environ.get("SQL_ECHO", "").lower() == "true",
+    **engine_pool_options(DATABASE_URL),
 )
 
 # Async engine
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=os.environ.get("SQL_ECHO", "").lower() == "true",
+    **engine_pool_options(ASYNC_DATABASE_URL),
 )
 
 
+_DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+_DEFAULT_SQLITE_MMAP_SIZE_MB = 256
+_DEFAULT_SQLITE_CACHE_SIZE_MB = 64
+
+
+def sqlite_performance_profile_enabled() -> bool:
+    """Return whether SQLITE_PROFILE=performance applies to this database.
+
+    The profile is opt-in and only meaningful for SQLite URLs.
+    """
+    if not DATABASE_URL.startswith("sqlite"):
+        return False
+    profile = os.environ.get("SQLITE_PROFILE", "").strip().lower()
+    if profile in ("", "default"):
+        return False
+    if profile != "performance":
+        logger.warning("Unknown SQLITE_PROFILE=%r; using default pragmas", profile)
+        return False
+    return True
+
+
+def sqlite_profile_pragmas() -> list[str]:
+    """Build the pragmas applied to each connection under the performance profile.
+
+    WAL lets readers proceed while one writer commits; synchronous=NORMAL
+    skips the per-commit fsync of the WAL (durable across application
+    crashes, not power loss); busy_timeout makes a blocked writer wait
+    instead of failing with "database is locked".
+
+    Returns:
+        PRAGMA statements in execution order.
+    """
+    busy_timeout_ms = _resolve_env_int(
+        "SQLITE_BUSY_TIMEOUT_MS", _DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+    )
+    mmap_mb = _resolve_env_int("SQLITE_MMAP_SIZE_MB", _DEFAULT_SQLITE_MMAP_SIZE_MB)
+    cache_mb = _resolve_env_int("SQLITE_CACHE_SIZE_MB", _DEFAULT_SQLITE_CACHE_SIZE_MB)
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={busy_timeout_ms}",
+        "PRAGMA temp_store=MEMORY",
+        f"PRAGMA mmap_size={mmap_mb * 1024 * 1024}",
+        # Negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size=-{cache_mb * 1024}",
+    ]
+
+
+def _apply_sqlite_profile(dbapi_connection: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_profile_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 # Enable foreign keys for SQLite
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
     """Enable foreign key constraints for SQLite connections.
 
     SQLite has foreign keys disabled by default. This pragma enables them
-    for every connection to ensure referential integrity.
+    for every connection to ensure referential integrity. With
+    SQLITE_PROFILE=performance the connection is also switched to WAL
+    with the tuned pragmas from ``sqlite_profile_pragmas``.
     """
     if DATABASE_URL.startswith("sqlite"):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        if sqlite_performance_profile_enabled():
+            _apply_sqlite_profile(dbapi_connection)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def set_async_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply the SQLite performance profile to aiosqlite connections."""
+    if sqlite_performance_profile_enabled():
+        _apply_sqlite_profile(dbapi_connection)
+
+
+# Trace SQL statements as child spans of the active span. These are
+# no-ops unless TRACING_EXPORTER is set and a span is active.
+def _start_sql_span(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+) -> None:
+    sql_span = start_child_span(
+        "db.query",
+        {
+            "db.system": conn.dialect.name,
+            "db.operation": statement.split(None, 1)[0].upper() if statement else "",
+            "db.statement": statement[:300],
+        },
+    )
+    conn.info.setdefault("trace_sql_spans", []).append(sql_span)
+
+
+def _end_sql_span(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool,
+) -> None:
+    spans = conn.info.get("trace_sql_spans")
+    sql_span = spans.pop() if spans else None
+    if sql_span is not None:
+        end_span(sql_span)
+
+
+def _fail_sql_span(exception_context: Any) -> None:
+    spans = exception_context.connection.info.get("trace_sql_spans") if (
+        exception_context.connection is not None
+    ) else None
+    sql_span = spans.pop() if spans else None
+    if sql_span is not None:
+        end_span(sql_span, exception_context.original_exception)
+
+
+for _traced_engine in (engine, async_engine.sync_engine):
+    event.listen(_traced_engine, "before_cursor_execute", _start_sql_span)
+    event.listen(_traced_engine, "after_cursor_execute", _end_sql_span)
+    event.listen(_traced_engine, "handle_error", _fail_sql_span)
 
 
 # Session factories
@@ -421,6 +576,15 @@ def _ensure_columns_exist(conn: Any) -> None:
                 "international_row_count",
                 "ALTER TABLE jobs ADD COLUMN international_row_count INTEGER NOT NULL DEFAULT 0",
             ),
+            # Execution lease columns (multi-worker job ownership)
+            (
+                "lease_owner",
+                "ALTER TABLE jobs ADD COLUMN lease_owner VARCHAR(200)",
+            ),
+            (
+                "lease_expires_at",
+                "ALTER TABLE jobs ADD COLUMN lease_expires_at VARCHAR(50)",
+            ),
         ]
 
         for col_name, ddl in migrations:
@@ -498,6 +662,7 @@ def _ensure_columns_exist(conn: Any) -> None:
         for idx_stmt in [
             "CREATE INDEX IF NOT EXISTS idx_job_rows_idempotency ON job_rows (idempotency_key)",
             "CREATE INDEX IF NOT EXISTS idx_job_rows_tracking ON job_rows (ups_tracking_number)",
+            "CREATE INDEX IF NOT EXISTS idx_job_rows_tracking_number ON job_rows (tracking_number)",
         ]:
             try:
                 conn.execute(text(idx_stmt))
@@ -161,6 +161,8 @@ class Job(Base):
         updated_at: ISO8601 timestamp of last update
         error_code: Error code if job failed (E-XXXX format)
         error_message: Human-readable error message if failed
+        lease_owner: Worker currently executing the job (host:pid:nonce)
+        lease_expires_at: ISO8601 timestamp after which the lease may be taken
     """
 
     __tablename__ = "jobs"
@@ -213,6 +215,10 @@ class Job(Base):
     error_code: Mapped[str | None] = mapped_column(String(20), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Execution lease (one worker owns a running job; see job_lease.py)
+    lease_owner: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    lease_expires_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
     # Relationships
     rows: Mapped[list["JobRow"]] = relationship(
         "JobRow", back_populates="job", cascade="all, delete-orphan"
@@ -312,6 +318,7 @@ class JobRow(Base):
         Index("idx_job_rows_status", "status"),
         Index("idx_job_rows_idempotency", "idempotency_key"),
         Index("idx_job_rows_tracking", "ups_tracking_number"),
+        Index("idx_job_rows_tracking_number", "tracking_number"),
     )
 
     def __repr__(self) -> str:
@@ -506,6 +513,116 @@ class WriteBackTask(Base):
         )
 
 
+class TrackingState(str, Enum):
+    """Normalized delivery state for a tracked shipment."""
+
+    label_created = "label_created"
+    in_transit = "in_transit"
+    out_for_delivery = "out_for_delivery"
+    exception = "exception"
+    delivered = "delivered"
+    returned = "returned"
+    unknown = "unknown"
+
+
+class TrackingStatus(Base):
+    """Latest known UPS tracking status for a tracking number.
+
+    Refreshed by the tracking refresher on an adaptive schedule and read
+    first by agent tracking lookups, so UPS is only called when the cached
+    state is stale.
+
+    Attributes:
+        tracking_number: UPS tracking number (primary key).
+        job_id: Job that created the shipment (optional).
+        row_number: Row within the job (optional).
+        state: Normalized TrackingState value.
+        status_code: Raw UPS current status code.
+        status_description: Raw UPS current status description.
+        delivery_date: Delivery or scheduled delivery date (YYYYMMDD).
+        activities_json: JSON array of recent normalized activities.
+        returned_tracking_number: Number UPS reported (differs in sandbox).
+        last_checked_at: ISO8601 timestamp of the last successful lookup.
+        next_check_at: ISO8601 timestamp of the next scheduled refresh;
+            NULL when polling has stopped (terminal state).
+        error_count: Consecutive failed lookups.
+        last_error: Message from the last failed lookup.
+        created_at: ISO8601 timestamp of first registration.
+    """
+
+    __tablename__ = "tracking_statuses"
+
+    tracking_number: Mapped[str] = mapped_column(String(50), primary_key=True)
+    job_id: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=True
+    )
+    row_number: Mapped[int | None] = mapped_column(nullable=True)
+    state: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=TrackingState.unknown.value
+    )
+    status_code: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    status_description: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    delivery_date: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    activities_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    returned_tracking_number: Mapped[str | None] = mapped_column(
+        String(50), nullable=True
+    )
+    last_checked_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    next_check_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now_iso
+    )
+
+    __table_args__ = (
+        Index("idx_tracking_next_check", "next_check_at"),
+        Index("idx_tracking_job_id", "job_id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrackingStatus(tracking_number={self.tracking_number!r}, "
+            f"state={self.state!r}, next_check_at={self.next_check_at!r})>"
+        )
+
+
+class AddressValidation(Base):
+    """Cached UPS address validation result for a normalized address.
+
+    Keyed by a hash of the normalized line1/city/state/ZIP5/country so
+    repeat recipients are validated once across jobs until the entry
+    expires.
+
+    Attributes:
+        address_key: SHA-256 of the normalized address (primary key).
+        country_code: Destination country of the address.
+        status: UPS verdict (valid, ambiguous, invalid, unknown).
+        candidates_json: JSON array of normalized UPS candidates.
+        residential: Residential classification, when UPS reports one.
+        validated_at: ISO8601 timestamp of the UPS lookup.
+    """
+
+    __tablename__ = "address_validations"
+
+    address_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    country_code: Mapped[str] = mapped_column(String(2), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    candidates_json: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    residential: Mapped[bool | None] = mapped_column(nullable=True)
+    validated_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=utc_now_iso
+    )
+
+    __table_args__ = (Index("idx_address_validations_validated_at", "validated_at"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<AddressValidation(address_key={self.address_key!r}, "
+            f"status={self.status!r})>"
+        )
+
+
 class SavedDataSource(Base):
     """Persistent record of a previously connected data source.
 
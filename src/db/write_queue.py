@@ -0,0 +1,323 @@
+"""Process-wide single-writer queue for SQLite.
+
+SQLite allows one writer at a time. When several services commit from
+different threads (audit logging, decision events, conversation
+messages, batch row state) they contend for the database write lock and
+each pays a full commit. Under ``SQLITE_PROFILE=performance`` writes
+routed through ``run_write`` are executed on one dedicated writer thread
+instead: whatever has queued up while the previous commit ran is applied
+in a single transaction (group commit). A write that raises fails on
+its own: the group is rolled back and the remaining writes replayed, so
+queued callables must only touch the database through the session they
+are given and be safe to run again.
+
+Writers that cannot be expressed as a queued callable — BatchEngine's
+row-state commits on its long-lived session — take ``writer_lock()``
+around their commit, so they serialize with the queue in-process rather
+than racing it for the SQLite lock.
+
+With the profile off (the default) ``run_write`` runs the callable
+inline and commits, exactly as the services did before.
+
+Waiting on the queue means waiting for the writer's current group as
+well, so the event loop must never block on it. Async callers await
+``run_write_async`` instead. A synchronous ``run_write`` made on an event
+loop thread runs inline, as it did before the profile existed, rather
+than stalling every other coroutine behind the writer.
+
+Example:
+    def _append(db: Session) -> str:
+        db.add(entry)
+        db.flush()
+        return entry.id
+
+    entry_id = run_write(_append)
+    entry_id = await run_write_async(_append)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.db.connection import (
+    engine,
+    get_db_context,
+    sqlite_performance_profile_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_DEFAULT_MAX_GROUP = 64
+
+
+class WriteQueue:
+    """Serialize write callables onto one thread and group-commit them.
+
+    Args:
+        session_factory: Creates the writer thread's session. Sessions
+            should use ``expire_on_commit=False`` so ORM objects returned by
+            a write stay readable after the group commits.
+        max_group: Most writes applied in one transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_group: int = _DEFAULT_MAX_GROUP,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_group = max(1, max_group)
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.RLock()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._local = threading.local()
+        self.groups_committed = 0
+        self.writes_committed = 0
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held while a group is applied; out-of-queue writers take it too."""
+        return self._lock
+
+    def submit[T](self, fn: Callable[[Session], T]) -> Future[T]:
+        """Queue ``fn(session)`` and return a future for its result.
+
+        The future resolves after the group containing the write has
+        committed, or with the exception raised by ``fn`` or the commit.
+
+        Raises:
+            RuntimeError: If the queue has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        self._ensure_started()
+        future: Future[T] = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def run[T](self, fn: Callable[[Session], T]) -> T:
+        """Run ``fn`` through the queue and block until it has committed.
+
+        Calls made from inside a queued write run inline on the writer's
+        session instead of deadlocking on the queue.
+        """
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return fn(session)
+        return self.submit(fn).result()
+
+    async def run_async[T](self, fn: Callable[[Session], T]) -> T:
+        """Run ``fn`` through the queue without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Apply everything already queued, then stop the writer thread."""
+        self._closed = True
+        thread = self._thread
+        if thread is None:
+            return
+        self._jobs.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Write queue did not drain within %.1fs", timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="sqlite-writer", daemon=True,
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        stopping = False
+        while not stopping:
+            job = self._jobs.get()
+            if job is _STOP:
+                break
+            group = [job]
+            # Take whatever queued up during the previous commit; never wait
+            # for more, so an idle queue adds no latency.
+            while len(group) < self._max_group:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stopping = True
+                    break
+                group.append(job)
+            self._apply(group)
+
+    def _apply(self, group: list[tuple[Callable[[Session], Any], Future]]) -> None:
+        pending = [
+            (fn, future) for fn, future in group if future.set_running_or_notify_cancel()
+        ]
+        with self._lock:
+            try:
+                while pending:
+                    pending = self._apply_once(pending)
+            except BaseException as exc:
+                # Keep the writer thread alive; fail whatever is unresolved.
+                logger.exception("Write queue group failed unexpectedly")
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _apply_once(
+        self, pending: list[tuple[Callable[[Session], Any], Future]],
+    ) -> list[tuple[Callable[[Session], Any], Future]]:
+        """Apply ``pending`` in one transaction; return the writes left to retry.
+
+        A write that raises fails alone: the transaction is rolled back and
+        the others are replayed without it. (pysqlite's implicit transaction
+        handling makes SAVEPOINT unreliable, so the group is re-run instead.)
+        """
+        done: list[tuple[Future, Any]] = []
+        session = self._session_factory()
+        self._local.session = session
+        try:
+            for index, (fn, future) in enumerate(pending):
+                try:
+                    result = fn(session)
+                    session.flush()
+                except Exception as exc:
+                    session.rollback()
+                    future.set_exception(exc)
+                    return pending[:index] + pending[index + 1:]
+                done.append((future, result))
+            try:
+                session.commit()
+            except Exception as exc:
+                logger.warning("Write queue group of %d failed: %s", len(done), exc)
+                session.rollback()
+                for future, _ in done:
+                    future.set_exception(exc)
+                return []
+        finally:
+            self._local.session = None
+            session.close()
+        self.groups_committed += 1
+        self.writes_committed += len(done)
+        for future, result in done:
+            future.set_result(result)
+        return []
+
+
+_queue: WriteQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteQueue | None:
+    """Return the process-wide queue, or None when the profile is off."""
+    global _queue
+    if not sqlite_performance_profile_enabled():
+        return None
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = WriteQueue(
+                    sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+                )
+    return _queue
+
+
+def on_event_loop() -> bool:
+    """Return whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _queue_for(db: Session | None) -> WriteQueue | None:
+    # A ``db`` that already has a transaction open may hold pending or
+    # flushed changes the caller expects this commit to include.
+    write_queue = get_write_queue()
+    if write_queue is not None and (db is None or not db.in_transaction()):
+        return write_queue
+    return None
+
+
+def run_write[T](fn: Callable[[Session], T], db: Session | None = None) -> T:
+    """Apply ``fn(session)`` as one committed write.
+
+    With the write queue active the callable runs on the writer thread.
+    Otherwise it runs on ``db`` (which is then committed, as the calling
+    services always did) or on a fresh ``get_db_context`` session.
+
+    Calls made on an event loop thread, and calls whose ``db`` already
+    has a transaction open, always run inline.
+
+    Args:
+        fn: Callable that performs the write on the session it is given.
+        db: Caller's session, used when the write runs inline.
+
+    Returns:
+        Whatever ``fn`` returned.
+    """
+    write_queue = _queue_for(db)
+    if write_queue is not None and not on_event_loop():
+        return write_queue.run(fn)
+    return _run_inline(fn, db)
+
+
+async def run_write_async[T](fn: Callable[[Session], T], db: Session | None = None) -> T:
+    """Awaitable ``run_write`` for coroutines.
+
+    With the write queue active the coroutine awaits the writer thread
+    instead of blocking the event loop; otherwise the write runs inline.
+
+    Args:
+        fn: Callable that performs the write on the session it is given.
+        db: Caller's session, used when the write runs inline.
+
+    Returns:
+        Whatever ``fn`` returned.
+    """
+    write_queue = _queue_for(db)
+    if write_queue is not None:
+        return await write_queue.run_async(fn)
+    return _run_inline(fn, db)
+
+
+def _run_inline[T](fn: Callable[[Session], T], db: Session | None) -> T:
+    if db is None:
+        with get_db_context() as session:
+            return fn(session)
+    result = fn(db)
+    db.commit()
+    return result
+
+
+@contextmanager
+def writer_lock() -> Iterator[None]:
+    """Hold the single-writer lock (a no-op when the queue is off)."""
+    write_queue = get_write_queue()
+    with write_queue.lock if write_queue is not None else nullcontext():
+        yield
+
+
+def shutdown_write_queue() -> None:
+    """Drain and stop the process-wide queue if it was started."""
+    global _queue
+    with _queue_lock:
+        write_queue, _queue = _queue, None
+    if write_queue is not None:
+        write_queue.close()
@@ -1,7 +1,8 @@
 """EDI adapter for importing X12 and EDIFACT files via DuckDB.
 
-Detects EDI format (X12 or EDIFACT), parses the document,
-normalizes to common schema, and loads into DuckDB.
+Detects EDI format (X12 or EDIFACT), streams the document through the
+segment tokenizer, normalizes orders incrementally into a staged NDJSON
+batch, and bulk-loads that batch into DuckDB with a single read_json.
 
 Supported formats:
 - X12: 850 (PO), 856 (ASN), 810 (Invoice)
@@ -9,6 +10,9 @@ Supported formats:
 """
 
 import json
+import os
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +25,52 @@ from src.mcp.data_source.edi.models import NormalizedOrder
 from src.mcp.data_source.edi.x12_parser import X12Parser
 from src.mcp.data_source.models import SOURCE_ROW_NUM_COLUMN, ImportResult, SchemaColumn
 
+_FORMAT_PROBE_CHARS = 4096
+
+
+# Table layout shared by staging and loading. _source_row_num BIGINT matches
+# the standard used by all other adapters (SOURCE_ROW_NUM_COLUMN from
+# models.py) for deterministic row tracking.
+_COLUMNS: tuple[tuple[str, str], ...] = (
+    (SOURCE_ROW_NUM_COLUMN, "BIGINT"),
+    ("po_number", "VARCHAR"),
+    ("reference_number", "VARCHAR"),
+    ("recipient_name", "VARCHAR"),
+    ("recipient_company", "VARCHAR"),
+    ("recipient_phone", "VARCHAR"),
+    ("recipient_email", "VARCHAR"),
+    ("address_line1", "VARCHAR"),
+    ("address_line2", "VARCHAR"),
+    ("city", "VARCHAR"),
+    ("state", "VARCHAR"),
+    ("postal_code", "VARCHAR"),
+    ("country", "VARCHAR"),
+    ("items", "JSON"),
+    ("edi_format", "VARCHAR"),
+    ("edi_transaction_type", "VARCHAR"),
+)
+
+
+def parse_edi_file(file_path: str) -> tuple[str, int]:
+    """Parse an EDI file into a staged batch; module-level for the parse pool.
+
+    Args:
+        file_path: Absolute path to the EDI file
+
+    Returns:
+        Tuple of (staged NDJSON path, order count) for EDIAdapter.load_staged.
+    """
+    return EDIAdapter().stage_orders(file_path)
+
+
+def discard_staged_edi(staged: tuple[str, int]) -> None:
+    """Remove a staged batch from parse_edi_file that will never be loaded.
+
+    Args:
+        staged: The (staged NDJSON path, order count) tuple.
+    """
+    Path(staged[0]).unlink(missing_ok=True)
+
 
 class EDIAdapter(BaseSourceAdapter):
     """Adapter for importing EDI files (X12 and EDIFACT).
@@ -65,6 +115,25 @@ class EDIAdapter(BaseSourceAdapter):
         Returns:
             ImportResult with row count, schema, and warnings
 
+        Raises:
+            FileNotFoundError: If EDI file doesn't exist
+            ValueError: If EDI format is invalid or unsupported
+        """
+        staged_path, count = self.stage_orders(file_path)
+        return self.load_staged(conn, staged_path, count, file_path)
+
+    def iter_orders(self, file_path: str) -> Iterator[NormalizedOrder]:
+        """Stream normalized orders from an EDI file.
+
+        The file is read in chunks by the X12 or EDIFACT tokenizer and one
+        transaction is held in memory at a time.
+
+        Args:
+            file_path: Absolute path to the EDI file
+
+        Yields:
+            Normalized orders in document order
+
         Raises:
             FileNotFoundError: If EDI file doesn't exist
             ValueError: If EDI format is invalid or unsupported
@@ -73,113 +142,125 @@ class EDIAdapter(BaseSourceAdapter):
         if not path.exists():
             raise FileNotFoundError(f"EDI file not found: {file_path}")
 
+        with open(path, encoding="utf-8") as f:
+            head = f.read(_FORMAT_PROBE_CHARS).lstrip()
+            f.seek(0)
+            if head.startswith("ISA"):
+                yield from self._x12_parser.iter_orders(f)
+            elif head.startswith(("UNA", "UNB")):
+                yield from self._edifact_parser.iter_orders(f)
+            else:
+                raise ValueError(
+                    "Unsupported EDI format. File must start with ISA (X12) "
+                    "or UNB (EDIFACT)"
+                )
+
+    def stage_orders(self, file_path: str) -> tuple[str, int]:
+        """Normalize an EDI file into a staged NDJSON batch for DuckDB.
+
+        Orders are written as they are parsed, so memory stays flat however
+        many transactions the interchange holds. The caller owns the staged
+        file; load_staged removes it.
+
+        Args:
+            file_path: Absolute path to the EDI file
+
+        Returns:
+            Tuple of (staged NDJSON path, order count)
+
+        Raises:
+            FileNotFoundError: If EDI file doesn't exist
+            ValueError: If EDI format is invalid or unsupported
+        """
+        fd, staged_path = tempfile.mkstemp(prefix="edi-", suffix=".ndjson")
+        count = 0
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                for count, order in enumerate(self.iter_orders(file_path), 1):
+                    out.write(json.dumps(self._order_record(count, order)))
+                    out.write("\n")
+        except BaseException:
+            Path(staged_path).unlink(missing_ok=True)
+            raise
+        return staged_path, count
+
+    def load_staged(
+        self,
+        conn: "DuckDBPyConnection",
+        staged_path: str,
+        count: int,
+        file_path: str,
+    ) -> ImportResult:
+        """Bulk-load a staged batch into the 'imported_data' table.
+
+        Args:
+            conn: DuckDB connection (in-memory)
+            staged_path: NDJSON file from stage_orders; removed afterwards
+            count: Number of staged orders
+            file_path: Source file, kept for get_metadata
+
+        Returns:
+            ImportResult with row count, schema, and warnings
+        """
         self._last_file_path = file_path
-        content = path.read_text()
         warnings: list[str] = []
 
-        # Detect format and parse
-        orders = self._parse_content(content)
-
-        if not orders:
+        if not count:
             warnings.append("No orders found in EDI file")
 
-        # Create table and load data
-        self._load_to_duckdb(conn, orders)
+        try:
+            self._load_to_duckdb(conn, staged_path if count else None)
+        finally:
+            Path(staged_path).unlink(missing_ok=True)
 
         # Build schema from normalized order structure
         columns = self._get_schema_columns(conn)
 
         return ImportResult(
-            row_count=len(orders),
+            row_count=count,
             columns=columns,
             warnings=warnings,
             source_type="edi",
         )
 
-    def _parse_content(self, content: str) -> list[NormalizedOrder]:
-        """Parse EDI content using appropriate parser."""
-        content = content.strip()
-
-        # Try X12 first
-        if content.startswith("ISA"):
-            return self._x12_parser.parse(content)
-
-        # Try EDIFACT
-        if content.startswith("UNB"):
-            return self._edifact_parser.parse(content)
-
-        raise ValueError(
-            "Unsupported EDI format. File must start with ISA (X12) or UNB (EDIFACT)"
-        )
+    @staticmethod
+    def _order_record(row_num: int, order: NormalizedOrder) -> dict:
+        """Flatten a normalized order into an imported_data record."""
+        source = order.source_document
+        return {
+            SOURCE_ROW_NUM_COLUMN: row_num,
+            "po_number": order.po_number,
+            "reference_number": order.reference_number,
+            "recipient_name": order.recipient_name,
+            "recipient_company": order.recipient_company,
+            "recipient_phone": order.recipient_phone,
+            "recipient_email": order.recipient_email,
+            "address_line1": order.address_line1,
+            "address_line2": order.address_line2,
+            "city": order.city,
+            "state": order.state,
+            "postal_code": order.postal_code,
+            "country": order.country,
+            "items": [item.model_dump() for item in order.items],
+            "edi_format": source.format.value if source else None,
+            "edi_transaction_type": source.transaction_type.value if source else None,
+        }
 
     def _load_to_duckdb(
-        self, conn: "DuckDBPyConnection", orders: list[NormalizedOrder]
+        self, conn: "DuckDBPyConnection", staged_path: str | None
     ) -> None:
-        """Load normalized orders into DuckDB table."""
-        # Create table with normalized schema
-        # _source_row_num BIGINT matches the standard used by all other adapters
-        # (SOURCE_ROW_NUM_COLUMN from models.py) for deterministic row tracking.
-        conn.execute(f"""
-            CREATE OR REPLACE TABLE imported_data (
-                {SOURCE_ROW_NUM_COLUMN} BIGINT,
-                po_number VARCHAR,
-                reference_number VARCHAR,
-                recipient_name VARCHAR,
-                recipient_company VARCHAR,
-                recipient_phone VARCHAR,
-                recipient_email VARCHAR,
-                address_line1 VARCHAR,
-                address_line2 VARCHAR,
-                city VARCHAR,
-                state VARCHAR,
-                postal_code VARCHAR,
-                country VARCHAR,
-                items JSON,
-                edi_format VARCHAR,
-                edi_transaction_type VARCHAR
-            )
-        """)
-
-        # Insert each order
-        for i, order in enumerate(orders, 1):
-            items_json = json.dumps(
-                [item.model_dump() for item in order.items]
-            )
-
-            edi_format = (
-                order.source_document.format.value
-                if order.source_document
-                else None
-            )
-            edi_tx_type = (
-                order.source_document.transaction_type.value
-                if order.source_document
-                else None
-            )
-
-            conn.execute(
-                """
-                INSERT INTO imported_data VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    i,
-                    order.po_number,
-                    order.reference_number,
-                    order.recipient_name,
-                    order.recipient_company,
-                    order.recipient_phone,
-                    order.recipient_email,
-                    order.address_line1,
-                    order.address_line2,
-                    order.city,
-                    order.state,
-                    order.postal_code,
-                    order.country,
-                    items_json,
-                    edi_format,
-                    edi_tx_type,
-                ],
-            )
+        """Create the normalized table and bulk-load a staged batch into it."""
+        col_defs = ", ".join(f"{name} {dtype}" for name, dtype in _COLUMNS)
+        conn.execute(f"CREATE OR REPLACE TABLE imported_data ({col_defs})")
+        if staged_path is None:
+            return
+        # One vectorized read instead of a statement per order.
+        json_columns = ", ".join(f"'{name}': '{dtype}'" for name, dtype in _COLUMNS)
+        conn.execute(
+            "INSERT INTO imported_data SELECT * FROM read_json("
+            f"?, format='newline_delimited', columns={{{json_columns}}})",
+            [staged_path],
+        )
 
     def _get_schema_columns(
         self, conn: "DuckDBPyConnection"
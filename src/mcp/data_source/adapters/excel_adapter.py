@@ -9,6 +9,7 @@ Per CONTEXT.md:
 - Best-effort parsing with string fallback
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,41 @@ if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection
 
 
+@dataclass
+class ParsedSheet:
+    """A sheet read and typed in memory, ready to load into DuckDB.
+
+    Attributes:
+        headers: Unique column names.
+        column_types: DuckDB type per column.
+        rows: Row tuples prefixed with the 1-based source row number.
+        skipped: Count of empty rows dropped.
+        date_warnings: Date-parsing warnings keyed by column name.
+    """
+
+    headers: list[str]
+    column_types: list[str]
+    rows: list[tuple]
+    skipped: int = 0
+    date_warnings: dict[str, list[str]] = field(default_factory=dict)
+
+
+def read_sheet(
+    file_path: str, sheet: str | None = None, header: bool = True
+) -> ParsedSheet:
+    """Parse an Excel sheet; module-level so it can run in the parse pool.
+
+    Args:
+        file_path: Path to Excel file (.xlsx or .xls)
+        sheet: Sheet name to import (default: first sheet)
+        header: Whether first row contains headers (default: True)
+
+    Returns:
+        ParsedSheet ready for ExcelAdapter.load_sheet.
+    """
+    return ExcelAdapter().parse_sheet(file_path, sheet, header)
+
+
 class ExcelAdapter(BaseSourceAdapter):
     """Adapter for importing Excel files via openpyxl and DuckDB.
 
@@ -132,6 +168,32 @@ class ExcelAdapter(BaseSourceAdapter):
         Returns:
             ImportResult with schema and row count
 
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If file has no sheets
+            ImportError: If .xls file and python-calamine not installed
+        """
+        return self.load_sheet(conn, self.parse_sheet(file_path, sheet, header))
+
+    def parse_sheet(
+        self,
+        file_path: str,
+        sheet: str | None = None,
+        header: bool = True,
+    ) -> ParsedSheet:
+        """Read and type a sheet without touching DuckDB.
+
+        This is the CPU-heavy half of import_data and is safe to run in a
+        worker process (see read_sheet).
+
+        Args:
+            file_path: Path to Excel file (.xlsx or .xls)
+            sheet: Sheet name to import (default: first sheet)
+            header: Whether first row contains headers (default: True)
+
+        Returns:
+            ParsedSheet ready for load_sheet.
+
         Raises:
             FileNotFoundError: If file does not exist
             ValueError: If file has no sheets
@@ -155,14 +217,7 @@ class ExcelAdapter(BaseSourceAdapter):
             rows_data = self._read_xlsx_openpyxl(file_path, sheet)
 
         if not rows_data:
-            # Empty sheet - create empty table
-            conn.execute("CREATE OR REPLACE TABLE imported_data (empty_sheet BOOLEAN)")
-            return ImportResult(
-                row_count=0,
-                columns=[],
-                warnings=["Sheet is empty"],
-                source_type="excel",
-            )
+            return ParsedSheet(headers=[], column_types=[], rows=[])
 
         # Extract headers
         if header:
@@ -187,43 +242,82 @@ class ExcelAdapter(BaseSourceAdapter):
         # Infer types from data
         column_types = self._infer_column_types(headers, non_empty_rows)
 
+        # Rows with a 1-based source row number, padded/truncated to headers
+        width = len(headers)
+        rows = []
+        for row_idx, row in enumerate(non_empty_rows, start=1):
+            padded_row = list(row)[:width]
+            padded_row.extend([None] * (width - len(padded_row)))
+            rows.append((row_idx, *padded_row))
+
+        # Date warnings from the first non-null value of each date column
+        date_warnings: dict[str, list[str]] = {}
+        for col_idx, (name, dtype) in enumerate(zip(headers, column_types, strict=False)):
+            if "DATE" not in dtype.upper() and "TIMESTAMP" not in dtype.upper():
+                continue
+            sample = next(
+                (r[col_idx + 1] for r in rows if r[col_idx + 1] is not None), None
+            )
+            if sample is None:
+                continue
+            date_result = parse_date_with_warnings(str(sample))
+            date_warnings[name] = [
+                w.get("message", str(w)) if isinstance(w, dict) else str(w)
+                for w in date_result.get("warnings", [])
+            ]
+
+        return ParsedSheet(
+            headers=headers,
+            column_types=column_types,
+            rows=rows,
+            skipped=len(data_rows) - len(non_empty_rows),
+            date_warnings=date_warnings,
+        )
+
+    def load_sheet(
+        self, conn: "DuckDBPyConnection", parsed: ParsedSheet
+    ) -> ImportResult:
+        """Load a parsed sheet into the imported_data table.
+
+        Args:
+            conn: DuckDB connection
+            parsed: Output of parse_sheet / read_sheet
+
+        Returns:
+            ImportResult with schema and row count
+        """
+        if not parsed.headers:
+            # Empty sheet - create empty table
+            conn.execute("CREATE OR REPLACE TABLE imported_data (empty_sheet BOOLEAN)")
+            return ImportResult(
+                row_count=0,
+                columns=[],
+                warnings=["Sheet is empty"],
+                source_type="excel",
+            )
+
+        headers = parsed.headers
+        column_types = parsed.column_types
+
         # Create table with inferred schema + identity tracking column
         col_defs = f"{SOURCE_ROW_NUM_COLUMN} BIGINT, " + ", ".join([
             f'"{name}" {dtype}' for name, dtype in zip(headers, column_types, strict=False)
         ])
         conn.execute(f"CREATE OR REPLACE TABLE imported_data ({col_defs})")
 
-        # Insert data with 1-based source row numbers
-        if non_empty_rows:
+        if parsed.rows:
             placeholders = ", ".join(["?"] * (len(headers) + 1))
-            for row_idx, row in enumerate(non_empty_rows, start=1):
-                # Pad or truncate row to match header count
-                padded_row = list(row)[:len(headers)]
-                while len(padded_row) < len(headers):
-                    padded_row.append(None)
-                conn.execute(
-                    f"INSERT INTO imported_data VALUES ({placeholders})",
-                    [row_idx] + padded_row
-                )
+            conn.executemany(
+                f"INSERT INTO imported_data VALUES ({placeholders})",
+                parsed.rows,
+            )
 
         # Build schema info with warnings
         columns = []
         all_warnings = []
 
         for name, dtype in zip(headers, column_types, strict=False):
-            col_warnings = []
-
-            # Check for date columns and parse with warnings
-            if "DATE" in dtype.upper() or "TIMESTAMP" in dtype.upper():
-                sample = conn.execute(f"""
-                    SELECT "{name}" FROM imported_data
-                    WHERE "{name}" IS NOT NULL LIMIT 1
-                """).fetchone()
-                if sample:
-                    date_result = parse_date_with_warnings(str(sample[0]))
-                    for w in date_result.get("warnings", []):
-                        msg = w.get("message", str(w)) if isinstance(w, dict) else str(w)
-                        col_warnings.append(msg)
+            col_warnings = list(parsed.date_warnings.get(name, []))
 
             # Check for nullable
             null_count = conn.execute(f"""
@@ -243,9 +337,8 @@ class ExcelAdapter(BaseSourceAdapter):
         row_count = conn.execute("SELECT COUNT(*) FROM imported_data").fetchone()[0]
 
         # Track skipped rows
-        skipped = len(data_rows) - len(non_empty_rows)
-        if skipped > 0:
-            all_warnings.append(f"Skipped {skipped} empty rows")
+        if parsed.skipped > 0:
+            all_warnings.append(f"Skipped {parsed.skipped} empty rows")
 
         return ImportResult(
             row_count=row_count,
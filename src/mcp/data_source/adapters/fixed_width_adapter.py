@@ -1,9 +1,11 @@
 """Fixed-width file adapter for Data Source MCP.
 
-Uses pure Python string slicing at agent-specified byte positions.
-No pandas dependency. The agent determines column specs by inspecting
-the file via the sniff_file MCP tool, then calls import_fixed_width
-with explicit positions.
+Loads the file into DuckDB as a single VARCHAR column with read_csv and
+projects every column with one substr/trim statement at agent-specified
+positions. No pandas dependency. The agent determines column specs by
+inspecting the file via the sniff_file MCP tool, then calls
+import_fixed_width with explicit positions; import_file auto-detects them
+from a sampled prefix of the file.
 
 Per CONTEXT.md:
 - Import all rows, flag invalid ones (no threshold)
@@ -11,7 +13,10 @@ Per CONTEXT.md:
 - Best-effort parsing with string fallback
 """
 
+import logging
+import os
 import re
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,8 +24,16 @@ if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection
 
 from src.mcp.data_source.adapters.base import BaseSourceAdapter
-from src.mcp.data_source.models import ImportResult
-from src.mcp.data_source.utils import coerce_records, load_flat_records_to_duckdb
+from src.mcp.data_source.models import SOURCE_ROW_NUM_COLUMN, ImportResult, SchemaColumn
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DETECT_SAMPLE_LINES = 1000
+
+_LINES_TABLE = "_fwf_lines"
+_FIELDS_TABLE = "_fwf_fields"
+# Characters str.strip() removes from ASCII text.
+_WHITESPACE = "' ' || chr(9) || chr(10) || chr(11) || chr(12) || chr(13)"
 
 # Pattern that a valid FWF column name must match.
 # Accepts identifiers like ORDER_NUM, RECIPIENT_NAME, WT_LBS, ST, ZIP.
@@ -260,6 +273,53 @@ def auto_detect_col_specs(
     return col_specs, names
 
 
+def _resolve_detect_sample_lines() -> int:
+    raw = os.environ.get(
+        "DATA_SOURCE_FWF_SAMPLE_LINES", str(DEFAULT_DETECT_SAMPLE_LINES)
+    )
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 2:
+        logger.warning(
+            "Invalid DATA_SOURCE_FWF_SAMPLE_LINES=%r, defaulting to %d",
+            raw,
+            DEFAULT_DETECT_SAMPLE_LINES,
+        )
+        return DEFAULT_DETECT_SAMPLE_LINES
+    return value
+
+
+def detect_fixed_width_layout(
+    file_path: str, preview_count: int = 10,
+) -> tuple[tuple[list[tuple[int, int]], list[str]] | None, list[str], int]:
+    """Auto-detect a fixed-width file's columns from a sampled prefix.
+
+    Only the header and the first DATA_SOURCE_FWF_SAMPLE_LINES lines feed
+    auto_detect_col_specs; the rest of the file is just counted. Module-level
+    so the Data Source MCP can run it in the parse pool.
+
+    Args:
+        file_path: Path to the fixed-width file.
+        preview_count: Leading lines returned for agent inspection.
+
+    Returns:
+        Tuple of (auto_detect_col_specs result or None, preview lines
+        without line endings, total line count).
+    """
+    sample_size = _resolve_detect_sample_lines()
+    with open(file_path, encoding="utf-8") as f:
+        sample = list(islice(f, sample_size))
+        line_count = len(sample) + sum(1 for _ in f)
+    preview = [ln.rstrip("\n\r") for ln in sample[:preview_count]]
+    return auto_detect_col_specs(sample), preview, line_count
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
 class FixedWidthAdapter(BaseSourceAdapter):
     """Adapter for importing fixed-width format files.
 
@@ -320,32 +380,124 @@ class FixedWidthAdapter(BaseSourceAdapter):
         if not col_specs:
             raise ValueError("col_specs required for fixed-width import")
 
-        with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
-
-        start_line = 0
-        if header and lines:
-            if names is None:
-                # Extract column names from first line using col_specs
-                names = [lines[0][s:e].strip() for s, e in col_specs]
-            start_line = 1
-
+        if header and names is None:
+            # Extract column names from first line using col_specs
+            with open(path, encoding="utf-8") as f:
+                first_line = f.readline()
+            names = [first_line[s:e].strip() for s, e in col_specs]
         if names is None:
             names = [f"col_{i}" for i in range(len(col_specs))]
 
-        records: list[dict] = []
-        for line in lines[start_line:]:
-            if not line.strip():
-                continue
-            record = {
-                names[i]: line[s:e].strip()
-                for i, (s, e) in enumerate(col_specs)
-            }
-            records.append(record)
+        # Later specs win on duplicate names, as when rows were built as dicts.
+        projection: dict[str, tuple[int, int]] = {}
+        for name, spec in zip(names, col_specs, strict=False):
+            projection[name] = spec
+
+        # 1. Whole lines as one VARCHAR column (NUL never occurs in text),
+        #    numbered so the header can be dropped and file order kept.
+        conn.execute(
+            f"""
+            CREATE OR REPLACE TEMP TABLE {_LINES_TABLE} AS
+            SELECT row_number() OVER () AS line_no, line
+            FROM read_csv(
+                ?, columns = {{'line': 'VARCHAR'}}, delim = ?, header = false,
+                quote = '', escape = '', auto_detect = false, null_padding = false
+            )
+            """,
+            [str(path), "\x00"],
+        )
+        try:
+            # 2. One substr/trim projection for every column.
+            fields = ", ".join(
+                f"NULLIF(trim(substr(line, {s + 1}, {max(e - s, 0)}), "
+                f"{_WHITESPACE}), '') AS {_quote_identifier(name)}"
+                for name, (s, e) in projection.items()
+            )
+            conn.execute(
+                f"""
+                CREATE OR REPLACE TEMP TABLE {_FIELDS_TABLE} AS
+                SELECT line_no, {fields}
+                FROM {_LINES_TABLE}
+                WHERE line_no > {1 if header else 0}
+                  AND trim(coalesce(line, ''), {_WHITESPACE}) <> ''
+                """
+            )
+
+            # 3. Numeric columns become BIGINT/DOUBLE when every value parses.
+            column_types = self._infer_types(conn, list(projection))
+
+            casts = ", ".join(
+                f"CAST({_quote_identifier(name)} AS {column_types[name]}) "
+                f"AS {_quote_identifier(name)}"
+                for name in projection
+            )
+            conn.execute(
+                f"""
+                CREATE OR REPLACE TABLE imported_data AS
+                SELECT row_number() OVER (ORDER BY line_no) AS {SOURCE_ROW_NUM_COLUMN},
+                       {casts}
+                FROM {_FIELDS_TABLE}
+                ORDER BY line_no
+                """
+            )
+        finally:
+            conn.execute(f"DROP TABLE IF EXISTS {_LINES_TABLE}")
+            conn.execute(f"DROP TABLE IF EXISTS {_FIELDS_TABLE}")
+
+        row_count = conn.execute("SELECT COUNT(*) FROM imported_data").fetchone()[0]
+        if row_count == 0:
+            conn.execute(
+                f"CREATE OR REPLACE TABLE imported_data ({SOURCE_ROW_NUM_COLUMN} BIGINT)"
+            )
+            return ImportResult(
+                row_count=0,
+                columns=[],
+                warnings=["No records to import"],
+                source_type="fixed_width",
+            )
 
-        # Coerce string values to natural Python types (int/float) so
-        # DuckDB assigns BIGINT/DOUBLE instead of VARCHAR for numeric columns.
-        records = coerce_records(records)
+        schema_rows = conn.execute("DESCRIBE imported_data").fetchall()
+        columns = [
+            SchemaColumn(name=col[0], type=col[1], nullable=True, warnings=[])
+            for col in schema_rows
+            if col[0] != SOURCE_ROW_NUM_COLUMN
+        ]
+        return ImportResult(
+            row_count=row_count,
+            columns=columns,
+            warnings=[],
+            source_type="fixed_width",
+        )
 
-        return load_flat_records_to_duckdb(conn, records, source_type="fixed_width")
+    @staticmethod
+    def _infer_types(
+        conn: "DuckDBPyConnection", names: list[str]
+    ) -> dict[str, str]:
+        """Pick BIGINT, DOUBLE or VARCHAR per column from all of its values.
 
+        A column is numeric only when every non-empty value parses, so a
+        stray code deep in the file can no longer break the load.
+        """
+        aggregates = []
+        for name in names:
+            col = _quote_identifier(name)
+            aggregates.append(
+                f"count({col}), "
+                f"count(*) FILTER (WHERE regexp_full_match({col}, '[+-]?[0-9]+') "
+                f"AND TRY_CAST({col} AS BIGINT) IS NOT NULL), "
+                f"count(TRY_CAST({col} AS DOUBLE))"
+            )
+        counts = conn.execute(
+            f"SELECT {', '.join(aggregates)} FROM {_FIELDS_TABLE}"
+        ).fetchone()
+
+        types: dict[str, str] = {}
+        for i, name in enumerate(names):
+            non_null, integers, doubles = counts[3 * i:3 * i + 3]
+            if non_null and integers == non_null:
+                types[name] = "BIGINT"
+            elif non_null and doubles == non_null:
+                types[name] = "DOUBLE"
+            else:
+                types[name] = "VARCHAR"
+        return types
@@ -1,11 +1,15 @@
 """EDIFACT EDI parser for ORDERS, DESADV, and INVOIC.
 
 Parses EDIFACT documents and normalizes to common order schema.
-Uses pydifact library for segment parsing.
+Messages are read with the streaming segment tokenizer, one UNH..UNT
+envelope at a time; pydifact is still used for message-type detection.
 """
 
+import io
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
 from pydifact.parser import Parser
-from pydifact.segments import Segment
 
 from src.mcp.data_source.edi.models import (
     EDIDocument,
@@ -14,6 +18,28 @@ from src.mcp.data_source.edi.models import (
     EDITransactionType,
     NormalizedOrder,
 )
+from src.mcp.data_source.edi.tokenizer import (
+    DEFAULT_CHUNK_SIZE,
+    EDISegment,
+    iter_edifact_segments,
+    iter_transactions,
+)
+
+_MESSAGE_TYPES = {
+    "ORDERS": EDITransactionType.EDIFACT_ORDERS,
+    "DESADV": EDITransactionType.EDIFACT_DESADV,
+    "INVOIC": EDITransactionType.EDIFACT_INVOIC,
+}
+
+
+def _message_type(unh: EDISegment) -> str:
+    """Return the message type named by a UNH segment."""
+    if len(unh.elements) < 2:
+        return ""
+    type_info = unh.elements[1]
+    if isinstance(type_info, list):
+        return type_info[0]
+    return str(type_info).split(":")[0]
 
 
 class EDIFACTParser:
@@ -96,25 +122,45 @@ class EDIFACTParser:
         Raises:
             ValueError: If content is invalid or unsupported
         """
-        # Validate format
         self.detect_format(content)
-        tx_type = self.detect_transaction_type(content)
+        return list(self.iter_orders(io.StringIO(content)))
 
-        try:
-            segments = list(Parser().parse(content))
-        except Exception as e:
-            raise ValueError(f"Invalid EDIFACT: {e}") from e
+    def iter_orders(
+        self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[NormalizedOrder]:
+        """Stream normalized orders from an EDIFACT interchange.
+
+        Reads the stream in chunks and holds one message at a time. Each
+        UNH..UNT message is dispatched on its own type.
 
-        if tx_type == EDITransactionType.EDIFACT_ORDERS:
-            return self._parse_orders(segments)
-        elif tx_type == EDITransactionType.EDIFACT_DESADV:
-            return self._parse_desadv(segments)
-        elif tx_type == EDITransactionType.EDIFACT_INVOIC:
-            return self._parse_invoic(segments)
-        else:
-            raise ValueError(f"Unsupported message type: {tx_type}")
+        Args:
+            stream: Text stream positioned at the UNA or UNB segment
+            chunk_size: Characters read per chunk
+
+        Yields:
+            NormalizedOrder objects in document order
 
-    def _get_element(self, segment: Segment, index: int, sub_index: int = 0) -> str | None:
+        Raises:
+            ValueError: If content is invalid or a message type is unsupported
+        """
+        handlers = {
+            EDITransactionType.EDIFACT_ORDERS: self._parse_orders,
+            EDITransactionType.EDIFACT_DESADV: self._parse_desadv,
+            EDITransactionType.EDIFACT_INVOIC: self._parse_invoic,
+        }
+        found = False
+        segments = iter_edifact_segments(stream, chunk_size)
+        for message in iter_transactions(segments, "UNH", "UNT"):
+            msg_type = _message_type(message[0])
+            tx_type = _MESSAGE_TYPES.get(msg_type)
+            if tx_type is None:
+                raise ValueError(f"Unsupported EDIFACT message type: {msg_type}")
+            found = True
+            yield from handlers[tx_type](message)
+        if not found:
+            raise ValueError("Invalid EDIFACT: UNH segment not found")
+
+    def _get_element(self, segment: EDISegment, index: int, sub_index: int = 0) -> str | None:
         """Safely get element from segment."""
         try:
             if index >= len(segment.elements):
@@ -128,9 +174,8 @@ class EDIFACTParser:
         except (IndexError, TypeError):
             return None
 
-    def _parse_orders(self, segments: list[Segment]) -> list[NormalizedOrder]:
+    def _parse_orders(self, segments: Iterable[EDISegment]) -> Iterator[NormalizedOrder]:
         """Parse EDIFACT ORDERS message."""
-        orders: list[NormalizedOrder] = []
         current_order: dict = {}
         current_items: list[EDILineItem] = []
         current_item: dict = {}
@@ -204,17 +249,14 @@ class EDIFACTParser:
                             transaction_type=EDITransactionType.EDIFACT_ORDERS,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 current_order = {}
                 current_items = []
                 current_item = {}
 
-        return orders
-
-    def _parse_desadv(self, segments: list[Segment]) -> list[NormalizedOrder]:
+    def _parse_desadv(self, segments: Iterable[EDISegment]) -> Iterator[NormalizedOrder]:
         """Parse EDIFACT DESADV (Dispatch Advice) message."""
-        orders: list[NormalizedOrder] = []
         current_order: dict = {}
         current_items: list[EDILineItem] = []
 
@@ -261,16 +303,13 @@ class EDIFACTParser:
                             transaction_type=EDITransactionType.EDIFACT_DESADV,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 current_order = {}
                 current_items = []
 
-        return orders
-
-    def _parse_invoic(self, segments: list[Segment]) -> list[NormalizedOrder]:
+    def _parse_invoic(self, segments: Iterable[EDISegment]) -> Iterator[NormalizedOrder]:
         """Parse EDIFACT INVOIC message."""
-        orders: list[NormalizedOrder] = []
         current_order: dict = {}
         current_items: list[EDILineItem] = []
 
@@ -316,9 +355,7 @@ class EDIFACTParser:
                             transaction_type=EDITransactionType.EDIFACT_INVOIC,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 current_order = {}
                 current_items = []
-
-        return orders
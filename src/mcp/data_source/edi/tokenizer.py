@@ -0,0 +1,231 @@
+"""Streaming segment tokenizers for X12 and EDIFACT interchanges.
+
+Both readers consume a text stream in fixed-size chunks and yield one
+segment at a time, so a multi-megabyte interchange is never held in
+memory as a single string or as a full segment list.
+
+- X12 delimiters are read once from the ISA header: the element separator
+  is the character after "ISA", and the component separator and segment
+  terminator follow the sixteenth element separator.
+- EDIFACT delimiters come from the optional UNA service string advice
+  (default ``:+.? '``). Release-escaped delimiters are honoured and
+  elements are shaped like pydifact's: a composite is a list of
+  components, a simple element a plain string.
+
+iter_transactions() groups a segment stream into ST..SE (X12) or
+UNH..UNT (EDIFACT) envelopes, one transaction in memory at a time.
+
+Example:
+    with open(path, encoding="utf-8") as f:
+        for transaction in iter_transactions(iter_x12_segments(f), "ST", "SE"):
+            ...
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain
+from typing import NamedTuple, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_ISA_ELEMENT_COUNT = 16
+_MIN_HEAD = 256
+_EDIFACT_DEFAULT_SERVICE = ":+.? '"
+
+
+@dataclass(frozen=True)
+class X12Delimiters:
+    """Delimiters declared by an X12 ISA header."""
+
+    element: str
+    component: str
+    segment: str
+
+
+class EDISegment(NamedTuple):
+    """An EDIFACT segment: tag plus pydifact-shaped elements."""
+
+    tag: str
+    elements: list[str | list[str]]
+
+
+def read_x12_delimiters(head: str) -> X12Delimiters:
+    """Read the delimiters from the start of an X12 interchange.
+
+    Args:
+        head: Text beginning with the ISA segment.
+
+    Returns:
+        X12Delimiters for the interchange.
+
+    Raises:
+        ValueError: If head does not start with a complete ISA segment.
+    """
+    if not head.startswith("ISA") or len(head) < 4:
+        raise ValueError("Not X12 format: must start with ISA segment")
+    element = head[3]
+    pos = 3
+    for _ in range(_ISA_ELEMENT_COUNT - 1):
+        pos = head.find(element, pos + 1)
+        if pos < 0:
+            raise ValueError("Invalid X12: truncated ISA segment")
+    if len(head) < pos + 3:
+        raise ValueError("Invalid X12: truncated ISA segment")
+    return X12Delimiters(element=element, component=head[pos + 1], segment=head[pos + 2])
+
+
+def _leading_chunks(stream: TextIO, chunk_size: int) -> tuple[str, Iterator[str]]:
+    """Return the head (leading whitespace removed) and the remaining chunks.
+
+    The head holds at least _MIN_HEAD characters when the stream has them,
+    so interchange headers can be read even with tiny chunk sizes.
+    """
+    rest = iter(lambda: stream.read(chunk_size), "")
+    head = ""
+    for chunk in rest:
+        head = (head + chunk).lstrip()
+        if len(head) >= _MIN_HEAD:
+            break
+    return head, rest
+
+
+def _split_escaped(text: str, sep: str, release: str | None) -> list[str]:
+    """Split on sep, skipping separators escaped by the release character.
+
+    A separator is escaped when preceded by an odd run of release
+    characters. Escapes are kept in the output so later splits see them.
+    """
+    if not release or release not in text:
+        return text.split(sep)
+    parts: list[str] = []
+    start = search = 0
+    while (i := text.find(sep, search)) >= 0:
+        j = i
+        while j > start and text[j - 1] == release:
+            j -= 1
+        search = i + 1
+        if (i - j) % 2:
+            continue
+        parts.append(text[start:i])
+        start = search
+    parts.append(text[start:])
+    return parts
+
+
+def _unescape(text: str, release: str) -> str:
+    if release not in text:
+        return text
+    out: list[str] = []
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i] == release and i + 1 < n:
+            i += 1
+        out.append(text[i])
+        i += 1
+    return "".join(out)
+
+
+def _split_segments(
+    chunks: Iterable[str], terminator: str, release: str | None = None,
+) -> Iterator[str]:
+    """Yield stripped, non-empty segments from a chunk stream."""
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        parts = _split_escaped(buffer, terminator, release)
+        buffer = parts.pop()
+        for part in parts:
+            part = part.strip()
+            if part:
+                yield part
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer
+
+
+def iter_x12_segments(
+    stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield (segment_id, elements) for each segment of an X12 stream.
+
+    Args:
+        stream: Text stream positioned at the start of the interchange.
+        chunk_size: Characters read per chunk.
+
+    Raises:
+        ValueError: If the stream does not start with an ISA segment.
+    """
+    first, rest = _leading_chunks(stream, chunk_size)
+    delimiters = read_x12_delimiters(first)
+    element = delimiters.element
+    for segment in _split_segments(chain((first,), rest), delimiters.segment):
+        parts = segment.split(element)
+        yield parts[0], parts[1:]
+
+
+def iter_edifact_segments(
+    stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[EDISegment]:
+    """Yield EDISegment tuples for each segment of an EDIFACT stream.
+
+    Args:
+        stream: Text stream positioned at the start of the interchange.
+        chunk_size: Characters read per chunk.
+
+    Raises:
+        ValueError: If the stream does not start with UNA or UNB.
+    """
+    first, rest = _leading_chunks(stream, chunk_size)
+    service = _EDIFACT_DEFAULT_SERVICE
+    if first.startswith("UNA"):
+        if len(first) < 9:
+            raise ValueError("Invalid EDIFACT: truncated UNA segment")
+        service = first[3:9]
+        first = first[9:].lstrip()
+    if not first.startswith("UNB"):
+        raise ValueError("Not EDIFACT format: must start with UNB segment")
+
+    component, element, _decimal, release, _reserved, terminator = service
+    release = release if release.strip() else None
+
+    for segment in _split_segments(chain((first,), rest), terminator, release):
+        raw_elements = _split_escaped(segment, element, release)
+        elements: list[str | list[str]] = []
+        for raw in raw_elements[1:]:
+            components = _split_escaped(raw, component, release)
+            if release:
+                components = [_unescape(c, release) for c in components]
+            elements.append(components if len(components) > 1 else components[0])
+        yield EDISegment(raw_elements[0], elements)
+
+
+def iter_transactions(
+    segments: Iterable[tuple], start_tag: str, end_tag: str,
+) -> Iterator[list[tuple]]:
+    """Group a segment stream into transaction envelopes.
+
+    Segments outside an envelope (interchange and group headers) are
+    dropped. A trailing envelope without its end segment is still yielded
+    so callers can validate its header.
+
+    Args:
+        segments: Segments whose first item is the segment tag.
+        start_tag: Envelope header tag ("ST" or "UNH").
+        end_tag: Envelope trailer tag ("SE" or "UNT").
+
+    Yields:
+        Lists of segments from header to trailer inclusive.
+    """
+    current: list[tuple] | None = None
+    for segment in segments:
+        tag = segment[0]
+        if tag == start_tag:
+            current = [segment]
+        elif current is not None:
+            current.append(segment)
+            if tag == end_tag:
+                yield current
+                current = None
+    if current is not None:
+        yield current
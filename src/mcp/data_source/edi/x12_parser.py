@@ -1,11 +1,16 @@
 """X12 EDI parser for 850 (PO), 856 (ASN), and 810 (Invoice).
 
 Parses X12 EDI documents and normalizes to common order schema.
-Uses simple regex-based parsing rather than full X12 library
-for lighter dependency footprint.
+Uses a streaming segment tokenizer rather than a full X12 library
+for lighter dependency footprint. Each ST..SE transaction is
+dispatched on its own type, so one interchange may mix 850, 856
+and 810 envelopes.
 """
 
+import io
 import re
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
 from src.mcp.data_source.edi.models import (
     EDIDocument,
@@ -14,6 +19,13 @@ from src.mcp.data_source.edi.models import (
     EDITransactionType,
     NormalizedOrder,
 )
+from src.mcp.data_source.edi.tokenizer import (
+    DEFAULT_CHUNK_SIZE,
+    iter_transactions,
+    iter_x12_segments,
+)
+
+Segment = tuple[str, list[str]]
 
 
 class X12Parser:
@@ -86,49 +98,45 @@ class X12Parser:
         Raises:
             ValueError: If content is invalid or unsupported
         """
-        # Validate format
-        self.detect_format(content)
-        tx_type = self.detect_transaction_type(content)
-
-        # Parse based on transaction type
-        if tx_type == EDITransactionType.X12_850:
-            return self._parse_850(content)
-        elif tx_type == EDITransactionType.X12_856:
-            return self._parse_856(content)
-        elif tx_type == EDITransactionType.X12_810:
-            return self._parse_810(content)
-        else:
-            raise ValueError(f"Unsupported transaction type: {tx_type}")
-
-    def _split_segments(self, content: str) -> list[str]:
-        """Split X12 content into segments."""
-        # Detect segment terminator from ISA
-        # ISA is fixed length, terminator is at position 105
-        if len(content) >= 106:
-            terminator = content[105]
-        else:
-            terminator = "~"
-
-        segments = content.split(terminator)
-        return [s.strip() for s in segments if s.strip()]
-
-    def _parse_segment(self, segment: str) -> tuple[str, list[str]]:
-        """Parse a segment into ID and elements."""
-        # Detect element separator (usually * but can vary)
-        if "*" in segment:
-            sep = "*"
-        elif "^" in segment:
-            sep = "^"
-        else:
-            sep = "*"
+        return list(self.iter_orders(io.StringIO(content)))
+
+    def iter_orders(
+        self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[NormalizedOrder]:
+        """Stream normalized orders from an X12 interchange.
+
+        Reads the stream in chunks and holds one transaction at a time.
+
+        Args:
+            stream: Text stream positioned at the ISA segment
+            chunk_size: Characters read per chunk
+
+        Yields:
+            NormalizedOrder objects in document order
 
-        parts = segment.split(sep)
-        return parts[0], parts[1:] if len(parts) > 1 else []
+        Raises:
+            ValueError: If content is invalid or a transaction type is unsupported
+        """
+        handlers = {
+            "850": self._parse_850,
+            "856": self._parse_856,
+            "810": self._parse_810,
+        }
+        found = False
+        segments = iter_x12_segments(stream, chunk_size)
+        for transaction in iter_transactions(segments, "ST", "SE"):
+            elements = transaction[0][1]
+            tx_type = elements[0] if elements else ""
+            handler = handlers.get(tx_type)
+            if handler is None:
+                raise ValueError(f"Unsupported X12 transaction type: {tx_type}")
+            found = True
+            yield from handler(transaction)
+        if not found:
+            raise ValueError("Invalid X12: ST segment not found")
 
-    def _parse_850(self, content: str) -> list[NormalizedOrder]:
+    def _parse_850(self, segments: Iterable[Segment]) -> Iterator[NormalizedOrder]:
         """Parse X12 850 Purchase Order."""
-        segments = self._split_segments(content)
-        orders: list[NormalizedOrder] = []
 
         # State for current order being parsed
         current_order: dict = {}
@@ -136,8 +144,7 @@ class X12Parser:
         current_item: dict = {}
         in_ship_to = False
 
-        for segment in segments:
-            seg_id, elements = self._parse_segment(segment)
+        for seg_id, elements in segments:
 
             if seg_id == "BEG":
                 # Beginning segment: PO number is element 2 (index 2)
@@ -225,28 +232,23 @@ class X12Parser:
                             transaction_type=EDITransactionType.X12_850,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 # Reset for next transaction
                 current_order = {}
                 current_items = []
                 current_item = {}
 
-        return orders
-
-    def _parse_856(self, content: str) -> list[NormalizedOrder]:
+    def _parse_856(self, segments: Iterable[Segment]) -> Iterator[NormalizedOrder]:
         """Parse X12 856 ASN (Advance Ship Notice)."""
         # Similar structure to 850 but with shipment-specific segments
         # For now, extract shipping info into normalized format
-        segments = self._split_segments(content)
-        orders: list[NormalizedOrder] = []
 
         current_order: dict = {}
         current_items: list[EDILineItem] = []
         in_ship_to = False
 
-        for segment in segments:
-            seg_id, elements = self._parse_segment(segment)
+        for seg_id, elements in segments:
 
             if seg_id == "BSN":
                 # Beginning Segment for Ship Notice
@@ -308,24 +310,19 @@ class X12Parser:
                             transaction_type=EDITransactionType.X12_856,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 current_order = {}
                 current_items = []
 
-        return orders
-
-    def _parse_810(self, content: str) -> list[NormalizedOrder]:
+    def _parse_810(self, segments: Iterable[Segment]) -> Iterator[NormalizedOrder]:
         """Parse X12 810 Invoice."""
-        segments = self._split_segments(content)
-        orders: list[NormalizedOrder] = []
 
         current_order: dict = {}
         current_items: list[EDILineItem] = []
         in_ship_to = False
 
-        for segment in segments:
-            seg_id, elements = self._parse_segment(segment)
+        for seg_id, elements in segments:
 
             if seg_id == "BIG":
                 # Beginning Segment for Invoice
@@ -388,9 +385,7 @@ class X12Parser:
                             transaction_type=EDITransactionType.X12_810,
                         ),
                     )
-                    orders.append(order)
+                    yield order
 
                 current_order = {}
                 current_items = []
-
-        return orders
@@ -0,0 +1,166 @@
+"""Process pool for CPU-bound file parsing in the Data Source MCP.
+
+Every data-source tool runs on a single asyncio loop, so a large Excel,
+fixed-width or EDI import used to block all other calls (including row
+fetches for in-flight batches) until parsing finished. Parse functions are
+now submitted to a small process pool and the tool awaits the result,
+reporting progress through ``ctx.info`` while it waits. Only the DuckDB
+load runs on the loop, since the connection cannot leave this process.
+
+Parse functions must be module-level (picklable) and return plain Python
+values; rows travel back to the server as pickled row batches.
+
+Configuration:
+    DATA_SOURCE_PARSE_WORKERS: Worker processes (default 2). 0 parses
+        inline on the loop, as before.
+    DATA_SOURCE_PARSE_PROGRESS_S: Seconds between progress messages while
+        a parse is running (default 5).
+
+Example:
+    rows = await run_parse(ctx, f"Reading {path}", read_sheet, path, None, True)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from fastmcp import Context
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSE_WORKERS = 2
+DEFAULT_PROGRESS_INTERVAL_S = 5.0
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _resolve_parse_workers() -> int:
+    raw = os.environ.get("DATA_SOURCE_PARSE_WORKERS", str(DEFAULT_PARSE_WORKERS))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "Invalid DATA_SOURCE_PARSE_WORKERS=%r, defaulting to %d",
+            raw,
+            DEFAULT_PARSE_WORKERS,
+        )
+        return DEFAULT_PARSE_WORKERS
+
+
+def _resolve_progress_interval() -> float:
+    raw = os.environ.get(
+        "DATA_SOURCE_PARSE_PROGRESS_S", str(DEFAULT_PROGRESS_INTERVAL_S)
+    )
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0.0
+    if value <= 0:
+        logger.warning(
+            "Invalid DATA_SOURCE_PARSE_PROGRESS_S=%r, defaulting to %.0f",
+            raw,
+            DEFAULT_PROGRESS_INTERVAL_S,
+        )
+        return DEFAULT_PROGRESS_INTERVAL_S
+    return value
+
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+    """Return the shared parse pool, or None when parsing runs inline.
+
+    Workers use the spawn start method: the server process holds DuckDB
+    and event-loop threads, which are unsafe to fork.
+    """
+    global _pool
+    workers = _resolve_parse_workers()
+    if workers == 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse pool, cancelling queued work. Safe to call repeatedly."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_parse(
+    ctx: Context,
+    description: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    on_discard: Callable[[Any], None] | None = None,
+) -> Any:
+    """Run a parse function in the pool, reporting progress until it returns.
+
+    If the calling tool is cancelled, a parse that has not started yet is
+    dropped from the queue; one that is already running finishes in its
+    worker and its result is handed to on_discard instead of the caller.
+
+    Args:
+        ctx: FastMCP context for progress messages.
+        description: Short label used in progress messages.
+        fn: Module-level parse function.
+        *args: Picklable arguments for fn.
+        on_discard: Releases a result nobody will receive, such as a
+            staged temp file. Called from a pool thread.
+
+    Returns:
+        The value returned by fn.
+
+    Raises:
+        Whatever fn raises, re-raised in the server process.
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return fn(*args)
+
+    submitted = pool.submit(fn, *args)
+    future = asyncio.wrap_future(submitted)
+    interval = _resolve_progress_interval()
+    started = time.monotonic()
+    try:
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=interval)
+            if done:
+                return future.result()
+            await ctx.info(
+                f"{description}: still parsing "
+                f"({time.monotonic() - started:.0f}s elapsed)"
+            )
+    except asyncio.CancelledError:
+        if not submitted.cancel() and on_discard is not None:
+            submitted.add_done_callback(
+                lambda done: _discard_result(done, on_discard, description),
+            )
+        future.cancel()
+        logger.info("Parse cancelled: %s", description)
+        raise
+
+
+def _discard_result(
+    done: Future, on_discard: Callable[[Any], None], description: str,
+) -> None:
+    if done.cancelled() or done.exception() is not None:
+        return
+    try:
+        on_discard(done.result())
+    except Exception as e:
+        logger.warning("Failed to discard parse result of %s: %s", description, e)
@@ -25,6 +25,9 @@ from typing import Any
 import duckdb
 from fastmcp import FastMCP
 
+from src.mcp.data_source.parse_pool import shutdown_parse_pool
+from src.mcp.data_source.trace_middleware import TraceContextMiddleware
+
 
 @asynccontextmanager
 async def lifespan(app: Any):
@@ -52,6 +55,7 @@ async def lifespan(app: Any):
     }
 
     # Cleanup on shutdown
+    shutdown_parse_pool()
     conn.close()
 
 
@@ -59,6 +63,8 @@ async def lifespan(app: Any):
 # Name: "DataSource" - identifies this server in MCP discovery
 # lifespan: Manages DuckDB connection lifecycle
 mcp = FastMCP("DataSource", lifespan=lifespan)
+# Continue the caller's trace (traceparent in request _meta) per tool call
+mcp.add_middleware(TraceContextMiddleware())
 
 
 # Import and register tools
@@ -3,14 +3,28 @@
 Manages the `imported_commodities` auxiliary table alongside the
 primary `imported_data` table. Follows the same ephemeral session
 model — import replaces previous commodities data.
+
+The table is keyed by order_id: import bulk-loads it in one vectorized
+read and builds an ART index on order_id, so lookups never scan the
+whole table per call. Bulk lookups pass the requested IDs as a single
+packed parameter rather than one bound value per ID, which keeps a
+several-thousand-order chunk to a single cheap statement.
 """
 
+import json
+import os
+import tempfile
 from collections import defaultdict
+from pathlib import Path
 from typing import Any
 
 from fastmcp import Context
 
 COMMODITIES_TABLE = "imported_commodities"
+COMMODITIES_INDEX = "idx_imported_commodities_order_id"
+
+# Packs order IDs into one VARCHAR parameter for bulk lookups.
+_ID_SEPARATOR = chr(0x1F)
 
 # Required columns for commodity data
 COMMODITY_COLUMNS = [
@@ -23,6 +37,22 @@ COMMODITY_COLUMNS = [
     ("unit_of_measure", "VARCHAR DEFAULT 'PCS'"),
 ]
 
+# Columns in the order returned to callers (order_id is the group key).
+_RESULT_COLUMNS = [name for name, _ in COMMODITY_COLUMNS if name != "order_id"]
+
+
+def _commodity_record(comm: dict) -> dict:
+    """Normalize one commodity dict to the stored column values."""
+    return {
+        "order_id": str(comm["order_id"]),
+        "description": str(comm["description"])[:35],
+        "commodity_code": str(comm.get("commodity_code", "")),
+        "origin_country": str(comm.get("origin_country", "")).upper(),
+        "quantity": int(comm.get("quantity", 1)),
+        "unit_value": str(comm.get("unit_value", "0")),
+        "unit_of_measure": str(comm.get("unit_of_measure", "PCS")).upper(),
+    }
+
 
 def import_commodities_sync(
     db: Any,
@@ -42,24 +72,34 @@ def import_commodities_sync(
     Returns:
         Dict with row_count and table_name.
     """
+    records = [_commodity_record(comm) for comm in commodities]
+
     col_defs = ", ".join(f"{name} {dtype}" for name, dtype in COMMODITY_COLUMNS)
-    db.execute(f"CREATE OR REPLACE TABLE {COMMODITIES_TABLE} ({col_defs})")
-
-    for comm in commodities:
-        db.execute(
-            f"""INSERT INTO {COMMODITIES_TABLE}
-            (order_id, description, commodity_code, origin_country, quantity, unit_value, unit_of_measure)
-            VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            [
-                str(comm["order_id"]),
-                str(comm["description"])[:35],
-                str(comm.get("commodity_code", "")),
-                str(comm.get("origin_country", "")).upper(),
-                int(comm.get("quantity", 1)),
-                str(comm.get("unit_value", "0")),
-                str(comm.get("unit_of_measure", "PCS")).upper(),
-            ],
-        )
+    db.execute(f"DROP TABLE IF EXISTS {COMMODITIES_TABLE}")
+    db.execute(f"CREATE TABLE {COMMODITIES_TABLE} ({col_defs})")
+
+    if records:
+        # Stage as NDJSON and load in one statement; a bound INSERT per
+        # commodity costs milliseconds each in DuckDB.
+        fd, staged_path = tempfile.mkstemp(prefix="commodities-", suffix=".ndjson")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                for record in records:
+                    out.write(json.dumps(record))
+                    out.write("\n")
+            json_columns = ", ".join(
+                f"'{name}': '{dtype.split()[0]}'" for name, dtype in COMMODITY_COLUMNS
+            )
+            db.execute(
+                f"INSERT INTO {COMMODITIES_TABLE} SELECT * FROM read_json("
+                f"?, format='newline_delimited', columns={{{json_columns}}})",
+                [staged_path],
+            )
+        finally:
+            Path(staged_path).unlink(missing_ok=True)
+
+    # Build the index after loading: one bulk build instead of per-row inserts.
+    db.execute(f"CREATE INDEX {COMMODITIES_INDEX} ON {COMMODITIES_TABLE} (order_id)")
 
     count = db.execute(f"SELECT COUNT(*) FROM {COMMODITIES_TABLE}").fetchone()[0]
     return {"row_count": count, "table_name": COMMODITIES_TABLE}
@@ -71,6 +111,9 @@ def get_commodities_bulk_sync(
 ) -> dict[int | str, list[dict]]:
     """Get commodities for multiple orders, grouped by order_id.
 
+    Callers fetching many orders should pass them in chunks (see
+    BatchEngine._get_commodities_bulk) so each response stays bounded.
+
     Args:
         db: DuckDB connection.
         order_ids: List of order IDs to look up.
@@ -79,6 +122,9 @@ def get_commodities_bulk_sync(
         Dict mapping order_id to list of commodity dicts.
         Missing orders are omitted from the result.
     """
+    if not order_ids:
+        return {}
+
     # Check if commodities table exists
     try:
         tables = [r[0] for r in db.execute("SHOW TABLES").fetchall()]
@@ -88,26 +134,21 @@ def get_commodities_bulk_sync(
     if COMMODITIES_TABLE not in tables:
         return {}
 
-    if not order_ids:
-        return {}
-
     # Coerce to strings for consistent VARCHAR matching
-    str_ids = [str(oid) for oid in order_ids]
-    placeholders = ", ".join("?" for _ in str_ids)
+    packed_ids = _ID_SEPARATOR.join(str(oid) for oid in order_ids)
+    select_cols = ", ".join(["order_id", *_RESULT_COLUMNS])
     rows = db.execute(
-        f"SELECT * FROM {COMMODITIES_TABLE} WHERE order_id IN ({placeholders})",
-        str_ids,
+        f"SELECT {select_cols} FROM {COMMODITIES_TABLE} "
+        # The cast is a no-op for imported tables (order_id is VARCHAR).
+        "WHERE CAST(order_id AS VARCHAR) IN (SELECT unnest(string_split(?, ?))) "
+        # rowid keeps each order's commodities in import order.
+        "ORDER BY rowid",
+        [packed_ids, _ID_SEPARATOR],
     ).fetchall()
 
-    # Get column names
-    schema = db.execute(f"DESCRIBE {COMMODITIES_TABLE}").fetchall()
-    columns = [col[0] for col in schema]
-
     result: dict[int | str, list[dict]] = defaultdict(list)
-    for row in rows:
-        row_dict = dict(zip(columns, row, strict=False))
-        oid = row_dict.pop("order_id")
-        result[oid].append(row_dict)
+    for oid, *values in rows:
+        result[oid].append(dict(zip(_RESULT_COLUMNS, values, strict=True)))
 
     return dict(result)
 
@@ -6,7 +6,12 @@ Automatically detects format and transaction type.
 
 from fastmcp import Context
 
-from src.mcp.data_source.adapters.edi_adapter import EDIAdapter
+from src.mcp.data_source.adapters.edi_adapter import (
+    EDIAdapter,
+    discard_staged_edi,
+    parse_edi_file,
+)
+from src.mcp.data_source.parse_pool import run_parse
 
 
 async def import_edi(file_path: str, ctx: Context) -> dict:
@@ -43,8 +48,11 @@ async def import_edi(file_path: str, ctx: Context) -> dict:
 
     await ctx.info(f"Importing EDI from {file_path}")
 
-    adapter = EDIAdapter()
-    result = adapter.import_data(conn=db, file_path=file_path)
+    staged_path, count = await run_parse(
+        ctx, f"Parsing EDI {file_path}", parse_edi_file, file_path,
+        on_discard=discard_staged_edi,
+    )
+    result = EDIAdapter().load_staged(db, staged_path, count, file_path)
 
     # Update current source tracking for session state.
     # Matches the pattern used by import_csv, import_excel, and import_fixed_width
@@ -9,6 +9,11 @@ Per CONTEXT.md:
 - User can import a CSV and see discovered schema
 - Ambiguous dates generate warnings
 
+CPU-heavy parsing (Excel, EDI, fixed-width column detection) runs in the
+parse pool (see parse_pool.py) so a large import does not block other
+data-source calls; only the DuckDB load runs on the event loop.
+Fixed-width rows are sliced by DuckDB itself in one vectorized statement.
+
 Security:
 - Connection strings are NEVER logged - they contain credentials
 - Database connections are not stored after import
@@ -23,7 +28,8 @@ from fastmcp import Context
 
 from src.mcp.data_source.adapters.csv_adapter import CSVAdapter
 from src.mcp.data_source.adapters.db_adapter import DatabaseAdapter
-from src.mcp.data_source.adapters.excel_adapter import ExcelAdapter
+from src.mcp.data_source.adapters.excel_adapter import ExcelAdapter, read_sheet
+from src.mcp.data_source.parse_pool import run_parse
 
 # --- Path security -----------------------------------------------------------
 
@@ -222,13 +228,10 @@ async def import_excel(
     sheet_info = f" sheet={sheet}" if sheet else ""
     await ctx.info(f"Importing Excel from {file_path}{sheet_info}")
 
-    adapter = ExcelAdapter()
-    result = adapter.import_data(
-        conn=db,
-        file_path=file_path,
-        sheet=sheet,
-        header=header,
+    parsed = await run_parse(
+        ctx, f"Reading {file_path}", read_sheet, file_path, sheet, header,
     )
+    result = ExcelAdapter().load_sheet(db, parsed)
 
     # Update current source tracking for session state
     ctx.request_context.lifespan_context["current_source"] = {
@@ -433,10 +436,10 @@ async def import_file(
         detected_delim = adapter_delim.detected_delimiter
 
     elif source_type == "excel":
-        adapter_excel = ExcelAdapter()
-        result = adapter_excel.import_data(
-            conn=db, file_path=file_path, sheet=sheet, header=header
+        parsed = await run_parse(
+            ctx, f"Reading {file_path}", read_sheet, file_path, sheet, header,
         )
+        result = ExcelAdapter().load_sheet(db, parsed)
 
     elif source_type == "json":
         adapter_json = JSONAdapter()
@@ -453,22 +456,21 @@ async def import_file(
     elif source_type == "fixed_width":
         from src.mcp.data_source.adapters.fixed_width_adapter import (
             FixedWidthAdapter,
-            auto_detect_col_specs,
+            detect_fixed_width_layout,
         )
 
         fwf_path = _validate_file_path(file_path)
         if not fwf_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(fwf_path, encoding="utf-8") as _fwf:
-            _lines = _fwf.readlines()
-
-        detected = auto_detect_col_specs(_lines)
+        detected, preview_lines, line_count = await run_parse(
+            ctx, f"Detecting columns in {file_path}",
+            detect_fixed_width_layout, str(fwf_path),
+        )
         if detected is None:
             # Auto-detection failed (e.g. legacy mainframe HDR/DTL/TRL format).
             # Return a structured preview so the agent can inspect the layout
             # and call import_fixed_width with explicit col_specs.
-            preview_lines = [ln.rstrip("\n\r") for ln in _lines[:10]]
             await ctx.info(
                 f"Fixed-width auto-detection failed for {file_path}; "
                 "returning preview for agent-driven column spec resolution"
@@ -476,7 +478,7 @@ async def import_file(
             return {
                 "status": "needs_column_specs",
                 "file_path": file_path,
-                "line_count": len(_lines),
+                "line_count": line_count,
                 "preview_lines": preview_lines,
                 "message": (
                     "Could not auto-detect column boundaries — the file does not "
@@ -492,8 +494,7 @@ async def import_file(
         await ctx.info(
             f"Auto-detected {len(_col_specs)} columns in fixed-width file"
         )
-        fwf_adapter = FixedWidthAdapter()
-        result = fwf_adapter.import_data(
+        result = FixedWidthAdapter().import_data(
             conn=db,
             file_path=file_path,
             col_specs=_col_specs,
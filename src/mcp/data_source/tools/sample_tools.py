@@ -2,6 +2,12 @@
 
 Provides sample distinct values per column to ground the LLM's
 FilterIntent generation with real data values from the source.
+
+Samples are snapshotted on the active source's metadata the first time
+they are requested after an import. Every import replaces that metadata,
+so the snapshot lives exactly as long as the data it was drawn from, and
+repeated agent starts for the same source skip the per-column DISTINCT
+scans.
 """
 
 from typing import Any
@@ -57,11 +63,24 @@ async def get_column_samples(
     Returns:
         Dict mapping column names to lists of sample values.
     """
-    db = ctx.request_context.lifespan_context["db"]
+    lifespan = ctx.request_context.lifespan_context
+    db = lifespan["db"]
+    current_source = lifespan.get("current_source")
+    snapshots = (
+        current_source.setdefault("column_samples", {})
+        if current_source is not None
+        else {}
+    )
+
+    result = snapshots.get(max_samples)
+    if result is not None:
+        await ctx.info(f"Returned cached samples for {len(result)} columns")
+        return result
 
     await ctx.info(f"Fetching column samples (max {max_samples} per column)")
 
     result = get_column_samples_impl(db, max_samples)
+    snapshots[max_samples] = result
 
     await ctx.info(f"Returned samples for {len(result)} columns")
     return result
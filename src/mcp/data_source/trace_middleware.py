@@ -0,0 +1,38 @@
+"""FastMCP middleware that continues the caller's trace in tool calls.
+
+The client (MCPClient) sends the active span's W3C ``traceparent`` in the
+request ``_meta``; each tool call here runs in a server span under it, so
+one trace covers both sides of the stdio boundary. Spans are exported by
+this process using the tracing settings forwarded in its environment.
+"""
+
+from typing import Any
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from src.utils.tracing import SPAN_KIND_SERVER, span
+
+
+def _request_traceparent(context: MiddlewareContext[Any]) -> str | None:
+    """Return the traceparent from the request ``_meta``, if present."""
+    fastmcp_context = context.fastmcp_context
+    if fastmcp_context is None:
+        return None
+    try:
+        meta = fastmcp_context.request_context.meta
+    except (AttributeError, LookupError, ValueError):
+        return None
+    return getattr(meta, "traceparent", None) if meta is not None else None
+
+
+class TraceContextMiddleware(Middleware):
+    """Wrap every tool call in a ``data_source.tool.<name>`` span."""
+
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: Any) -> Any:
+        """Run the tool inside a server span continuing the caller's trace."""
+        with span(
+            f"data_source.tool.{context.message.name}",
+            parent=_request_traceparent(context),
+            kind=SPAN_KIND_SERVER,
+        ):
+            return await call_next(context)
@@ -5,12 +5,26 @@ knowledge (service codes, filter rules, workflow) with the current data
 source schema. The schema section is refreshed per-message so the agent
 always has accurate column information.
 
+Rendered prompts are memoized per template (date, source signature and
+schema, column samples, interactive flag, contacts and the environment
+settings the text depends on), so every session built for the same
+template gets a byte-identical prompt and the provider's prompt cache can
+reuse it. A resumed session's prior conversation is appended after the
+shared text rather than spliced into it, keeping the common prefix intact.
+
 Example:
     prompt = build_system_prompt(source_info=svc.get_source_info())
 """
 
+import hashlib
+import json
+import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
 from datetime import UTC, datetime
 
 from src.orchestrator.filter_schema_inference import (
@@ -21,11 +35,15 @@ from src.orchestrator.models.filter_spec import FilterOperator
 from src.orchestrator.models.intent import SERVICE_ALIASES, ServiceCode
 from src.services.data_source_mcp_client import DataSourceInfo
 from src.services.filter_constants import BUSINESS_PREDICATES, REGIONS
+from src.services.metrics import SYSTEM_PROMPT_BUILD_SECONDS, SYSTEM_PROMPT_CHARS
+
+logger = logging.getLogger(__name__)
 
 # International service codes for labeling
 _INTERNATIONAL_SERVICES = frozenset({"07", "08", "11", "54", "65"})
 _MAX_SCHEMA_SAMPLES = 5
 MAX_PROMPT_CONTACTS = 20
+_PROMPT_CACHE_MAX_ENTRIES = 32
 
 FILE_IMPORT_INSTRUCTIONS = """
 ## File Import Decision Tree
@@ -375,6 +393,24 @@ def _build_prior_conversation_section(
     return "\n".join(lines)
 
 
+type _PromptKey = tuple[str, bool, str, str, str, str, str, bool]
+
+_prompt_lock = threading.Lock()
+_prompt_cache: OrderedDict[_PromptKey, str] = OrderedDict()
+
+
+def _digest(value: object) -> str:
+    """Return a stable fingerprint of a JSON-serializable prompt input."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def clear_prompt_cache() -> None:
+    """Drop every memoized prompt (used by tests and after config reloads)."""
+    with _prompt_lock:
+        _prompt_cache.clear()
+
+
 def build_system_prompt(
     source_info: DataSourceInfo | None = None,
     interactive_shipping: bool = False,
@@ -392,6 +428,10 @@ def build_system_prompt(
     (default), these sections are omitted entirely, keeping the agent
     focused on batch operations only.
 
+    The shared text is served from a bounded in-process memo keyed by every
+    input it depends on; only the prior-conversation section is rendered
+    per call and appended at the end.
+
     Args:
         source_info: Current data source metadata. None if no source connected.
         interactive_shipping: Whether interactive single-shipment mode is enabled.
@@ -402,7 +442,70 @@ def build_system_prompt(
     Returns:
         Complete system prompt string.
     """
+    started = time.perf_counter()
     current_date = datetime.now(UTC).strftime("%Y-%m-%d")
+    shopify_configured = False
+    if source_info is None and not interactive_shipping:
+        from src.services.runtime_credentials import resolve_shopify_credentials
+        shopify_configured = resolve_shopify_credentials() is not None
+
+    key: _PromptKey = (
+        current_date,
+        interactive_shipping,
+        _digest(asdict(source_info)) if source_info is not None else "",
+        _digest(column_samples) if column_samples else "",
+        _digest(contacts) if contacts else "",
+        os.environ.get("INTERNATIONAL_ENABLED_LANES", ""),
+        str(_resolve_sample_char_limit()),
+        shopify_configured,
+    )
+    with _prompt_lock:
+        prompt = _prompt_cache.get(key)
+        if prompt is not None:
+            _prompt_cache.move_to_end(key)
+    outcome = "hit"
+    if prompt is None:
+        outcome = "miss"
+        prompt = _render_prompt(
+            source_info,
+            interactive_shipping,
+            column_samples,
+            contacts,
+            current_date,
+            shopify_configured,
+        )
+        with _prompt_lock:
+            _prompt_cache[key] = prompt
+            while len(_prompt_cache) > _PROMPT_CACHE_MAX_ENTRIES:
+                _prompt_cache.popitem(last=False)
+
+    # Prior conversation goes last so resumed sessions share the prefix.
+    if prior_conversation:
+        prior_section = _build_prior_conversation_section(prior_conversation)
+        if prior_section:
+            prompt = f"{prompt}\n{prior_section}\n"
+
+    elapsed = time.perf_counter() - started
+    SYSTEM_PROMPT_BUILD_SECONDS.labels(outcome).observe(elapsed)
+    SYSTEM_PROMPT_CHARS.observe(len(prompt))
+    logger.debug(
+        "System prompt built: cache=%s chars=%d elapsed_ms=%.2f",
+        outcome,
+        len(prompt),
+        elapsed * 1000,
+    )
+    return prompt
+
+
+def _render_prompt(
+    source_info: DataSourceInfo | None,
+    interactive_shipping: bool,
+    column_samples: dict[str, list] | None,
+    contacts: list[dict] | None,
+    current_date: str,
+    shopify_configured: bool,
+) -> str:
+    """Render the shared prompt text for one template (see build_system_prompt)."""
     service_table = _build_service_table()
 
     # Data source section — interactive mode suppresses schema details.
@@ -416,8 +519,6 @@ def build_system_prompt(
     elif source_info is not None:
         data_section = _build_schema_section(source_info, column_samples=column_samples)
     else:
-        from src.services.runtime_credentials import resolve_shopify_credentials
-        shopify_configured = resolve_shopify_credentials() is not None
         if shopify_configured:
             data_section = (
                 "No data source imported yet, but Shopify credentials are configured "
@@ -699,11 +800,6 @@ administrator.
     # Build contacts section if contacts are provided
     contacts_section = _build_contacts_section(contacts) if contacts else ""
 
-    # Prior conversation section for session resume
-    prior_section = ""
-    if prior_conversation:
-        prior_section = _build_prior_conversation_section(prior_conversation)
-
     return f"""You are ShipAgent, an AI shipping assistant that helps users create, rate, and manage UPS shipments from their data sources.
 
 Current date (UTC): {current_date}
@@ -717,7 +813,6 @@ Current date (UTC): {current_date}
 
 {data_section}
 {contacts_section}
-{prior_section}
 ## Filter Generation Rules
 
 {filter_rules_section}
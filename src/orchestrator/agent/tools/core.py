@@ -5,7 +5,6 @@ UPS client cache, row normalization utilities, and preview helpers.
 All tool handler submodules import from here.
 """
 
-import hashlib
 import json
 import logging
 import re
@@ -15,7 +14,7 @@ from uuid import uuid4
 
 from src.db.connection import get_db_context
 from src.mcp.data_source.models import SOURCE_ROW_NUM_COLUMN
-from src.services.audit_service import AuditService, EventType
+from src.services.audit_service import AuditService, EventType, LogLevel
 from src.services.column_mapping import (
     apply_mapping,
     auto_map_columns,
@@ -31,12 +30,14 @@ from src.services.mapping_cache import (
     compute_mapping_hash,
     get_or_compute_mapping_with_diagnostics,
 )
+from src.services.order_data_codec import decode_order_data, encode_order_data
 from src.services.ups_service_codes import (
     SERVICE_ALIASES,
     SERVICE_CODE_NAMES,
     ServiceCode,
     translate_service_name,
 )
+from src.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,9 @@ class EventEmitterBridge:
         self.last_resolved_filter_command: str | None = None
         self.last_resolved_filter_schema_signature: str | None = None
         self.confirmed_resolutions: dict[str, Any] = {}
+        # traceparent of the current conversation turn; SDK tool handlers
+        # may run outside the turn's context, so tool spans parent on this.
+        self.traceparent: str | None = None
         self._fetched_rows_cache: dict[str, list[dict[str, Any]]] = {}
         self._fetched_rows_order: list[str] = []
 
@@ -160,10 +164,16 @@ def _bind_bridge(
     handler: Callable[..., Any],
     bridge: "EventEmitterBridge",
 ) -> Callable[[dict[str, Any]], Any]:
-    """Bind an EventEmitterBridge to a tool handler."""
+    """Bind an EventEmitterBridge to a tool handler.
+
+    Each call runs in an ``agent.tool.<name>`` span continuing the
+    conversation turn's trace.
+    """
+    span_name = "agent.tool." + handler.__name__.removesuffix("_tool")
 
     async def _wrapped(args: dict[str, Any]) -> Any:
-        return await handler(args, bridge=bridge)
+        with span(span_name, parent=bridge.traceparent):
+            return await handler(args, bridge=bridge)
 
     return _wrapped
 
@@ -191,9 +201,9 @@ async def _persist_job_source_signature(
         return
 
     try:
-        audit = AuditService(db)
-        audit.log_info(
+        await AuditService(db).log_async(
             job_id=job_id,
+            level=LogLevel.INFO,
             event_type=EventType.row_event,
             message="job_source_signature",
             details={"source_signature": signature},
@@ -237,8 +247,7 @@ def _build_job_row_data(
             or idx
         )
         row.pop("_checksum", None)  # Clean MCP metadata before serialization
-        row_json = json.dumps(row, sort_keys=True, default=str)
-        checksum = hashlib.md5(row_json.encode()).hexdigest()
+        row_json, checksum = encode_order_data(row)
         row_data.append(
             {
                 "row_number": source_row,
@@ -319,8 +328,7 @@ def _build_job_row_data_with_metadata(
             or idx
         )
         row.pop("_checksum", None)
-        row_json = json.dumps(row, sort_keys=True, default=str)
-        checksum = hashlib.md5(row_json.encode()).hexdigest()
+        row_json, checksum = encode_order_data(row)
         row_data.append(
             {
                 "row_number": source_row,
@@ -501,8 +509,10 @@ def _enrich_preview_rows(job_id: str, preview_rows: list[dict]) -> list[dict]:
         for r in db_rows:
             if r.order_data:
                 try:
-                    row_map[r.row_number] = json.loads(r.order_data)
-                except (json.JSONDecodeError, TypeError):
+                    row_map[r.row_number] = decode_order_data(
+                        r.order_data, job_id=job_id,
+                    )
+                except ValueError:
                     pass
 
     return _enrich_preview_rows_from_map(preview_rows, row_map)
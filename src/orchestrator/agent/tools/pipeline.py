@@ -47,6 +47,7 @@ from src.services.filter_constants import (
 )
 from src.services.job_service import JobService
 from src.services.mapping_cache import MAPPING_VERSION
+from src.services.order_data_codec import decode_order_data
 from src.services.ups_service_codes import translate_service_name
 
 logger = logging.getLogger(__name__)
@@ -1281,8 +1282,8 @@ async def ship_command_pipeline_tool(
                 )
                 for db_row in db_rows:
                     try:
-                        parsed = json.loads(db_row.order_data) if db_row.order_data else {}
-                    except (TypeError, json.JSONDecodeError):
+                        parsed = decode_order_data(db_row.order_data, job_id=job.id)
+                    except ValueError:
                         parsed = {}
                     row_map[db_row.row_number] = parsed
             except Exception as e:
@@ -3,6 +3,9 @@
 Wraps UPS track_package via UPSMCPClient and emits a tracking_result
 event for the frontend TrackingCard. Includes mismatch detection for
 sandbox environments where UPS may return a different tracking number.
+
+Lookups read the stored tracking status first (see tracking_service) and
+only call UPS when it is missing or older than TRACKING_CACHE_TTL_S.
 """
 
 from __future__ import annotations
@@ -18,18 +21,71 @@ from src.orchestrator.agent.tools.core import (
     _ok,
 )
 from src.services.errors import UPSServiceError
+from src.services.tracking_service import (
+    TrackingService,
+    parse_tracking_response,
+    status_to_event_payload,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _load_cached_status(tracking_number: str) -> dict[str, Any] | None:
+    """Return a fresh stored tracking payload, or None (best-effort)."""
+    from src.db.connection import get_db_context
+
+    try:
+        with get_db_context() as db:
+            status = TrackingService(db).get_fresh(tracking_number)
+            return status_to_event_payload(status) if status else None
+    except Exception as e:
+        logger.debug("Tracking cache lookup failed for %s: %s", tracking_number, e)
+        return None
+
+
+def _store_status(tracking_number: str, parsed: dict[str, Any]) -> None:
+    """Persist a live lookup so later lookups hit local state (best-effort)."""
+    from src.db.connection import get_db_context
+
+    try:
+        with get_db_context() as db:
+            TrackingService(db).record(tracking_number, parsed)
+    except Exception as e:
+        logger.debug("Tracking cache store failed for %s: %s", tracking_number, e)
+
+
+def _payload_from_parsed(
+    tracking_number: str,
+    parsed: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the tracking_result payload from a live lookup."""
+    returned_number = parsed["returned_number"]
+    payload: dict[str, Any] = {
+        "action": "tracked",
+        "success": True,
+        "trackingNumber": returned_number or tracking_number,
+        "currentStatus": parsed["status_code"],
+        "statusDescription": parsed["status_description"],
+        "activities": parsed["activities"],
+    }
+    if parsed["delivery_date"]:
+        payload["deliveryDate"] = parsed["delivery_date"]
+    # Detect mismatch (sandbox returns different tracking numbers)
+    if returned_number and returned_number != tracking_number:
+        payload["mismatch"] = True
+        payload["requestedNumber"] = tracking_number
+    return payload
+
+
 async def track_package_tool(
     args: dict[str, Any],
     bridge: EventEmitterBridge | None = None,
 ) -> dict[str, Any]:
     """Track a UPS package and emit tracking_result event.
 
-    Calls UPS track_package via the MCP client, extracts activity data,
-    and detects tracking number mismatches (common in sandbox mode).
+    Serves a fresh stored status when available; otherwise calls UPS
+    track_package via the MCP client, extracts activity data, stores the
+    result and detects tracking number mismatches (common in sandbox mode).
 
     Args:
         args: Dict with tracking_number (required).
@@ -43,87 +99,25 @@ async def track_package_tool(
         return _err("Missing required parameter: tracking_number")
 
     try:
-        client = await _get_ups_client()
-        raw = await client.track_package(tracking_number=tracking_number)
-
-        # Extract tracking details from UPS response
-        shipment = (
-            raw.get("trackResponse", {})
-            .get("shipment", [{}])
-        )
-        if isinstance(shipment, list):
-            shipment = shipment[0] if shipment else {}
-
-        package = shipment.get("package", [{}])
-        if isinstance(package, list):
-            package = package[0] if package else {}
-
-        # Extract returned tracking number
-        returned_number = package.get("trackingNumber", "")
-
-        # Extract current status
-        current_status = package.get("currentStatus", {})
-        status_desc = current_status.get("description", "")
-        status_code = current_status.get("code", "")
-
-        # Extract delivery date
-        delivery_date = package.get("deliveryDate", [{}])
-        if isinstance(delivery_date, list):
-            delivery_date = delivery_date[0] if delivery_date else {}
-        delivery_date_str = delivery_date.get("date", "") if isinstance(delivery_date, dict) else ""
-
-        # Extract activity history
-        activities_raw = package.get("activity", [])
-        if isinstance(activities_raw, dict):
-            activities_raw = [activities_raw]
-
-        activities = []
-        for act in activities_raw[:20]:  # Cap at 20 most recent
-            location = act.get("location", {})
-            address = location.get("address", {})
-            location_str = ", ".join(
-                p for p in [
-                    address.get("city", ""),
-                    address.get("stateProvince", ""),
-                    address.get("countryCode", ""),
-                ] if p
-            )
-            status = act.get("status", {})
-            activities.append({
-                "date": act.get("date", ""),
-                "time": act.get("time", ""),
-                "location": location_str,
-                "status": status.get("description", ""),
-            })
-
-        # Detect mismatch (sandbox returns different tracking numbers)
-        mismatch = bool(
-            returned_number
-            and returned_number != tracking_number
-        )
-
-        payload: dict[str, Any] = {
-            "action": "tracked",
-            "success": True,
-            "trackingNumber": returned_number or tracking_number,
-            "currentStatus": status_code,
-            "statusDescription": status_desc,
-            "activities": activities,
-        }
-
-        if delivery_date_str:
-            payload["deliveryDate"] = delivery_date_str
-
-        if mismatch:
-            payload["mismatch"] = True
-            payload["requestedNumber"] = tracking_number
+        cached = _load_cached_status(tracking_number)
+        if cached is not None:
+            payload = cached
+        else:
+            client = await _get_ups_client()
+            raw = await client.track_package(tracking_number=tracking_number)
+            parsed = parse_tracking_response(raw)
+            _store_status(tracking_number, parsed)
+            payload = _payload_from_parsed(tracking_number, parsed)
+
+        returned_number = payload["trackingNumber"]
+        mismatch = bool(payload.get("mismatch"))
 
         _emit_event("tracking_result", payload, bridge=bridge)
 
         # Return minimal response — the TrackingCard already displays
         # all details. A verbose response here causes the LLM to
         # paraphrase the same info as redundant text.
-        summary = f"Tracking result displayed for {returned_number or tracking_number}."
+        summary = f"Tracking result displayed for {returned_number}."
         if mismatch:
             summary += (
                 f" Note: UPS returned tracking data for {returned_number} "
@@ -0,0 +1,147 @@
+"""Pluggable pub/sub transport for batch progress events.
+
+A batch runs on whichever worker holds its lease, but the browser tab or
+CLI following it may be connected to any worker behind the load
+balancer. SSEProgressObserver therefore publishes every sequenced event
+to a ProgressBus, and each worker's observer applies the events it
+receives to its own replay buffers. Subscribers on any worker see the
+same event ids, so Last-Event-ID resume works across workers.
+
+Messages are JSON-serializable dicts::
+
+    {"origin": str, "job_id": str, "seq": int, "event": str, "data": dict}
+
+Implementations:
+    InProcessProgressBus: Delivers to local handlers only (default;
+        single-worker deployments).
+    LocalBroker / LocalBrokerBus: An in-memory broker that connects
+        several buses, standing in for a network broker in tests and
+        local multi-observer setups.
+
+Other transports (Redis, NATS, Postgres LISTEN/NOTIFY) plug in through
+PROGRESS_BUS_FACTORY, a ``module:callable`` path returning a
+ProgressBus. publish() must not block: network buses queue outgoing
+messages and deliver incoming ones on the event loop.
+
+Example:
+    observer = SSEProgressObserver(bus=build_progress_bus())
+    await observer.start()
+"""
+
+import importlib
+import logging
+import os
+from collections.abc import Callable
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+ProgressHandler = Callable[[dict[str, Any]], None]
+
+
+class ProgressBus(Protocol):
+    """Transport that fans progress messages out to every worker."""
+
+    def subscribe(self, handler: ProgressHandler) -> None:
+        """Register a handler for every message, including our own."""
+        ...
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Send a message to all subscribed handlers without blocking."""
+        ...
+
+    async def start(self) -> None:
+        """Open connections or consumer tasks."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections or consumer tasks."""
+        ...
+
+
+class InProcessProgressBus:
+    """Delivers messages synchronously to handlers in this process."""
+
+    def __init__(self) -> None:
+        self._handlers: list[ProgressHandler] = []
+
+    def subscribe(self, handler: ProgressHandler) -> None:
+        """Register a handler."""
+        self._handlers.append(handler)
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Deliver a message to every handler."""
+        for handler in self._handlers:
+            handler(message)
+
+    async def start(self) -> None:
+        """No-op: nothing to connect."""
+
+    async def close(self) -> None:
+        """No-op: nothing to release."""
+
+
+class LocalBroker:
+    """In-memory broker shared by several LocalBrokerBus clients.
+
+    Each client stands in for one worker: a message published by any
+    client reaches the handlers of every client, in publish order.
+    """
+
+    def __init__(self) -> None:
+        self._clients: list[LocalBrokerBus] = []
+
+    def connect(self) -> "LocalBrokerBus":
+        """Return a new client bus attached to this broker."""
+        client = LocalBrokerBus(self)
+        self._clients.append(client)
+        return client
+
+    def _route(self, message: dict[str, Any]) -> None:
+        for client in list(self._clients):
+            client._deliver(message)
+
+    def _disconnect(self, client: "LocalBrokerBus") -> None:
+        if client in self._clients:
+            self._clients.remove(client)
+
+
+class LocalBrokerBus(InProcessProgressBus):
+    """One worker's connection to a LocalBroker."""
+
+    def __init__(self, broker: LocalBroker) -> None:
+        super().__init__()
+        self._broker = broker
+
+    def publish(self, message: dict[str, Any]) -> None:
+        """Route a message through the broker to every client."""
+        self._broker._route(message)
+
+    def _deliver(self, message: dict[str, Any]) -> None:
+        super().publish(message)
+
+    async def close(self) -> None:
+        """Detach from the broker."""
+        self._broker._disconnect(self)
+
+
+def build_progress_bus() -> ProgressBus:
+    """Build the bus named by PROGRESS_BUS_FACTORY, or the in-process bus.
+
+    An invalid factory falls back to the in-process bus with a warning,
+    matching how other runtime knobs degrade.
+    """
+    factory_path = os.environ.get("PROGRESS_BUS_FACTORY", "").strip()
+    if not factory_path:
+        return InProcessProgressBus()
+    try:
+        module_name, _, attr = factory_path.partition(":")
+        factory = getattr(importlib.import_module(module_name), attr)
+        return factory()
+    except Exception as e:
+        logger.warning(
+            "Invalid PROGRESS_BUS_FACTORY=%r (%s); using in-process progress bus",
+            factory_path,
+            e,
+        )
+        return InProcessProgressBus()
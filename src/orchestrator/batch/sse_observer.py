@@ -1,57 +1,295 @@
 """SSE Progress Observer for real-time batch event streaming.
 
-Provides a BatchEventObserver implementation that bridges batch events
-to Server-Sent Events (SSE) connections for web clients.
+Provides a BatchEventObserver implementation that fans batch events out
+to any number of Server-Sent Events (SSE) connections for web clients.
+
+Each job owns one bounded ring buffer of sequenced events. Subscribers
+hold their own cursor into that buffer, so every browser tab or CLI
+stream sees every event, and a reconnecting client can resume from its
+``Last-Event-ID``. Bursts of ``row_completed`` events are coalesced into
+periodic cumulative ``batch_progress`` frames so a 10k-row batch costs a
+few frames per second rather than one frame per row per subscriber.
+``row_started`` is folded into the same frames as ``current_row``, and
+pending progress is flushed only ahead of events whose meaning depends on
+it (``row_failed`` and the terminal events).
+
+Events travel through a ProgressBus before reaching the buffers, so with
+a shared bus the observer on every API worker holds the same sequenced
+stream and a client can follow (or resume) a job from any worker.
 """
 
 import asyncio
 import logging
+import time
+import uuid
+from collections import OrderedDict, deque
 from typing import Any
 
+from src.orchestrator.batch.progress_bus import InProcessProgressBus, ProgressBus
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_REPLAY_BUFFER_SIZE = 1024
+DEFAULT_COALESCE_INTERVAL_S = 0.25
+# Finished jobs keep their replay buffer so late reconnects can still resume.
+DEFAULT_MAX_FINISHED_JOBS = 64
+
+_TERMINAL_EVENTS = frozenset({"batch_completed", "batch_failed"})
+
+
+class _JobChannel:
+    """Ring buffer, cumulative counters and subscriber set for one job."""
+
+    def __init__(self, job_id: str, buffer_size: int) -> None:
+        self.job_id = job_id
+        self.events: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+        self.next_seq = 1
+        # Next id this worker assigns when it originates an event.
+        self.emit_seq = 1
+        self.subscribers: set[ProgressSubscription] = set()
+        self.finished = False
+        self.total_rows = 0
+        self.successful = 0
+        self.failed = 0
+        self.total_cost_cents = 0
+        self.last_tracking_number: str | None = None
+        self.current_row: int | None = None
+        self.progress_dirty = False
+        self.last_progress_at = 0.0
+        self.flush_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest buffered event."""
+        return self.events[0]["id"] if self.events else self.next_seq
+
+    def progress_data(self) -> dict[str, Any]:
+        """Build the cumulative progress payload for this job."""
+        return {
+            "job_id": self.job_id,
+            "total_rows": self.total_rows,
+            "processed": self.successful + self.failed,
+            "successful": self.successful,
+            "failed": self.failed,
+            "total_cost_cents": self.total_cost_cents,
+            "last_tracking_number": self.last_tracking_number,
+            "current_row": self.current_row,
+        }
+
+    def publish(self, event: str, data: dict[str, Any], seq: int | None = None) -> None:
+        """Append an event to the ring buffer and wake all subscribers.
+
+        Args:
+            event: Event type name.
+            data: Event payload.
+            seq: Id assigned by the originating worker. A repeated id is
+                dropped; a jump forward discards the buffer so cursors
+                behind it receive a progress snapshot instead of a gap.
+        """
+        if seq is not None and seq != self.next_seq:
+            if seq < self.next_seq:
+                return
+            self.events.clear()
+            self.next_seq = seq
+        self.events.append({"id": self.next_seq, "event": event, "data": data})
+        self.next_seq += 1
+        for subscription in self.subscribers:
+            subscription._wakeup.set()
+
+
+def _apply_remote_counters(
+    channel: _JobChannel, event: str, data: dict[str, Any],
+) -> None:
+    """Fold an event originated on another worker into local counters."""
+    if event == "batch_started":
+        channel.finished = False
+        channel.total_rows = data.get("total_rows", 0)
+        channel.successful = 0
+        channel.failed = 0
+        channel.total_cost_cents = 0
+        channel.last_tracking_number = None
+        channel.current_row = None
+    elif event == "batch_progress":
+        channel.total_rows = data.get("total_rows", channel.total_rows)
+        channel.successful = data.get("successful", channel.successful)
+        channel.failed = data.get("failed", channel.failed)
+        channel.total_cost_cents = data.get("total_cost_cents", channel.total_cost_cents)
+        channel.last_tracking_number = data.get("last_tracking_number")
+        channel.current_row = data.get("current_row")
+    elif event == "row_started":
+        channel.current_row = data.get("row_number")
+    elif event == "row_completed":
+        channel.successful += 1
+        channel.total_cost_cents += data.get("cost_cents", 0)
+        if data.get("tracking_number"):
+            channel.last_tracking_number = data["tracking_number"]
+    elif event == "row_failed":
+        channel.failed += 1
+
+
+class ProgressSubscription:
+    """One subscriber's cursor into a job's replay buffer.
+
+    ``get()`` mirrors ``asyncio.Queue.get()`` so existing consumers can
+    await it in the same way. Returned events carry an ``id`` key that is
+    the monotonically increasing SSE event id for the job.
+    """
+
+    def __init__(self, channel: _JobChannel, cursor: int) -> None:
+        self.job_id = channel.job_id
+        self._channel = channel
+        self._cursor = cursor
+        self._wakeup = asyncio.Event()
+
+    def _next_event(self) -> dict[str, Any] | None:
+        """Return the next event at the cursor, or None when caught up."""
+        channel = self._channel
+        if self._cursor < channel.oldest_seq:
+            # Fell behind the ring buffer (or resumed from an evicted id):
+            # hand over a cumulative snapshot instead of the lost events.
+            self._cursor = channel.oldest_seq
+            return {
+                "id": self._cursor - 1,
+                "event": "batch_progress",
+                "data": channel.progress_data(),
+            }
+        if self._cursor >= channel.next_seq:
+            return None
+        event = channel.events[self._cursor - channel.oldest_seq]
+        self._cursor += 1
+        return event
+
+    async def get(self) -> dict[str, Any]:
+        """Wait for and return the next event for this subscriber."""
+        while True:
+            self._wakeup.clear()
+            event = self._next_event()
+            if event is not None:
+                return event
+            await self._wakeup.wait()
+
+    def get_nowait(self) -> dict[str, Any] | None:
+        """Return the next buffered event without waiting, or None."""
+        return self._next_event()
+
+    @property
+    def lag(self) -> int:
+        """Number of buffered events this subscriber has not consumed."""
+        return self._channel.next_seq - max(self._cursor, self._channel.oldest_seq)
+
 
 class SSEProgressObserver:
-    """Observer that bridges batch events to SSE connections.
+    """Observer that broadcasts batch events to SSE connections.
 
-    Implements the BatchEventObserver protocol and maintains per-job
-    asyncio.Queue instances for SSE event delivery. Web clients subscribe
-    to a job's queue to receive real-time progress updates.
+    Implements the BatchEventObserver protocol and maintains one bounded
+    replay buffer per job. Web clients subscribe to receive their own
+    cursor over that buffer; no subscriber can starve or steal events
+    from another.
 
-    Thread-safe for concurrent subscriptions and event emissions.
+    All methods run on the event loop thread; no cross-thread locking.
     """
 
-    def __init__(self) -> None:
-        """Initialize observer with empty subscription map."""
-        self._queues: dict[str, asyncio.Queue[dict[str, Any]]] = {}
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_REPLAY_BUFFER_SIZE,
+        coalesce_interval_s: float = DEFAULT_COALESCE_INTERVAL_S,
+        max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS,
+        bus: ProgressBus | None = None,
+    ) -> None:
+        """Initialize observer with empty channel map.
 
-    def subscribe(self, job_id: str) -> asyncio.Queue[dict[str, Any]]:
-        """Create a queue for SSE events for a specific job.
+        Args:
+            buffer_size: Events retained per job for replay/resume.
+            coalesce_interval_s: Minimum spacing of ``batch_progress``
+                frames. Zero disables coalescing and emits every
+                ``row_completed`` event as-is.
+            max_finished_jobs: Completed jobs whose buffers are retained.
+            bus: Transport shared with other workers' observers; defaults
+                to an in-process bus.
+        """
+        self._buffer_size = max(1, buffer_size)
+        self._coalesce_interval_s = max(0.0, coalesce_interval_s)
+        self._max_finished_jobs = max(0, max_finished_jobs)
+        self._channels: OrderedDict[str, _JobChannel] = OrderedDict()
+        self._origin = uuid.uuid4().hex
+        self._bus = bus or InProcessProgressBus()
+        self._bus.subscribe(self._deliver)
+
+    async def start(self) -> None:
+        """Start the progress bus (connect to a shared broker, if any)."""
+        await self._bus.start()
+
+    async def close(self) -> None:
+        """Stop the progress bus."""
+        await self._bus.close()
+
+    def _channel(self, job_id: str) -> _JobChannel:
+        """Return the channel for a job, creating it on first use."""
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = _JobChannel(job_id, self._buffer_size)
+            self._channels[job_id] = channel
+        return channel
+
+    def subscribe(
+        self,
+        job_id: str,
+        last_event_id: int | None = None,
+    ) -> ProgressSubscription:
+        """Create an independent subscription to a job's events.
 
-        If a queue already exists for the job, returns the existing queue.
-        This supports multiple browser tabs viewing the same job.
+        Without ``last_event_id`` the subscriber starts at the live tail and
+        only sees events published from now on. With it, delivery resumes
+        right after that id; if the id has already been evicted from the
+        ring buffer, the subscriber first receives a ``batch_progress``
+        snapshot.
 
         Args:
             job_id: Unique identifier for the batch job.
+            last_event_id: Id of the last event the client received.
 
         Returns:
-            asyncio.Queue for receiving SSE events.
+            ProgressSubscription with its own cursor.
         """
-        if job_id not in self._queues:
-            self._queues[job_id] = asyncio.Queue()
-            logger.debug("Created SSE subscription for job %s", job_id)
-        return self._queues[job_id]
+        channel = self._channel(job_id)
+        if last_event_id is None:
+            cursor = channel.next_seq
+        else:
+            cursor = min(max(last_event_id + 1, 1), channel.next_seq)
+        subscription = ProgressSubscription(channel, cursor)
+        channel.subscribers.add(subscription)
+        logger.debug(
+            "Created SSE subscription for job %s (%d active)",
+            job_id,
+            len(channel.subscribers),
+        )
+        return subscription
 
-    def unsubscribe(self, job_id: str) -> None:
-        """Remove queue when client disconnects.
+    def unsubscribe(
+        self,
+        job_id: str,
+        subscription: ProgressSubscription | None = None,
+    ) -> None:
+        """Remove a subscription when its client disconnects.
 
-        Safely removes the queue if it exists. No-op if job_id not found.
+        Safely no-ops if the job or subscription is unknown. Passing no
+        subscription removes every subscriber of the job.
 
         Args:
             job_id: Unique identifier for the batch job.
+            subscription: The subscription returned by ``subscribe``.
         """
-        if self._queues.pop(job_id, None) is not None:
-            logger.debug("Removed SSE subscription for job %s", job_id)
+        channel = self._channels.get(job_id)
+        if channel is None:
+            return
+        if subscription is None:
+            channel.subscribers.clear()
+        else:
+            channel.subscribers.discard(subscription)
+        logger.debug("Removed SSE subscription for job %s", job_id)
+        if not channel.subscribers and not channel.events:
+            # Nothing to replay; drop the placeholder channel.
+            self._channels.pop(job_id, None)
 
     def has_subscribers(self, job_id: str) -> bool:
         """Check if a job has active SSE subscribers.
@@ -62,18 +300,113 @@ class SSEProgressObserver:
         Returns:
             True if there are active subscribers for this job.
         """
-        return job_id in self._queues
+        channel = self._channels.get(job_id)
+        return bool(channel and channel.subscribers)
+
+    def subscriber_count(self, job_id: str) -> int:
+        """Return the number of active subscribers for a job."""
+        channel = self._channels.get(job_id)
+        return len(channel.subscribers) if channel else 0
+
+    def total_subscribers(self) -> int:
+        """Return the number of active subscribers across all jobs."""
+        return sum(len(channel.subscribers) for channel in self._channels.values())
+
+    def max_subscriber_lag(self) -> int:
+        """Return the largest unconsumed event count of any subscriber."""
+        return max(
+            (
+                subscription.lag
+                for channel in self._channels.values()
+                for subscription in channel.subscribers
+            ),
+            default=0,
+        )
 
-    async def _emit(self, job_id: str, event: str, data: dict[str, Any]) -> None:
-        """Emit an event to the job's queue if subscribed.
+    async def _emit(
+        self,
+        job_id: str,
+        event: str,
+        data: dict[str, Any],
+        flush: bool = False,
+    ) -> None:
+        """Publish an event to the job's replay buffer.
 
         Args:
             job_id: Unique identifier for the batch job.
             event: Event type name.
             data: Event payload data.
+            flush: Publish pending coalesced progress first, so subscribers
+                observe counters that include every row preceding this
+                event. Only failures and terminal events need this;
+                flushing on every event would defeat coalescing.
+        """
+        channel = self._channel(job_id)
+        if flush:
+            self._flush_progress(channel)
+        self._publish(channel, event, data)
+
+    def _publish(self, channel: _JobChannel, event: str, data: dict[str, Any]) -> None:
+        """Assign the next event id for a job and send the event on the bus."""
+        seq = max(channel.emit_seq, channel.next_seq)
+        channel.emit_seq = seq + 1
+        self._bus.publish({
+            "origin": self._origin,
+            "job_id": channel.job_id,
+            "seq": seq,
+            "event": event,
+            "data": data,
+        })
+
+    def _deliver(self, message: dict[str, Any]) -> None:
+        """Apply a bus message to the job's replay buffer.
+
+        Events from other workers also update this worker's cumulative
+        counters, so snapshots served here match the originating worker.
         """
-        if queue := self._queues.get(job_id):
-            await queue.put({"event": event, "data": data})
+        channel = self._channel(message["job_id"])
+        event = message["event"]
+        data = message["data"]
+        if message.get("origin") != self._origin:
+            _apply_remote_counters(channel, event, data)
+        channel.publish(event, data, message.get("seq"))
+        if event in _TERMINAL_EVENTS:
+            self._finish(channel)
+
+    def _flush_progress(self, channel: _JobChannel) -> None:
+        """Publish a ``batch_progress`` frame if counters changed."""
+        if channel.flush_handle is not None:
+            channel.flush_handle.cancel()
+            channel.flush_handle = None
+        if not channel.progress_dirty:
+            return
+        channel.progress_dirty = False
+        channel.last_progress_at = time.monotonic()
+        self._publish(channel, "batch_progress", channel.progress_data())
+
+    def _schedule_progress(self, channel: _JobChannel) -> None:
+        """Publish now, or arm a single timer for the next progress frame."""
+        channel.progress_dirty = True
+        elapsed = time.monotonic() - channel.last_progress_at
+        if elapsed >= self._coalesce_interval_s:
+            self._flush_progress(channel)
+            return
+        if channel.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            channel.flush_handle = loop.call_later(
+                self._coalesce_interval_s - elapsed,
+                self._flush_progress,
+                channel,
+            )
+
+    def _finish(self, channel: _JobChannel) -> None:
+        """Mark a job finished and evict the oldest finished buffers."""
+        channel.finished = True
+        self._channels.move_to_end(channel.job_id)
+        finished = [c for c in self._channels.values() if c.finished]
+        for stale in finished[: max(0, len(finished) - self._max_finished_jobs)]:
+            if not stale.subscribers:
+                self._channels.pop(stale.job_id, None)
 
     # BatchEventObserver protocol implementation
 
@@ -84,6 +417,19 @@ class SSEProgressObserver:
             job_id: Unique identifier for the batch job.
             total_rows: Total number of rows in the batch.
         """
+        channel = self._channel(job_id)
+        channel.finished = False
+        channel.total_rows = total_rows
+        channel.successful = 0
+        channel.failed = 0
+        channel.total_cost_cents = 0
+        channel.last_tracking_number = None
+        channel.current_row = None
+        # Progress still pending from a previous run is superseded.
+        if channel.flush_handle is not None:
+            channel.flush_handle.cancel()
+            channel.flush_handle = None
+        channel.progress_dirty = False
         await self._emit(
             job_id,
             "batch_started",
@@ -93,10 +439,16 @@ class SSEProgressObserver:
     async def on_row_started(self, job_id: str, row_number: int) -> None:
         """Handle row started event.
 
+        Recorded as ``current_row`` on the next progress frame rather than
+        sent on its own, unless coalescing is disabled.
+
         Args:
             job_id: Unique identifier for the batch job.
             row_number: 1-based row number being processed.
         """
+        self._channel(job_id).current_row = row_number
+        if self._coalesce_interval_s > 0:
+            return
         await self._emit(
             job_id,
             "row_started",
@@ -112,22 +464,33 @@ class SSEProgressObserver:
     ) -> None:
         """Handle row completed event.
 
+        Folded into the job's cumulative counters and emitted as a
+        coalesced ``batch_progress`` frame unless coalescing is disabled.
+
         Args:
             job_id: Unique identifier for the batch job.
             row_number: 1-based row number that completed.
             tracking_number: UPS tracking number for the shipment.
             cost_cents: Cost of the shipment in cents.
         """
-        await self._emit(
-            job_id,
-            "row_completed",
-            {
-                "job_id": job_id,
-                "row_number": row_number,
-                "tracking_number": tracking_number,
-                "cost_cents": cost_cents,
-            },
-        )
+        channel = self._channel(job_id)
+        channel.successful += 1
+        channel.total_cost_cents += cost_cents
+        if tracking_number:
+            channel.last_tracking_number = tracking_number
+        if self._coalesce_interval_s == 0:
+            await self._emit(
+                job_id,
+                "row_completed",
+                {
+                    "job_id": job_id,
+                    "row_number": row_number,
+                    "tracking_number": tracking_number,
+                    "cost_cents": cost_cents,
+                },
+            )
+            return
+        self._schedule_progress(channel)
 
     async def on_row_failed(
         self,
@@ -138,12 +501,15 @@ class SSEProgressObserver:
     ) -> None:
         """Handle row failed event.
 
+        Failures are never coalesced: each carries its own error detail.
+
         Args:
             job_id: Unique identifier for the batch job.
             row_number: 1-based row number that failed.
             error_code: Error code from the error registry.
             error_message: Human-readable error description.
         """
+        self._channel(job_id).failed += 1
         await self._emit(
             job_id,
             "row_failed",
@@ -153,6 +519,7 @@ class SSEProgressObserver:
                 "error_code": error_code,
                 "error_message": error_message,
             },
+            flush=True,
         )
 
     async def on_batch_completed(
@@ -185,6 +552,7 @@ class SSEProgressObserver:
                 "duties_taxes_cents": duties_taxes_cents,
                 "international_row_count": international_row_count,
             },
+            flush=True,
         )
 
     async def on_batch_failed(
@@ -217,4 +585,5 @@ class SSEProgressObserver:
                 "duties_taxes_cents": duties_taxes_cents,
                 "international_row_count": international_row_count,
             },
+            flush=True,
         )
@@ -5,18 +5,25 @@ and audit logging.
 """
 
 from src.services.audit_service import (
+    AsyncAuditService,
     AuditService,
     EventType,
     LogLevel,
     redact_sensitive,
 )
 from src.services.decision_audit_service import DecisionAuditService
-from src.services.job_service import InvalidStateTransition, JobService
+from src.services.job_service import (
+    AsyncJobService,
+    InvalidStateTransition,
+    JobService,
+)
 
 __all__ = [
     "JobService",
+    "AsyncJobService",
     "InvalidStateTransition",
     "AuditService",
+    "AsyncAuditService",
     "redact_sensitive",
     "LogLevel",
     "EventType",
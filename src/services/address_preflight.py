@@ -0,0 +1,394 @@
+"""Address validation pre-flight for batch preview and execution.
+
+Before rating or shipping, a batch's destination addresses are deduped by a
+normalized key (line1/city/state/ZIP5/country) and looked up in the
+persistent ``address_validations`` cache. Only cache misses are sent to UPS
+address validation, concurrently. Results are written back into each row's
+order_data so rating and shipment building see corrected fields:
+
+- ``address_validation``: {"status", "candidates", "residential"}
+- ``address_corrections``: list of {"field", "from", "to"} applied
+- ``ship_to_residential``: set from UPS classification when not provided
+
+UPS street-level validation covers US and Puerto Rico only; other
+destinations are skipped.
+
+Controlled by ADDRESS_PREFLIGHT_MODE:
+    off (default): no pre-flight.
+    annotate: validate and correct, never block rows.
+    enforce: additionally fail rows whose address UPS reports as invalid
+        before any shipment is created.
+
+Example:
+    preflight = build_address_preflight(ups, db)
+    if preflight is not None:
+        await preflight.run([plan.order_data(r) for r in rows])
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.db.bulk import upsert_rows
+from src.db.models import AddressValidation
+
+logger = logging.getLogger(__name__)
+
+PREFLIGHT_MODES = frozenset({"off", "annotate", "enforce"})
+
+# Countries supported by UPS street-level address validation.
+VALIDATED_COUNTRIES = frozenset({"US", "PR"})
+
+DEFAULT_CACHE_TTL_DAYS = 30
+
+# Max address keys bound into a single IN (...) clause.
+_IN_CLAUSE_CHUNK = 500
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[.,#]")
+
+
+def resolve_preflight_mode() -> str:
+    """Resolve ADDRESS_PREFLIGHT_MODE with safe fallback to 'off'."""
+    raw = os.environ.get("ADDRESS_PREFLIGHT_MODE", "off").strip().lower()
+    if raw not in PREFLIGHT_MODES:
+        logger.warning("Invalid ADDRESS_PREFLIGHT_MODE=%r, defaulting to off", raw)
+        return "off"
+    return raw
+
+
+def _resolve_ttl_days() -> float:
+    raw = os.environ.get(
+        "ADDRESS_VALIDATION_CACHE_TTL_DAYS", str(DEFAULT_CACHE_TTL_DAYS),
+    )
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning(
+            "Invalid ADDRESS_VALIDATION_CACHE_TTL_DAYS=%r, defaulting to %d",
+            raw,
+            DEFAULT_CACHE_TTL_DAYS,
+        )
+        return float(DEFAULT_CACHE_TTL_DAYS)
+
+
+def _clean(value: Any) -> str:
+    text = _PUNCT_RE.sub(" ", str(value or ""))
+    return _WS_RE.sub(" ", text).strip().upper()
+
+
+def normalized_address(order_data: dict[str, Any]) -> dict[str, str] | None:
+    """Return the normalized address fields used for dedupe and lookup.
+
+    Args:
+        order_data: Parsed row order data.
+
+    Returns:
+        Dict with line1, city, state, zip5 and country, or None when the
+        address is incomplete or outside VALIDATED_COUNTRIES.
+    """
+    country = _clean(order_data.get("ship_to_country")) or "US"
+    if country not in VALIDATED_COUNTRIES:
+        return None
+    line1 = _clean(order_data.get("ship_to_address1"))
+    city = _clean(order_data.get("ship_to_city"))
+    state = _clean(order_data.get("ship_to_state"))
+    zip5 = re.sub(r"\D", "", str(order_data.get("ship_to_postal_code") or ""))[:5]
+    if not line1 or not (zip5 or (city and state)):
+        return None
+    return {
+        "line1": line1,
+        "city": city,
+        "state": state,
+        "zip5": zip5,
+        "country": country,
+    }
+
+
+def address_key(normalized: dict[str, str]) -> str:
+    """Hash normalized address fields into a stable cache key."""
+    raw = "|".join(
+        normalized[k] for k in ("line1", "city", "state", "zip5", "country")
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def apply_validation(
+    order_data: dict[str, Any],
+    result: dict[str, Any],
+) -> list[dict[str, str]]:
+    """Write a validation result back into order_data.
+
+    City, state and ZIP are corrected only when UPS reports the address as
+    valid with exactly one candidate; street lines are never rewritten.
+
+    Args:
+        order_data: Row order data (mutated in place).
+        result: Dict with status, candidates and optional residential.
+
+    Returns:
+        List of corrections applied.
+    """
+    status = result.get("status", "unknown")
+    candidates = result.get("candidates", [])
+    residential = result.get("residential")
+    if residential is None and len(candidates) == 1:
+        residential = candidates[0].get("residential")
+
+    order_data["address_validation"] = {
+        "status": status,
+        "candidates": candidates,
+        "residential": residential,
+    }
+
+    corrections: list[dict[str, str]] = []
+    if status == "valid" and len(candidates) == 1:
+        candidate = candidates[0]
+        current_zip5 = re.sub(
+            r"\D", "", str(order_data.get("ship_to_postal_code") or ""),
+        )[:5]
+        for field, value in (
+            ("ship_to_city", candidate.get("city", "")),
+            ("ship_to_state", candidate.get("stateProvinceCode", "")),
+        ):
+            current = str(order_data.get(field) or "")
+            if value and _clean(current) != _clean(value):
+                corrections.append({"field": field, "from": current, "to": value})
+                order_data[field] = value
+        postal = candidate.get("postalCode", "")
+        if postal and postal != current_zip5:
+            current = str(order_data.get("ship_to_postal_code") or "")
+            corrections.append(
+                {"field": "ship_to_postal_code", "from": current, "to": postal},
+            )
+            order_data["ship_to_postal_code"] = postal
+
+    if residential is not None and "ship_to_residential" not in order_data:
+        order_data["ship_to_residential"] = residential
+
+    if corrections:
+        order_data["address_corrections"] = corrections
+    return corrections
+
+
+def invalid_address_reason(order_data: dict[str, Any]) -> str | None:
+    """Return a failure reason when pre-flight marked the address invalid.
+
+    Args:
+        order_data: Row order data after AddressPreflight.run().
+
+    Returns:
+        Human-readable reason, or None when the address may be shipped.
+    """
+    validation = order_data.get("address_validation") or {}
+    if validation.get("status") != "invalid":
+        return None
+    return (
+        "UPS address validation found no matching address for "
+        f"{order_data.get('ship_to_address1', '')}, "
+        f"{order_data.get('ship_to_city', '')}, "
+        f"{order_data.get('ship_to_state', '')} "
+        f"{order_data.get('ship_to_postal_code', '')}"
+    ).strip()
+
+
+class AddressValidationCache:
+    """Persistent TTL cache of UPS address validation results."""
+
+    def __init__(self, db: Session, ttl_days: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            db: SQLAlchemy session.
+            ttl_days: Entry lifetime; defaults to ADDRESS_VALIDATION_CACHE_TTL_DAYS.
+        """
+        self._db = db
+        self._ttl = timedelta(
+            days=_resolve_ttl_days() if ttl_days is None else ttl_days,
+        )
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Return unexpired cached results for the given keys.
+
+        Args:
+            keys: Address keys to look up.
+
+        Returns:
+            Mapping of key to validation result for cache hits.
+        """
+        cutoff = (datetime.now(UTC) - self._ttl).isoformat()
+        hits: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(keys), _IN_CLAUSE_CHUNK):
+            chunk = keys[start:start + _IN_CLAUSE_CHUNK]
+            entries = (
+                self._db.query(AddressValidation)
+                .filter(AddressValidation.address_key.in_(chunk))
+                .filter(AddressValidation.validated_at >= cutoff)
+                .all()
+            )
+            for entry in entries:
+                hits[entry.address_key] = {
+                    "status": entry.status,
+                    "candidates": json.loads(entry.candidates_json or "[]"),
+                    "residential": entry.residential,
+                }
+        return hits
+
+    def put_many(self, results: dict[str, tuple[str, dict[str, Any]]]) -> bool:
+        """Store validation results, replacing any existing entries.
+
+        Entries are written with one upsert, so two batches validating the
+        same address concurrently cannot collide on the primary key. The
+        cache is best-effort: a failed write is rolled back and logged, and
+        the caller keeps using the fresh results it already holds.
+
+        Args:
+            results: Mapping of key to (country_code, validation result).
+
+        Returns:
+            True when the entries were stored (or there were none).
+        """
+        if not results:
+            return True
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            {
+                "address_key": key,
+                "country_code": country,
+                "status": result.get("status", "unknown"),
+                "candidates_json": json.dumps(result.get("candidates", [])),
+                "residential": result.get("residential"),
+                "validated_at": now,
+            }
+            for key, (country, result) in results.items()
+        ]
+        try:
+            for start in range(0, len(rows), _IN_CLAUSE_CHUNK):
+                upsert_rows(
+                    self._db,
+                    AddressValidation.__table__,
+                    "address_key",
+                    rows[start:start + _IN_CLAUSE_CHUNK],
+                )
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            logger.warning("Failed to cache %d address validations: %s", len(rows), e)
+            return False
+        return True
+
+
+class AddressPreflight:
+    """Dedupe, cache-check and validate a batch's destination addresses."""
+
+    def __init__(
+        self,
+        ups_service: Any,
+        cache: AddressValidationCache,
+        concurrency: int = 5,
+    ) -> None:
+        """Initialize the pre-flight stage.
+
+        Args:
+            ups_service: Client exposing async validate_address().
+            cache: Persistent validation cache.
+            concurrency: Max concurrent UPS validation calls.
+        """
+        self._ups = ups_service
+        self._cache = cache
+        self._concurrency = max(1, concurrency)
+
+    async def run(self, orders: list[dict[str, Any]]) -> dict[str, int]:
+        """Validate and annotate every order in place.
+
+        Args:
+            orders: Parsed order_data dicts (mutated in place).
+
+        Returns:
+            Dict with unique, cache_hits, validated, failed and corrected counts.
+        """
+        groups: dict[str, list[dict[str, Any]]] = {}
+        addresses: dict[str, dict[str, str]] = {}
+        for order in orders:
+            normalized = normalized_address(order)
+            if normalized is None:
+                continue
+            key = address_key(normalized)
+            groups.setdefault(key, []).append(order)
+            addresses.setdefault(key, normalized)
+
+        results = self._cache.get_many(list(groups))
+        cache_hits = len(results)
+        misses = [k for k in groups if k not in results]
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        fresh: dict[str, tuple[str, dict[str, Any]]] = {}
+        failed = 0
+
+        async def _validate(key: str) -> None:
+            nonlocal failed
+            # Validate using the first order's raw fields, not the
+            # upper-cased key, so UPS sees what the user entered.
+            order = groups[key][0]
+            async with semaphore:
+                try:
+                    result = await self._ups.validate_address(
+                        addressLine1=str(order.get("ship_to_address1") or ""),
+                        addressLine2=str(order.get("ship_to_address2") or ""),
+                        city=str(order.get("ship_to_city") or ""),
+                        stateProvinceCode=str(order.get("ship_to_state") or ""),
+                        postalCode=addresses[key]["zip5"],
+                        countryCode=addresses[key]["country"],
+                    )
+                except Exception as e:
+                    failed += 1
+                    logger.warning("Address pre-flight lookup failed: %s", e)
+                    return
+            fresh[key] = (addresses[key]["country"], result)
+
+        await asyncio.gather(*(_validate(k) for k in misses))
+        self._cache.put_many(fresh)
+        results.update({k: r for k, (_, r) in fresh.items()})
+
+        corrected = 0
+        for key, result in results.items():
+            for order in groups[key]:
+                if apply_validation(order, result):
+                    corrected += 1
+
+        stats = {
+            "unique": len(groups),
+            "cache_hits": cache_hits,
+            "validated": len(fresh),
+            "failed": failed,
+            "corrected": corrected,
+        }
+        logger.info("Address pre-flight: %s", stats)
+        return stats
+
+
+def build_address_preflight(
+    ups_service: Any,
+    db: Session,
+    concurrency: int = 5,
+) -> AddressPreflight | None:
+    """Build the pre-flight stage when ADDRESS_PREFLIGHT_MODE enables it.
+
+    Args:
+        ups_service: Client exposing async validate_address().
+        db: SQLAlchemy session for the validation cache.
+        concurrency: Max concurrent UPS validation calls.
+
+    Returns:
+        AddressPreflight, or None when the mode is 'off'.
+    """
+    if resolve_preflight_mode() == "off":
+        return None
+    return AddressPreflight(ups_service, AddressValidationCache(db), concurrency)
@@ -0,0 +1,277 @@
+"""Warm pool of pre-started orchestration agents.
+
+Starting an ``OrchestrationAgent`` spawns the Agent SDK subprocess and its
+MCP servers, which dominates the latency of a conversation's first
+message. The pool keeps a few agents already started so a new session can
+claim one instantly and bind it to itself.
+
+The system prompt and tool set are fixed when the SDK subprocess spawns,
+so pooled agents are not tied to a session but are built for a template:
+the connected source's hash plus the interactive-shipping flag. A session
+claims an agent for the template it would otherwise build, then binds it
+by pointing the agent's event bridge at its session ID. Only one data
+source is connected at a time, so when a claim or refill names a new
+source hash, agents warmed for the previous source are retired.
+
+Pool size follows traffic: each template keeps as many warm agents as it
+had claims in the last ``AGENT_POOL_WINDOW_S`` seconds, bounded by
+``AGENT_POOL_MIN_SIZE`` and ``AGENT_POOL_MAX_SIZE``. Refills run in the
+background after every claim, so the claiming request never waits on them.
+
+Configuration:
+    AGENT_POOL_MAX_SIZE: Warm agents kept per template (default 0, which
+        disables the pool; each warm agent holds an SDK subprocess).
+    AGENT_POOL_MIN_SIZE: Warm agents kept per template with no recent
+        traffic (default 1).
+    AGENT_POOL_WINDOW_S: Traffic window used to size the pool (default 300).
+    AGENT_POOL_MAX_IDLE_S: Seconds a warm agent may sit unclaimed before it
+        is retired, which also bounds how long it runs with credentials
+        or MRU data captured at spawn time (default 600).
+
+Example:
+    agent = await pool.claim(key)
+    if agent is None:
+        agent = await start_agent()
+    pool.refill(key, start_agent)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.services.metrics import AGENT_POOL_CLAIMS, AGENT_STARTUP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# (source hash, interactive_shipping) — the inputs a pooled agent is built for.
+type PoolKey = tuple[str, bool]
+type AgentFactory = Callable[[], Awaitable[Any]]
+
+DEFAULT_MAX_SIZE = 0
+DEFAULT_MIN_SIZE = 1
+DEFAULT_WINDOW_S = 300.0
+DEFAULT_MAX_IDLE_S = 600.0
+
+
+def _resolve_pool_number(env_key: str, default: float) -> float:
+    """Read a non-negative pool setting, falling back to the default when invalid."""
+    raw = os.environ.get(env_key)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if value < 0:
+        logger.warning("Invalid %s=%r, defaulting to %s", env_key, raw, default)
+        return default
+    return value
+
+
+@dataclass
+class _WarmAgent:
+    agent: Any
+    started_at: float
+
+
+class AgentPool:
+    """Pre-started agents claimed by new sessions and refilled in the background.
+
+    Args:
+        max_size: Upper bound of warm agents per template. Defaults to
+            AGENT_POOL_MAX_SIZE; 0 disables the pool.
+        min_size: Warm agents kept per template without recent claims.
+            Defaults to AGENT_POOL_MIN_SIZE.
+        window_s: Seconds of claim history used to size the pool.
+            Defaults to AGENT_POOL_WINDOW_S.
+        max_idle_s: Seconds before an unclaimed agent is retired.
+            Defaults to AGENT_POOL_MAX_IDLE_S.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None = None,
+        min_size: int | None = None,
+        window_s: float | None = None,
+        max_idle_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = int(
+            max_size if max_size is not None
+            else _resolve_pool_number("AGENT_POOL_MAX_SIZE", DEFAULT_MAX_SIZE)
+        )
+        self._min_size = min(
+            self._max_size,
+            int(
+                min_size if min_size is not None
+                else _resolve_pool_number("AGENT_POOL_MIN_SIZE", DEFAULT_MIN_SIZE)
+            ),
+        )
+        self._window_s = (
+            window_s if window_s is not None
+            else _resolve_pool_number("AGENT_POOL_WINDOW_S", DEFAULT_WINDOW_S)
+        )
+        self._max_idle_s = (
+            max_idle_s if max_idle_s is not None
+            else _resolve_pool_number("AGENT_POOL_MAX_IDLE_S", DEFAULT_MAX_IDLE_S)
+        )
+        self._clock = clock
+        self._idle: dict[PoolKey, deque[_WarmAgent]] = {}
+        self._claims: deque[tuple[float, PoolKey]] = deque()
+        self._refills: dict[PoolKey, asyncio.Task[None]] = {}
+        self._retiring: set[asyncio.Task[None]] = set()
+        self._source_hash: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the pool keeps any warm agents."""
+        return self._max_size > 0
+
+    @property
+    def size(self) -> int:
+        """Number of warm agents currently waiting to be claimed."""
+        return sum(len(entries) for entries in self._idle.values())
+
+    def target_size(self, key: PoolKey) -> int:
+        """Return how many warm agents ``key`` should have right now."""
+        if not self.enabled:
+            return 0
+        self._trim_claims()
+        recent = sum(1 for _, claimed in self._claims if claimed == key)
+        return max(self._min_size, min(self._max_size, recent))
+
+    async def claim(self, key: PoolKey) -> Any | None:
+        """Take a warm agent built for ``key``, or None when none is ready.
+
+        Every call counts toward the traffic that sizes the pool, whether
+        or not it finds an agent.
+
+        Args:
+            key: Template the caller would otherwise build an agent for.
+
+        Returns:
+            A started agent the caller now owns, or None.
+        """
+        if not self.enabled:
+            return None
+        self._claims.append((self._clock(), key))
+        self._switch_source(key[0])
+
+        entries = self._idle.get(key)
+        while entries:
+            warm = entries.popleft()
+            if self._clock() - warm.started_at > self._max_idle_s:
+                self._retire(warm.agent)
+                continue
+            if not getattr(warm.agent, "is_started", True):
+                continue
+            AGENT_POOL_CLAIMS.labels("hit").inc()
+            return warm.agent
+        AGENT_POOL_CLAIMS.labels("miss").inc()
+        return None
+
+    def refill(self, key: PoolKey, factory: AgentFactory) -> asyncio.Task[None] | None:
+        """Top up ``key`` to its target size in the background.
+
+        At most one refill runs per template; calling again while one is in
+        flight returns that task.
+
+        Args:
+            key: Template to warm agents for.
+            factory: Coroutine function returning one started agent.
+
+        Returns:
+            The refill task, or None when the pool is disabled.
+        """
+        if not self.enabled:
+            return None
+        running = self._refills.get(key)
+        if running is not None and not running.done():
+            return running
+        task = asyncio.create_task(self._refill(key, factory))
+        self._refills[key] = task
+        return task
+
+    async def close(self) -> None:
+        """Cancel refills and stop every warm agent."""
+        refills = [task for task in self._refills.values() if not task.done()]
+        for task in refills:
+            task.cancel()
+        if refills:
+            await asyncio.gather(*refills, return_exceptions=True)
+        self._refills.clear()
+        for entries in self._idle.values():
+            while entries:
+                self._retire(entries.popleft().agent)
+        self._idle.clear()
+        if self._retiring:
+            await asyncio.gather(*list(self._retiring), return_exceptions=True)
+
+    async def _refill(self, key: PoolKey, factory: AgentFactory) -> None:
+        self._switch_source(key[0])
+        entries = self._idle.setdefault(key, deque())
+        self._retire_expired(entries)
+        while len(entries) > self.target_size(key):
+            self._retire(entries.pop().agent)
+        while len(entries) < self.target_size(key):
+            started = time.perf_counter()
+            try:
+                agent = await factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Leave the pool short; the next claim schedules another try.
+                logger.warning("Agent pool refill failed for %s: %s", key, e)
+                return
+            AGENT_STARTUP_SECONDS.labels("pool").observe(time.perf_counter() - started)
+            if self._source_hash != key[0]:
+                # The source changed while this agent was starting.
+                self._retire(agent)
+                return
+            entries.append(_WarmAgent(agent=agent, started_at=self._clock()))
+        logger.info(
+            "Agent pool warm: interactive=%s size=%d target=%d",
+            key[1],
+            len(entries),
+            self.target_size(key),
+        )
+
+    def _switch_source(self, source_hash: str) -> None:
+        if self._source_hash == source_hash:
+            return
+        self._source_hash = source_hash
+        for key in [k for k in self._idle if k[0] != source_hash]:
+            for warm in self._idle.pop(key):
+                self._retire(warm.agent)
+
+    def _retire_expired(self, entries: deque[_WarmAgent]) -> None:
+        now = self._clock()
+        keep = [w for w in entries if now - w.started_at <= self._max_idle_s]
+        for warm in entries:
+            if now - warm.started_at > self._max_idle_s:
+                self._retire(warm.agent)
+        entries.clear()
+        entries.extend(keep)
+
+    def _trim_claims(self) -> None:
+        horizon = self._clock() - self._window_s
+        while self._claims and self._claims[0][0] < horizon:
+            self._claims.popleft()
+
+    def _retire(self, agent: Any) -> None:
+        async def _stop() -> None:
+            try:
+                await agent.stop()
+            except Exception as e:
+                logger.warning("Error stopping pooled agent: %s", e)
+
+        task = asyncio.create_task(_stop())
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
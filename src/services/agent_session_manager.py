@@ -36,6 +36,8 @@ class AgentSession:
         agent: Persistent OrchestrationAgent instance (None until first message).
         agent_source_hash: Hash of the data source used to build the agent's
             system prompt. If the data source changes, the agent is rebuilt.
+        agent_from_pool: Whether the current agent was claimed pre-started
+            from the warm agent pool.
         interactive_shipping: Whether interactive single-shipment mode is enabled.
         terminating: Whether a DELETE request is in progress for this session.
         lock: Async lock serializing message processing for this session.
@@ -54,6 +56,7 @@ class AgentSession:
         self.last_active = datetime.now(UTC)
         self.agent: Any = None  # OrchestrationAgent, set by conversations route
         self.agent_source_hash: str | None = None
+        self.agent_from_pool: bool = False
         self.interactive_shipping: bool = False
         self.terminating: bool = False
         self.confirmed_resolutions: dict[str, Any] = {}  # token → confirmed ResolvedFilterSpec
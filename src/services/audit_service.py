@@ -19,18 +19,39 @@ Usage:
     export = audit.export_logs_text(job_id)
 """
 
+import base64
 import json
+import logging
+import os
 import re
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.db.models import AuditLog, EventType, LogLevel
+from src.db.bulk import copy_rows
+from src.db.models import AuditLog, EventType, LogLevel, generate_uuid
+from src.db.write_queue import run_write, run_write_async
+
+logger = logging.getLogger(__name__)
+
+# Marks a compressed ``AuditLog.details`` value (see encode_details).
+_COMPRESSED_DETAILS_PREFIX = "zlib:"
+
+# Rows fetched per round trip by the streaming text export.
+_EXPORT_BATCH_SIZE = 500
 
 # Re-export enums for convenience
 __all__ = [
     "AuditService",
+    "decode_details",
+    "export_filename",
+    "log_record",
+    "parse_details",
     "redact_sensitive",
     "LogLevel",
     "EventType",
@@ -135,6 +156,175 @@ def _utc_now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _resolve_audit_int(env_key: str, default: int) -> int:
+    """Read a non-negative integer audit setting from env with safe fallback."""
+    raw = os.environ.get(env_key, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r, defaulting to %d", env_key, raw, default)
+        return default
+
+
+def encode_details(details: dict[str, Any] | None) -> str | None:
+    """Redact and serialize ``details`` into the stored column value.
+
+    Payloads of at least ``AUDIT_DETAILS_COMPRESS_MIN_BYTES`` (0 disables)
+    are zlib-compressed and stored base64-encoded behind a ``zlib:``
+    prefix; ``decode_details`` reverses this.
+
+    Args:
+        details: Structured event data, or None.
+
+    Returns:
+        JSON text (possibly compressed), or None.
+    """
+    if details is None:
+        return None
+    text = json.dumps(redact_sensitive(details))
+    threshold = _resolve_audit_int("AUDIT_DETAILS_COMPRESS_MIN_BYTES", 0)
+    if threshold and len(text) >= threshold:
+        packed = base64.b64encode(zlib.compress(text.encode("utf-8"))).decode("ascii")
+        return _COMPRESSED_DETAILS_PREFIX + packed
+    return text
+
+
+def decode_details(stored: str | None) -> str | None:
+    """Return the JSON text of a stored ``details`` value.
+
+    Args:
+        stored: Raw ``AuditLog.details`` column value.
+
+    Returns:
+        Decompressed JSON text, or the value unchanged if not compressed.
+    """
+    if not stored or not stored.startswith(_COMPRESSED_DETAILS_PREFIX):
+        return stored
+    try:
+        packed = base64.b64decode(stored[len(_COMPRESSED_DETAILS_PREFIX):])
+        return zlib.decompress(packed).decode("utf-8")
+    except (ValueError, zlib.error):
+        return stored
+
+
+def _audit_row(
+    job_id: str,
+    level: LogLevel | str,
+    event_type: EventType | str,
+    message: str,
+    row_number: int | None,
+) -> dict[str, Any]:
+    """Build an ``audit_logs`` row without its ``details`` column."""
+    return {
+        "id": generate_uuid(),
+        "job_id": job_id,
+        "timestamp": _utc_now_iso(),
+        "level": LogLevel(level).value,
+        "event_type": EventType(event_type).value,
+        "message": message,
+        "row_number": row_number,
+    }
+
+
+def _logs_query(
+    job_id: str,
+    level: LogLevel | None,
+    event_type: EventType | None,
+    limit: int | None,
+) -> Select[tuple[AuditLog]]:
+    """Build the job log query shared by the sync and async services."""
+    stmt = select(AuditLog).where(AuditLog.job_id == job_id)
+    if level is not None:
+        stmt = stmt.where(AuditLog.level == level.value)
+    if event_type is not None:
+        stmt = stmt.where(AuditLog.event_type == event_type.value)
+    stmt = stmt.order_by(AuditLog.timestamp.asc())
+    return stmt if limit is None else stmt.limit(limit)
+
+
+def _recent_errors_query(job_id: str, limit: int) -> Select[tuple[AuditLog]]:
+    """Build the newest-first ERROR log query for a job."""
+    return (
+        select(AuditLog)
+        .where(AuditLog.job_id == job_id, AuditLog.level == LogLevel.ERROR.value)
+        .order_by(AuditLog.timestamp.desc())
+        .limit(limit)
+    )
+
+
+def _format_log_lines(log_entry: AuditLog) -> list[str]:
+    """Render one log entry as lines of the plain-text export format."""
+    # Build the main log line
+    row_prefix = f"[Row {log_entry.row_number}] " if log_entry.row_number else ""
+    lines = [
+        f"[{log_entry.timestamp}] [{log_entry.level}] "
+        f"[{log_entry.event_type}] {row_prefix}{log_entry.message}"
+    ]
+
+    # Add details if present
+    details = decode_details(log_entry.details)
+    if details:
+        try:
+            details_dict = json.loads(details)
+            details_formatted = json.dumps(details_dict, indent=4)
+            # Indent each line of the details
+            for detail_line in details_formatted.split("\n"):
+                lines.append(f"    {detail_line}")
+        except json.JSONDecodeError:
+            # If details aren't valid JSON, include as-is
+            lines.append(f"    {details}")
+
+    return lines
+
+
+def parse_details(stored: str | None) -> dict | None:
+    """Decode a stored details payload into a dict.
+
+    Args:
+        stored: ``AuditLog.details`` as stored, compressed or not.
+
+    Returns:
+        Parsed details, ``{"raw": ...}`` for non-JSON payloads, or None
+        when there are no details.
+    """
+    details = decode_details(stored)
+    if not details:
+        return None
+    try:
+        return json.loads(details)
+    except json.JSONDecodeError:
+        return {"raw": details}
+
+
+def log_record(log_entry: AuditLog) -> dict[str, Any]:
+    """Render one log entry as a JSON-ready dict (the NDJSON export record)."""
+    return {
+        "id": log_entry.id,
+        "job_id": log_entry.job_id,
+        "timestamp": log_entry.timestamp,
+        "level": log_entry.level,
+        "event_type": log_entry.event_type,
+        "message": log_entry.message,
+        "details": parse_details(log_entry.details),
+        "row_number": log_entry.row_number,
+    }
+
+
+def export_filename(job_name: str, extension: str = "txt") -> str:
+    """Build the ``{job_name}_logs_{timestamp}.{extension}`` export filename."""
+    # Clean job_name for filesystem
+    clean_name = re.sub(r"[^\w\s-]", "", job_name)  # Remove special chars
+    clean_name = re.sub(r"\s+", "_", clean_name)  # Replace spaces with underscores
+    clean_name = clean_name.strip("_")  # Remove leading/trailing underscores
+
+    # Generate timestamp for filename
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+
+    return f"{clean_name}_logs_{timestamp}.{extension}"
+
+
 class AuditService:
     """Service for job-scoped audit logging with sensitive data redaction.
 
@@ -179,28 +369,85 @@ class AuditService:
         Returns:
             The created AuditLog entry.
         """
-        # Redact and serialize details if provided
-        details_json: str | None = None
-        if details is not None:
-            redacted_details = redact_sensitive(details)
-            details_json = json.dumps(redacted_details)
+        log_entry, insert = self._entry(job_id, level, event_type, message, details, row_number)
+        run_write(insert, self.db)
+        return self._refreshed(log_entry)
 
+    async def log_async(
+        self,
+        job_id: str,
+        level: LogLevel,
+        event_type: EventType,
+        message: str,
+        details: dict[str, Any] | None = None,
+        row_number: int | None = None,
+    ) -> AuditLog:
+        """Create an audit log entry from a coroutine.
+
+        Same as ``log``, but awaits the write queue instead of blocking the
+        event loop while the writer thread commits.
+
+        Returns:
+            The created AuditLog entry.
+        """
+        log_entry, insert = self._entry(job_id, level, event_type, message, details, row_number)
+        await run_write_async(insert, self.db)
+        return self._refreshed(log_entry)
+
+    @staticmethod
+    def _entry(
+        job_id: str,
+        level: LogLevel,
+        event_type: EventType,
+        message: str,
+        details: dict[str, Any] | None,
+        row_number: int | None,
+    ) -> tuple[AuditLog, Callable[[Session], AuditLog]]:
         log_entry = AuditLog(
-            job_id=job_id,
-            timestamp=_utc_now_iso(),
-            level=level.value,
-            event_type=event_type.value,
-            message=message,
-            details=details_json,
-            row_number=row_number,
+            **_audit_row(job_id, level, event_type, message, row_number),
+            details=encode_details(details),
         )
 
-        self.db.add(log_entry)
-        self.db.commit()
-        self.db.refresh(log_entry)
+        def _insert(db: Session) -> AuditLog:
+            db.add(log_entry)
+            db.flush()
+            return log_entry
 
+        return log_entry, _insert
+
+    def _refreshed(self, log_entry: AuditLog) -> AuditLog:
+        if log_entry in self.db:
+            self.db.refresh(log_entry)
         return log_entry
 
+    def log_many(self, entries: list[dict[str, Any]]) -> int:
+        """Ingest many audit log entries in one round trip.
+
+        Uses COPY on Postgres and a single executemany INSERT elsewhere.
+        Details are redacted exactly as in ``log``.
+
+        Args:
+            entries: Dicts with ``job_id``, ``level``, ``event_type`` and
+                ``message``, plus optional ``details`` and ``row_number``.
+
+        Returns:
+            Number of entries written.
+        """
+        rows = [
+            {
+                **_audit_row(
+                    entry["job_id"],
+                    entry["level"],
+                    entry["event_type"],
+                    entry["message"],
+                    entry.get("row_number"),
+                ),
+                "details": encode_details(entry.get("details")),
+            }
+            for entry in entries
+        ]
+        return run_write(lambda db: copy_rows(db, AuditLog.__table__, rows), self.db)
+
     # Convenience methods for log levels
 
     def log_info(
@@ -409,15 +656,7 @@ class AuditService:
         Returns:
             List of AuditLog entries ordered by timestamp (oldest first).
         """
-        query = self.db.query(AuditLog).filter(AuditLog.job_id == job_id)
-
-        if level is not None:
-            query = query.filter(AuditLog.level == level.value)
-
-        if event_type is not None:
-            query = query.filter(AuditLog.event_type == event_type.value)
-
-        return query.order_by(AuditLog.timestamp.asc()).limit(limit).all()
+        return list(self.db.scalars(_logs_query(job_id, level, event_type, limit)))
 
     def get_recent_errors(self, job_id: str, limit: int = 10) -> list[AuditLog]:
         """Get most recent ERROR level logs for a job.
@@ -429,13 +668,7 @@ class AuditService:
         Returns:
             List of ERROR AuditLog entries ordered by timestamp (newest first).
         """
-        return (
-            self.db.query(AuditLog)
-            .filter(AuditLog.job_id == job_id, AuditLog.level == LogLevel.ERROR.value)
-            .order_by(AuditLog.timestamp.desc())
-            .limit(limit)
-            .all()
-        )
+        return list(self.db.scalars(_recent_errors_query(job_id, limit)))
 
     # Export methods
 
@@ -457,31 +690,44 @@ class AuditService:
                 Request: {"service": "03", ...}
                 Response: {"tracking_number": "TRACK001", ...}
         """
-        logs = self.get_logs(job_id)
-        lines = []
-
-        for log_entry in logs:
-            # Build the main log line
-            row_prefix = f"[Row {log_entry.row_number}] " if log_entry.row_number else ""
-            line = (
-                f"[{log_entry.timestamp}] [{log_entry.level}] "
-                f"[{log_entry.event_type}] {row_prefix}{log_entry.message}"
-            )
-            lines.append(line)
-
-            # Add details if present
-            if log_entry.details:
-                try:
-                    details_dict = json.loads(log_entry.details)
-                    details_formatted = json.dumps(details_dict, indent=4)
-                    # Indent each line of the details
-                    for detail_line in details_formatted.split("\n"):
-                        lines.append(f"    {detail_line}")
-                except json.JSONDecodeError:
-                    # If details aren't valid JSON, include as-is
-                    lines.append(f"    {log_entry.details}")
-
-        return "\n".join(lines)
+        return "\n".join(self.iter_logs_text(job_id))
+
+    def iter_logs_text(
+        self, job_id: str, batch_size: int = _EXPORT_BATCH_SIZE
+    ) -> Iterator[str]:
+        """Yield the plain-text export of every log for a job, line by line.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat
+        for jobs with very large logs.
+
+        Args:
+            job_id: UUID of the job.
+            batch_size: Rows fetched per database round trip.
+
+        Yields:
+            Export lines without trailing newlines.
+        """
+        for log_entry in self._iter_logs(job_id, batch_size):
+            yield from _format_log_lines(log_entry)
+
+    def iter_log_records(
+        self, job_id: str, batch_size: int = _EXPORT_BATCH_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every log for a job as an NDJSON-ready dict, oldest first.
+
+        Args:
+            job_id: UUID of the job.
+            batch_size: Rows fetched per database round trip.
+
+        Yields:
+            Records shaped like ``log_record``.
+        """
+        for log_entry in self._iter_logs(job_id, batch_size):
+            yield log_record(log_entry)
+
+    def _iter_logs(self, job_id: str, batch_size: int) -> Iterator[AuditLog]:
+        stmt = _logs_query(job_id, None, None, None).execution_options(yield_per=batch_size)
+        yield from self.db.scalars(stmt)
 
     def export_logs_for_download(
         self, job_id: str, job_name: str
@@ -496,15 +742,119 @@ class AuditService:
             Tuple of (filename, content) ready for download.
             Filename format: {job_name}_logs_{timestamp}.txt
         """
-        # Clean job_name for filesystem
-        clean_name = re.sub(r"[^\w\s-]", "", job_name)  # Remove special chars
-        clean_name = re.sub(r"\s+", "_", clean_name)  # Replace spaces with underscores
-        clean_name = clean_name.strip("_")  # Remove leading/trailing underscores
+        return export_filename(job_name), self.export_logs_text(job_id)
+
+
+class AsyncAuditService:
+    """Read-only audit log queries on an ``AsyncSession``.
+
+    Mirrors the query and export methods of ``AuditService`` for async
+    API routes, so reading logs never parks a threadpool worker on the
+    database. Writes stay on ``AuditService``.
+
+    Attributes:
+        db: Async SQLAlchemy session for database operations.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the async audit service.
+
+        Args:
+            db: Async SQLAlchemy session for database operations.
+        """
+        self.db = db
+
+    async def get_logs(
+        self,
+        job_id: str,
+        level: LogLevel | None = None,
+        event_type: EventType | None = None,
+        limit: int = 1000,
+    ) -> list[AuditLog]:
+        """Get audit logs for a job with optional filters.
+
+        Args:
+            job_id: UUID of the job.
+            level: Optional filter by log level.
+            event_type: Optional filter by event type.
+            limit: Maximum number of logs to return (default 1000).
+
+        Returns:
+            List of AuditLog entries ordered by timestamp (oldest first).
+        """
+        result = await self.db.scalars(_logs_query(job_id, level, event_type, limit))
+        return list(result)
+
+    async def get_recent_errors(self, job_id: str, limit: int = 10) -> list[AuditLog]:
+        """Get most recent ERROR level logs for a job.
+
+        Args:
+            job_id: UUID of the job.
+            limit: Maximum number of logs to return (default 10).
+
+        Returns:
+            List of ERROR AuditLog entries ordered by timestamp (newest first).
+        """
+        result = await self.db.scalars(_recent_errors_query(job_id, limit))
+        return list(result)
+
+    async def export_logs_text(self, job_id: str) -> str:
+        """Export all logs for a job as plain text.
 
-        # Generate timestamp for filename
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        Args:
+            job_id: UUID of the job.
 
-        filename = f"{clean_name}_logs_{timestamp}.txt"
-        content = self.export_logs_text(job_id)
+        Returns:
+            Formatted plain text of all log entries.
+        """
+        return "\n".join([line async for line in self.iter_logs_text(job_id)])
+
+    async def iter_logs_text(
+        self, job_id: str, batch_size: int = _EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[str]:
+        """Yield the plain-text export of every log for a job, line by line.
+
+        Args:
+            job_id: UUID of the job.
+            batch_size: Rows fetched per database round trip.
+
+        Yields:
+            Export lines without trailing newlines.
+        """
+        async for log_entry in self._iter_logs(job_id, batch_size):
+            for line in _format_log_lines(log_entry):
+                yield line
 
-        return filename, content
+    async def iter_log_records(
+        self, job_id: str, batch_size: int = _EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every log for a job as an NDJSON-ready dict, oldest first.
+
+        Args:
+            job_id: UUID of the job.
+            batch_size: Rows fetched per database round trip.
+
+        Yields:
+            Records shaped like ``log_record``.
+        """
+        async for log_entry in self._iter_logs(job_id, batch_size):
+            yield log_record(log_entry)
+
+    async def _iter_logs(self, job_id: str, batch_size: int) -> AsyncIterator[AuditLog]:
+        stmt = _logs_query(job_id, None, None, None).execution_options(yield_per=batch_size)
+        async for log_entry in await self.db.stream_scalars(stmt):
+            yield log_entry
+
+    async def export_logs_for_download(
+        self, job_id: str, job_name: str
+    ) -> tuple[str, str]:
+        """Generate filename and content for log download.
+
+        Args:
+            job_id: UUID of the job.
+            job_name: Name of the job (used in filename).
+
+        Returns:
+            Tuple of (filename, content) ready for download.
+        """
+        return export_filename(job_name), await self.export_logs_text(job_id)
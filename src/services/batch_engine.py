@@ -16,6 +16,7 @@ import hashlib
 import json
 import logging
 import os
+import time
 import traceback
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
@@ -23,27 +24,40 @@ from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
 from typing import Any
 
+from src.db.write_queue import writer_lock
+from src.services.address_preflight import (
+    build_address_preflight,
+    invalid_address_reason,
+    resolve_preflight_mode,
+)
+from src.services.batch_payload_plan import BatchPayloadPlan
+from src.services.commodity_cache import get_commodity_cache
 from src.services.errors import UPSServiceError
 from src.services.gateway_provider import get_data_gateway, get_external_sources_client
 from src.services.idempotency import generate_idempotency_key
-from src.services.international_rules import (
-    get_requirements,
-    validate_international_readiness,
+from src.services.international_rules import validate_international_readiness
+from src.services.label_storage import (
+    AsyncLabelStorage,
+    LabelStorage,
+    build_async_label_storage,
+    build_label_storage,
 )
-from src.services.label_storage import LabelStorage, build_label_storage
 from src.services.mcp_client import MCPConnectionError
+from src.services.metrics import BATCH_DB_COMMIT_SECONDS, BATCH_ROWS_PER_SECOND
+from src.services.order_data_codec import decode_order_data
 from src.services.ups_constants import DEFAULT_ORIGIN_COUNTRY, UPS_CARRIER_NAME
 from src.services.ups_payload_builder import (
+    apply_compatibility_corrections,
     build_shipment_request,
     build_ups_api_payload,
     build_ups_rate_payload,
 )
-from src.services.ups_service_codes import ServiceCode, upgrade_to_international
 from src.services.write_back_worker import (
     enqueue_write_back,
     mark_rows_completed,
     mark_tasks_completed,
 )
+from src.utils.tracing import current_span, span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +77,9 @@ def _dollars_to_cents(amount: str) -> int:
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DEFAULT_LABELS_DIR = PROJECT_ROOT / "labels"
 
+# Order IDs per commodity lookup call (BATCH_COMMODITY_CHUNK_SIZE)
+DEFAULT_COMMODITY_CHUNK_SIZE = 2000
+
 # Maximum recovery attempts before escalating in_flight rows to needs_review
 MAX_RECOVERY_ATTEMPTS = int(os.environ.get("MAX_RECOVERY_ATTEMPTS", "3"))
 
@@ -133,6 +150,7 @@ class BatchEngine:
             return default
         return value
 
+    @traced("batch.preview")
     async def preview(
         self,
         job_id: str,
@@ -162,57 +180,16 @@ class BatchEngine:
         rate_timeout_s = self._resolve_timeout_seconds(
             "BATCH_PREVIEW_RATE_TIMEOUT_SECONDS", 8.0,
         )
-        commodity_timeout_s = self._resolve_timeout_seconds(
-            "BATCH_COMMODITY_PREFETCH_TIMEOUT_SECONDS", 3.0,
-        )
 
         preview_rows: list[dict[str, Any]] = []
         total_cost_cents = 0
         row_durations: list[float] = []
+        plan = BatchPayloadPlan(shipper, service_code)
 
         # Pre-hydrate commodities for international rows that need them.
-        # Collect order IDs, bulk-fetch from MCP, then inject into order data.
-        commodity_cache: dict[str, list[dict]] = {}
-        if rows:
-            order_ids = []
-            for r in rows:
-                try:
-                    od = self._parse_order_data(r)
-                    dest_country = od.get("ship_to_country", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = service_code or od.get(
-                        "service_code", ServiceCode.GROUND.value,
-                    )
-                    origin_country = shipper.get("countryCode", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = upgrade_to_international(
-                        eff_service, origin_country, dest_country,
-                    )
-                    requirements = get_requirements(
-                        origin_country, dest_country, eff_service,
-                    )
-                    if requirements.requires_commodities and not od.get("commodities"):
-                        oid = od.get("order_id") or od.get("order_number")
-                        if oid:
-                            order_ids.append(str(oid))
-                except Exception as e:
-                    logger.warning(
-                        "Skipping commodity lookup for row %s (parse error): %s",
-                        getattr(r, "row_number", "?"),
-                        e,
-                    )
-            if order_ids:
-                try:
-                    raw = await asyncio.wait_for(
-                        self._get_commodities_bulk(order_ids),
-                        timeout=commodity_timeout_s,
-                    )
-                    commodity_cache = {str(k): v for k, v in raw.items()}
-                except TimeoutError:
-                    logger.warning(
-                        "Commodity bulk fetch timed out after %.1fs (non-critical)",
-                        commodity_timeout_s,
-                    )
-                except Exception as e:
-                    logger.warning("Commodity bulk fetch failed (non-critical): %s", e)
+        commodity_cache, commodity_unavailable = await self._prefetch_commodities(
+            job_id, plan, rows,
+        )
 
         async def _rate_row(row: Any) -> tuple[dict[str, Any], int, float]:
             """Rate a single row with concurrency control."""
@@ -223,23 +200,31 @@ class BatchEngine:
                 rate_error: str | None = None
                 cost_cents = 0
                 try:
-                    order_data = self._parse_order_data(row)
+                    order_data = plan.order_data(row)
 
                     # International validation (preview)
-                    dest_country = order_data.get("ship_to_country", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = service_code or order_data.get("service_code", ServiceCode.GROUND.value)
-                    origin_country = shipper.get("countryCode", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = upgrade_to_international(eff_service, origin_country, dest_country)
-                    requirements = get_requirements(origin_country, dest_country, eff_service)
+                    lane = plan.resolve_lane(order_data)
+                    eff_service = lane.service_code
+                    requirements = lane.requirements
 
                     if requirements.not_shippable_reason:
                         raise ValueError(requirements.not_shippable_reason)
 
+                    if enforce_addresses:
+                        address_error = invalid_address_reason(order_data)
+                        if address_error:
+                            raise ValueError(address_error)
+
                     # Hydrate commodities from cache if needed
                     if requirements.requires_commodities and not order_data.get("commodities"):
                         oid = str(order_data.get("order_id") or order_data.get("order_number") or "")
                         if oid and oid in commodity_cache:
                             order_data["commodities"] = commodity_cache[oid]
+                        elif oid in commodity_unavailable:
+                            raise ValueError(
+                                f"Commodity lookup failed for order {oid}; "
+                                "retry once the data source is reachable"
+                            )
 
                     if requirements.is_international or requirements.requires_invoice_line_total:
                         validation_errors = validate_international_readiness(
@@ -252,7 +237,7 @@ class BatchEngine:
 
                     simplified = build_shipment_request(
                         order_data=order_data,
-                        shipper=shipper,
+                        shipper=plan.shipper,
                         service_code=eff_service,
                     )
                     rate_payload = build_ups_rate_payload(
@@ -294,6 +279,8 @@ class BatchEngine:
                         traceback.format_exc(),
                     )
                     rate_error = err_msg
+                finally:
+                    plan.release(row)
                 row_elapsed = (datetime.now(UTC) - row_started).total_seconds()
 
                 row_info: dict[str, Any] = {
@@ -318,7 +305,17 @@ class BatchEngine:
         except ValueError:
             preview_cap = self.DEFAULT_PREVIEW_MAX_ROWS
         rows_to_rate = rows if preview_cap <= 0 else rows[:preview_cap]
-        rated_results = await asyncio.gather(*[_rate_row(row) for row in rows_to_rate])
+        enforce_addresses = await self._run_address_preflight(plan, rows_to_rate)
+        current_span().set_attribute("job.id", job_id)
+
+        async def _traced_rate_row(row: Any) -> tuple[dict[str, Any], int, float]:
+            with span(
+                "batch.preview.row",
+                {"job.id": job_id, "row.number": getattr(row, "row_number", None)},
+            ):
+                return await _rate_row(row)
+
+        rated_results = await asyncio.gather(*[_traced_rate_row(row) for row in rows_to_rate])
         for row_info, cost_cents, row_elapsed in rated_results:
             preview_rows.append(row_info)
             total_cost_cents += cost_cents
@@ -384,6 +381,10 @@ class BatchEngine:
             job_id,
             int(total_elapsed * 1000),
         )
+        if preview_rows and total_elapsed > 0:
+            BATCH_ROWS_PER_SECOND.labels("preview").observe(
+                len(preview_rows) / total_elapsed,
+            )
 
         return {
             "job_id": job_id,
@@ -393,6 +394,7 @@ class BatchEngine:
             "total_estimated_cost_cents": total_estimated_cost_cents,
         }
 
+    @traced("batch.execute")
     async def execute(
         self,
         job_id: str,
@@ -427,9 +429,13 @@ class BatchEngine:
         # Removing this lock requires per-task sessions/transactions first.
         db_lock = asyncio.Lock()
         counters_lock = asyncio.Lock()
-        commodity_timeout_s = self._resolve_timeout_seconds(
-            "BATCH_COMMODITY_PREFETCH_TIMEOUT_SECONDS", 3.0,
-        )
+
+        def _commit() -> None:
+            """Commit row state; callers hold db_lock."""
+            commit_started = time.perf_counter()
+            with writer_lock():
+                self._db.commit()
+            BATCH_DB_COMMIT_SECONDS.observe(time.perf_counter() - commit_started)
 
         successful = 0
         failed = 0
@@ -437,49 +443,15 @@ class BatchEngine:
         successful_write_back_updates: dict[int, dict[str, str]] = {}
 
         pending_rows = [r for r in rows if r.status == "pending"]
+        plan = BatchPayloadPlan(shipper, service_code)
 
         # Pre-hydrate commodities for international rows that need them.
-        exec_commodity_cache: dict[str, list[dict]] = {}
-        if pending_rows:
-            order_ids = []
-            for r in pending_rows:
-                try:
-                    od = self._parse_order_data(r)
-                    dest_country = od.get("ship_to_country", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = service_code or od.get(
-                        "service_code", ServiceCode.GROUND.value,
-                    )
-                    origin_country = shipper.get("countryCode", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = upgrade_to_international(
-                        eff_service, origin_country, dest_country,
-                    )
-                    requirements = get_requirements(
-                        origin_country, dest_country, eff_service,
-                    )
-                    if requirements.requires_commodities and not od.get("commodities"):
-                        oid = od.get("order_id") or od.get("order_number")
-                        if oid:
-                            order_ids.append(str(oid))
-                except Exception as e:
-                    logger.warning(
-                        "Skipping commodity lookup for row %s (parse error): %s",
-                        getattr(r, "row_number", "?"),
-                        e,
-                    )
-            if order_ids:
-                try:
-                    raw = await asyncio.wait_for(
-                        self._get_commodities_bulk(order_ids),
-                        timeout=commodity_timeout_s,
-                    )
-                    exec_commodity_cache = {str(k): v for k, v in raw.items()}
-                except TimeoutError:
-                    logger.warning(
-                        "Commodity bulk fetch timed out after %.1fs (non-critical)",
-                        commodity_timeout_s,
-                    )
-                except Exception as e:
-                    logger.warning("Commodity bulk fetch failed (non-critical): %s", e)
+        # Orders already fetched during preview come from the job cache.
+        exec_commodity_cache, commodity_unavailable = await self._prefetch_commodities(
+            job_id, plan, pending_rows,
+        )
+
+        enforce_addresses = await self._run_address_preflight(plan, pending_rows)
 
         async def _process_row(row: Any) -> None:
             """Process a single row with two-phase commit state machine.
@@ -499,24 +471,36 @@ class BatchEngine:
 
             async with semaphore:
                 try:
-                    # Parse and build payload (CPU-bound, fast)
-                    order_data = self._parse_order_data(row)
+                    # Parse and build payload (CPU-bound, fast). The plan has
+                    # already decoded this row during commodity prefetch.
+                    order_data = plan.order_data(row)
+                    plan.release(row)
 
                     # International validation (execute)
-                    dest_country = order_data.get("ship_to_country", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = service_code or order_data.get("service_code", ServiceCode.GROUND.value)
-                    origin_country = shipper.get("countryCode", DEFAULT_ORIGIN_COUNTRY)
-                    eff_service = upgrade_to_international(eff_service, origin_country, dest_country)
-                    requirements = get_requirements(origin_country, dest_country, eff_service)
+                    lane = plan.resolve_lane(order_data)
+                    dest_country = lane.dest_country
+                    eff_service = lane.service_code
+                    requirements = lane.requirements
 
                     if requirements.not_shippable_reason:
                         raise ValueError(requirements.not_shippable_reason)
 
+                    # Fail before Phase 1 so no shipment is attempted
+                    if enforce_addresses:
+                        address_error = invalid_address_reason(order_data)
+                        if address_error:
+                            raise ValueError(address_error)
+
                     # Hydrate commodities from cache if needed
                     if requirements.requires_commodities and not order_data.get("commodities"):
                         oid = str(order_data.get("order_id") or order_data.get("order_number") or "")
                         if oid and oid in exec_commodity_cache:
                             order_data["commodities"] = exec_commodity_cache[oid]
+                        elif oid in commodity_unavailable:
+                            raise ValueError(
+                                f"Commodity lookup failed for order {oid}; "
+                                "retry once the data source is reachable"
+                            )
 
                     if requirements.is_international or requirements.requires_invoice_line_total:
                         validation_errors = validate_international_readiness(
@@ -530,9 +514,6 @@ class BatchEngine:
                     # Shared domestic pre-flight validation + auto-correction
                     # Covers confirm-time service overrides (selected_service_code
                     # from preview.py → batch_executor → BatchEngine.execute)
-                    from src.services.ups_payload_builder import (
-                        apply_compatibility_corrections,
-                    )
                     domestic_issues = apply_compatibility_corrections(order_data, eff_service)
                     domestic_errors = [
                         i for i in domestic_issues
@@ -546,7 +527,7 @@ class BatchEngine:
 
                     simplified = build_shipment_request(
                         order_data=order_data,
-                        shipper=shipper,
+                        shipper=plan.shipper,
                         service_code=eff_service,
                     )
 
@@ -576,7 +557,7 @@ class BatchEngine:
                     async with db_lock:
                         row.status = "in_flight"
                         row.idempotency_key = idem_key
-                        self._db.commit()
+                        _commit()
 
                     # Build payload with idempotency key for UPS audit trail
                     api_payload = build_ups_api_payload(
@@ -606,7 +587,7 @@ class BatchEngine:
                             row.status = "failed"
                             row.error_code = e.code
                             row.error_message = str(e)
-                            self._db.commit()
+                            _commit()
                         raise
                     except MCPConnectionError as e:
                         # Could not reach MCP server. No side effect. Safe to fail.
@@ -614,7 +595,7 @@ class BatchEngine:
                             row.status = "failed"
                             row.error_code = "E-3001"
                             row.error_message = str(e)
-                            self._db.commit()
+                            _commit()
                         raise
                     except Exception as e:
                         # Ambiguous transport failure — UPS may have acted.
@@ -629,7 +610,7 @@ class BatchEngine:
                                 f"Ambiguous transport error during create_shipment: "
                                 f"{type(e).__name__}: {e}"
                             )
-                            self._db.commit()
+                            _commit()
                         raise
 
                     # --- POST-UPS: side effect occurred ---
@@ -644,11 +625,17 @@ class BatchEngine:
                                 "shipmentIdentificationNumber", tracking_number,
                             )
 
-                        # Save label to staging directory (not final path yet)
-                        label_path = ""
+                        # PHASE 2: Persist label first, then commit DB.
+                        # Crash safety: if we commit first and crash before the
+                        # label is durable, the row is completed with no label.
+                        # Persisting first means a crash leaves the label at its
+                        # final path + row still in_flight → recovery handles it.
+                        # Storage I/O runs on the label pool, off the event loop.
+                        final_label_path = ""
                         label_data_list = result.get("labelData", [])
                         if label_data_list and label_data_list[0]:
-                            label_path = self._save_label_staged(
+                            final_label_path = await self._persist_label(
+                                label_io,
                                 tracking_number,
                                 label_data_list[0],
                                 job_id=job_id,
@@ -679,15 +666,6 @@ class BatchEngine:
                                     duties["monetaryValue"],
                                 )
 
-                        # PHASE 2: Promote label first, then commit DB.
-                        # Crash safety: if we commit first and crash before promote,
-                        # startup cleanup deletes the staging file → completed row
-                        # with no label. By promoting first, crash leaves label at
-                        # final path + row still in_flight → recovery handles normally.
-                        final_label_path = ""
-                        if label_path:
-                            final_label_path = self._promote_label(label_path)
-
                         async with db_lock:
                             row.tracking_number = tracking_number
                             row.label_path = final_label_path
@@ -701,7 +679,7 @@ class BatchEngine:
                             row.ups_tracking_number = tracking_number
                             row.status = "completed"
                             row.processed_at = datetime.now(UTC).isoformat()
-                            self._db.commit()
+                            _commit()
 
                         async with counters_lock:
                             successful += 1
@@ -757,7 +735,7 @@ class BatchEngine:
                                 tn = result.get("trackingNumbers", [])
                                 if tn:
                                     row.ups_tracking_number = tn[0]
-                            self._db.commit()
+                            _commit()
 
                 except Exception as e:
                     # Reaches here for:
@@ -772,7 +750,7 @@ class BatchEngine:
                                 row.status = "failed"
                                 row.error_code = getattr(e, "code", "E-4001")
                                 row.error_message = str(e)
-                                self._db.commit()
+                                _commit()
 
                     async with counters_lock:
                         failed += 1
@@ -788,8 +766,28 @@ class BatchEngine:
 
                     logger.error("Row %d failed: %s", row.row_number, e)
 
+        current_span().set_attribute("job.id", job_id)
+
+        async def _traced_process_row(row: Any) -> None:
+            with span(
+                "batch.execute.row",
+                {"job.id": job_id, "row.number": getattr(row, "row_number", None)},
+            ):
+                await _process_row(row)
+
         # Process all rows concurrently (bounded by semaphore)
-        await asyncio.gather(*[_process_row(row) for row in pending_rows])
+        if pending_rows:
+            label_io = build_async_label_storage(self._label_storage)
+            execute_started = time.perf_counter()
+            try:
+                await asyncio.gather(*[_traced_process_row(row) for row in pending_rows])
+            finally:
+                label_io.close()
+            execute_elapsed = time.perf_counter() - execute_started
+            if execute_elapsed > 0:
+                BATCH_ROWS_PER_SECOND.labels("execute").observe(
+                    len(pending_rows) / execute_elapsed,
+                )
 
         write_back_result: dict[str, Any] = {
             "status": "skipped",
@@ -940,8 +938,8 @@ class BatchEngine:
                 })
                 continue
             try:
-                order_data = json.loads(row.order_data)
-            except (json.JSONDecodeError, TypeError):
+                order_data = decode_order_data(row.order_data, job_id=row.job_id)
+            except ValueError:
                 failures += 1
                 errors.append({
                     "row_number": row_number,
@@ -985,47 +983,125 @@ class BatchEngine:
             "errors": errors,
         }
 
-    def _parse_order_data(self, row: Any) -> dict[str, Any]:
-        """Parse order_data JSON from a JobRow.
+    async def _prefetch_commodities(
+        self, job_id: str, plan: BatchPayloadPlan, rows: list[Any],
+    ) -> tuple[dict[str, list[dict]], set[str]]:
+        """Collect commodities for rows whose lane requires them.
+
+        Orders whose commodities an earlier preview or execute of this job
+        already found are served from the job commodity cache; the rest are
+        fetched in chunks with no overall deadline.
 
         Args:
-            row: JobRow with order_data JSON string
+            job_id: Job UUID, used to key the commodity cache.
+            plan: Payload plan used to decode rows and resolve lanes.
+            rows: JobRow objects to hydrate.
 
         Returns:
-            Parsed order data dict
-
-        Raises:
-            ValueError: If order_data is invalid JSON
+            Tuple of (order_id -> commodities, order IDs whose lookup
+            failed and so could not be hydrated).
         """
-        if not row.order_data:
-            return {}
+        order_ids: list[str] = []
+        for r in rows:
+            try:
+                od = plan.order_data(r)
+                requirements = plan.resolve_lane(od).requirements
+                if requirements.requires_commodities and not od.get("commodities"):
+                    oid = od.get("order_id") or od.get("order_number")
+                    if oid:
+                        order_ids.append(str(oid))
+            except Exception as e:
+                logger.warning(
+                    "Skipping commodity lookup for row %s (parse error): %s",
+                    getattr(r, "row_number", "?"),
+                    e,
+                )
+        if not order_ids:
+            return {}, set()
+
+        cache = get_commodity_cache()
+        commodities, missing = cache.lookup(job_id, order_ids)
+        if not missing:
+            return commodities, set()
+
+        # Orders covered by a completed chunk, found or not. Tracked here
+        # rather than re-read from the cache, which may be disabled or may
+        # evict this job mid-fetch.
+        looked_up: set[str] = set()
+
+        def _record(chunk: list[str], fetched: dict[str, list[dict]]) -> None:
+            looked_up.update(chunk)
+            cache.store(job_id, chunk, fetched)
+
+        fetched = await self._get_commodities_bulk(missing, on_chunk=_record)
+        commodities.update({str(k): v for k, v in fetched.items()})
+        return commodities, {oid for oid in missing if oid not in looked_up}
+
+    @staticmethod
+    def _resolve_commodity_chunk_size() -> int:
+        """Resolve order IDs per commodity fetch from env with safe fallback."""
+        raw = os.environ.get(
+            "BATCH_COMMODITY_CHUNK_SIZE", str(DEFAULT_COMMODITY_CHUNK_SIZE),
+        )
         try:
-            return json.loads(row.order_data)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid order_data JSON on row {row.row_number}: {e}") from e
+            value = int(raw)
+        except ValueError:
+            logger.warning(
+                "Invalid BATCH_COMMODITY_CHUNK_SIZE=%r, defaulting to %d",
+                raw,
+                DEFAULT_COMMODITY_CHUNK_SIZE,
+            )
+            return DEFAULT_COMMODITY_CHUNK_SIZE
+        return max(1, value)
 
     async def _get_commodities_bulk(
-        self, order_ids: list[int | str],
+        self,
+        order_ids: list[int | str],
+        on_chunk: Callable[[list[str], dict[str, list[dict]]], None] | None = None,
     ) -> dict[int | str, list[dict]]:
         """Fetch commodities for orders via the data source gateway.
 
         Resolves the process-global DataSourceMCPClient via get_data_gateway()
-        (already imported at module level). Delegates to its
-        get_commodities_bulk() method which calls the MCP tool.
-        Returns empty dict on any failure (non-critical for batch flow).
+        (already imported at module level) and calls its
+        get_commodities_bulk() once per BATCH_COMMODITY_CHUNK_SIZE orders,
+        so no single MCP response grows with the batch. Each chunk is
+        handed to on_chunk as soon as it arrives. A failed chunk ends the
+        fetch; orders fetched so far are returned (non-critical for batch
+        flow).
 
         Args:
             order_ids: List of order IDs to retrieve commodities for.
+            on_chunk: Optional callback receiving each completed chunk's
+                order IDs (as strings) and its commodities keyed by string.
 
         Returns:
             Dict mapping order_id to list of commodity dicts.
         """
+        result: dict[int | str, list[dict]] = {}
+        if not order_ids:
+            return result
+        chunk_size = self._resolve_commodity_chunk_size()
+        done = 0
         try:
             gateway = await get_data_gateway()
-            return await gateway.get_commodities_bulk(order_ids)
+            while done < len(order_ids):
+                chunk = order_ids[done:done + chunk_size]
+                fetched = await gateway.get_commodities_bulk(chunk)
+                result.update(fetched)
+                if on_chunk is not None:
+                    on_chunk(
+                        [str(oid) for oid in chunk],
+                        {str(k): v for k, v in fetched.items()},
+                    )
+                done += len(chunk)
         except Exception as e:
-            logger.warning("Commodity fetch failed (non-critical): %s", e)
-            return {}
+            logger.warning(
+                "Commodity fetch failed after %d of %d orders (non-critical): %s",
+                done,
+                len(order_ids),
+                e,
+            )
+        return result
 
     def _save_label(
         self,
@@ -1057,51 +1133,73 @@ class BatchEngine:
             row_number=row_number,
         )
 
-    def _save_label_staged(
+    async def _persist_label(
         self,
+        label_io: AsyncLabelStorage,
         tracking_number: str,
         base64_data: str,
         job_id: str,
         row_number: int,
     ) -> str:
-        """Save label to staging directory for crash-safe two-phase commit.
+        """Durably persist a label off the event loop and return its final ref.
 
-        Labels are first written to a staging subdirectory, then atomically
-        moved to the final location via _promote_label(). This prevents
-        partially-written labels from appearing at the final path if the
-        process crashes between the UPS call and the DB commit.
+        Backends with atomic final writes (S3) are written directly; others
+        are staged and then promoted inside a single worker call, so a crash
+        never leaves a partially written label at the final path.
 
         Args:
+            label_io: Async storage facade for this execution.
             tracking_number: UPS tracking number.
             base64_data: Base64-encoded PDF label data.
-            job_id: Job UUID (used as staging subdirectory name).
+            job_id: Job UUID.
             row_number: 1-based row number within the job.
 
         Returns:
-            Staged label reference (local path or object URI).
+            Final label reference (local path or object URI).
         """
         pdf_bytes = base64.b64decode(base64_data)
-        return self._label_storage.save_staged(
+        return await label_io.persist(
             tracking_number=tracking_number,
             pdf_bytes=pdf_bytes,
             job_id=job_id,
             row_number=row_number,
         )
 
-    def _promote_label(self, staging_path: str) -> str:
-        """Atomically move label from staging to final location.
+    async def _run_address_preflight(
+        self,
+        plan: BatchPayloadPlan,
+        rows: list[Any],
+    ) -> bool:
+        """Validate destination addresses in bulk when pre-flight is enabled.
 
-        Uses os.rename() which is atomic on the same filesystem (POSIX).
-        After this call, the label exists at the final path and the staging
-        file is removed.
+        Corrections are written into the plan's cached order_data, so the
+        row tasks that follow rate and ship the corrected addresses. Lookup
+        failures never block the batch.
 
         Args:
-            staging_path: Path to the staged label file.
+            plan: Payload plan holding each row's parsed order_data.
+            rows: Rows about to be rated or shipped.
 
         Returns:
-            Final label reference (local path or object URI).
+            True when rows with invalid addresses must be failed (enforce mode).
         """
-        return self._label_storage.promote(staging_path)
+        preflight = build_address_preflight(
+            self._ups, self._db, concurrency=self._resolve_concurrency(),
+        )
+        if preflight is None or not rows:
+            return False
+        orders = []
+        for r in rows:
+            try:
+                orders.append(plan.order_data(r))
+            except ValueError:
+                continue  # Surfaced as a row error by the row task
+        try:
+            await preflight.run(orders)
+        except Exception as e:
+            logger.warning("Address pre-flight failed (non-critical): %s", e)
+            return False
+        return resolve_preflight_mode() == "enforce"
 
     def _label_exists(self, ref: str) -> bool:
         """Return True when a label reference exists in configured storage."""
@@ -1120,7 +1218,11 @@ class BatchEngine:
 
         Called at startup. Only removes staging files for jobs where NO rows
         are in_flight or needs_review. Those staging files may contain labels
-        for shipments that need recovery or operator resolution.
+        for shipments that need recovery or operator resolution. Jobs that
+        are running or leased are skipped too: another worker (or a batch
+        started since this process booted) may be staging labels right now.
+        Files or directories that disappear or gain entries mid-cleanup are
+        left alone.
 
         Args:
             job_service: JobService instance for database queries.
@@ -1146,24 +1248,41 @@ class BatchEngine:
         if not staging_root.exists():
             return 0
 
-        count = 0
-        for job_dir in staging_root.iterdir():
-            if not job_dir.is_dir():
-                continue
-            job_id = job_dir.name
+        job_dirs = [d for d in staging_root.iterdir() if d.is_dir()]
+        if not job_dirs:
+            return 0
 
-            # Check if this job has any unresolved rows
-            rows = job_service.get_rows(job_id)
-            has_unresolved = any(
-                r.status in ("in_flight", "needs_review") for r in rows
-            )
-            if has_unresolved:
-                continue  # Preserve staging files for recovery
+        # One aggregated query for every staged job instead of loading all
+        # rows per job; unresolved jobs keep their files for recovery.
+        from src.db.models import RowStatus
 
-            for f in job_dir.iterdir():
-                f.unlink()
+        names = [d.name for d in job_dirs]
+        unresolved = job_service.get_job_ids_with_row_status(
+            names,
+            (RowStatus.in_flight, RowStatus.needs_review),
+        )
+        active = job_service.get_active_job_ids(names)
+
+        count = 0
+        for job_dir in job_dirs:
+            if job_dir.name in unresolved or job_dir.name in active:
+                continue  # Preserve staging files for recovery or a live batch
+
+            try:
+                files = list(job_dir.iterdir())
+            except FileNotFoundError:
+                continue
+            for f in files:
+                try:
+                    f.unlink()
+                except FileNotFoundError:
+                    continue  # Promoted or removed concurrently
                 count += 1
-            job_dir.rmdir()
+            try:
+                job_dir.rmdir()
+            except OSError as e:
+                # Gone already, or a label was staged after the listing.
+                logger.debug("Kept staging dir %s: %s", job_dir, e)
 
         return count
 
@@ -1171,6 +1290,7 @@ class BatchEngine:
         self,
         job_id: str,
         rows: list[Any],
+        concurrency: int | None = None,
     ) -> dict[str, Any]:
         """Recover rows stuck in 'in_flight' state after a crash.
 
@@ -1191,135 +1311,33 @@ class BatchEngine:
             failed lookups, escalate to needs_review. Below limit, leave
             in_flight for next startup pass.
 
+        Tracking lookups run concurrently, bounded by ``concurrency``; row
+        updates are applied on the event loop between awaits so the shared
+        session is never used from two places at once.
+
         Args:
             job_id: Job UUID for logging context.
-            rows: All rows for the job (filters to in_flight internally).
+            rows: Rows for the job (filters to in_flight internally).
+            concurrency: Max concurrent track_package calls. Defaults to
+                BATCH_CONCURRENCY.
 
         Returns:
             Dict with recovered, needs_review, unresolved counts and
             per-row details for operator action.
         """
         in_flight = [r for r in rows if r.status == "in_flight"]
-        recovered = 0
-        needs_review = 0
-        unresolved = 0
-        details: list[dict[str, Any]] = []
-
-        for row in in_flight:
-            if row.ups_tracking_number:
-                # Tier 1: We have a per-package tracking number — verify it
-                try:
-                    raw = await self._ups.track_package(
-                        tracking_number=row.ups_tracking_number,
-                    )
-                    # Parse nested UPS tracking response
-                    shipment = raw.get("trackResponse", {}).get("shipment", [{}])
-                    if isinstance(shipment, list):
-                        shipment = shipment[0] if shipment else {}
-                    package = shipment.get("package", [{}])
-                    if isinstance(package, list):
-                        package = package[0] if package else {}
-                    returned_number = package.get("trackingNumber", "")
-
-                    if returned_number:
-                        # UPS confirms shipment exists — verify local artifacts
-                        missing_artifacts: list[str] = []
-                        if not row.label_path or not self._label_exists(row.label_path):
-                            missing_artifacts.append("label_path")
-                        if row.cost_cents is None:
-                            missing_artifacts.append("cost_cents")
-
-                        if missing_artifacts:
-                            row.status = "needs_review"
-                            row.error_message = (
-                                f"Shipment verified at UPS ({returned_number}) but "
-                                f"missing artifacts: {', '.join(missing_artifacts)}"
-                            )
-                            self._db.commit()
-                            needs_review += 1
-                            details.append({
-                                "row_number": row.row_number,
-                                "action": "needs_review",
-                                "reason": f"UPS confirmed but missing: {', '.join(missing_artifacts)}",
-                                "tracking_number": returned_number,
-                                "idempotency_key": row.idempotency_key,
-                            })
-                        else:
-                            # All artifacts present — safe to complete
-                            row.tracking_number = returned_number
-                            row.status = "completed"
-                            row.processed_at = datetime.now(UTC).isoformat()
-                            self._db.commit()
-                            recovered += 1
-                            details.append({
-                                "row_number": row.row_number,
-                                "action": "recovered",
-                                "tracking_number": returned_number,
-                            })
-                    else:
-                        # UPS doesn't recognize this tracking number
-                        row.status = "needs_review"
-                        row.error_message = (
-                            f"UPS returned empty tracking for stored number "
-                            f"'{row.ups_tracking_number}'"
-                        )
-                        self._db.commit()
-                        needs_review += 1
-                        details.append({
-                            "row_number": row.row_number,
-                            "action": "needs_review",
-                            "reason": "UPS returned invalid for stored tracking number",
-                            "ups_tracking_number": row.ups_tracking_number,
-                            "idempotency_key": row.idempotency_key,
-                        })
-                except Exception as e:
-                    # Tier 3: Lookup failed — escalation policy
-                    row.recovery_attempt_count += 1
-                    if row.recovery_attempt_count >= MAX_RECOVERY_ATTEMPTS:
-                        row.status = "needs_review"
-                        row.error_message = (
-                            f"UPS lookup failed {row.recovery_attempt_count} times "
-                            f"(last error: {e}) — escalated for manual resolution"
-                        )
-                        self._db.commit()
-                        needs_review += 1
-                        details.append({
-                            "row_number": row.row_number,
-                            "action": "needs_review",
-                            "reason": (
-                                f"Escalated after {row.recovery_attempt_count} "
-                                f"failed lookups"
-                            ),
-                            "idempotency_key": row.idempotency_key,
-                        })
-                    else:
-                        # Below limit — leave in_flight for next startup pass
-                        self._db.commit()
-                        unresolved += 1
-                        details.append({
-                            "row_number": row.row_number,
-                            "action": "unresolved",
-                            "reason": (
-                                f"UPS lookup failed "
-                                f"({row.recovery_attempt_count}/{MAX_RECOVERY_ATTEMPTS}): {e}"
-                            ),
-                            "idempotency_key": row.idempotency_key,
-                        })
-            else:
-                # Tier 2: No tracking info — ambiguous, mark for operator
-                row.status = "needs_review"
-                row.error_message = (
-                    "No UPS tracking number stored — cannot verify programmatically. "
-                    "Check UPS Quantum View using idempotency key."
-                )
-                self._db.commit()
-                needs_review += 1
-                details.append({
-                    "row_number": row.row_number,
-                    "action": "needs_review",
-                    "reason": "No ups_tracking_number — cannot verify programmatically",
-                    "idempotency_key": row.idempotency_key,
-                })
+        semaphore = asyncio.Semaphore(concurrency or self._resolve_concurrency())
+
+        async def _bounded(row: Any) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                return await self._recover_row(row)
+
+        outcomes = await asyncio.gather(*(_bounded(r) for r in in_flight))
+
+        recovered = sum(1 for action, _ in outcomes if action == "recovered")
+        needs_review = sum(1 for action, _ in outcomes if action == "needs_review")
+        unresolved = sum(1 for action, _ in outcomes if action == "unresolved")
+        details = [detail for _, detail in outcomes]
 
         logger.info(
             "In-flight recovery complete: job_id=%s recovered=%d "
@@ -1333,3 +1351,122 @@ class BatchEngine:
             "unresolved": unresolved,
             "details": details,
         }
+
+    async def _recover_row(self, row: Any) -> tuple[str, dict[str, Any]]:
+        """Apply the three-tier recovery policy to one in_flight row.
+
+        Args:
+            row: JobRow in in_flight state.
+
+        Returns:
+            Tuple of (action, detail) where action is recovered,
+            needs_review or unresolved.
+        """
+        if row.ups_tracking_number:
+            # Tier 1: We have a per-package tracking number — verify it
+            try:
+                raw = await self._ups.track_package(
+                    tracking_number=row.ups_tracking_number,
+                )
+                # Parse nested UPS tracking response
+                shipment = raw.get("trackResponse", {}).get("shipment", [{}])
+                if isinstance(shipment, list):
+                    shipment = shipment[0] if shipment else {}
+                package = shipment.get("package", [{}])
+                if isinstance(package, list):
+                    package = package[0] if package else {}
+                returned_number = package.get("trackingNumber", "")
+
+                if returned_number:
+                    # UPS confirms shipment exists — verify local artifacts
+                    missing_artifacts: list[str] = []
+                    if not row.label_path or not self._label_exists(row.label_path):
+                        missing_artifacts.append("label_path")
+                    if row.cost_cents is None:
+                        missing_artifacts.append("cost_cents")
+
+                    if missing_artifacts:
+                        row.status = "needs_review"
+                        row.error_message = (
+                            f"Shipment verified at UPS ({returned_number}) but "
+                            f"missing artifacts: {', '.join(missing_artifacts)}"
+                        )
+                        self._db.commit()
+                        return "needs_review", {
+                            "row_number": row.row_number,
+                            "action": "needs_review",
+                            "reason": f"UPS confirmed but missing: {', '.join(missing_artifacts)}",
+                            "tracking_number": returned_number,
+                            "idempotency_key": row.idempotency_key,
+                        }
+                    else:
+                        # All artifacts present — safe to complete
+                        row.tracking_number = returned_number
+                        row.status = "completed"
+                        row.processed_at = datetime.now(UTC).isoformat()
+                        self._db.commit()
+                        return "recovered", {
+                            "row_number": row.row_number,
+                            "action": "recovered",
+                            "tracking_number": returned_number,
+                        }
+                else:
+                    # UPS doesn't recognize this tracking number
+                    row.status = "needs_review"
+                    row.error_message = (
+                        f"UPS returned empty tracking for stored number "
+                        f"'{row.ups_tracking_number}'"
+                    )
+                    self._db.commit()
+                    return "needs_review", {
+                        "row_number": row.row_number,
+                        "action": "needs_review",
+                        "reason": "UPS returned invalid for stored tracking number",
+                        "ups_tracking_number": row.ups_tracking_number,
+                        "idempotency_key": row.idempotency_key,
+                    }
+            except Exception as e:
+                # Tier 3: Lookup failed — escalation policy
+                row.recovery_attempt_count += 1
+                if row.recovery_attempt_count >= MAX_RECOVERY_ATTEMPTS:
+                    row.status = "needs_review"
+                    row.error_message = (
+                        f"UPS lookup failed {row.recovery_attempt_count} times "
+                        f"(last error: {e}) — escalated for manual resolution"
+                    )
+                    self._db.commit()
+                    return "needs_review", {
+                        "row_number": row.row_number,
+                        "action": "needs_review",
+                        "reason": (
+                            f"Escalated after {row.recovery_attempt_count} "
+                            f"failed lookups"
+                        ),
+                        "idempotency_key": row.idempotency_key,
+                    }
+                else:
+                    # Below limit — leave in_flight for next startup pass
+                    self._db.commit()
+                    return "unresolved", {
+                        "row_number": row.row_number,
+                        "action": "unresolved",
+                        "reason": (
+                            f"UPS lookup failed "
+                            f"({row.recovery_attempt_count}/{MAX_RECOVERY_ATTEMPTS}): {e}"
+                        ),
+                        "idempotency_key": row.idempotency_key,
+                    }
+        else:
+            # Tier 2: No tracking info — ambiguous, mark for operator
+            row.status = "needs_review"
+            row.error_message = (
+                "No UPS tracking number stored — cannot verify programmatically. "
+                "Check UPS Quantum View using idempotency key."
+            )
+            self._db.commit()
+            return "needs_review", {
+                "row_number": row.row_number,
+                "action": "needs_review",
+                "reason": "No ups_tracking_number — cannot verify programmatically",
+                "idempotency_key": row.idempotency_key,
+            }
@@ -17,6 +17,14 @@ from typing import Any
 from src.db.models import Job, JobRow, RowStatus
 from src.services.batch_engine import BatchEngine
 from src.services.decision_audit_service import DecisionAuditService
+from src.services.job_lease import (
+    JobLeaseHeldError,
+    LeaseHeartbeat,
+    acquire_lease,
+    release_lease,
+    worker_id,
+)
+from src.services.order_data_codec import get_parsed_order_cache
 from src.services.ups_mcp_client import UPSMCPClient
 
 logger = logging.getLogger(__name__)
@@ -111,6 +119,8 @@ async def execute_batch(
     - International data aggregation (duties/taxes, country counts)
     - Completion timestamp
     - Error handling with fallback status
+    - The job's execution lease: claimed before any row is touched,
+      renewed by a heartbeat while rows run, released at the end
 
     Callers do NOT need to perform any post-execution status updates.
 
@@ -125,6 +135,7 @@ async def execute_batch(
 
     Raises:
         ValueError: If job not found.
+        JobLeaseHeldError: If another live worker is executing the job.
     """
     from datetime import UTC, datetime
 
@@ -163,13 +174,17 @@ async def execute_batch(
     logger.info("Batch execution using UPS environment=%s", ups_creds.environment)
     account_number = ups_creds.account_number or os.environ.get("UPS_ACCOUNT_NUMBER", "")
 
+    lease_owner = worker_id()
+    if not acquire_lease(db_session, job_id, lease_owner):
+        raise JobLeaseHeldError(job_id)
+
     try:
         async with UPSMCPClient(
             client_id=ups_creds.client_id,
             client_secret=ups_creds.client_secret,
             environment=ups_creds.environment,
             account_number=account_number,
-        ) as ups:
+        ) as ups, LeaseHeartbeat(job_id, lease_owner):
             engine = BatchEngine(
                 ups_service=ups,
                 db_session=db_session,
@@ -287,3 +302,11 @@ async def execute_batch(
             job.error_message = str(e)
             db_session.commit()
         raise
+    finally:
+        # The run is over; its decoded rows are no longer hot.
+        get_parsed_order_cache().invalidate(job_id)
+        try:
+            release_lease(db_session, job_id, lease_owner)
+        except Exception as e:
+            # The lease expires on its own; recovery can claim it after the TTL.
+            logger.warning("Failed releasing lease for job %s: %s", job_id, e)
@@ -0,0 +1,134 @@
+"""Per-job payload plan for batch preview and execution.
+
+BatchEngine used to redo job-invariant work for every row: parsing the
+same order_data twice (commodity prefetch and again in the row task),
+cleaning the shipper block, and resolving service upgrades and lane
+requirements for lanes it had already seen. A BatchPayloadPlan does that
+work once per job and hands each row task its pre-resolved lane.
+
+Example:
+    plan = BatchPayloadPlan(shipper, service_code=None)
+    lane = plan.resolve_lane(plan.order_data(row))
+    if lane.requirements.not_shippable_reason: ...
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from src.services.international_rules import RequirementSet, get_requirements
+from src.services.order_data_codec import decode_order_data
+from src.services.ups_constants import DEFAULT_ORIGIN_COUNTRY
+from src.services.ups_service_codes import ServiceCode, upgrade_to_international
+
+
+@dataclass(frozen=True)
+class ResolvedLane:
+    """Service and lane requirements resolved for one row.
+
+    Attributes:
+        dest_country: Destination country as read from the order.
+        service_code: Effective service after international upgrade.
+        requirements: Lane requirements for origin/destination/service.
+    """
+
+    dest_country: str
+    service_code: str
+    requirements: RequirementSet
+
+
+class BatchPayloadPlan:
+    """Job-invariant payload inputs shared by every row of a batch.
+
+    Not thread-safe; intended for use by the tasks of one batch on a
+    single event loop.
+
+    Attributes:
+        shipper: Shipper block with empty values removed, built once.
+        origin_country: Shipper country used as the lane origin.
+        service_code: Job-level service override, if any.
+    """
+
+    def __init__(
+        self,
+        shipper: dict[str, str],
+        service_code: str | None = None,
+    ) -> None:
+        """Precompute the shipper block and lane origin for a job.
+
+        Args:
+            shipper: Shipper address info for the job.
+            service_code: Optional service code override for all rows.
+        """
+        self.shipper = {k: v for k, v in shipper.items() if v}
+        self.origin_country = shipper.get("countryCode", DEFAULT_ORIGIN_COUNTRY)
+        self.service_code = service_code
+        self._lanes: dict[tuple[str, str], ResolvedLane] = {}
+        self._orders: dict[int, dict[str, Any]] = {}
+
+    def order_data(self, row: Any) -> dict[str, Any]:
+        """Return the parsed order_data for a row, decoding it only once.
+
+        The same dict is returned on every call for a row, so mutations made
+        by the row task (commodity hydration, auto-corrections) stay visible
+        to later steps of that task.
+
+        Args:
+            row: JobRow with order_data JSON string.
+
+        Returns:
+            Parsed order data dict.
+
+        Raises:
+            ValueError: If order_data is not a JSON object.
+        """
+        # Keyed by object identity: rows stay alive for the whole batch and
+        # test doubles do not always carry distinct row numbers.
+        key = id(row)
+        cached = self._orders.get(key)
+        if cached is not None:
+            return cached
+        try:
+            parsed = decode_order_data(
+                row.order_data, job_id=getattr(row, "job_id", None),
+            )
+        except ValueError as e:
+            raise ValueError(f"{e} (row {row.row_number})") from e
+        self._orders[key] = parsed
+        return parsed
+
+    def resolve_lane(self, order_data: dict[str, Any]) -> ResolvedLane:
+        """Resolve effective service and requirements for an order.
+
+        Memoized per (destination, requested service): a job typically
+        spans only a handful of lanes, so the upgrade and requirement
+        lookup run once per lane instead of once per row.
+
+        Args:
+            order_data: Parsed order data for the row.
+
+        Returns:
+            ResolvedLane for the row.
+        """
+        dest_country = order_data.get("ship_to_country", DEFAULT_ORIGIN_COUNTRY)
+        requested = self.service_code or order_data.get(
+            "service_code", ServiceCode.GROUND.value,
+        )
+        key = (dest_country, requested)
+        lane = self._lanes.get(key)
+        if lane is None:
+            eff_service = upgrade_to_international(
+                requested, self.origin_country, dest_country,
+            )
+            lane = ResolvedLane(
+                dest_country=dest_country,
+                service_code=eff_service,
+                requirements=get_requirements(
+                    self.origin_country, dest_country, eff_service,
+                ),
+            )
+            self._lanes[key] = lane
+        return lane
+
+    def release(self, row: Any) -> None:
+        """Drop the cached order for a row once its task has finished."""
+        self._orders.pop(id(row), None)
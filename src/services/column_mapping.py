@@ -12,6 +12,8 @@ Example:
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 NORMALIZER_VERSION = "column_mapping_v2"
@@ -185,7 +187,7 @@ _AUTO_MAP_RULES: list[tuple[list[str], list[str], str]] = [
     # Location
     (["city"], [], "shipTo.city"),
     # Short FWF abbreviations for state — must come BEFORE the generic "state"
-    # rule because _match_quality does a substring-in-canonical check, which
+    # rule because the matcher does a substring-in-canonical check, which
     # means "state" (6 chars) can never match the canonical header "st" (2
     # chars).  These exact-match rules handle columns named ST, PROV, etc.
     (["st"], ["status", "street", "store", "start", "step", "stock", "style", "standard"], "shipTo.stateProvinceCode"),
@@ -289,20 +291,113 @@ def _token_set(canonical_header: str) -> set[str]:
     return {t for t in canonical_header.split("_") if t}
 
 
-def _match_quality(
-    token: str,
-    canonical_header: str,
-    tokens: set[str],
-) -> int:
-    """Return token match quality (2 exact, 1 substring, 0 no match)."""
-    normalized = _canonicalize_header(token)
-    if not normalized:
-        return 0
-    if normalized == canonical_header or normalized in tokens:
-        return 2
-    if normalized in canonical_header:
-        return 1
-    return 0
+@dataclass(frozen=True)
+class _CompiledRule:
+    """An _AUTO_MAP_RULES entry with canonicalized tokens.
+
+    Attributes:
+        priority: Position in _AUTO_MAP_RULES; lower wins ties.
+        required: Canonical tokens that must all match the header.
+        blocked: Canonical tokens that must not match the header.
+        path: Simplified UPS field path the rule maps to.
+    """
+
+    priority: int
+    required: tuple[str, ...]
+    blocked: tuple[str, ...]
+    path: str
+
+
+class _AutoMapMatcher:
+    """Token-indexed matcher compiled once from _AUTO_MAP_RULES.
+
+    Every distinct rule token is canonicalized at compile time, and each
+    rule is indexed under one anchor token (its longest required token).
+    Matching a header looks its own substrings up in the token vocabulary,
+    so the work depends on the header's length rather than the number of
+    rules, then evaluates only the rules anchored on tokens it contains.
+    """
+
+    def __init__(self, rules: list[tuple[list[str], list[str], str]]) -> None:
+        """Compile a rule table.
+
+        Args:
+            rules: (must_contain_all, must_not_contain, path) tuples in
+                priority order.
+        """
+        compiled: list[_CompiledRule] = []
+        path_order: dict[str, None] = {}
+        for priority, (must_have, must_not, path) in enumerate(rules):
+            path_order.setdefault(path, None)
+            required = tuple(_canonicalize_header(t) for t in must_have)
+            if not required or not all(required):
+                # A token that canonicalizes to nothing can never match.
+                continue
+            blocked = tuple(b for b in (_canonicalize_header(t) for t in must_not) if b)
+            compiled.append(_CompiledRule(priority, required, blocked, path))
+
+        by_anchor: dict[str, list[_CompiledRule]] = {}
+        vocabulary: set[str] = set()
+        for rule in compiled:
+            anchor = max(rule.required, key=len)
+            by_anchor.setdefault(anchor, []).append(rule)
+            vocabulary.update(rule.required)
+            vocabulary.update(rule.blocked)
+
+        self.path_order: tuple[str, ...] = tuple(path_order)
+        self._vocabulary: frozenset[str] = frozenset(vocabulary)
+        # Rule tokens only ever match header substrings of these lengths.
+        self._token_lengths: tuple[int, ...] = tuple(
+            sorted({len(token) for token in vocabulary})
+        )
+        self._by_anchor: dict[str, tuple[_CompiledRule, ...]] = {
+            anchor: tuple(group) for anchor, group in by_anchor.items()
+        }
+
+    def match(self, canonical_header: str) -> tuple[tuple[_CompiledRule, int, int], ...]:
+        """Return the rules matching a canonical header.
+
+        Args:
+            canonical_header: Header normalized by _canonicalize_header().
+
+        Returns:
+            Tuple of (rule, exact_matches, substring_matches).
+        """
+        tokens = _token_set(canonical_header)
+        present: dict[str, int] = {}
+        vocabulary = self._vocabulary
+        header_len = len(canonical_header)
+        for start in range(header_len):
+            for length in self._token_lengths:
+                end = start + length
+                if end > header_len:
+                    break
+                token = canonical_header[start:end]
+                if token in vocabulary and token not in present:
+                    exact = token == canonical_header or token in tokens
+                    present[token] = 2 if exact else 1
+
+        matches: list[tuple[_CompiledRule, int, int]] = []
+        for anchor in present:
+            for rule in self._by_anchor.get(anchor, ()):
+                if any(t not in present for t in rule.required):
+                    continue
+                if any(t in present for t in rule.blocked):
+                    continue
+                exact_matches = sum(1 for t in rule.required if present[t] == 2)
+                matches.append(
+                    (rule, exact_matches, len(rule.required) - exact_matches)
+                )
+        return tuple(matches)
+
+
+_MATCHER = _AutoMapMatcher(_AUTO_MAP_RULES)
+
+
+@lru_cache(maxsize=4096)
+def _match_header(canonical_header: str) -> tuple[tuple[_CompiledRule, int, int], ...]:
+    """Memoized _MATCHER.match(); ERP exports repeat the same headers."""
+    return _MATCHER.match(canonical_header)
 
 
 def auto_map_columns(source_columns: list[str]) -> dict[str, str]:
@@ -327,7 +422,8 @@ def auto_map_columns_with_trace(
     """Auto-map source column names and return trace metadata.
 
     Trace includes the selected source column and candidate ranking basis
-    for each mapped target path.
+    for each mapped target path. Mapping and trace come from one pass of
+    the compiled matcher.
     """
     # Deterministic candidate pool per target path, independent of source order.
     by_path: dict[str, list[tuple[int, int, int, int, str, str]]] = {}
@@ -344,27 +440,12 @@ def auto_map_columns_with_trace(
     )
 
     for canonical_header, original_header in canonical_columns:
-        tokens = _token_set(canonical_header)
-        for rule_index, (must_have, must_not, path) in enumerate(_AUTO_MAP_RULES):
-            required_scores = [
-                _match_quality(token, canonical_header, tokens) for token in must_have
-            ]
-            if any(score == 0 for score in required_scores):
-                continue
-            blocked = any(
-                _match_quality(token, canonical_header, tokens) > 0
-                for token in must_not
-            )
-            if blocked:
-                continue
-
-            exact_matches = sum(1 for score in required_scores if score == 2)
-            substring_matches = sum(1 for score in required_scores if score == 1)
-            by_path.setdefault(path, []).append(
+        for rule, exact_matches, substring_matches in _match_header(canonical_header):
+            by_path.setdefault(rule.path, []).append(
                 (
                     exact_matches,
                     substring_matches,
-                    -rule_index,              # earlier rules win
+                    -rule.priority,           # earlier rules win
                     -len(canonical_header),   # shorter headers win
                     canonical_header,         # stable lexical tie-break
                     original_header,
@@ -373,11 +454,7 @@ def auto_map_columns_with_trace(
 
     mapping: dict[str, str] = {}
     trace: dict[str, Any] = {}
-    seen_paths: set[str] = set()
-    for _, _, path in _AUTO_MAP_RULES:
-        if path in seen_paths:
-            continue
-        seen_paths.add(path)
+    for path in _MATCHER.path_order:
         candidates = by_path.get(path, [])
         if not candidates:
             continue
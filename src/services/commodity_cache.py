@@ -0,0 +1,139 @@
+"""Per-job cache of commodities hydrated for international batch rows.
+
+Preview and execute used to fetch a job's commodities separately, each
+racing a short timeout: a slow data source meant rows silently went
+without commodities and failed validation. BatchEngine now fetches in
+chunks with no overall deadline and records each completed chunk here,
+so execute reuses what preview already found and only looks up the
+remaining orders (for example after a failed chunk).
+
+Only orders whose lookup found commodities are cached. An order found
+without any is looked up again next time, so commodities imported after
+a preview flagged them missing are picked up by execute. Entries are
+grouped by job; at most COMMODITY_CACHE_MAX_JOBS jobs are kept, least
+recently used first out. A job's entry is dropped when the job is deleted.
+
+Example:
+    cache = get_commodity_cache()
+    found, missing = cache.lookup(job_id, order_ids)
+    cache.store(job_id, chunk_ids, fetched)
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_JOBS = 16
+
+
+def _resolve_cache_max_jobs() -> int:
+    raw = os.environ.get("COMMODITY_CACHE_MAX_JOBS", str(DEFAULT_CACHE_MAX_JOBS))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "Invalid COMMODITY_CACHE_MAX_JOBS=%r, defaulting to %d",
+            raw,
+            DEFAULT_CACHE_MAX_JOBS,
+        )
+        return DEFAULT_CACHE_MAX_JOBS
+
+
+class JobCommodityCache:
+    """Commodities by order_id, grouped and evicted per job. Thread-safe."""
+
+    def __init__(self, max_jobs: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_jobs: Max jobs held; defaults to COMMODITY_CACHE_MAX_JOBS.
+        """
+        self._max_jobs = _resolve_cache_max_jobs() if max_jobs is None else max_jobs
+        self._jobs: OrderedDict[str, dict[str, list[dict]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def lookup(
+        self, job_id: str, order_ids: Iterable[str],
+    ) -> tuple[dict[str, list[dict]], list[str]]:
+        """Split order IDs into cached commodities and IDs still to fetch.
+
+        Args:
+            job_id: Job the orders belong to.
+            order_ids: Order IDs (as strings) needing commodities.
+
+        Returns:
+            Tuple of (order_id -> cached commodities, order IDs with no
+            cached commodities for this job, deduplicated in order).
+        """
+        found: dict[str, list[dict]] = {}
+        missing: list[str] = []
+        with self._lock:
+            entries = self._jobs.get(job_id)
+            if entries is not None:
+                self._jobs.move_to_end(job_id)
+            for oid in dict.fromkeys(order_ids):
+                cached = entries.get(oid) if entries is not None else None
+                if cached:
+                    found[oid] = cached
+                else:
+                    missing.append(oid)
+        return found, missing
+
+    def store(
+        self,
+        job_id: str,
+        order_ids: Iterable[str],
+        fetched: Mapping[str, list[dict]],
+    ) -> None:
+        """Record the commodities a completed lookup found.
+
+        Orders the lookup covered but found nothing for are not cached.
+
+        Args:
+            job_id: Job the orders belong to.
+            order_ids: Every order ID the lookup covered.
+            fetched: Commodities found, keyed by order ID string.
+        """
+        found = {oid: fetched[oid] for oid in order_ids if fetched.get(oid)}
+        if self._max_jobs == 0 or not found:
+            return
+        with self._lock:
+            entries = self._jobs.get(job_id)
+            if entries is None:
+                while len(self._jobs) >= self._max_jobs:
+                    self._jobs.popitem(last=False)
+                entries = self._jobs[job_id] = {}
+            else:
+                self._jobs.move_to_end(job_id)
+            entries.update(found)
+
+    def invalidate(self, job_id: str) -> None:
+        """Drop a job's cached commodities."""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached commodities."""
+        with self._lock:
+            self._jobs.clear()
+
+
+_cache: JobCommodityCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_commodity_cache() -> JobCommodityCache:
+    """Return the process-wide commodity cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = JobCommodityCache()
+    return _cache
@@ -7,6 +7,7 @@ so both HTTP routes and InProcessRunner call the same code path.
 import hashlib
 import json
 import logging
+import time
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -22,6 +23,8 @@ from src.services.decision_audit_context import (
 )
 from src.services.decision_audit_service import DecisionAuditService
 from src.services.gateway_provider import get_data_gateway
+from src.services.metrics import AGENT_TIME_TO_FIRST_TOKEN_SECONDS, AGENT_TURN_SECONDS
+from src.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +216,7 @@ async def process_message(
     Yields:
         Event dicts with 'event' and 'data' keys.
     """
+    turn_started = time.perf_counter()
     existing_run_id = get_decision_run_id()
     created_run_id: str | None = None
     run_token = None
@@ -238,38 +242,59 @@ async def process_message(
                 source_info = None
 
             # Ensure agent exists (creates + starts if needed)
-            await ensure_agent(session, source_info, interactive_shipping)
+            agent_started = await ensure_agent(session, source_info, interactive_shipping)
 
             # Wire emitter bridge for tool events (preview_ready, etc.)
+            bridge = session.agent.emitter_bridge
             if emit_callback:
-                session.agent.emitter_bridge.callback = emit_callback
-
-            try:
-                async for event in session.agent.process_message_stream(content):
-                    yield event
-
-                    # Store complete text blocks in session history
-                    if event.get("event") == "agent_message":
-                        text = event.get("data", {}).get("text", "")
-                        if text:
-                            session.add_message("assistant", text)
-                    elif event.get("event") == "error":
-                        run_status = AgentDecisionRunStatus.failed
-                    elif event.get("event") == "preview_ready":
-                        event_job_id = event.get("data", {}).get("job_id")
-                        if isinstance(event_job_id, str) and event_job_id:
-                            set_decision_job_id(event_job_id)
-                            DecisionAuditService.set_run_job_id(
-                                get_decision_run_id(),
-                                event_job_id,
-                            )
-            finally:
-                if emit_callback:
-                    session.agent.emitter_bridge.callback = None
+                bridge.callback = emit_callback
+
+            # The turn span is opened after ensure_agent so SDK background
+            # tasks started there never inherit it; tools join the turn's
+            # trace through the bridge instead.
+            with span(
+                "agent.turn",
+                {"session.id": session.session_id, "interactive": interactive_shipping},
+            ) as turn_span:
+                bridge.traceparent = turn_span.traceparent
+                try:
+                    first_event = True
+                    async for event in session.agent.process_message_stream(content):
+                        if first_event:
+                            first_event = False
+                            AGENT_TIME_TO_FIRST_TOKEN_SECONDS.labels(
+                                "cold" if agent_started else "reused",
+                            ).observe(time.perf_counter() - turn_started)
+                        yield event
+
+                        # Store complete text blocks in session history
+                        if event.get("event") == "agent_message":
+                            text = event.get("data", {}).get("text", "")
+                            if text:
+                                session.add_message("assistant", text)
+                        elif event.get("event") == "error":
+                            run_status = AgentDecisionRunStatus.failed
+                            turn_span.set_attribute("error", True)
+                        elif event.get("event") == "preview_ready":
+                            event_job_id = event.get("data", {}).get("job_id")
+                            if isinstance(event_job_id, str) and event_job_id:
+                                turn_span.set_attribute("job.id", event_job_id)
+                                set_decision_job_id(event_job_id)
+                                DecisionAuditService.set_run_job_id(
+                                    get_decision_run_id(),
+                                    event_job_id,
+                                )
+                finally:
+                    bridge.traceparent = None
+                    if emit_callback:
+                        bridge.callback = None
     except Exception:
         run_status = AgentDecisionRunStatus.failed
         raise
     finally:
+        AGENT_TURN_SECONDS.labels(run_status.value).observe(
+            time.perf_counter() - turn_started,
+        )
         try:
             if created_run_id is not None:
                 DecisionAuditService.complete_run(
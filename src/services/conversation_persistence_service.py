@@ -7,6 +7,7 @@ writes messages — the backend owns all persistence.
 
 import json
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -20,6 +21,9 @@ from src.db.models import (  # noqa: E402
     generate_uuid,
     utc_now_iso,
 )
+from src.db.write_queue import run_write  # noqa: E402
+
+_EXPORT_BATCH_SIZE = 500
 
 
 class ConversationPersistenceService:
@@ -77,36 +81,39 @@ class ConversationPersistenceService:
         Returns:
             The created ConversationMessage.
         """
-        # Compute next sequence number.
-        # Note: For SQLite with single-writer semantics, SELECT+INSERT
-        # is safe within a single transaction. If migrating to Postgres with
-        # concurrent writes, consider using a DB sequence or SELECT FOR UPDATE.
-        max_seq = (
-            self._db.query(ConversationMessage.sequence)
-            .filter_by(session_id=session_id)
-            .order_by(ConversationMessage.sequence.desc())
-            .first()
-        )
-        next_seq = (max_seq[0] + 1) if max_seq else 1
-
-        msg = ConversationMessage(
-            id=generate_uuid(),
-            session_id=session_id,
-            role=role,
-            message_type=message_type,
-            content=content,
-            metadata_json=json.dumps(metadata) if metadata else None,
-            sequence=next_seq,
-        )
-        self._db.add(msg)
-
-        # Update session's updated_at
-        session = self._db.get(ConversationSession, session_id)
-        if session:
-            session.updated_at = utc_now_iso()
-
-        self._db.commit()
-        return msg
+        def _append(db: Session) -> ConversationMessage:
+            # Compute next sequence number.
+            # Note: For SQLite with single-writer semantics, SELECT+INSERT
+            # is safe within a single transaction. If migrating to Postgres with
+            # concurrent writes, consider using a DB sequence or SELECT FOR UPDATE.
+            max_seq = (
+                db.query(ConversationMessage.sequence)
+                .filter_by(session_id=session_id)
+                .order_by(ConversationMessage.sequence.desc())
+                .first()
+            )
+            next_seq = (max_seq[0] + 1) if max_seq else 1
+
+            msg = ConversationMessage(
+                id=generate_uuid(),
+                session_id=session_id,
+                role=role,
+                message_type=message_type,
+                content=content,
+                metadata_json=json.dumps(metadata) if metadata else None,
+                sequence=next_seq,
+            )
+            db.add(msg)
+
+            # Update session's updated_at
+            session = db.get(ConversationSession, session_id)
+            if session:
+                session.updated_at = utc_now_iso()
+
+            db.flush()
+            return msg
+
+        return run_write(_append, self._db)
 
     def list_sessions(
         self,
@@ -196,44 +203,23 @@ class ConversationPersistenceService:
         if limit is not None:
             query = query.limit(limit)
 
-        messages = []
-        for m in query.all():
-            metadata = None
-            if m.metadata_json:
-                try:
-                    metadata = json.loads(m.metadata_json)
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning("Corrupted metadata_json for message %s", m.id)
-            messages.append({
-                "id": m.id,
-                "role": m.role,
-                "message_type": m.message_type,
-                "content": m.content,
-                "metadata": metadata,
-                "sequence": m.sequence,
-                "created_at": m.created_at,
-            })
-
-        context = None
-        if session.context_data:
-            try:
-                context = json.loads(session.context_data)
-            except (json.JSONDecodeError, TypeError):
-                logger.warning("Corrupted context_data for session %s", session.id)
-
         return {
-            "session": {
-                "id": session.id,
-                "title": session.title,
-                "mode": session.mode,
-                "context_data": context,
-                "is_active": session.is_active,
-                "created_at": session.created_at,
-                "updated_at": session.updated_at,
-            },
-            "messages": messages,
+            "session": _session_to_dict(session),
+            "messages": [_message_to_dict(m) for m in query.all()],
         }
 
+    def get_session(self, session_id: str) -> dict[str, Any] | None:
+        """Load a session's metadata without its messages.
+
+        Args:
+            session_id: Session ID.
+
+        Returns:
+            Session dict (the ``session`` part of an export), or None.
+        """
+        session = self._db.get(ConversationSession, session_id)
+        return _session_to_dict(session) if session is not None else None
+
     def update_session_title(self, session_id: str, title: str) -> bool:
         """Set the session title.
 
@@ -366,3 +352,82 @@ class ConversationPersistenceService:
             "session": result["session"],
             "messages": result["messages"],
         }
+
+    def iter_export_json(
+        self, session_id: str, batch_size: int = _EXPORT_BATCH_SIZE
+    ) -> Iterator[str]:
+        """Yield the ``export_session_json`` document as JSON text fragments.
+
+        Produces the same indented document as ``json.dumps(export,
+        indent=2)``, but reads messages ``batch_size`` at a time, so
+        sessions of any length export in constant memory.
+
+        Args:
+            session_id: Session ID.
+            batch_size: Messages fetched per database round trip.
+
+        Yields:
+            Consecutive fragments of the JSON document; nothing if the
+            session does not exist.
+        """
+        session = self._db.get(ConversationSession, session_id)
+        if session is None:
+            return
+        yield (
+            "{\n"
+            f'  "exported_at": {json.dumps(utc_now_iso())},\n'
+            f'  "session": {_indented_json(_session_to_dict(session), 1)},\n'
+            '  "messages": ['
+        )
+        query = (
+            self._db.query(ConversationMessage)
+            .filter_by(session_id=session_id)
+            .order_by(ConversationMessage.sequence)
+            .yield_per(batch_size)
+        )
+        separator = "\n    "
+        for m in query:
+            yield separator + _indented_json(_message_to_dict(m), 2)
+            separator = ",\n    "
+        yield ("]" if separator == "\n    " else "\n  ]") + "\n}"
+
+
+def _session_to_dict(session: ConversationSession) -> dict[str, Any]:
+    context = None
+    if session.context_data:
+        try:
+            context = json.loads(session.context_data)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Corrupted context_data for session %s", session.id)
+    return {
+        "id": session.id,
+        "title": session.title,
+        "mode": session.mode,
+        "context_data": context,
+        "is_active": session.is_active,
+        "created_at": session.created_at,
+        "updated_at": session.updated_at,
+    }
+
+
+def _message_to_dict(m: ConversationMessage) -> dict[str, Any]:
+    metadata = None
+    if m.metadata_json:
+        try:
+            metadata = json.loads(m.metadata_json)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Corrupted metadata_json for message %s", m.id)
+    return {
+        "id": m.id,
+        "role": m.role,
+        "message_type": m.message_type,
+        "content": m.content,
+        "metadata": metadata,
+        "sequence": m.sequence,
+        "created_at": m.created_at,
+    }
+
+
+def _indented_json(value: Any, depth: int) -> str:
+    """``json.dumps(value, indent=2)`` nested ``depth`` levels deep."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
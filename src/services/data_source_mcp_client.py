@@ -7,6 +7,7 @@ via a process-global, long-lived stdio connection.
 import logging
 import os
 import sys
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -18,6 +19,8 @@ from src.services.mapping_cache import (
     should_invalidate as mapping_cache_should_invalidate,
 )
 from src.services.mcp_client import MCPClient
+from src.services.metrics import DATA_SOURCE_CALL_SECONDS
+from src.utils.tracing import span, tracing_env
 
 # -- Gateway-local DTOs --------------------------------------------------------
 
@@ -99,6 +102,8 @@ class DataSourceMCPClient:
             env={
                 "PYTHONPATH": _PROJECT_ROOT,
                 "PATH": os.environ.get("PATH", ""),
+                "OTEL_SERVICE_NAME": "shipagent-data-source",
+                **tracing_env(),
             },
         )
 
@@ -145,6 +150,20 @@ class DataSourceMCPClient:
     async def _call_tool(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Call MCP tool with one reconnect retry on transport failures."""
         await self._ensure_connected()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span("data_source.call_tool", {"mcp.tool": name}):
+                result = await self._call_tool_reconnecting(name, args)
+            outcome = "ok"
+            return result
+        finally:
+            DATA_SOURCE_CALL_SECONDS.labels(name, outcome).observe(
+                time.perf_counter() - started,
+            )
+
+    async def _call_tool_reconnecting(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
+        """Call MCP tool, reconnecting once if the transport has failed."""
         try:
             return await self._mcp.call_tool(name, args)
         except Exception as e:
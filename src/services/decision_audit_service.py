@@ -14,11 +14,14 @@ import queue
 import re
 import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy import desc
+from sqlalchemy.orm import Session
 
 from src.db.connection import get_db_context
 from src.db.models import (
@@ -27,7 +30,9 @@ from src.db.models import (
     AgentDecisionPhase,
     AgentDecisionRun,
     AgentDecisionRunStatus,
+    generate_uuid,
 )
+from src.db.write_queue import get_write_queue, on_event_loop
 from src.services.audit_service import redact_sensitive
 from src.services.decision_audit_context import get_decision_run_id
 
@@ -37,6 +42,7 @@ _DEFAULT_JSONL_PATH = "/app/data/agent-decision-log.jsonl"
 _DEFAULT_RETENTION_DAYS = 30
 _DEFAULT_MAX_PAYLOAD_BYTES = 16384
 _CLEANUP_INTERVAL_SECONDS = 3600
+_EXPORT_BATCH_SIZE = 500
 
 _EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
 _PHONE_RE = re.compile(r"\b(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}\b")
@@ -139,6 +145,18 @@ def _jsonl_writer(path: Path) -> _JSONLMirrorWriter:
         return writer
 
 
+def _finish_queued_event(
+    done: Future[tuple[int, str | None, str]],
+    mirror: Callable[[tuple[int, str | None, str]], None],
+) -> None:
+    """Mirror a queued decision event once the writer has committed it."""
+    exc = done.exception()
+    if exc is not None:
+        logger.warning("Decision audit log_event failed: %s", exc)
+        return
+    mirror(done.result())
+
+
 class DecisionAuditService:
     """Service for writing/querying the centralized agent decision ledger."""
 
@@ -356,72 +374,94 @@ class DecisionAuditService:
         actor_value = actor.value if isinstance(actor, AgentDecisionActor) else str(actor)
         timestamp = _utc_now_iso()
         payload_redacted_json, payload_hash = cls._prepare_payload(payload)
+        event_id = generate_uuid()
 
-        with get_db_context() as db:
-            try:
-                latest = (
-                    db.query(AgentDecisionEvent)
-                    .filter(AgentDecisionEvent.run_id == run_id)
-                    .order_by(desc(AgentDecisionEvent.seq))
-                    .first()
-                )
-                seq = (latest.seq + 1) if latest else 1
-                prev_hash = latest.event_hash if latest else None
-                event_hash = _sha256_text(
-                    _canonical_json(
-                        {
-                            "run_id": run_id,
-                            "seq": seq,
-                            "timestamp": timestamp,
-                            "phase": phase_value,
-                            "event_name": event_name,
-                            "actor": actor_value,
-                            "tool_name": tool_name or "",
-                            "payload_hash": payload_hash,
-                            "latency_ms": latency_ms,
-                            "prev_event_hash": prev_hash or "",
-                        }
-                    )
+        def _append(db: Session) -> tuple[int, str | None, str]:
+            latest = (
+                db.query(AgentDecisionEvent)
+                .filter(AgentDecisionEvent.run_id == run_id)
+                .order_by(desc(AgentDecisionEvent.seq))
+                .first()
+            )
+            seq = (latest.seq + 1) if latest else 1
+            prev_hash = latest.event_hash if latest else None
+            event_hash = _sha256_text(
+                _canonical_json(
+                    {
+                        "run_id": run_id,
+                        "seq": seq,
+                        "timestamp": timestamp,
+                        "phase": phase_value,
+                        "event_name": event_name,
+                        "actor": actor_value,
+                        "tool_name": tool_name or "",
+                        "payload_hash": payload_hash,
+                        "latency_ms": latency_ms,
+                        "prev_event_hash": prev_hash or "",
+                    }
                 )
+            )
+
+            event = AgentDecisionEvent(
+                id=event_id,
+                run_id=run_id,
+                seq=seq,
+                timestamp=timestamp,
+                phase=phase_value,
+                event_name=event_name,
+                actor=actor_value,
+                tool_name=tool_name,
+                payload_redacted=payload_redacted_json,
+                payload_hash=payload_hash,
+                latency_ms=latency_ms,
+                prev_event_hash=prev_hash,
+                event_hash=event_hash,
+            )
+            db.add(event)
+            db.flush()
+            return seq, prev_hash, event_hash
+
+        def _mirror(appended: tuple[int, str | None, str]) -> None:
+            seq, prev_hash, event_hash = appended
+            cls._mirror_append(
+                {
+                    "record_type": "event",
+                    "timestamp": timestamp,
+                    "run_id": run_id,
+                    "event_id": event_id,
+                    "seq": seq,
+                    "phase": phase_value,
+                    "event_name": event_name,
+                    "actor": actor_value,
+                    "tool_name": tool_name,
+                    "payload_hash": payload_hash,
+                    "latency_ms": latency_ms,
+                    "prev_event_hash": prev_hash,
+                    "event_hash": event_hash,
+                }
+            )
 
-                event = AgentDecisionEvent(
-                    run_id=run_id,
-                    seq=seq,
-                    timestamp=timestamp,
-                    phase=phase_value,
-                    event_name=event_name,
-                    actor=actor_value,
-                    tool_name=tool_name,
-                    payload_redacted=payload_redacted_json,
-                    payload_hash=payload_hash,
-                    latency_ms=latency_ms,
-                    prev_event_hash=prev_hash,
-                    event_hash=event_hash,
+        # The hash chain reads the run's latest event, so appends are
+        # serialized through the single-writer queue when it is enabled.
+        # On the event loop the append is queued without waiting for the
+        # writer's current group; the event ID is known up front.
+        write_queue = get_write_queue()
+        try:
+            if write_queue is not None and on_event_loop():
+                write_queue.submit(_append).add_done_callback(
+                    lambda done: _finish_queued_event(done, _mirror),
                 )
-                db.add(event)
-                db.flush()
-                event_id = event.id
-            except Exception as exc:
-                logger.warning("Decision audit log_event failed: %s", exc)
-                return None
+                return event_id
+            if write_queue is not None:
+                appended = write_queue.run(_append)
+            else:
+                with get_db_context() as db:
+                    appended = _append(db)
+        except Exception as exc:
+            logger.warning("Decision audit log_event failed: %s", exc)
+            return None
 
-        cls._mirror_append(
-            {
-                "record_type": "event",
-                "timestamp": timestamp,
-                "run_id": run_id,
-                "event_id": event_id,
-                "seq": seq,
-                "phase": phase_value,
-                "event_name": event_name,
-                "actor": actor_value,
-                "tool_name": tool_name,
-                "payload_hash": payload_hash,
-                "latency_ms": latency_ms,
-                "prev_event_hash": prev_hash,
-                "event_hash": event_hash,
-            }
-        )
+        _mirror(appended)
         return event_id
 
     @classmethod
@@ -577,6 +617,30 @@ class DecisionAuditService:
         started_after: str | None = None,
         started_before: str | None = None,
     ) -> list[dict[str, Any]]:
+        return list(
+            cls.iter_export_events(
+                run_id=run_id,
+                job_id=job_id,
+                started_after=started_after,
+                started_before=started_before,
+            )
+        )
+
+    @classmethod
+    def iter_export_events(
+        cls,
+        *,
+        run_id: str | None = None,
+        job_id: str | None = None,
+        started_after: str | None = None,
+        started_before: str | None = None,
+        batch_size: int = _EXPORT_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield matching events oldest first, ``batch_size`` rows per fetch.
+
+        The session stays open until the iterator is exhausted or closed,
+        so exports of any size run in constant memory.
+        """
         with get_db_context() as db:
             query = db.query(AgentDecisionEvent, AgentDecisionRun)
             query = query.join(AgentDecisionRun, AgentDecisionEvent.run_id == AgentDecisionRun.id)
@@ -591,16 +655,14 @@ class DecisionAuditService:
 
             rows = (
                 query.order_by(AgentDecisionEvent.timestamp.asc(), AgentDecisionEvent.seq.asc())
-                .all()
+                .yield_per(batch_size)
             )
-            out: list[dict[str, Any]] = []
             for event, run in rows:
                 item = cls._event_to_dict(event)
                 item["run_status"] = run.status
                 item["job_id"] = run.job_id
                 item["session_id"] = run.session_id
-                out.append(item)
-        return out
+                yield item
 
     @classmethod
     def cleanup_retention(cls) -> dict[str, int]:
@@ -6,11 +6,18 @@ required and what InternationalForms sections must be populated.
 
 The rules engine is deterministic and testable — compliance logic lives
 here, not in prompts or conversation flow.
+
+Requirement lookups are pure functions of the lane, service, packaging and
+the INTERNATIONAL_ENABLED_LANES config, so results are compiled once per
+config version into immutable RequirementSets and served from a cache.
+Changing the env var changes the config version and invalidates implicitly;
+clear_requirements_cache() drops everything explicitly.
 """
 
+import functools
 import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
 
 from src.services.ups_constants import (
@@ -41,6 +48,19 @@ DOMESTIC_ONLY_SERVICES: frozenset[str] = frozenset({
     "14",  # Next Day Air Early
 })
 
+INTERNATIONAL_ENABLED_LANES_ENV = "INTERNATIONAL_ENABLED_LANES"
+
+# Every service code accepted on domestic lanes (domestic + international).
+_ALL_SERVICES: tuple[str, ...] = tuple(
+    sorted(DOMESTIC_ONLY_SERVICES | SUPPORTED_INTERNATIONAL_SERVICES)
+)
+_INTERNATIONAL_SERVICES: tuple[str, ...] = tuple(
+    sorted(SUPPORTED_INTERNATIONAL_SERVICES)
+)
+
+# Upper bound on distinct (lane, service, packaging, config) entries cached.
+_REQUIREMENTS_CACHE_SIZE = 4096
+
 # Lanes requiring InvoiceLineTotal
 INVOICE_LINE_TOTAL_LANES: frozenset[str] = frozenset({"US-CA", "US-PR"})
 
@@ -76,10 +96,13 @@ class ValidationError:
     error_code: str = "E-2013"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RequirementSet:
     """Requirements for a specific shipping lane and service.
 
+    Immutable and hashable: instances are shared between every caller that
+    asks about the same lane, so they must never be modified in place.
+
     Attributes:
         rule_version: Version of the rules that produced this result.
         effective_date: Date these rules became effective.
@@ -97,7 +120,7 @@ class RequirementSet:
     """
 
     rule_version: str = RULE_VERSION
-    effective_date: str = field(default_factory=lambda: date.today().isoformat())
+    effective_date: str = ""
     is_international: bool = False
     requires_description: bool = False
     requires_shipper_contact: bool = False
@@ -105,11 +128,46 @@ class RequirementSet:
     requires_invoice_line_total: bool = False
     requires_international_forms: bool = False
     requires_commodities: bool = False
-    supported_services: list[str] = field(default_factory=list)
+    supported_services: tuple[str, ...] = ()
     currency_code: str = DEFAULT_CURRENCY_CODE
     form_type: str = DEFAULT_FORM_TYPE
     not_shippable_reason: str | None = None
 
+    def __post_init__(self) -> None:
+        """Default effective_date to today when not supplied."""
+        if not self.effective_date:
+            object.__setattr__(self, "effective_date", date.today().isoformat())
+
+
+def lane_config_version() -> str:
+    """Return the current lane configuration version.
+
+    The raw INTERNATIONAL_ENABLED_LANES value is the version: any change
+    to it selects a different set of compiled requirement entries.
+
+    Returns:
+        Opaque config version string.
+    """
+    return os.environ.get(INTERNATIONAL_ENABLED_LANES_ENV, "")
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_enabled_lanes(config: str) -> frozenset[str]:
+    """Parse an INTERNATIONAL_ENABLED_LANES value into a lane set."""
+    if not config:
+        return frozenset()
+    return frozenset(lane.strip().upper() for lane in config.split(","))
+
+
+def _lane_enabled_for(config: str, origin: str, destination: str) -> bool:
+    """Check a lane against a specific config version."""
+    lanes = _compile_enabled_lanes(config)
+    if not lanes:
+        return False
+    if "*" in lanes:
+        return True
+    return f"{origin.upper()}-{destination.upper()}" in lanes
+
 
 def is_lane_enabled(origin: str, destination: str) -> bool:
     """Check if a shipping lane is enabled via feature flag.
@@ -121,13 +179,7 @@ def is_lane_enabled(origin: str, destination: str) -> bool:
     Returns:
         True if the lane is enabled.
     """
-    enabled = os.environ.get("INTERNATIONAL_ENABLED_LANES", "")
-    if not enabled:
-        return False
-    lanes = {lane.strip().upper() for lane in enabled.split(",")}
-    if "*" in lanes:
-        return True
-    return f"{origin.upper()}-{destination.upper()}" in lanes
+    return _lane_enabled_for(lane_config_version(), origin, destination)
 
 
 def recipient_state_required(destination: str) -> bool:
@@ -255,33 +307,69 @@ def get_requirements(
         packaging_code: UPS packaging type code (e.g., "01" for Letter).
 
     Returns:
-        RequirementSet with all field requirements for this lane.
+        RequirementSet with all field requirements for this lane. The
+        instance is shared and immutable.
+    """
+    return _compiled_requirements(
+        origin.upper().strip(),
+        destination.upper().strip(),
+        service_code.strip(),
+        packaging_code,
+        lane_config_version(),
+        date.today().isoformat(),
+    )
+
+
+def clear_requirements_cache() -> None:
+    """Drop all compiled lane requirements.
+
+    Call after changing lane configuration through a path other than the
+    INTERNATIONAL_ENABLED_LANES env var (which invalidates implicitly), or
+    after editing rule constants at runtime in tests.
+    """
+    _compiled_requirements.cache_clear()
+    _compile_enabled_lanes.cache_clear()
+
+
+@functools.lru_cache(maxsize=_REQUIREMENTS_CACHE_SIZE)
+def _compiled_requirements(
+    origin: str,
+    destination: str,
+    service_code: str,
+    packaging_code: str | None,
+    lanes_config: str,
+    effective_date: str,
+) -> RequirementSet:
+    """Compute requirements for normalized inputs under one config version.
+
+    ``effective_date`` is part of the key so cached entries roll over at
+    midnight rather than reporting a stale date.
     """
-    origin = origin.upper().strip()
-    destination = destination.upper().strip()
-    service_code = service_code.strip()
     lane_key = f"{origin}-{destination}"
 
     # Domestic shipment (same country, not PR)
     if origin == destination and destination != "PR":
         return RequirementSet(
+            effective_date=effective_date,
             is_international=False,
-            supported_services=list(DOMESTIC_ONLY_SERVICES | SUPPORTED_INTERNATIONAL_SERVICES),
+            supported_services=_ALL_SERVICES,
         )
 
     # US→PR: US territory but requires InvoiceLineTotal for billing
     if origin == "US" and destination == "PR":
         return RequirementSet(
+            effective_date=effective_date,
             is_international=False,
             requires_invoice_line_total=True,
-            supported_services=list(DOMESTIC_ONLY_SERVICES | SUPPORTED_INTERNATIONAL_SERVICES),
+            supported_services=_ALL_SERVICES,
         )
 
     # KILL SWITCH: Feature flag is the sole international gate.
     # If lane is not enabled via INTERNATIONAL_ENABLED_LANES env var,
     # return not_shippable immediately. This is the production safety gate.
-    if not is_lane_enabled(origin, destination):
+    if not _lane_enabled_for(lanes_config, origin, destination):
         return RequirementSet(
+            effective_date=effective_date,
             is_international=True,
             not_shippable_reason=(
                 f"International shipping to {destination} is not enabled. "
@@ -292,6 +380,7 @@ def get_requirements(
     # Check service code is valid for international
     if service_code in DOMESTIC_ONLY_SERVICES:
         return RequirementSet(
+            effective_date=effective_date,
             is_international=True,
             not_shippable_reason=(
                 f"Service '{service_code}' is domestic-only and cannot be used for "
@@ -302,6 +391,7 @@ def get_requirements(
 
     if service_code not in SUPPORTED_INTERNATIONAL_SERVICES:
         return RequirementSet(
+            effective_date=effective_date,
             is_international=True,
             not_shippable_reason=(
                 f"Unknown service code '{service_code}'. Supported international services: "
@@ -312,6 +402,7 @@ def get_requirements(
     # UPS Letter exemption: no description, forms, or commodities required
     if _is_ups_letter(packaging_code):
         return RequirementSet(
+            effective_date=effective_date,
             is_international=True,
             requires_description=False,
             requires_shipper_contact=True,
@@ -319,7 +410,7 @@ def get_requirements(
             requires_invoice_line_total=lane_key in INVOICE_LINE_TOTAL_LANES,
             requires_international_forms=False,
             requires_commodities=False,
-            supported_services=list(SUPPORTED_INTERNATIONAL_SERVICES),
+            supported_services=_INTERNATIONAL_SERVICES,
             currency_code=DEFAULT_CURRENCY_CODE,
             form_type=DEFAULT_FORM_TYPE,
         )
@@ -327,6 +418,7 @@ def get_requirements(
     # EU-to-EU Standard exemption: no description, forms, or commodities required
     if _is_eu_to_eu_standard(origin, destination, service_code):
         return RequirementSet(
+            effective_date=effective_date,
             is_international=True,
             requires_description=False,
             requires_shipper_contact=True,
@@ -334,13 +426,14 @@ def get_requirements(
             requires_invoice_line_total=lane_key in INVOICE_LINE_TOTAL_LANES,
             requires_international_forms=False,
             requires_commodities=False,
-            supported_services=list(SUPPORTED_INTERNATIONAL_SERVICES),
+            supported_services=_INTERNATIONAL_SERVICES,
             currency_code=DEFAULT_CURRENCY_CODE,
             form_type=DEFAULT_FORM_TYPE,
         )
 
     # Standard international: full requirements
     return RequirementSet(
+        effective_date=effective_date,
         is_international=True,
         requires_description=True,
         requires_shipper_contact=True,
@@ -348,7 +441,7 @@ def get_requirements(
         requires_invoice_line_total=lane_key in INVOICE_LINE_TOTAL_LANES,
         requires_international_forms=True,
         requires_commodities=True,
-        supported_services=list(SUPPORTED_INTERNATIONAL_SERVICES),
+        supported_services=_INTERNATIONAL_SERVICES,
         currency_code=DEFAULT_CURRENCY_CODE,
         form_type=DEFAULT_FORM_TYPE,
     )
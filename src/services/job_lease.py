@@ -0,0 +1,273 @@
+"""Database leases that give one worker ownership of a running batch job.
+
+With several API workers (or nodes) sharing one database, a running job
+must be executed by exactly one of them, and crash recovery on a worker
+that starts up must not touch in-flight rows that another live worker is
+still processing. Ownership is recorded on the Job row itself:
+
+- acquire_lease() claims a job with one conditional UPDATE that succeeds
+  only if the job is unleased, already ours, or its lease has expired.
+- LeaseHeartbeat renews the lease every third of its TTL while a batch
+  runs. If a renewal finds the lease taken over, the batch task is
+  cancelled so two workers never submit the same rows.
+- release_lease() clears ownership when the batch finishes.
+
+Lease timestamps are ISO8601 UTC strings like every other Job timestamp,
+so expiry comparisons are plain string comparisons in SQL.
+
+Configuration:
+    JOB_LEASE_TTL_S: Seconds a lease stays valid without a heartbeat
+        (default 60). A crashed worker's jobs can be recovered after this.
+
+Example:
+    owner = worker_id()
+    if not acquire_lease(db, job_id, owner):
+        raise JobLeaseHeldError(job_id)
+    async with LeaseHeartbeat(job_id, owner):
+        await engine.execute(...)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from src.db.models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TTL_S = 60.0
+
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobLeaseHeldError(RuntimeError):
+    """Raised when another live worker holds a job's lease."""
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(f"Job {job_id} is leased by another worker")
+        self.job_id = job_id
+
+
+def resolve_lease_ttl() -> float:
+    """Return JOB_LEASE_TTL_S, falling back to the default when invalid."""
+    raw = os.environ.get("JOB_LEASE_TTL_S", str(DEFAULT_LEASE_TTL_S))
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0.0
+    if value <= 0:
+        logger.warning(
+            "Invalid JOB_LEASE_TTL_S=%r, defaulting to %.0f",
+            raw,
+            DEFAULT_LEASE_TTL_S,
+        )
+        return DEFAULT_LEASE_TTL_S
+    return value
+
+
+def worker_id() -> str:
+    """Return this process's lease owner ID (host:pid:nonce)."""
+    return _WORKER_ID
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _expiry_iso(ttl_s: float) -> str:
+    return (datetime.now(UTC) + timedelta(seconds=ttl_s)).isoformat()
+
+
+def acquire_lease(
+    db: Session,
+    job_id: str,
+    owner: str | None = None,
+    ttl_s: float | None = None,
+) -> bool:
+    """Claim a job if it is unleased, already ours, or its lease expired.
+
+    Args:
+        db: Database session; the claim is committed.
+        job_id: Job to claim.
+        owner: Lease owner ID; defaults to worker_id().
+        ttl_s: Lease validity; defaults to JOB_LEASE_TTL_S.
+
+    Returns:
+        True if this owner now holds the lease.
+    """
+    owner = owner or worker_id()
+    ttl_s = resolve_lease_ttl() if ttl_s is None else ttl_s
+    result = db.execute(
+        update(Job)
+        .where(
+            Job.id == job_id,
+            or_(
+                Job.lease_owner.is_(None),
+                Job.lease_owner == owner,
+                Job.lease_expires_at < _now_iso(),
+            ),
+        )
+        .values(lease_owner=owner, lease_expires_at=_expiry_iso(ttl_s))
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def renew_lease(
+    db: Session,
+    job_id: str,
+    owner: str,
+    ttl_s: float | None = None,
+) -> bool:
+    """Extend a lease this owner still holds.
+
+    Args:
+        db: Database session; the renewal is committed.
+        job_id: Leased job.
+        owner: Lease owner ID.
+        ttl_s: New validity from now; defaults to JOB_LEASE_TTL_S.
+
+    Returns:
+        False if the lease was released or taken over.
+    """
+    ttl_s = resolve_lease_ttl() if ttl_s is None else ttl_s
+    result = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.lease_owner == owner)
+        .values(lease_expires_at=_expiry_iso(ttl_s))
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def release_lease(db: Session, job_id: str, owner: str) -> None:
+    """Clear a lease if this owner still holds it."""
+    db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.lease_owner == owner)
+        .values(lease_owner=None, lease_expires_at=None)
+    )
+    db.commit()
+
+
+def leased_job_ids(db: Session, job_ids: list[str] | None = None) -> set[str]:
+    """Return jobs whose lease is currently live.
+
+    Args:
+        db: Database session.
+        job_ids: Optional candidates to restrict the query to.
+
+    Returns:
+        IDs of jobs held by some worker right now.
+    """
+    query = db.query(Job.id).filter(
+        Job.lease_owner.isnot(None), Job.lease_expires_at >= _now_iso(),
+    )
+    if job_ids is not None:
+        if not job_ids:
+            return set()
+        query = query.filter(Job.id.in_(job_ids))
+    return {job_id for (job_id,) in query.all()}
+
+
+def lease_expiries(db: Session, job_ids: list[str]) -> dict[str, datetime | None]:
+    """Return when each job's lease expires.
+
+    Args:
+        db: Database session.
+        job_ids: Jobs to look up.
+
+    Returns:
+        Mapping of job_id to its lease expiry, or None when unleased.
+        Unknown jobs are omitted.
+    """
+    if not job_ids:
+        return {}
+    rows = db.query(Job.id, Job.lease_owner, Job.lease_expires_at).filter(
+        Job.id.in_(job_ids),
+    )
+    return {
+        job_id: datetime.fromisoformat(expires) if owner and expires else None
+        for job_id, owner, expires in rows.all()
+    }
+
+
+class LeaseHeartbeat:
+    """Async context manager that keeps a held lease alive.
+
+    Renews from its own session (the batch session is busy with row
+    writes) every third of the TTL. When the lease is lost, the task that
+    entered the context is cancelled. Transient renewal errors are logged
+    and retried on the next beat; the lease simply expires if they persist.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        owner: str | None = None,
+        ttl_s: float | None = None,
+        session_factory: Callable[[], AbstractContextManager[Session]] | None = None,
+    ) -> None:
+        """Initialize the heartbeat.
+
+        Args:
+            job_id: Leased job.
+            owner: Lease owner ID; defaults to worker_id().
+            ttl_s: Lease validity; defaults to JOB_LEASE_TTL_S.
+            session_factory: Context manager yielding a session; defaults
+                to get_db_context.
+        """
+        self.job_id = job_id
+        self.owner = owner or worker_id()
+        self.ttl_s = resolve_lease_ttl() if ttl_s is None else ttl_s
+        self.lost = False
+        self._session_factory = session_factory
+        self._task: asyncio.Task[None] | None = None
+        self._owner_task: asyncio.Task[Any] | None = None
+
+    def _session(self) -> AbstractContextManager[Session]:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from src.db.connection import get_db_context
+
+        return get_db_context()
+
+    async def _beat(self) -> None:
+        interval = self.ttl_s / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                with self._session() as db:
+                    held = renew_lease(db, self.job_id, self.owner, self.ttl_s)
+            except Exception as e:
+                logger.warning("Lease renewal failed for job %s: %s", self.job_id, e)
+                continue
+            if not held:
+                self.lost = True
+                logger.error(
+                    "Lease for job %s lost by %s; stopping its batch",
+                    self.job_id,
+                    self.owner,
+                )
+                if self._owner_task is not None:
+                    self._owner_task.cancel()
+                return
+
+    async def __aenter__(self) -> "LeaseHeartbeat":
+        self._owner_task = asyncio.current_task()
+        self._task = asyncio.create_task(self._beat())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
@@ -5,14 +5,22 @@ enforcing valid state transitions and supporting crash recovery through
 per-row status tracking.
 """
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import func
+from sqlalchemy import Select, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.db.bulk import copy_rows, update_rows
 from src.db.models import Job, JobRow, JobStatus, RowStatus
+from src.services.commodity_cache import get_commodity_cache
+from src.services.order_data_codec import get_parsed_order_cache
+
+# Max job_ids bound into a single IN (...) clause.
+_IN_CLAUSE_CHUNK = 500
 
 
 class InvalidStateTransition(Exception):
@@ -61,6 +69,59 @@ def _utc_now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+def _rows_query(job_id: str, status: RowStatus | None) -> Select[tuple[JobRow]]:
+    """Build the ordered row query shared by the sync and async services."""
+    stmt = select(JobRow).where(JobRow.job_id == job_id)
+    if status is not None:
+        stmt = stmt.where(JobRow.status == status.value)
+    return stmt.order_by(JobRow.row_number.asc())
+
+
+def _summary_totals_query(job_id: str) -> Select[tuple[int, int, int]]:
+    """Count needs_review/in_flight rows and sum completed cost in one pass."""
+    def _count(status: RowStatus):
+        return func.coalesce(func.sum(case((JobRow.status == status.value, 1), else_=0)), 0)
+
+    completed_cost = case(
+        (JobRow.status == RowStatus.completed.value, JobRow.cost_cents), else_=None,
+    )
+    return select(
+        _count(RowStatus.needs_review),
+        _count(RowStatus.in_flight),
+        func.coalesce(func.sum(completed_cost), 0),
+    ).where(JobRow.job_id == job_id)
+
+
+def _build_summary(
+    job: Job,
+    needs_review_count: int,
+    in_flight_count: int,
+    total_cost_cents: int,
+) -> dict[str, Any]:
+    """Assemble the job summary dict from the job and its row totals."""
+    # pending_count excludes needs_review and in_flight
+    pending_count = (
+        job.total_rows
+        - job.processed_rows
+        - needs_review_count
+        - in_flight_count
+    )
+    return {
+        "total_rows": job.total_rows,
+        "processed_rows": job.processed_rows,
+        "successful_rows": job.successful_rows,
+        "failed_rows": job.failed_rows,
+        "pending_count": pending_count,
+        "needs_review_count": needs_review_count,
+        "in_flight_count": in_flight_count,
+        "total_cost_cents": total_cost_cents,
+        "status": job.status,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+
+
 class JobService:
     """Service for job lifecycle management with state machine validation.
 
@@ -165,6 +226,8 @@ class JobService:
             return False
         self.db.delete(job)
         self.db.commit()
+        get_parsed_order_cache().invalidate(job_id)
+        get_commodity_cache().invalidate(job_id)
         return True
 
     # =========================================================================
@@ -218,11 +281,14 @@ class JobService:
             job.started_at = now
 
         # Set completed_at for terminal states
-        if new_status in (JobStatus.completed, JobStatus.failed, JobStatus.cancelled):
+        terminal = new_status in (JobStatus.completed, JobStatus.failed, JobStatus.cancelled)
+        if terminal:
             job.completed_at = now
 
         self.db.commit()
         self.db.refresh(job)
+        if terminal:
+            get_parsed_order_cache().invalidate(job_id)
         return job
 
     # =========================================================================
@@ -316,28 +382,67 @@ class JobService:
         if job is None:
             raise ValueError(f"Job not found: {job_id}")
 
-        rows = []
-        for data in row_data:
-            row = JobRow(
-                id=str(uuid4()),
-                job_id=job_id,
-                row_number=data["row_number"],
-                row_checksum=data["row_checksum"],
-                order_data=data.get("order_data"),
-                status=RowStatus.pending.value,
-            )
-            rows.append(row)
-            self.db.add(row)
+        payload = [
+            {
+                "id": str(uuid4()),
+                "job_id": job_id,
+                "row_number": data["row_number"],
+                "row_checksum": data["row_checksum"],
+                "order_data": data.get("order_data"),
+                "status": RowStatus.pending.value,
+            }
+            for data in row_data
+        ]
+        # COPY on Postgres, one executemany INSERT elsewhere — instead of an
+        # ORM add plus a refresh per row.
+        copy_rows(self.db, JobRow.__table__, payload)
 
         # Update job total row count
         job.total_rows = len(row_data)
         job.updated_at = _utc_now_iso()
 
         self.db.commit()
-        for row in rows:
-            self.db.refresh(row)
+        # One query loads every new row instead of a refresh per row.
+        by_id = {
+            row.id: row
+            for row in self.db.query(JobRow).filter(JobRow.job_id == job_id)
+        }
         self.db.refresh(job)
-        return rows
+        return [by_id[item["id"]] for item in payload]
+
+    def transition_rows(self, job_id: str, updates: list[dict[str, Any]]) -> int:
+        """Apply per-row state changes for one job in a single round trip.
+
+        Uses ``UPDATE ... FROM (VALUES ...)`` on Postgres and a keyed
+        executemany elsewhere. Updates are grouped by the columns they set,
+        so rows may change different fields.
+
+        Args:
+            job_id: The UUID of the parent job.
+            updates: Dicts with ``row_number`` plus the JobRow columns to set,
+                e.g. ``{"row_number": 3, "status": "failed", "error_code": "E-3001"}``.
+
+        Returns:
+            Number of rows updated.
+        """
+        ids = dict(
+            self.db.query(JobRow.row_number, JobRow.id).filter(JobRow.job_id == job_id).all()
+        )
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for change in updates:
+            row_id = ids.get(change["row_number"])
+            if row_id is None:
+                continue
+            columns = tuple(sorted(k for k in change if k != "row_number"))
+            groups.setdefault(columns, []).append(
+                {"id": row_id, **{name: change[name] for name in columns}}
+            )
+
+        updated = 0
+        for rows in groups.values():
+            updated += update_rows(self.db, JobRow.__table__, "id", rows)
+        self.db.commit()
+        return updated
 
     def get_row(self, row_id: str) -> JobRow | None:
         """Get a row by its ID.
@@ -364,11 +469,7 @@ class JobService:
         Returns:
             List of JobRow objects ordered by row_number ASC.
         """
-        query = self.db.query(JobRow).filter(JobRow.job_id == job_id)
-        if status is not None:
-            query = query.filter(JobRow.status == status.value)
-        query = query.order_by(JobRow.row_number.asc())
-        return query.all()
+        return list(self.db.scalars(_rows_query(job_id, status)))
 
     def get_pending_rows(self, job_id: str) -> list[JobRow]:
         """Get all pending rows for a job.
@@ -392,6 +493,90 @@ class JobService:
         """
         return self.get_rows(job_id, status=RowStatus.failed)
 
+    def get_rows_for_jobs_in_status(
+        self,
+        job_status: JobStatus,
+        row_statuses: Iterable[RowStatus],
+    ) -> dict[str, list[JobRow]]:
+        """Get rows in the given statuses across all jobs in a job status.
+
+        Single joined query: only matching rows are loaded, never the full
+        row set of each job.
+
+        Args:
+            job_status: Parent job status to match (e.g. running).
+            row_statuses: Row statuses to include.
+
+        Returns:
+            Mapping of job_id to its matching rows ordered by row_number ASC.
+        """
+        values = [s.value for s in row_statuses]
+        rows = (
+            self.db.query(JobRow)
+            .join(Job, Job.id == JobRow.job_id)
+            .filter(Job.status == job_status.value)
+            .filter(JobRow.status.in_(values))
+            .order_by(JobRow.job_id.asc(), JobRow.row_number.asc())
+            .all()
+        )
+        grouped: dict[str, list[JobRow]] = {}
+        for row in rows:
+            grouped.setdefault(row.job_id, []).append(row)
+        return grouped
+
+    def get_job_ids_with_row_status(
+        self,
+        job_ids: Iterable[str],
+        row_statuses: Iterable[RowStatus],
+    ) -> set[str]:
+        """Return the subset of job_ids that have any row in row_statuses.
+
+        Args:
+            job_ids: Candidate job UUIDs.
+            row_statuses: Row statuses to look for.
+
+        Returns:
+            Set of job_ids with at least one matching row.
+        """
+        ids = list(job_ids)
+        values = [s.value for s in row_statuses]
+        found: set[str] = set()
+        # Chunked to stay under the SQLite bound-parameter limit.
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start:start + _IN_CLAUSE_CHUNK]
+            found.update(
+                job_id
+                for (job_id,) in self.db.query(JobRow.job_id)
+                .filter(JobRow.job_id.in_(chunk))
+                .filter(JobRow.status.in_(values))
+                .distinct()
+            )
+        return found
+
+    def get_active_job_ids(self, job_ids: Iterable[str]) -> set[str]:
+        """Return the subset of job_ids that are running or hold a live lease.
+
+        Args:
+            job_ids: Candidate job UUIDs.
+
+        Returns:
+            Set of job_ids a worker may still be executing.
+        """
+        from src.services.job_lease import leased_job_ids
+
+        ids = list(job_ids)
+        found: set[str] = set()
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            chunk = ids[start:start + _IN_CLAUSE_CHUNK]
+            found.update(
+                job_id
+                for (job_id,) in self.db.query(Job.id)
+                .filter(Job.id.in_(chunk))
+                .filter(Job.status == JobStatus.running.value)
+            )
+            found.update(leased_job_ids(self.db, chunk))
+        return found
+
     # =========================================================================
     # Row State Operations
     # =========================================================================
@@ -536,16 +721,21 @@ class JobService:
         job.completed_at = None
         job.updated_at = now
 
-        # Reset all rows to pending
-        rows = self.get_rows(job_id)
-        for row in rows:
-            row.status = RowStatus.pending.value
-            row.tracking_number = None
-            row.label_path = None
-            row.cost_cents = None
-            row.error_code = None
-            row.error_message = None
-            row.processed_at = None
+        # Reset all rows to pending in one statement instead of loading them.
+        self.db.execute(
+            update(JobRow)
+            .where(JobRow.job_id == job_id)
+            .values(
+                status=RowStatus.pending.value,
+                tracking_number=None,
+                label_path=None,
+                cost_cents=None,
+                error_code=None,
+                error_message=None,
+                processed_at=None,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
 
         self.db.commit()
         self.db.refresh(job)
@@ -575,49 +765,70 @@ class JobService:
         if job is None:
             raise ValueError(f"Job not found: {job_id}")
 
-        # Calculate counts by status
-        needs_review_count = (
-            self.db.query(func.count(JobRow.id))
-            .filter(JobRow.job_id == job_id)
-            .filter(JobRow.status == RowStatus.needs_review.value)
-            .scalar()
-        ) or 0
-
-        in_flight_count = (
-            self.db.query(func.count(JobRow.id))
-            .filter(JobRow.job_id == job_id)
-            .filter(JobRow.status == RowStatus.in_flight.value)
-            .scalar()
-        ) or 0
-
-        # pending_count excludes needs_review and in_flight
-        pending_count = (
-            job.total_rows
-            - job.processed_rows
-            - needs_review_count
-            - in_flight_count
-        )
+        totals = self.db.execute(_summary_totals_query(job_id)).one()
+        return _build_summary(job, *totals)
 
-        # Calculate total cost from successful rows
-        total_cost_result = (
-            self.db.query(func.sum(JobRow.cost_cents))
-            .filter(JobRow.job_id == job_id)
-            .filter(JobRow.status == RowStatus.completed.value)
-            .scalar()
-        )
-        total_cost_cents = total_cost_result or 0
-
-        return {
-            "total_rows": job.total_rows,
-            "processed_rows": job.processed_rows,
-            "successful_rows": job.successful_rows,
-            "failed_rows": job.failed_rows,
-            "pending_count": pending_count,
-            "needs_review_count": needs_review_count,
-            "in_flight_count": in_flight_count,
-            "total_cost_cents": total_cost_cents,
-            "status": job.status,
-            "created_at": job.created_at,
-            "started_at": job.started_at,
-            "completed_at": job.completed_at,
-        }
+
+class AsyncJobService:
+    """Read-only job queries on an ``AsyncSession``.
+
+    Backs the async read routes (job detail, rows, summary) so they await
+    the database instead of holding a threadpool worker. State changes
+    stay on ``JobService``, which owns the transition rules.
+
+    Attributes:
+        db: Async SQLAlchemy session for database operations.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize the async job service.
+
+        Args:
+            db: Async SQLAlchemy session for database operations.
+        """
+        self.db = db
+
+    async def get_job(self, job_id: str) -> Job | None:
+        """Get a job by its ID.
+
+        Args:
+            job_id: The UUID of the job to retrieve.
+
+        Returns:
+            The Job object if found, None otherwise.
+        """
+        return await self.db.get(Job, job_id)
+
+    async def get_rows(
+        self,
+        job_id: str,
+        status: RowStatus | None = None,
+    ) -> list[JobRow]:
+        """Get all rows for a job, optionally filtered by status.
+
+        Args:
+            job_id: The UUID of the parent job.
+            status: Filter by row status (optional).
+
+        Returns:
+            List of JobRow objects ordered by row_number ASC.
+        """
+        return list(await self.db.scalars(_rows_query(job_id, status)))
+
+    async def get_job_summary(self, job_id: str) -> dict[str, Any]:
+        """Get a summary of job progress and metrics.
+
+        Args:
+            job_id: The UUID of the job.
+
+        Returns:
+            The same dictionary as ``JobService.get_job_summary``.
+
+        Raises:
+            ValueError: If job not found.
+        """
+        job = await self.get_job(job_id)
+        if job is None:
+            raise ValueError(f"Job not found: {job_id}")
+        totals = (await self.db.execute(_summary_totals_query(job_id))).one()
+        return _build_summary(job, *totals)
@@ -1,22 +1,38 @@
 """Label storage backends for shipment labels.
 
 Provides a pluggable storage interface so labels are not tied to an
-ephemeral local filesystem in containerized deployments.
+ephemeral local filesystem in containerized deployments, plus an async
+facade that keeps blocking storage I/O off the batch event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Protocol
 
 logger = logging.getLogger(__name__)
 _s3_lifecycle_warning_emitted = False
 
+DEFAULT_LABEL_STORAGE_WORKERS = 8
+DEFAULT_LABEL_STORAGE_MAX_PENDING = 32
+# Labels above this size are uploaded to S3 as parallel multipart parts.
+DEFAULT_S3_MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+
 
 class LabelStorage(Protocol):
-    """Storage contract used by BatchEngine for label persistence."""
+    """Storage contract used by BatchEngine for label persistence.
+
+    Backends whose ``save_final`` is atomic (a reader can never observe a
+    partially written object) set ``atomic_final_writes`` so callers may
+    skip the staged write + promote round trip.
+    """
+
+    atomic_final_writes: bool
 
     def save_final(
         self,
@@ -75,6 +91,9 @@ def _warn_s3_staging_lifecycle(prefix: str) -> None:
 class LocalLabelStorage:
     """Filesystem-backed label storage."""
 
+    # write_bytes() can leave a truncated file behind on crash; use staging.
+    atomic_final_writes = False
+
     def __init__(self, base_dir: str | Path) -> None:
         self.base_dir = Path(base_dir)
 
@@ -125,7 +144,13 @@ class LocalLabelStorage:
 
 
 class S3LabelStorage:
-    """S3-backed label storage for durable label persistence."""
+    """S3-backed label storage for durable label persistence.
+
+    PUTs are atomic in S3 — an object is either fully visible or absent —
+    so final labels are written directly without the staging copy+delete.
+    """
+
+    atomic_final_writes = True
 
     def __init__(
         self,
@@ -133,11 +158,13 @@ class S3LabelStorage:
         prefix: str = "labels",
         region_name: str | None = None,
         endpoint_url: str | None = None,
+        multipart_threshold: int = DEFAULT_S3_MULTIPART_THRESHOLD_BYTES,
     ) -> None:
         self.bucket = bucket
         self.prefix = prefix.strip("/")
         self.region_name = region_name
         self.endpoint_url = endpoint_url
+        self.multipart_threshold = multipart_threshold
         self._client = None
 
     def _get_client(self):
@@ -171,6 +198,27 @@ class S3LabelStorage:
             return f"{self.prefix}/{filename}"
         return filename
 
+    def _put(self, key: str, pdf_bytes: bytes) -> None:
+        """Upload label bytes, switching to parallel multipart when large."""
+        client = self._get_client()
+        if len(pdf_bytes) < self.multipart_threshold:
+            client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=pdf_bytes,
+                ContentType="application/pdf",
+            )
+            return
+        from boto3.s3.transfer import TransferConfig
+
+        client.upload_fileobj(
+            io.BytesIO(pdf_bytes),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": "application/pdf"},
+            Config=TransferConfig(multipart_threshold=self.multipart_threshold),
+        )
+
     def save_final(
         self,
         tracking_number: str,
@@ -184,12 +232,7 @@ class S3LabelStorage:
             row_number=row_number,
         )
         key = self._final_key(filename)
-        self._get_client().put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=pdf_bytes,
-            ContentType="application/pdf",
-        )
+        self._put(key, pdf_bytes)
         return self._uri(key)
 
     def save_staged(
@@ -209,12 +252,7 @@ class S3LabelStorage:
             staged_key = f"{self.prefix}/staging/{job_id}/{filename}"
         else:
             staged_key = f"staging/{job_id}/{filename}"
-        self._get_client().put_object(
-            Bucket=self.bucket,
-            Key=staged_key,
-            Body=pdf_bytes,
-            ContentType="application/pdf",
-        )
+        self._put(staged_key, pdf_bytes)
         return self._uri(staged_key)
 
     def promote(self, staged_ref: str) -> str:
@@ -239,6 +277,148 @@ class S3LabelStorage:
             return False
 
 
+class AsyncLabelStorage:
+    """Async facade that runs a LabelStorage backend on a worker pool.
+
+    Blocking backend calls (filesystem writes, boto3 requests) run on a
+    dedicated thread pool so they never stall other in-flight rows on the
+    event loop. A semaphore bounds the number of queued operations, which
+    applies backpressure to callers instead of buffering unbounded label
+    bytes in memory.
+    """
+
+    def __init__(
+        self,
+        storage: LabelStorage,
+        max_workers: int = DEFAULT_LABEL_STORAGE_WORKERS,
+        max_pending: int = DEFAULT_LABEL_STORAGE_MAX_PENDING,
+    ) -> None:
+        self.storage = storage
+        self._max_workers = max(1, max_workers)
+        self._max_pending = max(1, max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    async def _run(self, fn, /, *args, **kwargs):
+        """Run ``fn`` on the storage pool, waiting for a free queue slot."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="label-storage",
+            )
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_pending)
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(
+                self._executor, lambda: fn(*args, **kwargs),
+            )
+
+    async def save_final(
+        self,
+        tracking_number: str,
+        pdf_bytes: bytes,
+        job_id: str = "",
+        row_number: int = 0,
+    ) -> str:
+        """Persist a final label off the event loop."""
+        return await self._run(
+            self.storage.save_final,
+            tracking_number=tracking_number,
+            pdf_bytes=pdf_bytes,
+            job_id=job_id,
+            row_number=row_number,
+        )
+
+    async def save_staged(
+        self,
+        tracking_number: str,
+        pdf_bytes: bytes,
+        job_id: str,
+        row_number: int,
+    ) -> str:
+        """Persist a staged label off the event loop."""
+        return await self._run(
+            self.storage.save_staged,
+            tracking_number=tracking_number,
+            pdf_bytes=pdf_bytes,
+            job_id=job_id,
+            row_number=row_number,
+        )
+
+    async def promote(self, staged_ref: str) -> str:
+        """Promote a staged label off the event loop."""
+        return await self._run(self.storage.promote, staged_ref)
+
+    async def exists(self, ref: str) -> bool:
+        """Check label existence off the event loop."""
+        return await self._run(self.storage.exists, ref)
+
+    async def persist(
+        self,
+        tracking_number: str,
+        pdf_bytes: bytes,
+        job_id: str,
+        row_number: int,
+    ) -> str:
+        """Crash-safely persist a label and return its final reference.
+
+        Backends with atomic final writes get a single direct write.
+        Others are staged and promoted in one worker round trip so a crash
+        never leaves a partial file at the final path.
+        """
+        if getattr(self.storage, "atomic_final_writes", False):
+            return await self.save_final(
+                tracking_number=tracking_number,
+                pdf_bytes=pdf_bytes,
+                job_id=job_id,
+                row_number=row_number,
+            )
+
+        def _stage_and_promote() -> str:
+            staged = self.storage.save_staged(
+                tracking_number=tracking_number,
+                pdf_bytes=pdf_bytes,
+                job_id=job_id,
+                row_number=row_number,
+            )
+            return self.storage.promote(staged)
+
+        return await self._run(_stage_and_promote)
+
+    def close(self) -> None:
+        """Release the worker pool without blocking the calling thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._slots = None
+
+
+def _env_int(key: str, default: int) -> int:
+    """Read a positive integer from env with safe fallback."""
+    raw = os.environ.get(key, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r, defaulting to %d", key, raw, default)
+        return default
+
+
+def build_async_label_storage(storage: LabelStorage) -> AsyncLabelStorage:
+    """Wrap a storage backend in an AsyncLabelStorage sized from environment."""
+    return AsyncLabelStorage(
+        storage,
+        max_workers=_env_int(
+            "LABEL_STORAGE_WORKERS", DEFAULT_LABEL_STORAGE_WORKERS,
+        ),
+        max_pending=_env_int(
+            "LABEL_STORAGE_MAX_PENDING", DEFAULT_LABEL_STORAGE_MAX_PENDING,
+        ),
+    )
+
+
 def build_label_storage(local_labels_dir: str | Path) -> LabelStorage:
     """Build label storage backend from environment configuration."""
     backend = os.environ.get("LABEL_STORAGE_BACKEND", "local").strip().lower()
@@ -1,7 +1,12 @@
-"""Verified process-global cache for auto_map_columns results.
+"""Verified process-global cache for auto column-mapping results.
 
-Caches one active mapping keyed by schema fingerprint and source columns.
-Persists a verified snapshot to a temp file for warm restarts.
+Holds a bounded LRU of mappings keyed by (schema fingerprint, source
+columns), so alternating between sources or hot-folder layouts does not
+evict each other. Each entry records whether its mapping passed
+verification; verified mappings are persisted to one file per fingerprint
+for warm restarts, tracked by a small on-disk index that drives eviction.
+
+Hit, miss and eviction counters are available from cache_stats().
 """
 
 from __future__ import annotations
@@ -11,30 +16,53 @@ import json
 import logging
 import os
 import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from src.services.column_mapping import (
     REQUIRED_FIELDS,
-    auto_map_columns,
     auto_map_columns_with_trace,
 )
 
 logger = logging.getLogger(__name__)
 
 _CACHE_VERSION = 1
+_INDEX_VERSION = 1
+_INDEX_FILENAME = "mappings.idx"
 MAPPING_VERSION = "mapping_cache_v2"
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _DEFAULT_VERIFY_SAMPLE_ROWS = 5
 _DEFAULT_MAX_DISK_CACHE_FILES = 10
+_DEFAULT_MAX_MEMORY_ENTRIES = 16
+
+
+@dataclass
+class _MappingEntry:
+    """One cached mapping and its verification state."""
+
+    mapping: dict[str, str]
+    mapping_hash: str
+    selection_trace: dict[str, Any]
+    verified: bool
+    verify_details: list[str] = field(default_factory=list)
+    verified_at: str | None = None
+
 
 _lock = threading.Lock()
-_cached_fingerprint: str | None = None
-_cached_columns: tuple[str, ...] | None = None
-_cached_mapping: dict[str, str] | None = None
-_cached_mapping_hash: str | None = None
-_cached_selection_trace: dict[str, Any] | None = None
+_disk_lock = threading.Lock()
+_entries: OrderedDict[tuple[str, tuple[str, ...]], _MappingEntry] = OrderedDict()
+_stats: dict[str, int] = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "misses": 0,
+    "verify_failures": 0,
+    "evictions": 0,
+    "disk_evictions": 0,
+}
 
 _REQUIRED_PATH_TO_CANONICAL: dict[str, str] = {
     "shipTo.name": "ship_to_name",
@@ -133,7 +161,7 @@ def compute_mapping_hash(mapping: dict[str, str]) -> str:
 def _load_from_disk(
     schema_fingerprint: str,
     source_columns: list[str],
-) -> tuple[dict[str, str], str, dict[str, Any]] | None:
+) -> tuple[dict[str, str], str, dict[str, Any], str | None] | None:
     path = _fingerprint_cache_path(schema_fingerprint)
     try:
         raw = json.loads(path.read_text())
@@ -173,7 +201,10 @@ def _load_from_disk(
     selection_trace: dict[str, Any] = {}
     if isinstance(selection_trace_raw, dict):
         selection_trace = selection_trace_raw
-    return mapping, mapping_hash, selection_trace
+    verified_at = raw.get("verified_at")
+    if not isinstance(verified_at, str):
+        verified_at = None
+    return mapping, mapping_hash, selection_trace, verified_at
 
 
 def _persist_to_disk(
@@ -182,6 +213,7 @@ def _persist_to_disk(
     mapping: dict[str, str],
     mapping_hash: str,
     selection_trace: dict[str, Any],
+    verified_at: str,
 ) -> None:
     path = _fingerprint_cache_path(schema_fingerprint)
     payload = {
@@ -191,39 +223,124 @@ def _persist_to_disk(
         "mapping": mapping,
         "mapping_hash": mapping_hash,
         "selection_trace": selection_trace,
-        "verified_at": datetime.now(UTC).isoformat(),
+        "verified_at": verified_at,
     }
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     tmp_path.write_text(json.dumps(payload, sort_keys=True))
     os.replace(tmp_path, path)
-    _evict_old_cache_files(path)
+    _touch_index(path)
 
 
-def _evict_old_cache_files(just_written: Path) -> None:
-    """Remove oldest *.json files if the cache directory exceeds the max limit."""
+def _resolve_max_disk_files() -> int:
     raw = os.environ.get(
         "COLUMN_MAPPING_MAX_DISK_CACHE_FILES",
         str(_DEFAULT_MAX_DISK_CACHE_FILES),
     ).strip()
     try:
-        max_files = max(1, int(raw))
+        return max(1, int(raw))
     except ValueError:
-        max_files = _DEFAULT_MAX_DISK_CACHE_FILES
+        return _DEFAULT_MAX_DISK_CACHE_FILES
+
+
+def _resolve_max_memory_entries() -> int:
+    raw = os.environ.get(
+        "COLUMN_MAPPING_CACHE_MAX_ENTRIES",
+        str(_DEFAULT_MAX_MEMORY_ENTRIES),
+    ).strip()
     try:
-        existing = sorted(
-            just_written.parent.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-        )
+        return max(1, int(raw))
+    except ValueError:
+        return _DEFAULT_MAX_MEMORY_ENTRIES
+
+
+def _index_path() -> Path:
+    return _cache_dir() / _INDEX_FILENAME
+
+
+def _load_index() -> dict[str, float]:
+    """Return {cache file name: last-used epoch seconds} from the disk index.
+
+    A missing or unreadable index is rebuilt once from the files present, so
+    caches written before the index existed are still tracked and evicted.
+    """
+    path = _index_path()
+    try:
+        raw = json.loads(path.read_text())
+        if raw.get("version") == _INDEX_VERSION and isinstance(raw.get("files"), dict):
+            return {str(k): float(v) for k, v in raw["files"].items()}
+        logger.info("mapping_cache_index_rebuild reason=version_mismatch")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.info("mapping_cache_index_rebuild reason=read_error error=%s", e)
+    files: dict[str, float] = {}
+    try:
+        for file_path in path.parent.glob("*.json"):
+            files[file_path.name] = file_path.stat().st_mtime
     except Exception:
-        return
-    while len(existing) > max_files:
-        oldest = existing.pop(0)
+        pass
+    return files
+
+
+def _write_index(files: dict[str, float]) -> None:
+    path = _index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps({"version": _INDEX_VERSION, "files": files}))
+    os.replace(tmp_path, path)
+
+
+def _touch_index(just_used: Path) -> None:
+    """Mark a cache file as most recently used and evict beyond the limit."""
+    with _disk_lock:
+        files = _load_index()
+        files[just_used.name] = time.time()
+        max_files = _resolve_max_disk_files()
+        evicted = 0
+        for name in sorted(files, key=files.__getitem__)[: max(0, len(files) - max_files)]:
+            files.pop(name)
+            try:
+                (just_used.parent / name).unlink(missing_ok=True)
+                evicted += 1
+                logger.info("mapping_cache_evict file=%s", name)
+            except Exception as exc:
+                logger.info("mapping_cache_evict_error file=%s error=%s", name, exc)
         try:
-            oldest.unlink(missing_ok=True)
-            logger.info("mapping_cache_evict file=%s", oldest.name)
+            _write_index(files)
         except Exception as exc:
-            logger.info("mapping_cache_evict_error file=%s error=%s", oldest.name, exc)
+            logger.info("mapping_cache_index_write_error error=%s", exc)
+    if evicted:
+        with _lock:
+            _stats["disk_evictions"] += evicted
+
+
+def _remember(
+    key: tuple[str, tuple[str, ...]],
+    entry: _MappingEntry,
+) -> None:
+    """Insert an entry as most recently used; caller holds _lock."""
+    _entries[key] = entry
+    _entries.move_to_end(key)
+    max_entries = _resolve_max_memory_entries()
+    while len(_entries) > max_entries:
+        evicted_key, _ = _entries.popitem(last=False)
+        _stats["evictions"] += 1
+        logger.debug("mapping_cache_memory_evict fingerprint=%s", evicted_key[0][:12])
+
+
+def cache_stats() -> dict[str, int]:
+    """Return cache counters and sizes for tuning.
+
+    Returns:
+        Dict with memory_hits, disk_hits, misses, verify_failures,
+        evictions (memory), disk_evictions, entries and max_entries.
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_entries)
+    stats["max_entries"] = _resolve_max_memory_entries()
+    return stats
 
 
 def get_or_compute_mapping(
@@ -260,16 +377,12 @@ def get_or_compute_mapping_with_diagnostics(
     sample_rows: list[dict[str, Any]] | None = None,
 ) -> tuple[dict[str, str], str, dict[str, Any]]:
     """Return mapping, hash, and cache/selection diagnostics."""
-    global _cached_fingerprint, _cached_columns, _cached_mapping
-    global _cached_mapping_hash, _cached_selection_trace
-
     normalized_columns = sorted({str(col) for col in source_columns})
     verify_limit = _resolve_verify_sample_limit()
     sample = (sample_rows or [])[:verify_limit]
 
     if not schema_fingerprint or not _is_cache_enabled():
-        mapping = auto_map_columns(normalized_columns)
-        _, selection_trace = auto_map_columns_with_trace(normalized_columns)
+        mapping, selection_trace = auto_map_columns_with_trace(normalized_columns)
         return (
             mapping,
             compute_mapping_hash(mapping),
@@ -281,38 +394,47 @@ def get_or_compute_mapping_with_diagnostics(
             },
         )
 
-    cols_key = tuple(normalized_columns)
+    key = (schema_fingerprint, tuple(normalized_columns))
     with _lock:
-        if (
-            _cached_fingerprint == schema_fingerprint
-            and _cached_columns == cols_key
-            and _cached_mapping is not None
-            and _cached_mapping_hash is not None
-        ):
-            logger.debug(
-                "mapping_cache_hit source=memory fingerprint=%s",
-                schema_fingerprint[:12],
-            )
-            return (
-                _cached_mapping,
-                _cached_mapping_hash,
-                {
-                    "cache_hit": True,
-                    "cache_source": "memory",
-                    "schema_fingerprint": schema_fingerprint,
-                    "selection_trace": _cached_selection_trace or {},
-                },
-            )
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _stats["memory_hits"] += 1
+    if entry is not None:
+        logger.debug(
+            "mapping_cache_hit source=memory fingerprint=%s verified=%s",
+            schema_fingerprint[:12],
+            entry.verified,
+        )
+        return (
+            entry.mapping,
+            entry.mapping_hash,
+            {
+                # Unverified entries only spare the recompute; callers still
+                # see the original verification outcome.
+                "cache_hit": entry.verified,
+                "cache_source": "memory" if entry.verified else "verification_failed",
+                "schema_fingerprint": schema_fingerprint,
+                "selection_trace": entry.selection_trace,
+            },
+        )
 
     cached_from_disk = _load_from_disk(schema_fingerprint, normalized_columns)
     if cached_from_disk is not None:
-        cached_mapping, cached_hash, cached_trace = cached_from_disk
+        cached_mapping, cached_hash, cached_trace, verified_at = cached_from_disk
         with _lock:
-            _cached_fingerprint = schema_fingerprint
-            _cached_columns = cols_key
-            _cached_mapping = cached_mapping
-            _cached_mapping_hash = cached_hash
-            _cached_selection_trace = cached_trace
+            _remember(key, _MappingEntry(
+                mapping=cached_mapping,
+                mapping_hash=cached_hash,
+                selection_trace=cached_trace,
+                verified=True,
+                verified_at=verified_at,
+            ))
+            _stats["disk_hits"] += 1
+        try:
+            _touch_index(_fingerprint_cache_path(schema_fingerprint))
+        except Exception as e:
+            logger.info("mapping_cache_index_write_error error=%s", e)
         logger.info(
             "mapping_cache_hit source=disk fingerprint=%s mapped_fields=%d",
             schema_fingerprint[:12],
@@ -329,10 +451,23 @@ def get_or_compute_mapping_with_diagnostics(
             },
         )
 
-    mapping = auto_map_columns(normalized_columns)
-    _, selection_trace = auto_map_columns_with_trace(normalized_columns)
+    mapping, selection_trace = auto_map_columns_with_trace(normalized_columns)
     mapping_hash = compute_mapping_hash(mapping)
     verified, details = _verify_mapping(mapping, normalized_columns, sample)
+    verified_at = datetime.now(UTC).isoformat() if verified else None
+    with _lock:
+        _remember(key, _MappingEntry(
+            mapping=mapping,
+            mapping_hash=mapping_hash,
+            selection_trace=selection_trace,
+            verified=verified,
+            verify_details=details,
+            verified_at=verified_at,
+        ))
+        _stats["misses"] += 1
+        if not verified:
+            _stats["verify_failures"] += 1
+
     if verified:
         try:
             _persist_to_disk(
@@ -341,15 +476,10 @@ def get_or_compute_mapping_with_diagnostics(
                 mapping,
                 mapping_hash,
                 selection_trace,
+                verified_at,
             )
         except Exception as e:
             logger.info("mapping_cache_recompute reason=file_write_error error=%s", e)
-        with _lock:
-            _cached_fingerprint = schema_fingerprint
-            _cached_columns = cols_key
-            _cached_mapping = mapping
-            _cached_mapping_hash = mapping_hash
-            _cached_selection_trace = selection_trace
         logger.info(
             "mapping_cache_miss fingerprint=%s mapped_fields=%d rows_sampled=%d mapping_hash=%s",
             schema_fingerprint[:12],
@@ -374,7 +504,6 @@ def get_or_compute_mapping_with_diagnostics(
         "; ".join(details) if details else "unknown",
         len(sample),
     )
-    logger.info("mapping_cache_recompute reason=verification_failed")
     return (
         mapping,
         mapping_hash,
@@ -387,35 +516,37 @@ def get_or_compute_mapping_with_diagnostics(
     )
 
 
+def _clear_memory() -> None:
+    """Drop in-memory entries, keeping disk files (simulates a cold process)."""
+    with _lock:
+        _entries.clear()
+
+
 def invalidate() -> None:
     """Clear in-memory cache and all per-fingerprint disk cache files."""
-    global _cached_fingerprint, _cached_columns, _cached_mapping, _cached_mapping_hash
-    global _cached_selection_trace
     with _lock:
-        _cached_fingerprint = None
-        _cached_columns = None
-        _cached_mapping = None
-        _cached_mapping_hash = None
-        _cached_selection_trace = None
+        _entries.clear()
 
-    try:
-        for file_path in _cache_dir().glob("*.json"):
-            file_path.unlink(missing_ok=True)
-    except Exception as exc:
-        logger.info("mapping_cache_invalidate dir_error=%s", exc)
+    with _disk_lock:
+        try:
+            cache_dir = _cache_dir()
+            for file_path in cache_dir.glob("*.json"):
+                file_path.unlink(missing_ok=True)
+            (cache_dir / _INDEX_FILENAME).unlink(missing_ok=True)
+        except Exception as exc:
+            logger.info("mapping_cache_invalidate dir_error=%s", exc)
     logger.info("mapping_cache_invalidate")
 
 
 def should_invalidate(new_fingerprint: str | None) -> bool:
     """Return True when the cache should be invalidated for a new import.
 
-    Returns False only when ``new_fingerprint`` is non-empty and matches
-    the currently cached fingerprint exactly.
+    Entries are keyed by schema fingerprint, so a source with a different
+    fingerprint can never be served another source's mapping; switching
+    sources therefore keeps the cache. Only imports that cannot supply a
+    fingerprint invalidate it.
 
     Callers that cannot supply a fingerprint (e.g. disconnect) should call
     ``invalidate()`` unconditionally rather than using this function.
     """
-    if not new_fingerprint:
-        return True
-    with _lock:
-        return _cached_fingerprint != new_fingerprint
+    return not new_fingerprint
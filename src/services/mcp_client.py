@@ -24,6 +24,8 @@ from mcp.types import TextContent
 
 from mcp import ClientSession, StdioServerParameters
 from src.services.decision_audit_service import DecisionAuditService
+from src.services.metrics import MCP_CALL_SECONDS, MCP_RETRIES
+from src.utils.tracing import SPAN_KIND_CLIENT, span, trace_meta
 
 logger = logging.getLogger(__name__)
 
@@ -293,6 +295,21 @@ class MCPClient:
         retries = self._max_retries if max_retries is None else max_retries
         delay_base = self._base_delay if base_delay is None else base_delay
 
+        with span("mcp.call_tool", {"mcp.tool": name}, kind=SPAN_KIND_CLIENT):
+            return await self._call_tool_with_retries(name, arguments, retries, delay_base)
+
+    async def _call_tool_with_retries(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None,
+        retries: int,
+        delay_base: float,
+    ) -> dict[str, Any]:
+        """Run call attempts with exponential backoff on retryable errors.
+
+        The active trace context travels to the server in request ``_meta``.
+        """
+        meta = trace_meta()
         last_error: str = ""
         call_started = time.perf_counter()
         for attempt in range(retries + 1):
@@ -308,7 +325,10 @@ class MCPClient:
                     "has_arguments": bool(arguments),
                 },
             )
-            result = await self._session.call_tool(name, arguments)
+            if meta:
+                result = await self._session.call_tool(name, arguments, meta=meta)
+            else:
+                result = await self._session.call_tool(name, arguments)
 
             if not result.isError:
                 parsed = self._parse_response(name, result)
@@ -325,6 +345,7 @@ class MCPClient:
                     },
                     latency_ms=int((time.perf_counter() - attempt_started) * 1000),
                 )
+                MCP_CALL_SECONDS.labels(name, "ok").observe(time.perf_counter() - call_started)
                 return parsed
 
             # Extract error text
@@ -352,6 +373,7 @@ class MCPClient:
                     name, attempt + 1, retries + 1, delay, error_text[:200],
                 )
                 self._retry_attempts_total += 1
+                MCP_RETRIES.labels(name).inc()
                 DecisionAuditService.log_event_from_context(
                     phase="tool_result",
                     event_name="mcp.call.retrying",
@@ -379,6 +401,7 @@ class MCPClient:
                 "total_duration_ms": int((time.perf_counter() - call_started) * 1000),
             },
         )
+        MCP_CALL_SECONDS.labels(name, "error").observe(time.perf_counter() - call_started)
         raise MCPToolError(tool_name=name, error_text=last_error)
 
     def _parse_response(self, tool_name: str, result: Any) -> dict[str, Any]:
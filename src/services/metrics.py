@@ -0,0 +1,361 @@
+"""Process-local metrics registry with Prometheus text exposition.
+
+Hot paths record latencies and counts into histograms, counters and
+gauges defined at the bottom of this module; ``GET /metrics`` renders the
+registry in the Prometheus text format (version 0.0.4). The registry is
+dependency-free and cheap enough to leave on in production: recording is
+a tuple-keyed dict lookup, a bisect over the bucket bounds and two
+additions under an uncontended lock (about a microsecond per call).
+
+Label values must come from small fixed sets (tool names, phases,
+outcomes) — never job IDs or other unbounded values.
+
+Example:
+    started = time.perf_counter()
+    try:
+        result = await call()
+    finally:
+        UPS_CALL_SECONDS.labels(tool, "ok").observe(time.perf_counter() - started)
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+# Request/tool latencies in seconds, from sub-millisecond DB work up to
+# slow UPS calls.
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self._value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge to a value."""
+        self._value = float(value)
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_counts", "_lock", "_sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+
+class _Metric:
+    """Named metric family holding one child per label-value tuple."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """Return the child for a label-value tuple, creating it once."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values!r}"
+                )
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Return this family in Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def _items(self) -> list[tuple[tuple[str, ...], object]]:
+        with self._lock:
+            items = list(self._children.items())
+        return sorted(items, key=lambda item: item[0])
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase an unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _samples(self) -> Iterable[str]:
+        for values, child in self._items():
+            label_text = _label_text(self.labelnames, values)
+            yield f"{self.name}_total{label_text} {_format_value(child._value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, optionally sampled at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function: Callable[[], float] | None = None
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float] | None) -> None:
+        """Sample an unlabelled gauge from ``function`` on every scrape."""
+        self._function = function
+
+    def _samples(self) -> Iterable[str]:
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception:
+                value = math.nan
+            yield f"{self.name} {_format_value(value)}"
+            return
+        for values, child in self._items():
+            label_text = _label_text(self.labelnames, values)
+            yield f"{self.name}{label_text} {_format_value(child._value)}"
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observations."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record one observation on an unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self) -> Iterable[str]:
+        for values, child in self._items():
+            with child._lock:
+                counts = list(child._counts)
+                total = child._sum
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                label_text = _label_text(
+                    (*self.labelnames, "le"), (*values, _format_value(bound)),
+                )
+                yield f"{self.name}_bucket{label_text} {cumulative}"
+            label_text = _label_text(self.labelnames, values)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter with this name, registering it on first use."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge with this name, registering it on first use."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with this name, registering it on first use."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """Return every registered family in Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# -- Application metrics -----------------------------------------------------
+
+UPS_CALL_SECONDS = REGISTRY.histogram(
+    "shipagent_ups_call_seconds",
+    "UPSMCPClient tool call latency including reconnect and replay.",
+    ("tool", "outcome"),
+)
+MCP_CALL_SECONDS = REGISTRY.histogram(
+    "shipagent_mcp_call_seconds",
+    "MCPClient.call_tool latency across all attempts.",
+    ("tool", "outcome"),
+)
+MCP_RETRIES = REGISTRY.counter(
+    "shipagent_mcp_retries",
+    "MCP tool calls retried after a retryable error.",
+    ("tool",),
+)
+DATA_SOURCE_CALL_SECONDS = REGISTRY.histogram(
+    "shipagent_data_source_call_seconds",
+    "DataSourceMCPClient tool call latency including one reconnect.",
+    ("tool", "outcome"),
+)
+BATCH_DB_COMMIT_SECONDS = REGISTRY.histogram(
+    "shipagent_batch_db_commit_seconds",
+    "Row state commits made while holding the batch db_lock.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+BATCH_ROWS_PER_SECOND = REGISTRY.histogram(
+    "shipagent_batch_rows_per_second",
+    "Rows processed per second for each preview or execute run.",
+    ("phase",),
+    buckets=(0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+SSE_SUBSCRIBERS = REGISTRY.gauge(
+    "shipagent_sse_subscribers",
+    "Active batch progress SSE subscriptions.",
+)
+SSE_MAX_LAG_EVENTS = REGISTRY.gauge(
+    "shipagent_sse_max_lag_events",
+    "Largest number of buffered progress events any subscriber has not consumed.",
+)
+WRITE_BACK_LAG_SECONDS = REGISTRY.histogram(
+    "shipagent_write_back_lag_seconds",
+    "Time from enqueueing a write-back task to completing it.",
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600, 14400, 86400),
+)
+AGENT_TURN_SECONDS = REGISTRY.histogram(
+    "shipagent_agent_turn_seconds",
+    "End-to-end latency of one conversation message through the agent.",
+    ("status",),
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300),
+)
+AGENT_TIME_TO_FIRST_TOKEN_SECONDS = REGISTRY.histogram(
+    "shipagent_agent_time_to_first_token_seconds",
+    "Time from receiving a conversation message to the agent's first streamed event.",
+    ("agent_start",),
+    buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20, 30, 60),
+)
+AGENT_STARTUP_SECONDS = REGISTRY.histogram(
+    "shipagent_agent_startup_seconds",
+    "Time to build a system prompt and start an orchestration agent.",
+    ("path",),
+    buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20, 30),
+)
+SYSTEM_PROMPT_BUILD_SECONDS = REGISTRY.histogram(
+    "shipagent_system_prompt_build_seconds",
+    "Time to build an agent system prompt, by prompt memo outcome (hit, miss).",
+    ("cache",),
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05),
+)
+SYSTEM_PROMPT_CHARS = REGISTRY.histogram(
+    "shipagent_system_prompt_chars",
+    "Length in characters of each agent system prompt built.",
+    buckets=(5000, 10000, 15000, 20000, 25000, 30000, 40000, 50000, 75000, 100000),
+)
+AGENT_POOL_CLAIMS = REGISTRY.counter(
+    "shipagent_agent_pool_claims",
+    "Warm agent pool claims by outcome (hit, miss).",
+    ("outcome",),
+)
+AGENT_POOL_IDLE = REGISTRY.gauge(
+    "shipagent_agent_pool_idle",
+    "Pre-started agents waiting in the warm pool.",
+)
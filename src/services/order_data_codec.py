@@ -0,0 +1,244 @@
+"""Compact encoding and per-job decode cache for JobRow.order_data.
+
+order_data is written once when a job's rows are created and never
+rewritten, yet the same text used to be parsed by the commodity prefetch,
+each preview and execute row task, the preview route, the agent's preview
+card and external write-back. This module centralizes both directions:
+
+- encode_order_data() serializes with sorted keys and no insignificant
+  whitespace, so stored rows are smaller. The row checksum is still taken
+  over the legacy ``json.dumps(sort_keys=True, default=str)`` text, because
+  it feeds the idempotency keys of rows created before this encoding.
+- decode_order_data() parses through a process-wide cache grouped by job,
+  so each distinct row text is decoded once per job while it stays warm.
+
+Decoded dicts are shared, so callers receive a shallow copy: top-level
+writes (auto-corrections, commodity hydration) never leak between callers.
+Nested values must be treated as read-only.
+
+The cache holds at most ORDER_DATA_CACHE_MAX_ROWS parsed rows. When full,
+whole least-recently-used jobs are evicted; a single job larger than the
+budget caches its first rows and decodes the rest directly rather than
+thrashing. A job is dropped when it reaches a terminal status, and any job
+not read for ORDER_DATA_CACHE_TTL_S seconds is evicted on the next access,
+so finished jobs do not pin memory until the budget fills.
+
+Example:
+    text, checksum = encode_order_data(row)
+    order = decode_order_data(job_row.order_data, job_id=job_row.job_id)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_ROWS = 50_000
+DEFAULT_CACHE_TTL_S = 1800.0
+
+_SEPARATORS = (",", ":")
+
+
+def _resolve_cache_max_rows() -> int:
+    raw = os.environ.get("ORDER_DATA_CACHE_MAX_ROWS", str(DEFAULT_CACHE_MAX_ROWS))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "Invalid ORDER_DATA_CACHE_MAX_ROWS=%r, defaulting to %d",
+            raw,
+            DEFAULT_CACHE_MAX_ROWS,
+        )
+        return DEFAULT_CACHE_MAX_ROWS
+
+
+def _resolve_cache_ttl_s() -> float:
+    raw = os.environ.get("ORDER_DATA_CACHE_TTL_S", str(DEFAULT_CACHE_TTL_S))
+    try:
+        value = float(raw)
+    except ValueError:
+        value = -1.0
+    if value < 0:
+        logger.warning(
+            "Invalid ORDER_DATA_CACHE_TTL_S=%r, defaulting to %s",
+            raw,
+            DEFAULT_CACHE_TTL_S,
+        )
+        return DEFAULT_CACHE_TTL_S
+    return value
+
+
+def encode_order_data(order: dict[str, Any]) -> tuple[str, str]:
+    """Serialize order data for storage and compute its row checksum.
+
+    Args:
+        order: Normalized order data dict.
+
+    Returns:
+        Tuple of (compact JSON text, MD5 hex digest of the legacy
+        ``json.dumps(sort_keys=True, default=str)`` text).
+    """
+    text = json.dumps(order, sort_keys=True, separators=_SEPARATORS, default=str)
+    legacy = json.dumps(order, sort_keys=True, default=str)
+    return text, hashlib.md5(legacy.encode()).hexdigest()
+
+
+class ParsedOrderCache:
+    """Bounded cache of parsed order_data, grouped and evicted per job.
+
+    Keyed by the raw order_data text within a job, so an entry can never
+    go stale: different text is simply a different key. Thread-safe; the
+    lock is held only for dict bookkeeping, never while parsing.
+    """
+
+    def __init__(
+        self,
+        max_rows: int | None = None,
+        ttl_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_rows: Max parsed rows held; defaults to ORDER_DATA_CACHE_MAX_ROWS.
+            ttl_s: Seconds a job may go unread before it is evicted; defaults
+                to ORDER_DATA_CACHE_TTL_S. 0 disables expiry.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self._max_rows = _resolve_cache_max_rows() if max_rows is None else max_rows
+        self._ttl_s = _resolve_cache_ttl_s() if ttl_s is None else ttl_s
+        self._clock = clock
+        self._jobs: OrderedDict[str, dict[str, dict[str, Any]]] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, job_id: str, raw: str) -> dict[str, Any]:
+        """Return a shallow copy of the parsed order_data for a row.
+
+        Args:
+            job_id: Job the row belongs to.
+            raw: The row's order_data JSON text.
+
+        Returns:
+            Parsed order data dict (a fresh top-level copy).
+
+        Raises:
+            ValueError: If raw is not a JSON object.
+        """
+        with self._lock:
+            self._expire()
+            entries = self._jobs.get(job_id)
+            if entries is not None:
+                self._jobs.move_to_end(job_id)
+                self._last_used[job_id] = self._clock()
+                cached = entries.get(raw)
+                if cached is not None:
+                    return dict(cached)
+
+        parsed = _parse(raw)
+
+        with self._lock:
+            self._store(job_id, raw, parsed)
+        return dict(parsed)
+
+    def _store(self, job_id: str, raw: str, parsed: dict[str, Any]) -> None:
+        entries = self._jobs.get(job_id)
+        if entries is not None and raw in entries:
+            return
+        while self._size >= self._max_rows and self._jobs:
+            oldest = next(iter(self._jobs))
+            if oldest == job_id:
+                # This job alone fills the budget; stop caching its rows.
+                return
+            self._drop(oldest)
+        if self._size >= self._max_rows:
+            return
+        if entries is None:
+            entries = self._jobs[job_id] = {}
+        self._last_used[job_id] = self._clock()
+        entries[raw] = parsed
+        self._size += 1
+
+    def _expire(self) -> None:
+        # Jobs are kept in access order, so expired ones sit at the front.
+        if self._ttl_s <= 0:
+            return
+        horizon = self._clock() - self._ttl_s
+        while self._jobs:
+            oldest = next(iter(self._jobs))
+            if self._last_used.get(oldest, horizon) > horizon:
+                return
+            self._drop(oldest)
+
+    def _drop(self, job_id: str) -> None:
+        entries = self._jobs.pop(job_id, None)
+        self._last_used.pop(job_id, None)
+        if entries:
+            self._size -= len(entries)
+
+    def invalidate(self, job_id: str) -> None:
+        """Drop every cached row of a job."""
+        with self._lock:
+            self._drop(job_id)
+
+    def clear(self) -> None:
+        """Drop all cached rows."""
+        with self._lock:
+            self._jobs.clear()
+            self._last_used.clear()
+            self._size = 0
+
+
+def _parse(raw: str) -> dict[str, Any]:
+    try:
+        parsed = json.loads(raw)
+    except (json.JSONDecodeError, TypeError) as e:
+        raise ValueError(f"Invalid order_data JSON: {e}") from e
+    if not isinstance(parsed, dict):
+        raise ValueError("Invalid order_data JSON: expected an object")
+    return parsed
+
+
+_cache: ParsedOrderCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_parsed_order_cache() -> ParsedOrderCache:
+    """Return the process-wide parsed order cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ParsedOrderCache()
+    return _cache
+
+
+def decode_order_data(raw: str | None, job_id: str | None = None) -> dict[str, Any]:
+    """Parse a row's order_data, reusing the job's cached decode when warm.
+
+    Args:
+        raw: order_data JSON text; empty or None yields an empty dict.
+        job_id: Owning job; rows without a job are decoded uncached.
+
+    Returns:
+        Parsed order data dict, safe to mutate at the top level.
+
+    Raises:
+        ValueError: If raw is not a JSON object.
+    """
+    if not raw:
+        return {}
+    if not isinstance(job_id, str):
+        return _parse(raw)
+    return get_parsed_order_cache().get(job_id, raw)
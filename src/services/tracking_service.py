@@ -0,0 +1,692 @@
+"""Tracking status cache and scheduled bulk refresher.
+
+Delivery status for shipped rows is stored per tracking number in the
+``tracking_statuses`` table. Agent lookups read that local state first and
+only call UPS when it is stale; a background TrackingRefresher polls due
+tracking numbers with bounded concurrency and a request-rate cap.
+
+Polling frequency adapts to the shipment state: exceptions are re-checked
+quickly, quiet in-transit shipments less often, and terminal states
+(delivered, returned) stop polling entirely. Polling also stops once a
+shipment is older than TRACKING_MAX_AGE_DAYS or has failed
+TRACKING_MAX_ERRORS lookups in a row. Only shipments created by a job are
+polled; ad-hoc agent lookups are cached but never scheduled.
+
+Example:
+    service = TrackingService(db)
+    service.register_shipments()
+    await service.refresh_due(ups_client, limit=200)
+    summary = service.job_summary(job_id)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.db.models import JobRow, RowStatus, TrackingState, TrackingStatus
+
+logger = logging.getLogger(__name__)
+
+# Most recent activities kept per tracking number.
+MAX_ACTIVITIES = 20
+
+# Seconds until the next refresh, by state. None stops polling.
+POLL_INTERVALS: dict[TrackingState, int | None] = {
+    TrackingState.exception: 30 * 60,
+    TrackingState.out_for_delivery: 60 * 60,
+    TrackingState.in_transit: 4 * 60 * 60,
+    TrackingState.label_created: 12 * 60 * 60,
+    TrackingState.unknown: 6 * 60 * 60,
+    TrackingState.delivered: None,
+    TrackingState.returned: None,
+}
+
+# Failed lookups back off exponentially from this base, up to the cap.
+_ERROR_BACKOFF_S = 15 * 60
+_MAX_ERROR_BACKOFF_S = 24 * 60 * 60
+
+# UPS activity status type → normalized state.
+_UPS_TYPE_STATES: dict[str, TrackingState] = {
+    "D": TrackingState.delivered,
+    "X": TrackingState.exception,
+    "I": TrackingState.in_transit,
+    "P": TrackingState.in_transit,
+    "O": TrackingState.out_for_delivery,
+    "M": TrackingState.label_created,
+    "MV": TrackingState.label_created,
+    "RS": TrackingState.returned,
+}
+
+# UPS currentStatus codes (Track API v1) → normalized state.
+_UPS_CURRENT_STATUS_STATES: dict[str, TrackingState] = {
+    "003": TrackingState.label_created,
+    "005": TrackingState.in_transit,
+    "011": TrackingState.delivered,
+    "021": TrackingState.out_for_delivery,
+}
+
+DEFAULT_CACHE_TTL_S = 15 * 60
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_ERRORS = 10
+
+
+def _env_number(name: str, default: float, *, minimum: float = 0) -> float:
+    """Read a numeric env var, falling back to default on bad values."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, defaulting to %s", name, raw, default)
+        return default
+    return max(minimum, value)
+
+
+def cache_ttl_seconds() -> float:
+    """Return how long a cached status satisfies agent lookups."""
+    return _env_number("TRACKING_CACHE_TTL_S", DEFAULT_CACHE_TTL_S)
+
+
+def max_age_seconds() -> float:
+    """Return how long after registration a shipment keeps being polled."""
+    return _env_number("TRACKING_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS) * 24 * 60 * 60
+
+
+def max_errors() -> int:
+    """Return how many consecutive failed lookups stop polling."""
+    return int(_env_number("TRACKING_MAX_ERRORS", DEFAULT_MAX_ERRORS, minimum=1))
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def classify_state(
+    status_code: str,
+    status_description: str,
+    latest_type: str = "",
+) -> TrackingState:
+    """Map raw UPS status fields onto a TrackingState.
+
+    Args:
+        status_code: currentStatus.code from the UPS response.
+        status_description: currentStatus.description from the response.
+        latest_type: status.type of the most recent activity, if any.
+
+    Returns:
+        Normalized TrackingState (unknown when nothing matches).
+    """
+    code = (status_code or "").strip().upper()
+    for key in (latest_type.strip().upper(), code):
+        if key in _UPS_TYPE_STATES:
+            return _UPS_TYPE_STATES[key]
+    if code in _UPS_CURRENT_STATUS_STATES:
+        return _UPS_CURRENT_STATUS_STATES[code]
+
+    desc = (status_description or "").lower()
+    if "out for delivery" in desc:
+        return TrackingState.out_for_delivery
+    if "exception" in desc:
+        return TrackingState.exception
+    if "return" in desc:
+        return TrackingState.returned
+    if "delivered" in desc:
+        return TrackingState.delivered
+    if "label" in desc or "billing information" in desc:
+        return TrackingState.label_created
+    if "transit" in desc or "departed" in desc or "arrived" in desc:
+        return TrackingState.in_transit
+    return TrackingState.unknown
+
+
+def parse_tracking_response(raw: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a UPS track_package response.
+
+    Args:
+        raw: Raw response from UPSMCPClient.track_package().
+
+    Returns:
+        Dict with returned_number, status_code, status_description,
+        delivery_date, activities (newest first, capped) and state.
+    """
+    shipment = raw.get("trackResponse", {}).get("shipment", [{}])
+    if isinstance(shipment, list):
+        shipment = shipment[0] if shipment else {}
+
+    package = shipment.get("package", [{}])
+    if isinstance(package, list):
+        package = package[0] if package else {}
+
+    current_status = package.get("currentStatus", {}) or {}
+    status_code = current_status.get("code", "")
+    status_desc = current_status.get("description", "")
+
+    delivery_date = package.get("deliveryDate", [{}])
+    if isinstance(delivery_date, list):
+        delivery_date = delivery_date[0] if delivery_date else {}
+    delivery_date_str = (
+        delivery_date.get("date", "") if isinstance(delivery_date, dict) else ""
+    )
+
+    activities_raw = package.get("activity", [])
+    if isinstance(activities_raw, dict):
+        activities_raw = [activities_raw]
+
+    activities = []
+    for act in activities_raw[:MAX_ACTIVITIES]:
+        address = act.get("location", {}).get("address", {})
+        location_str = ", ".join(
+            p for p in [
+                address.get("city", ""),
+                address.get("stateProvince", ""),
+                address.get("countryCode", ""),
+            ] if p
+        )
+        status = act.get("status", {})
+        activities.append({
+            "date": act.get("date", ""),
+            "time": act.get("time", ""),
+            "location": location_str,
+            "status": status.get("description", ""),
+        })
+
+    latest_type = ""
+    if activities_raw:
+        latest_type = activities_raw[0].get("status", {}).get("type", "") or ""
+
+    return {
+        "returned_number": package.get("trackingNumber", ""),
+        "status_code": status_code,
+        "status_description": status_desc,
+        "delivery_date": delivery_date_str,
+        "activities": activities,
+        "state": classify_state(status_code, status_desc, latest_type),
+    }
+
+
+def next_check_at(state: TrackingState, now: datetime | None = None) -> str | None:
+    """Return when a shipment in ``state`` should next be polled.
+
+    Args:
+        state: Current normalized state.
+        now: Reference time (defaults to current UTC time).
+
+    Returns:
+        ISO8601 timestamp, or None when polling should stop.
+    """
+    interval = POLL_INTERVALS.get(state, POLL_INTERVALS[TrackingState.unknown])
+    if interval is None:
+        return None
+    return ((now or _now()) + timedelta(seconds=interval)).isoformat()
+
+
+def status_to_event_payload(status: TrackingStatus) -> dict[str, Any]:
+    """Build the tracking_result event payload from a stored status.
+
+    Args:
+        status: Stored TrackingStatus row.
+
+    Returns:
+        Payload matching the live track_package_tool event shape.
+    """
+    requested = status.tracking_number
+    returned = status.returned_tracking_number or requested
+    payload: dict[str, Any] = {
+        "action": "tracked",
+        "success": True,
+        "trackingNumber": returned,
+        "currentStatus": status.status_code or "",
+        "statusDescription": status.status_description or "",
+        "activities": json.loads(status.activities_json or "[]"),
+    }
+    if status.delivery_date:
+        payload["deliveryDate"] = status.delivery_date
+    if returned != requested:
+        payload["mismatch"] = True
+        payload["requestedNumber"] = requested
+    return payload
+
+
+class _RateLimiter:
+    """Space out calls to at most ``rate`` per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class TrackingService:
+    """Read, record and refresh stored tracking statuses.
+
+    Attributes:
+        db: SQLAlchemy session for tracking state.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """Initialize the tracking service.
+
+        Args:
+            db: SQLAlchemy session for tracking state.
+        """
+        self.db = db
+
+    def get(self, tracking_number: str) -> TrackingStatus | None:
+        """Return the stored status for a tracking number, if any."""
+        return self.db.get(TrackingStatus, tracking_number)
+
+    def get_fresh(
+        self,
+        tracking_number: str,
+        ttl_seconds: float | None = None,
+    ) -> TrackingStatus | None:
+        """Return the stored status when it is recent enough to serve.
+
+        Terminal states are always fresh; other states are fresh for
+        ``ttl_seconds`` after the last successful lookup.
+
+        Args:
+            tracking_number: UPS tracking number.
+            ttl_seconds: Freshness window (defaults to TRACKING_CACHE_TTL_S).
+
+        Returns:
+            The stored TrackingStatus, or None when missing or stale.
+        """
+        status = self.get(tracking_number)
+        if status is None or status.last_checked_at is None:
+            return None
+        if POLL_INTERVALS.get(TrackingState(status.state)) is None:
+            return status
+        ttl = cache_ttl_seconds() if ttl_seconds is None else ttl_seconds
+        checked = _parse_ts(status.last_checked_at)
+        if checked is None or (_now() - checked).total_seconds() > ttl:
+            return None
+        return status
+
+    def record(
+        self,
+        tracking_number: str,
+        parsed: dict[str, Any],
+        now: datetime | None = None,
+    ) -> TrackingStatus:
+        """Store a normalized lookup result and schedule the next refresh.
+
+        Args:
+            tracking_number: Tracking number that was looked up.
+            parsed: Output of parse_tracking_response().
+            now: Lookup time (defaults to current UTC time).
+
+        Returns:
+            The updated or created TrackingStatus.
+        """
+        now = now or _now()
+        status = self.get(tracking_number)
+        if status is None:
+            status = TrackingStatus(tracking_number=tracking_number)
+            shipment = self._find_shipment(tracking_number)
+            if shipment is not None:
+                status.job_id, status.row_number = shipment
+            self.db.add(status)
+        state = TrackingState(parsed["state"])
+        status.state = state.value
+        status.status_code = parsed["status_code"] or None
+        status.status_description = parsed["status_description"] or None
+        status.delivery_date = parsed["delivery_date"] or None
+        status.activities_json = json.dumps(parsed["activities"])
+        status.returned_tracking_number = parsed["returned_number"] or None
+        status.last_checked_at = now.isoformat()
+        status.next_check_at = (
+            next_check_at(state, now) if self._keep_polling(status, now) else None
+        )
+        status.error_count = 0
+        status.last_error = None
+        self.db.commit()
+        return status
+
+    def record_error(
+        self,
+        tracking_number: str,
+        error: str,
+        now: datetime | None = None,
+    ) -> TrackingStatus | None:
+        """Record a failed lookup and back off the next refresh.
+
+        Args:
+            tracking_number: Tracking number that failed.
+            error: Error message.
+            now: Failure time (defaults to current UTC time).
+
+        Returns:
+            The updated TrackingStatus, or None if it is not tracked.
+        """
+        status = self.get(tracking_number)
+        if status is None:
+            return None
+        now = now or _now()
+        status.error_count = (status.error_count or 0) + 1
+        status.last_error = error[:500]
+        backoff = min(
+            _ERROR_BACKOFF_S * 2 ** (status.error_count - 1),
+            _MAX_ERROR_BACKOFF_S,
+        )
+        if status.error_count >= max_errors() or not self._keep_polling(status, now):
+            logger.info(
+                "Stopped polling %s after %d failed lookups",
+                tracking_number,
+                status.error_count,
+            )
+            status.next_check_at = None
+        else:
+            status.next_check_at = (now + timedelta(seconds=backoff)).isoformat()
+        self.db.commit()
+        return status
+
+    def _find_shipment(self, tracking_number: str) -> tuple[str, int] | None:
+        """Return (job_id, row_number) of the job row that shipped a number."""
+        return (
+            self.db.query(JobRow.job_id, JobRow.row_number)
+            .filter(JobRow.tracking_number == tracking_number)
+            .filter(JobRow.status == RowStatus.completed.value)
+            .order_by(JobRow.created_at.desc())
+            .first()
+        )
+
+    @staticmethod
+    def _keep_polling(status: TrackingStatus, now: datetime) -> bool:
+        """Return whether the refresher should keep scheduling a status.
+
+        Only shipments created by a job are polled, and only until they
+        are older than TRACKING_MAX_AGE_DAYS.
+        """
+        if status.job_id is None:
+            return False
+        registered = _parse_ts(status.created_at)
+        if registered is None:
+            return True
+        return (now - registered).total_seconds() <= max_age_seconds()
+
+    def register_shipments(self, limit: int = 1000) -> int:
+        """Start tracking completed rows that have no stored status yet.
+
+        Rows shipped longer ago than TRACKING_MAX_AGE_DAYS are skipped, so
+        enabling the refresher does not start polling an old backlog.
+
+        Args:
+            limit: Maximum rows to register in one call.
+
+        Returns:
+            Number of tracking numbers registered.
+        """
+        cutoff = (_now() - timedelta(seconds=max_age_seconds())).isoformat()
+        candidates = (
+            self.db.query(JobRow.job_id, JobRow.row_number, JobRow.tracking_number)
+            .outerjoin(
+                TrackingStatus,
+                TrackingStatus.tracking_number == JobRow.tracking_number,
+            )
+            .filter(JobRow.status == RowStatus.completed.value)
+            .filter(JobRow.tracking_number.isnot(None))
+            .filter(JobRow.tracking_number != "")
+            .filter(TrackingStatus.tracking_number.is_(None))
+            .filter(func.coalesce(JobRow.processed_at, JobRow.created_at) >= cutoff)
+            .limit(limit)
+            .all()
+        )
+        now = _now().isoformat()
+        seen: set[str] = set()
+        for job_id, row_number, tracking_number in candidates:
+            if tracking_number in seen:
+                continue
+            seen.add(tracking_number)
+            self.db.add(TrackingStatus(
+                tracking_number=tracking_number,
+                job_id=job_id,
+                row_number=row_number,
+                state=TrackingState.unknown.value,
+                next_check_at=now,
+            ))
+        if seen:
+            self.db.commit()
+        return len(seen)
+
+    def due(self, limit: int, now: datetime | None = None) -> list[TrackingStatus]:
+        """Return tracking numbers whose next refresh is due, oldest first.
+
+        Args:
+            limit: Maximum number of entries.
+            now: Reference time (defaults to current UTC time).
+
+        Returns:
+            Due TrackingStatus rows.
+        """
+        cutoff = (now or _now()).isoformat()
+        return (
+            self.db.query(TrackingStatus)
+            .filter(TrackingStatus.next_check_at.isnot(None))
+            .filter(TrackingStatus.next_check_at <= cutoff)
+            .order_by(TrackingStatus.next_check_at.asc())
+            .limit(limit)
+            .all()
+        )
+
+    async def refresh_due(
+        self,
+        ups_client: Any,
+        limit: int = 200,
+        concurrency: int = 5,
+        rate_per_second: float = 5.0,
+    ) -> dict[str, int]:
+        """Refresh due tracking numbers against UPS.
+
+        Lookups run concurrently (bounded by ``concurrency``) and are spaced
+        to at most ``rate_per_second``; results are written on the event
+        loop between awaits so the session is never shared across threads.
+
+        Args:
+            ups_client: Client exposing async track_package(tracking_number=...).
+            limit: Maximum tracking numbers to refresh.
+            concurrency: Maximum in-flight lookups.
+            rate_per_second: Maximum lookups started per second (0 = no cap).
+
+        Returns:
+            Dict with refreshed and failed counts.
+        """
+        entries = self.due(limit)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        limiter = _RateLimiter(rate_per_second)
+        counts = {"refreshed": 0, "failed": 0}
+
+        async def _refresh(tracking_number: str) -> None:
+            async with semaphore:
+                await limiter.acquire()
+                try:
+                    raw = await ups_client.track_package(
+                        tracking_number=tracking_number,
+                    )
+                except Exception as e:
+                    self.record_error(tracking_number, str(e))
+                    counts["failed"] += 1
+                    return
+            self.record(tracking_number, parse_tracking_response(raw))
+            counts["refreshed"] += 1
+
+        await asyncio.gather(*(_refresh(e.tracking_number) for e in entries))
+        return counts
+
+    def job_summary(self, job_id: str) -> dict[str, Any]:
+        """Summarize delivery status across every shipped row of a job.
+
+        Args:
+            job_id: Job UUID.
+
+        Returns:
+            Dict with job_id, total, per-state counts and per-row shipments.
+            Rows not yet refreshed report state "unknown".
+        """
+        rows = (
+            self.db.query(JobRow.row_number, JobRow.tracking_number, TrackingStatus)
+            .outerjoin(
+                TrackingStatus,
+                TrackingStatus.tracking_number == JobRow.tracking_number,
+            )
+            .filter(JobRow.job_id == job_id)
+            .filter(JobRow.tracking_number.isnot(None))
+            .filter(JobRow.tracking_number != "")
+            .order_by(JobRow.row_number.asc())
+            .all()
+        )
+        counts: dict[str, int] = {}
+        shipments: list[dict[str, Any]] = []
+        for row_number, tracking_number, status in rows:
+            state = status.state if status is not None else TrackingState.unknown.value
+            counts[state] = counts.get(state, 0) + 1
+            shipments.append({
+                "row_number": row_number,
+                "tracking_number": tracking_number,
+                "state": state,
+                "status_description": status.status_description if status else None,
+                "delivery_date": status.delivery_date if status else None,
+                "last_checked_at": status.last_checked_at if status else None,
+            })
+        return {
+            "job_id": job_id,
+            "total": len(shipments),
+            "counts": counts,
+            "shipments": shipments,
+        }
+
+
+class TrackingRefresher:
+    """Background scheduler that periodically refreshes due tracking numbers.
+
+    Each cycle registers newly shipped rows, then refreshes up to
+    ``batch_size`` due tracking numbers. Failures are logged and the loop
+    continues on the next interval.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        ups_client_factory: Callable[[], Awaitable[Any]],
+        interval_s: float = 300.0,
+        batch_size: int = 200,
+        concurrency: int = 5,
+        rate_per_second: float = 5.0,
+    ) -> None:
+        """Initialize the refresher.
+
+        Args:
+            session_factory: Context manager factory yielding a DB session.
+            ups_client_factory: Async factory returning a connected UPS client.
+            interval_s: Seconds between refresh cycles.
+            batch_size: Max tracking numbers refreshed per cycle.
+            concurrency: Max concurrent UPS lookups.
+            rate_per_second: Max UPS lookups started per second.
+        """
+        self._session_factory = session_factory
+        self._ups_client_factory = ups_client_factory
+        self._interval_s = interval_s
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._rate_per_second = rate_per_second
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> dict[str, int]:
+        """Run a single register + refresh cycle.
+
+        Returns:
+            Dict with registered, refreshed and failed counts.
+        """
+        with self._session_factory() as db:
+            service = TrackingService(db)
+            registered = service.register_shipments(limit=self._batch_size * 5)
+            if not service.due(1):
+                return {"registered": registered, "refreshed": 0, "failed": 0}
+            ups_client = await self._ups_client_factory()
+            counts = await service.refresh_due(
+                ups_client,
+                limit=self._batch_size,
+                concurrency=self._concurrency,
+                rate_per_second=self._rate_per_second,
+            )
+        return {"registered": registered, **counts}
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                result = await self.run_once()
+                if any(result.values()):
+                    logger.info("Tracking refresh cycle: %s", result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Tracking refresh cycle failed: %s", e)
+            await asyncio.sleep(self._interval_s)
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def build_tracking_refresher() -> TrackingRefresher:
+    """Build a TrackingRefresher configured from environment variables.
+
+    Reads TRACKING_REFRESH_INTERVAL_S, TRACKING_REFRESH_BATCH_SIZE,
+    TRACKING_REFRESH_CONCURRENCY and TRACKING_REFRESH_RATE_PER_SEC.
+
+    Returns:
+        Configured TrackingRefresher using the shared UPS gateway.
+    """
+    from src.db.connection import get_db_context
+    from src.services.gateway_provider import get_ups_gateway
+
+    return TrackingRefresher(
+        session_factory=get_db_context,
+        ups_client_factory=get_ups_gateway,
+        interval_s=_env_number("TRACKING_REFRESH_INTERVAL_S", 300.0, minimum=1),
+        batch_size=int(_env_number("TRACKING_REFRESH_BATCH_SIZE", 200, minimum=1)),
+        concurrency=int(_env_number("TRACKING_REFRESH_CONCURRENCY", 5, minimum=1)),
+        rate_per_second=_env_number("TRACKING_REFRESH_RATE_PER_SEC", 5.0),
+    )
@@ -15,6 +15,7 @@ import json
 import logging
 import os
 import sys
+import time
 from typing import Any, Literal
 
 from mcp import StdioServerParameters
@@ -26,8 +27,10 @@ from src.services.mcp_client import (
     MCPToolError,
     _auto_decline_elicitation,
 )
+from src.services.metrics import UPS_CALL_SECONDS
 from src.services.ups_service_codes import SERVICE_CODE_NAMES
 from src.services.ups_specs import ensure_ups_specs_dir
+from src.utils.tracing import SPAN_KIND_CLIENT, span
 
 logger = logging.getLogger(__name__)
 
@@ -815,6 +818,22 @@ class UPSMCPClient:
                 "UPSMCPClient not connected. Use 'async with UPSMCPClient(...)' context."
             )
 
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span("ups.call", {"ups.tool": tool_name}, kind=SPAN_KIND_CLIENT):
+                result = await self._call_with_recovery(tool_name, arguments)
+            outcome = "ok"
+            return result
+        finally:
+            UPS_CALL_SECONDS.labels(tool_name, outcome).observe(
+                time.perf_counter() - started,
+            )
+
+    async def _call_with_recovery(
+        self, tool_name: str, arguments: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Call a tool with tool-level retries and transport recovery."""
         # Faster retries for non-mutating requests. Mutating operations
         # intentionally avoid tool-level retries to prevent side effects.
         if tool_name in self._READ_ONLY_TOOLS:
@@ -1205,17 +1224,45 @@ class UPSMCPClient:
                 candidate_data = [candidate_data]
             for c in candidate_data:
                 akf = c.get("AddressKeyFormat", {})
-                candidates.append({
+                candidate = {
                     "addressLines": akf.get("AddressLine", []),
                     "city": akf.get("PoliticalDivision2", ""),
                     "stateProvinceCode": akf.get("PoliticalDivision1", ""),
                     "postalCode": akf.get("PostcodePrimaryLow", ""),
-                })
+                }
+                residential = self._address_classification(c)
+                if residential is not None:
+                    candidate["residential"] = residential
+                candidates.append(candidate)
 
-        return {
+        result: dict[str, Any] = {
             "status": status,
             "candidates": candidates,
         }
+        residential = self._address_classification(xav)
+        if residential is not None:
+            result["residential"] = residential
+        return result
+
+    @staticmethod
+    def _address_classification(node: dict) -> bool | None:
+        """Read an XAV AddressClassification as a residential flag.
+
+        Args:
+            node: XAVResponse or Candidate dict.
+
+        Returns:
+            True for residential, False for commercial, None if unclassified.
+        """
+        classification = node.get("AddressClassification")
+        if not isinstance(classification, dict):
+            return None
+        code = str(classification.get("Code", ""))
+        if code == "2":
+            return True
+        if code == "1":
+            return False
+        return None
 
     def _normalize_void_response(self, raw: dict) -> dict[str, Any]:
         """Extract void status from raw UPS response.
@@ -9,12 +9,16 @@ any pending tasks can be drained via process_write_back_queue().
 """
 
 import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.db.models import WriteBackTask
+from src.db.write_queue import writer_lock
+from src.services.metrics import WRITE_BACK_LAG_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,19 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 
 
+def _observe_lag(created_ats: Iterable[str | None]) -> None:
+    """Record enqueue-to-completion lag for tasks completed just now."""
+    now = datetime.now(UTC)
+    for created_at in created_ats:
+        try:
+            created = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            continue
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=UTC)
+        WRITE_BACK_LAG_SECONDS.observe(max(0.0, (now - created).total_seconds()))
+
+
 def _find_existing_task(
     db: Session,
     job_id: str,
@@ -58,29 +75,9 @@ def enqueue_write_back(
     Returns:
         The created WriteBackTask ORM instance.
     """
-    existing = _find_existing_task(db, job_id, row_number)
-    if existing is not None:
-        if existing.status == "pending":
-            existing.tracking_number = tracking_number
-            existing.shipped_at = shipped_at
-            db.commit()
-        return existing
-
-    task = WriteBackTask(
-        job_id=job_id,
-        row_number=row_number,
-        tracking_number=tracking_number,
-        shipped_at=shipped_at,
-        status="pending",
-        retry_count=0,
-    )
-    db.add(task)
-    try:
-        db.commit()
-        return task
-    except IntegrityError:
-        # Race-safe fallback when another worker inserts the task first.
-        db.rollback()
+    # Runs on the caller's session (BatchEngine's); hold the single-writer
+    # lock so these commits serialize with the SQLite write queue.
+    with writer_lock():
         existing = _find_existing_task(db, job_id, row_number)
         if existing is not None:
             if existing.status == "pending":
@@ -88,7 +85,30 @@ def enqueue_write_back(
                 existing.shipped_at = shipped_at
                 db.commit()
             return existing
-        raise
+
+        task = WriteBackTask(
+            job_id=job_id,
+            row_number=row_number,
+            tracking_number=tracking_number,
+            shipped_at=shipped_at,
+            status="pending",
+            retry_count=0,
+        )
+        db.add(task)
+        try:
+            db.commit()
+            return task
+        except IntegrityError:
+            # Race-safe fallback when another worker inserts the task first.
+            db.rollback()
+            existing = _find_existing_task(db, job_id, row_number)
+            if existing is not None:
+                if existing.status == "pending":
+                    existing.tracking_number = tracking_number
+                    existing.shipped_at = shipped_at
+                    db.commit()
+                return existing
+            raise
 
 
 def get_pending_tasks(db: Session, job_id: str | None = None) -> list[WriteBackTask]:
@@ -119,12 +139,13 @@ def mark_tasks_completed(db: Session, job_id: str) -> int:
     Returns:
         Number of tasks marked completed.
     """
-    count = (
-        db.query(WriteBackTask)
-        .filter(WriteBackTask.job_id == job_id, WriteBackTask.status == "pending")
-        .update({"status": "completed"})
+    pending = db.query(WriteBackTask).filter(
+        WriteBackTask.job_id == job_id, WriteBackTask.status == "pending",
     )
+    created_ats = [created_at for (created_at,) in pending.with_entities(WriteBackTask.created_at)]
+    count = pending.update({"status": "completed"})
     db.commit()
+    _observe_lag(created_ats)
     return count
 
 
@@ -144,16 +165,15 @@ def mark_rows_completed(db: Session, job_id: str, row_numbers: list[int]) -> int
     """
     if not row_numbers:
         return 0
-    count = (
-        db.query(WriteBackTask)
-        .filter(
-            WriteBackTask.job_id == job_id,
-            WriteBackTask.status == "pending",
-            WriteBackTask.row_number.in_(row_numbers),
-        )
-        .update({"status": "completed"}, synchronize_session="fetch")
+    pending = db.query(WriteBackTask).filter(
+        WriteBackTask.job_id == job_id,
+        WriteBackTask.status == "pending",
+        WriteBackTask.row_number.in_(row_numbers),
     )
+    created_ats = [created_at for (created_at,) in pending.with_entities(WriteBackTask.created_at)]
+    count = pending.update({"status": "completed"}, synchronize_session="fetch")
     db.commit()
+    _observe_lag(created_ats)
     return count
 
 
@@ -179,6 +199,7 @@ async def process_write_back_queue(
     processed = 0
     failed = 0
     dead_letter = 0
+    completed_created_ats: list[str] = []
 
     for task in tasks:
         try:
@@ -189,6 +210,7 @@ async def process_write_back_queue(
             )
             task.status = "completed"
             processed += 1
+            completed_created_ats.append(task.created_at)
         except Exception as e:
             task.retry_count = (task.retry_count or 0) + 1
             if task.retry_count >= MAX_RETRIES:
@@ -210,6 +232,7 @@ async def process_write_back_queue(
                 )
 
     db.commit()
+    _observe_lag(completed_created_ats)
 
     return {
         "processed": processed,
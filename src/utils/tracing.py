@@ -0,0 +1,494 @@
+"""Lightweight tracing with OpenTelemetry-compatible spans.
+
+Spans follow the W3C Trace Context model (32-hex trace id, 16-hex span
+id) and are exported as OTLP/JSON, so any OpenTelemetry collector or
+viewer can read them. The current span lives in a ContextVar, the same
+way decision-audit correlation is propagated; ``current_traceparent()``
+renders it as a ``traceparent`` header for boundaries contextvars cannot
+cross — MCP stdio requests carry it in their ``_meta`` and the agent
+bridge carries it into SDK tool handlers.
+
+Configuration:
+    TRACING_EXPORTER: ``none`` (default), ``jsonl`` or ``otlp``.
+    TRACING_FILE: Output path for the ``jsonl`` exporter (default
+        ``traces/spans.jsonl``). Each line is one OTLP/JSON export
+        request, the format read by the collector's otlpjsonfile receiver.
+    OTEL_EXPORTER_OTLP_ENDPOINT: Collector base URL for the ``otlp``
+        exporter (default ``http://localhost:4318``); spans are batched
+        and POSTed to ``/v1/traces`` from a background thread.
+    OTEL_SERVICE_NAME: ``service.name`` resource attribute.
+
+With tracing disabled, ``span()`` yields a shared no-op span and costs
+one global lookup.
+
+Example:
+    with span("batch.row", {"job.id": job_id, "row.number": 3}) as s:
+        result = await rate(row)
+        s.set_attribute("ups.service", result["service"])
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_NAME = "shipagent"
+DEFAULT_TRACE_FILE = "traces/spans.jsonl"
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318"
+
+# Env vars forwarded to MCP subprocesses so their spans join the trace.
+_PROPAGATED_ENV = (
+    "TRACING_EXPORTER",
+    "TRACING_FILE",
+    "OTEL_EXPORTER_OTLP_ENDPOINT",
+)
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# OTLP SpanKind values.
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = (
+        "attributes",
+        "end_ns",
+        "kind",
+        "name",
+        "parent_span_id",
+        "span_id",
+        "start_ns",
+        "status_code",
+        "status_message",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str | None,
+        kind: int,
+        attributes: Mapping[str, Any] | None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status_code = 0
+        self.status_message = ""
+
+    @property
+    def traceparent(self) -> str:
+        """W3C traceparent header value for this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute (str, bool, int or float)."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span failed with the error's type and message."""
+        self.status_code = _STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"[:500]
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return the span in OTLP/JSON form."""
+        body: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            body["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            body["status"]["message"] = self.status_message
+        return body
+
+
+class _NoopSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard the attribute."""
+
+    def record_error(self, error: BaseException) -> None:
+        """Discard the error."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("trace_current_span", default=None)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def _export_request(spans: list[dict[str, Any]], service_name: str) -> dict[str, Any]:
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "shipagent"}, "spans": spans}],
+        }],
+    }
+
+
+class SpanExporter(Protocol):
+    """Destination for finished spans."""
+
+    def export(self, span: Span) -> None:
+        """Accept one finished span without blocking."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush buffered spans and release resources."""
+        ...
+
+
+class JsonlSpanExporter:
+    """Appends one OTLP/JSON export request per span to a file."""
+
+    def __init__(self, path: str | Path, service_name: str = DEFAULT_SERVICE_NAME) -> None:
+        self.path = Path(path)
+        self.service_name = service_name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        """Write the span as one line."""
+        line = json.dumps(_export_request([span.to_otlp()], self.service_name))
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def shutdown(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+
+class OtlpHttpSpanExporter:
+    """Batches spans and POSTs them to an OTLP/HTTP collector.
+
+    Spans are queued (bounded; overflow is dropped) and sent from a
+    daemon thread in batches, so request paths never wait on the
+    collector.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_OTLP_ENDPOINT,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        max_queue: int = 10_000,
+        max_batch: int = 512,
+        flush_interval_s: float = 2.0,
+    ) -> None:
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=max_queue)
+        self._max_batch = max_batch
+        self._flush_interval_s = flush_interval_s
+        self._dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="otlp-span-exporter", daemon=True,
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        """Queue the span, dropping it if the queue is full."""
+        try:
+            self._queue.put_nowait(span.to_otlp())
+        except queue.Full:
+            self._dropped += 1
+
+    def _run(self) -> None:
+        import httpx
+
+        with httpx.Client(timeout=5.0) as client:
+            stopping = False
+            while not stopping:
+                batch: list[dict[str, Any]] = []
+                deadline = time.monotonic() + self._flush_interval_s
+                while len(batch) < self._max_batch:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                if batch:
+                    self._post(client, batch)
+
+    def _post(self, client: Any, batch: list[dict[str, Any]]) -> None:
+        try:
+            response = client.post(self.url, json=_export_request(batch, self.service_name))
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning("OTLP span export to %s failed (%d spans): %s", self.url, len(batch), e)
+        if self._dropped:
+            logger.warning("Dropped %d spans: export queue full", self._dropped)
+            self._dropped = 0
+
+    def shutdown(self) -> None:
+        """Flush queued spans and stop the sender thread."""
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+
+
+_exporter: SpanExporter | None = None
+_configured = False
+_config_lock = threading.Lock()
+
+
+def _exporter_from_env(service_name: str | None) -> SpanExporter | None:
+    kind = os.environ.get("TRACING_EXPORTER", "none").strip().lower()
+    service_name = service_name or os.environ.get("OTEL_SERVICE_NAME", DEFAULT_SERVICE_NAME)
+    if kind in ("", "none"):
+        return None
+    try:
+        if kind == "jsonl":
+            path = os.environ.get("TRACING_FILE", "").strip() or DEFAULT_TRACE_FILE
+            return JsonlSpanExporter(path, service_name)
+        if kind == "otlp":
+            endpoint = (
+                os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip() or DEFAULT_OTLP_ENDPOINT
+            )
+            return OtlpHttpSpanExporter(endpoint, service_name)
+    except Exception as e:
+        logger.warning("Tracing exporter %r failed to start (%s); tracing disabled", kind, e)
+        return None
+    logger.warning("Invalid TRACING_EXPORTER=%r; tracing disabled", kind)
+    return None
+
+
+def configure_tracing(
+    exporter: SpanExporter | None = None,
+    *,
+    service_name: str | None = None,
+) -> None:
+    """Install an exporter, or build one from the environment.
+
+    Args:
+        exporter: Exporter to use; when None, TRACING_EXPORTER decides.
+        service_name: Overrides OTEL_SERVICE_NAME for env-built exporters.
+    """
+    global _exporter, _configured
+    with _config_lock:
+        previous = _exporter
+        _exporter = exporter if exporter is not None else _exporter_from_env(service_name)
+        _configured = True
+    if previous is not None and previous is not _exporter:
+        previous.shutdown()
+
+
+def shutdown_tracing() -> None:
+    """Flush and detach the current exporter."""
+    global _exporter
+    with _config_lock:
+        exporter, _exporter = _exporter, None
+    if exporter is not None:
+        exporter.shutdown()
+
+
+atexit.register(shutdown_tracing)
+
+
+def _active_exporter() -> SpanExporter | None:
+    if not _configured:
+        configure_tracing()
+    return _exporter
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Return (trace_id, parent_span_id) from a traceparent, or None."""
+    if not value or not isinstance(value, str):
+        return None
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def current_span() -> Span | _NoopSpan:
+    """Return the active span, or a no-op span when there is none."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+def current_traceparent() -> str | None:
+    """Return the traceparent of the active span, if any."""
+    active = _current_span.get()
+    return active.traceparent if active is not None else None
+
+
+def trace_meta() -> dict[str, Any] | None:
+    """Return MCP request ``_meta`` carrying the active trace, if any."""
+    traceparent = current_traceparent()
+    return {"traceparent": traceparent} if traceparent else None
+
+
+def tracing_env() -> dict[str, str]:
+    """Return tracing settings to forward to MCP subprocess environments."""
+    return {key: os.environ[key] for key in _PROPAGATED_ENV if os.environ.get(key)}
+
+
+def _new_span(
+    name: str,
+    attributes: Mapping[str, Any] | None,
+    parent: str | None,
+    kind: int,
+) -> Span:
+    active = _current_span.get()
+    if active is not None:
+        trace_id, parent_id = active.trace_id, active.span_id
+    elif (remote := parse_traceparent(parent)) is not None:
+        trace_id, parent_id = remote
+    else:
+        trace_id, parent_id = secrets.token_hex(16), None
+    return Span(name, trace_id, parent_id, kind, attributes)
+
+
+def _finish(current: Span, exporter: SpanExporter) -> None:
+    current.end_ns = time.time_ns()
+    if current.status_code == 0:
+        current.status_code = _STATUS_OK
+    try:
+        exporter.export(current)
+    except Exception as e:
+        logger.debug("Span export failed: %s", e)
+
+
+@contextmanager
+def span(
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    *,
+    parent: str | None = None,
+    kind: int = SPAN_KIND_INTERNAL,
+) -> Iterator[Span | _NoopSpan]:
+    """Time a block as a span, nested under the active span.
+
+    Args:
+        name: Span name, e.g. ``mcp.call_tool``.
+        attributes: Initial attributes.
+        parent: traceparent to continue when no span is active in this
+            context (MCP requests, SDK tool handlers).
+        kind: OTLP span kind.
+
+    Yields:
+        The span, or a no-op stand-in when tracing is disabled.
+    """
+    exporter = _active_exporter()
+    if exporter is None:
+        yield _NOOP_SPAN
+        return
+
+    current = _new_span(name, attributes, parent, kind)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.record_error(e)
+        raise
+    finally:
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # An async generator finalized from another context.
+            pass
+        _finish(current, exporter)
+
+
+def start_child_span(
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    kind: int = SPAN_KIND_CLIENT,
+) -> Span | None:
+    """Start a leaf span under the active span without activating it.
+
+    For callback-style instrumentation (SQL statement hooks) where the
+    start and end happen in different functions. Returns None when
+    tracing is disabled or no span is active, so background work does
+    not produce orphan traces.
+    """
+    if _active_exporter() is None or _current_span.get() is None:
+        return None
+    return _new_span(name, attributes, None, kind)
+
+
+def end_span(current: Span, error: BaseException | None = None) -> None:
+    """Finish a span from ``start_child_span``."""
+    exporter = _exporter
+    if exporter is None:
+        return
+    if error is not None:
+        current.record_error(error)
+    _finish(current, exporter)
+
+
+def traced(name: str, kind: int = SPAN_KIND_INTERNAL) -> Callable[[F], F]:
+    """Decorate an async function to run inside a span."""
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, kind=kind):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
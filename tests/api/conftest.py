@@ -13,8 +13,9 @@ import pytest
 from fastapi.testclient import TestClient
 from pypdf import PdfWriter
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 os.environ.setdefault("SHIPAGENT_SKIP_SDK_CHECK", "true")
 os.environ.setdefault(
@@ -23,7 +24,7 @@ os.environ.setdefault(
 )
 
 from src.api.main import app
-from src.db.connection import get_db
+from src.db.connection import get_async_db, get_db
 from src.db.models import Base, Job, JobRow, JobStatus, RowStatus
 
 
@@ -57,15 +58,22 @@ def mock_agent_processing():
 
 
 @pytest.fixture
-def test_db() -> Generator[Session, None, None]:
-    """Create an in-memory SQLite database for testing.
+def test_db_path(tmp_path: Path) -> Path:
+    """Path of the per-test SQLite file shared by the sync and async engines."""
+    return tmp_path / "api-test.db"
 
-    Creates all tables, yields a session, and cleans up after test.
+
+@pytest.fixture
+def test_db(test_db_path: Path) -> Generator[Session, None, None]:
+    """Create a file-backed SQLite database for testing.
+
+    A file (rather than ``:memory:``) lets the async routes read what the
+    sync fixtures write. Creates all tables, yields a session, and cleans
+    up after test.
     """
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{test_db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -75,18 +83,25 @@ def test_db() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+        engine.dispose()
 
 
 @pytest.fixture
-def client(test_db: Session) -> Generator[TestClient, None, None]:
-    """Create a TestClient with overridden database dependency.
+def client(test_db: Session, test_db_path: Path) -> Generator[TestClient, None, None]:
+    """Create a TestClient with overridden database dependencies.
 
     Args:
         test_db: Test database session fixture.
+        test_db_path: SQLite file backing ``test_db``.
 
     Yields:
         TestClient configured for testing.
     """
+    # NullPool: TestClient runs each request on its own event loop.
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{test_db_path}", poolclass=NullPool,
+    )
+    AsyncTestingSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
     def override_get_db():
         try:
@@ -94,7 +109,12 @@ def client(test_db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
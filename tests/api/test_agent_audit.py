@@ -49,11 +49,26 @@ def test_export_requires_filter(client):
 def test_export_jsonl(client, monkeypatch):
     """Export returns JSONL content."""
     monkeypatch.setattr(
-        "src.api.routes.agent_audit.DecisionAuditService.export_events",
-        MagicMock(return_value=[{"id": "e1", "run_id": "r1"}]),
+        "src.api.routes.agent_audit.DecisionAuditService.iter_export_events",
+        MagicMock(return_value=iter([{"id": "e1", "run_id": "r1"}])),
     )
     resp = client.get("/api/v1/agent-audit/export?run_id=r1")
     assert resp.status_code == 200
     body = resp.text.strip().splitlines()
     assert len(body) == 1
     assert '"id":"e1"' in body[0]
+
+
+def test_export_is_gzipped_when_accepted(client, monkeypatch):
+    """Export is compressed on the fly for clients that accept gzip."""
+    monkeypatch.setattr(
+        "src.api.routes.agent_audit.DecisionAuditService.iter_export_events",
+        MagicMock(return_value=iter([{"id": f"e{n}", "seq": n} for n in range(3000)])),
+    )
+    resp = client.get(
+        "/api/v1/agent-audit/export?job_id=j1", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.headers["content-encoding"] == "gzip"
+    lines = resp.text.splitlines()
+    assert len(lines) == 3000
+    assert lines[-1] == '{"id":"e2999","seq":2999}'
@@ -0,0 +1,172 @@
+"""Tests for the read routes served from the async database session.
+
+Covers the job list/detail/rows/summary routes, the log routes, and the
+row label route after their move onto ``AsyncSession``, plus parity
+between ``AsyncJobService`` and ``JobService`` summaries.
+"""
+
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.db.models import Job, JobRow, JobStatus, RowStatus
+from src.services import AsyncAuditService, AsyncJobService, AuditService, JobService
+
+
+class TestJobReadRoutes:
+    """GET /api/v1/jobs and per-job read endpoints."""
+
+    def test_list_jobs_filters_and_counts_before_paging(
+        self, client: TestClient, test_db: Session
+    ):
+        for i in range(3):
+            test_db.add(Job(name=f"Batch {i}", original_command="ship", status="pending"))
+        test_db.add(Job(name="Other", original_command="ship", status="completed"))
+        test_db.commit()
+
+        response = client.get("/api/v1/jobs", params={"name": "batch", "limit": 2})
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["total"] == 3
+        assert len(data["jobs"]) == 2
+        assert all(j["name"].startswith("Batch") for j in data["jobs"])
+
+        completed = client.get("/api/v1/jobs", params={"status": "completed"}).json()
+        assert [j["name"] for j in completed["jobs"]] == ["Other"]
+
+    def test_get_job_and_rows_filtered_by_status(
+        self, client: TestClient, test_db: Session, job_with_rows: Job
+    ):
+        row = test_db.query(JobRow).filter(JobRow.row_number == 2).one()
+        row.status = RowStatus.failed.value
+        test_db.commit()
+
+        job = client.get(f"/api/v1/jobs/{job_with_rows.id}")
+        failed = client.get(
+            f"/api/v1/jobs/{job_with_rows.id}/rows", params={"status": "failed"}
+        )
+
+        assert job.json()["name"] == "Test Job"
+        assert [r["row_number"] for r in failed.json()] == [2]
+        assert client.get("/api/v1/jobs/missing/rows").status_code == 404
+
+    def test_summary_counts_review_in_flight_and_completed_cost(
+        self, client: TestClient, test_db: Session, job_with_rows: Job
+    ):
+        rows = test_db.query(JobRow).order_by(JobRow.row_number).all()
+        rows[0].status = RowStatus.completed.value
+        rows[1].status = RowStatus.needs_review.value
+        rows[2].status = RowStatus.in_flight.value
+        job_with_rows.processed_rows = 1
+        test_db.commit()
+
+        summary = client.get(f"/api/v1/jobs/{job_with_rows.id}/summary").json()
+
+        assert summary["needs_review_count"] == 1
+        assert summary["in_flight_count"] == 1
+        assert summary["pending_count"] == 5 - 1 - 1 - 1
+        assert summary["total_cost_cents"] == rows[0].cost_cents
+
+
+class TestLogReadRoutes:
+    """GET /api/v1/jobs/{job_id}/logs endpoints."""
+
+    def test_logs_errors_and_export(
+        self, client: TestClient, test_db: Session, sample_job: Job
+    ):
+        audit = AuditService(test_db)
+        audit.log_state_change(sample_job.id, "pending", "running")
+        audit.log_job_error(sample_job.id, "E-3001", "UPS rejected the address")
+
+        logs = client.get(f"/api/v1/jobs/{sample_job.id}/logs").json()
+        errors = client.get(f"/api/v1/jobs/{sample_job.id}/logs/errors").json()
+        export = client.get(f"/api/v1/jobs/{sample_job.id}/logs/export")
+
+        assert [log["event_type"] for log in logs] == ["state_change", "error"]
+        assert [e["message"] for e in errors] == ["E-3001: UPS rejected the address"]
+        assert export.headers["content-disposition"].startswith(
+            'attachment; filename="Test_Job_logs_'
+        )
+        assert "[ERROR] [error] E-3001" in export.text
+
+    def test_logs_for_missing_job_is_404(self, client: TestClient):
+        assert client.get("/api/v1/jobs/missing/logs").status_code == 404
+
+    def test_ndjson_export_streams_gzipped_records(
+        self, client: TestClient, test_db: Session, sample_job: Job
+    ):
+        audit = AuditService(test_db)
+        for n in range(1, 1201):
+            audit.log_row_event(sample_job.id, n, "completed", {"tracking": f"1Z{n}"})
+
+        export = client.get(
+            f"/api/v1/jobs/{sample_job.id}/logs/export",
+            params={"format": "ndjson"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        records = [json.loads(line) for line in export.text.splitlines()]
+        assert export.headers["content-encoding"] == "gzip"
+        assert export.headers["content-disposition"].endswith('.ndjson"')
+        assert len(records) == 1200
+        assert records[-1]["row_number"] == 1200
+        assert records[-1]["details"] == {"tracking": "1Z1200"}
+        assert client.get("/api/v1/jobs/missing/logs/export").status_code == 404
+
+
+class TestLabelReadRoutes:
+    """Label downloads resolve their row through the async session."""
+
+    def test_label_by_row_serves_file(
+        self, client: TestClient, test_db: Session, sample_job: Job, sample_label_file: Path
+    ):
+        test_db.add(
+            JobRow(
+                job_id=sample_job.id,
+                row_number=1,
+                row_checksum="c1",
+                status=RowStatus.completed.value,
+                tracking_number="1ZROW1",
+                label_path=str(sample_label_file),
+            )
+        )
+        test_db.commit()
+
+        response = client.get(f"/api/v1/jobs/{sample_job.id}/labels/1")
+
+        assert response.status_code == 200
+        assert response.content == sample_label_file.read_bytes()
+
+
+class TestAsyncServiceParity:
+    """Async services return what their sync counterparts return."""
+
+    async def test_summary_and_logs_match_sync(self, test_db: Session, test_db_path: Path):
+        job = JobService(test_db).create_job(name="Parity", original_command="ship")
+        JobService(test_db).create_rows(
+            job.id, [{"row_number": n, "row_checksum": f"c{n}"} for n in (1, 2)],
+        )
+        test_db.query(JobRow).filter(JobRow.row_number == 1).update(
+            {"status": RowStatus.completed.value, "cost_cents": 1234}
+        )
+        test_db.query(Job).filter(Job.id == job.id).update(
+            {"status": JobStatus.running.value, "processed_rows": 1}
+        )
+        test_db.commit()
+        AuditService(test_db).log_state_change(job.id, "pending", "running")
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{test_db_path}")
+        try:
+            async with AsyncSession(engine) as session:
+                summary = await AsyncJobService(session).get_job_summary(job.id)
+                text = await AsyncAuditService(session).export_logs_text(job.id)
+        finally:
+            await engine.dispose()
+
+        assert summary == JobService(test_db).get_job_summary(job.id)
+        assert summary["total_cost_cents"] == 1234
+        assert text == AuditService(test_db).export_logs_text(job.id)
@@ -558,3 +558,54 @@ async def test_process_message_keeps_final_message_when_no_artifact(monkeypatch)
 
     conversations._session_manager.remove_session(session_id)
     conversations._event_queues.pop(session_id, None)
+
+
+@pytest.mark.asyncio
+async def test_ensure_agent_claims_warm_agent_for_new_session():
+    """A new session binds a pooled agent; a resumed one starts its own."""
+    from src.api.routes import conversations
+    from src.services.agent_pool import AgentPool
+
+    def _agent():
+        return SimpleNamespace(
+            is_started=True,
+            emitter_bridge=SimpleNamespace(session_id=None),
+            stop=AsyncMock(),
+        )
+
+    warm = _agent()
+    cold = _agent()
+    pool = AgentPool(max_size=2, min_size=1)
+    await pool.refill(("none", False), AsyncMock(return_value=warm))
+    start_agent = AsyncMock(return_value=cold)
+
+    new_session = conversations._session_manager.get_or_create_session("pool-new")
+    new_session.add_message("user", "Ship all orders")
+    resumed = conversations._session_manager.get_or_create_session("pool-resumed")
+    resumed.add_message("user", "Ship them now")
+    prior = [
+        {"role": "user", "content": "Ship all orders"},
+        {"role": "assistant", "content": "Preview ready"},
+        {"role": "user", "content": "Ship them now"},
+    ]
+
+    with (
+        patch.object(conversations, "_agent_pool", pool),
+        patch.object(conversations, "_start_agent", new=start_agent),
+        patch(
+            "src.services.conversation_handler._load_prior_conversation",
+            side_effect=[[{"role": "user", "content": "Ship all orders"}], prior],
+        ),
+    ):
+        assert await conversations._ensure_agent(new_session, None)
+        assert await conversations._ensure_agent(resumed, None)
+        await pool.close()
+
+    assert new_session.agent is warm
+    assert new_session.agent_from_pool
+    assert warm.emitter_bridge.session_id == "pool-new"
+    assert resumed.agent is cold
+    assert not resumed.agent_from_pool
+    assert start_agent.await_args.kwargs["prior_conversation"] == prior
+    conversations._session_manager.remove_session("pool-new")
+    conversations._session_manager.remove_session("pool-resumed")
@@ -5,12 +5,18 @@ shipping labels and merged PDF downloads, including path traversal
 protection (F-1, CWE-22).
 """
 
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+from pypdf import PdfReader
 from sqlalchemy.orm import Session
 
+from src.api.routes import labels as labels_route
 from src.db.models import Job, JobRow, RowStatus
 from tests.api.conftest import create_valid_pdf
 
@@ -238,6 +244,175 @@ class TestDownloadLabelsMerged:
         assert response.content.startswith(b"%PDF")
 
 
+    def test_merged_reuses_cached_artifact(
+        self,
+        client: TestClient,
+        test_db: Session,
+        sample_job: Job,
+        valid_label_dir: Path,
+    ):
+        """Second download serves the cached merged PDF without rebuilding."""
+        label_path = valid_label_dir / "label_1.pdf"
+        create_valid_pdf(label_path)
+        test_db.add(
+            JobRow(
+                job_id=sample_job.id,
+                row_number=1,
+                row_checksum="checksum_1",
+                status=RowStatus.completed.value,
+                tracking_number="1Z999CACHE001",
+                label_path=str(label_path),
+            )
+        )
+        test_db.commit()
+
+        first = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+        with patch("src.api.routes.labels._build_merged_pdf") as build:
+            second = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        build.assert_not_called()
+        assert second.content == first.content
+
+    def test_merged_cache_invalidated_by_new_label(
+        self,
+        client: TestClient,
+        test_db: Session,
+        sample_job: Job,
+        valid_label_dir: Path,
+    ):
+        """Completing another row produces a fresh artifact with both labels."""
+        for i in (1, 2):
+            label_path = valid_label_dir / f"label_{i}.pdf"
+            create_valid_pdf(label_path)
+            test_db.add(
+                JobRow(
+                    job_id=sample_job.id,
+                    row_number=i,
+                    row_checksum=f"checksum_{i}",
+                    status=RowStatus.completed.value,
+                    tracking_number=f"1Z999GROW{i:03d}",
+                    label_path=str(label_path) if i == 1 else None,
+                )
+            )
+        test_db.commit()
+
+        first = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+        assert len(PdfReader(io.BytesIO(first.content)).pages) == 1
+
+        row2 = (
+            test_db.query(JobRow)
+            .filter(JobRow.job_id == sample_job.id, JobRow.row_number == 2)
+            .one()
+        )
+        row2.label_path = str(valid_label_dir / "label_2.pdf")
+        test_db.commit()
+
+        second = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+        assert len(PdfReader(io.BytesIO(second.content)).pages) == 2
+
+    def test_merged_reference_released_after_response(
+        self,
+        client: TestClient,
+        test_db: Session,
+        sample_job: Job,
+        valid_label_dir: Path,
+    ):
+        """The served artifact is held only while the response is sent."""
+        label_path = valid_label_dir / "label_1.pdf"
+        create_valid_pdf(label_path)
+        test_db.add(
+            JobRow(
+                job_id=sample_job.id,
+                row_number=1,
+                row_checksum="checksum_1",
+                status=RowStatus.completed.value,
+                tracking_number="1Z999HELD001",
+                label_path=str(label_path),
+            )
+        )
+        test_db.commit()
+
+        response = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+
+        assert response.status_code == 200
+        assert not labels_route._merged_in_use
+
+    def test_concurrent_downloads_build_once(self, tmp_path: Path):
+        """Callers racing on one label set share a single build."""
+        dest = tmp_path / "merged" / "job_abc.pdf"
+        started = threading.Barrier(4)
+        builds: list[int] = []
+
+        def _slow_build(_paths, target):
+            builds.append(1)
+            time.sleep(0.05)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(b"%PDF")
+            return 1
+
+        def _download():
+            started.wait()
+            return labels_route._ensure_merged_pdf([], dest)
+
+        with patch("src.api.routes.labels._build_merged_pdf", _slow_build):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(lambda _: _download(), range(4)))
+
+        assert results == [True] * 4
+        assert len(builds) == 1
+        assert not labels_route._merged_build_locks
+
+    def test_eviction_keeps_artifacts_still_being_served(self, tmp_path: Path):
+        """A superseded artifact survives until its download finishes."""
+        stale = tmp_path / "job-1_old.pdf"
+        current = tmp_path / "job-1_new.pdf"
+        stale.write_bytes(b"%PDF")
+        current.write_bytes(b"%PDF")
+
+        labels_route._acquire_merged(stale)
+        labels_route._evict_stale_merged("job-1", keep=current)
+        assert stale.exists()
+
+        labels_route._release_merged(stale)
+        labels_route._evict_stale_merged("job-1", keep=current)
+        assert not stale.exists()
+        assert current.exists()
+
+    def test_merged_thermal_labels_concatenated(
+        self,
+        client: TestClient,
+        test_db: Session,
+        sample_job: Job,
+        valid_label_dir: Path,
+    ):
+        """ZPL labels are concatenated in row order without pypdf."""
+        for i in (2, 1):
+            label_path = valid_label_dir / f"label_{i}.zpl"
+            label_path.write_bytes(f"^XA^FDROW{i}^FS^XZ\n".encode())
+            test_db.add(
+                JobRow(
+                    job_id=sample_job.id,
+                    row_number=i,
+                    row_checksum=f"checksum_{i}",
+                    status=RowStatus.completed.value,
+                    tracking_number=f"1Z999ZPL{i:03d}",
+                    label_path=str(label_path),
+                )
+            )
+        test_db.commit()
+
+        with patch("src.api.routes.labels._build_merged_pdf") as build:
+            response = client.get(f"/api/v1/jobs/{sample_job.id}/labels/merged")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-zpl"
+        assert "labels-" in response.headers.get("content-disposition", "")
+        assert response.content == b"^XA^FDROW1^FS^XZ\n^XA^FDROW2^FS^XZ\n"
+        build.assert_not_called()
+
+
 class TestPathTraversal:
     """Tests for path traversal protection (F-1, CWE-22)."""
 
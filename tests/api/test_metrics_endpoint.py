@@ -0,0 +1,33 @@
+"""Tests for the Prometheus /metrics endpoint."""
+
+from fastapi.testclient import TestClient
+
+from src.services.metrics import UPS_CALL_SECONDS
+
+
+class TestMetricsEndpoint:
+    """Scrape output from the application registry."""
+
+    def test_metrics_exposes_hot_path_families(self, client: TestClient):
+        UPS_CALL_SECONDS.labels("rate_shipment", "ok").observe(0.2)
+
+        resp = client.get("/metrics")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = resp.text
+        for family in (
+            "shipagent_ups_call_seconds",
+            "shipagent_mcp_call_seconds",
+            "shipagent_mcp_retries",
+            "shipagent_data_source_call_seconds",
+            "shipagent_batch_db_commit_seconds",
+            "shipagent_batch_rows_per_second",
+            "shipagent_sse_subscribers",
+            "shipagent_sse_max_lag_events",
+            "shipagent_write_back_lag_seconds",
+            "shipagent_agent_turn_seconds",
+        ):
+            assert f"# TYPE {family} " in body
+        assert 'shipagent_ups_call_seconds_count{tool="rate_shipment",outcome="ok"}' in body
+        assert "shipagent_sse_subscribers 0" in body
@@ -4,10 +4,15 @@ Tests the /api/v1/jobs/{job_id}/progress endpoints for
 SSE streaming and fallback progress retrieval.
 """
 
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from src.api.routes.progress import _event_generator, _parse_last_event_id
 from src.db.models import Job, JobStatus
+from src.orchestrator.batch import SSEProgressObserver
 
 
 class TestProgressFallback:
@@ -128,3 +133,30 @@ class TestProgressStream:
         assert response.status_code == 200
         # EventSourceResponse should set the correct content type
         assert "text/event-stream" in response.headers.get("content-type", "")
+
+
+class TestEventGenerator:
+    """Tests for the SSE event generator feeding stream_progress."""
+
+    async def test_events_carry_sequence_ids(self):
+        """Each SSE frame carries the broadcaster sequence as its id."""
+        observer = SSEProgressObserver(coalesce_interval_s=0)
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+
+        with patch("src.api.routes.progress.sse_observer", observer):
+            subscription = observer.subscribe("job-1")
+            await observer.on_batch_started("job-1", 1)
+            gen = _event_generator(request, "job-1", subscription)
+            frame = await gen.__anext__()
+            await gen.aclose()
+
+        assert frame["id"] == "1"
+        assert json.loads(frame["data"])["event"] == "batch_started"
+        assert not observer.has_subscribers("job-1")
+
+    def test_parse_last_event_id(self):
+        """Malformed Last-Event-ID headers are ignored."""
+        assert _parse_last_event_id("42") == 42
+        assert _parse_last_event_id("abc") is None
+        assert _parse_last_event_id(None) is None
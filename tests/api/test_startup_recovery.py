@@ -7,6 +7,10 @@ Verifies that on startup:
 4. Recovery report is logged when needs_review rows found
 5. UPS MCP unavailability is handled gracefully (rows stay in_flight)
 6. UPS client is disconnected after recovery completes
+7. Only in_flight rows of running jobs are queried
+8. Recovery progress is published for the readiness endpoint
+9. Jobs leased by another live worker are not recovered
+10. Stale leases are reclaimed when they expire, not after a full TTL
 """
 
 from datetime import UTC, datetime, timedelta
@@ -14,8 +18,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.api.main import run_startup_recovery
-from src.db.models import JobStatus
+from src.api.main import _recovery_status, run_startup_recovery
+from src.db.models import JobStatus, RowStatus
+
+
+@pytest.fixture(autouse=True)
+def _lease_always_granted():
+    """Mock DB sessions cannot run the lease UPDATE; grant every claim."""
+    with patch("src.api.main.acquire_lease", return_value=True), patch(
+        "src.api.main.release_lease",
+    ):
+        yield
 
 
 class TestStartupRecovery:
@@ -57,7 +70,9 @@ class TestStartupRecovery:
 
             in_flight_row = MagicMock()
             in_flight_row.status = "in_flight"
-            mock_js.get_rows.return_value = [in_flight_row]
+            mock_js.get_rows_for_jobs_in_status.return_value = {
+                mock_job.id: [in_flight_row],
+            }
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -78,6 +93,7 @@ class TestStartupRecovery:
             mock_db = MagicMock()
             mock_js = MagicMock()
             mock_js.list_jobs.return_value = []
+            mock_js.get_rows_for_jobs_in_status.return_value = {}
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -98,6 +114,7 @@ class TestStartupRecovery:
             mock_db = MagicMock()
             mock_js = MagicMock()
             mock_js.list_jobs.return_value = []
+            mock_js.get_rows_for_jobs_in_status.return_value = {}
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -106,7 +123,7 @@ class TestStartupRecovery:
 
     @pytest.mark.asyncio
     async def test_skips_jobs_without_inflight_rows(self) -> None:
-        """Jobs in running state but without in_flight rows skip recovery."""
+        """Running jobs without in_flight rows never reach recovery."""
         mock_ups_class = MagicMock()
 
         with patch(
@@ -122,10 +139,8 @@ class TestStartupRecovery:
             mock_job.id = "job-123"
             mock_js.list_jobs.return_value = [mock_job]
 
-            # No in_flight rows
-            completed_row = MagicMock()
-            completed_row.status = "completed"
-            mock_js.get_rows.return_value = [completed_row]
+            # The in_flight query returns nothing for this job
+            mock_js.get_rows_for_jobs_in_status.return_value = {}
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -159,7 +174,9 @@ class TestStartupRecovery:
 
             in_flight_row = MagicMock()
             in_flight_row.status = "in_flight"
-            mock_js.get_rows.return_value = [in_flight_row]
+            mock_js.get_rows_for_jobs_in_status.return_value = {
+                mock_job.id: [in_flight_row],
+            }
 
             # Should not raise — recovery failures are logged, not propagated
             await run_startup_recovery(mock_db, mock_js)
@@ -195,7 +212,9 @@ class TestStartupRecovery:
 
             in_flight_row = MagicMock()
             in_flight_row.status = "in_flight"
-            mock_js.get_rows.return_value = [in_flight_row]
+            mock_js.get_rows_for_jobs_in_status.return_value = {
+                mock_job.id: [in_flight_row],
+            }
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -229,7 +248,9 @@ class TestStartupRecovery:
 
             in_flight_row = MagicMock()
             in_flight_row.status = "in_flight"
-            mock_js.get_rows.return_value = [in_flight_row]
+            mock_js.get_rows_for_jobs_in_status.return_value = {
+                mock_job.id: [in_flight_row],
+            }
 
             await run_startup_recovery(mock_db, mock_js)
 
@@ -248,6 +269,7 @@ class TestStartupRecovery:
         mock_db = MagicMock()
         mock_js = MagicMock()
         mock_js.get_rows.return_value = []
+        mock_js.get_rows_for_jobs_in_status.return_value = {}
         mock_js.delete_job.return_value = True
 
         def _list_jobs(status=None, limit=50, offset=0):
@@ -272,6 +294,7 @@ class TestStartupRecovery:
         mock_db = MagicMock()
         mock_js = MagicMock()
         mock_js.get_rows.return_value = []
+        mock_js.get_rows_for_jobs_in_status.return_value = {}
 
         def _list_jobs(status=None, limit=50, offset=0):
             if status == JobStatus.pending:
@@ -284,3 +307,127 @@ class TestStartupRecovery:
             await run_startup_recovery(mock_db, mock_js)
 
         mock_js.delete_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recovery_queries_only_inflight_rows_of_running_jobs(self) -> None:
+        """Recovery uses the filtered row query instead of loading every row."""
+        with patch("src.api.main.BatchEngine.cleanup_staging", return_value=0):
+            mock_js = MagicMock()
+            mock_js.list_jobs.return_value = []
+            mock_js.get_rows_for_jobs_in_status.return_value = {}
+
+            await run_startup_recovery(MagicMock(), mock_js)
+
+        mock_js.get_rows_for_jobs_in_status.assert_called_once_with(
+            JobStatus.running, (RowStatus.in_flight,),
+        )
+        mock_js.get_rows.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recovery_status_reports_progress(self) -> None:
+        """Aggregated recovery counters are published for /readyz."""
+        mock_engine = AsyncMock()
+        mock_engine.recover_in_flight_rows = AsyncMock(
+            return_value={"recovered": 1, "needs_review": 1, "unresolved": 0, "details": []},
+        )
+        mock_ups_client = AsyncMock()
+
+        with patch(
+            "src.api.main.BatchEngine", return_value=mock_engine,
+        ), patch(
+            "src.api.main.BatchEngine.cleanup_staging", return_value=0,
+        ), patch(
+            "src.api.main.UPSMCPClient", return_value=mock_ups_client,
+        ):
+            mock_js = MagicMock()
+            mock_js.list_jobs.return_value = []
+            mock_js.get_rows_for_jobs_in_status.return_value = {
+                "job-a": [MagicMock(), MagicMock()],
+                "job-b": [MagicMock(), MagicMock()],
+            }
+
+            await run_startup_recovery(MagicMock(), mock_js)
+
+        assert _recovery_status["status"] == "completed"
+        assert _recovery_status["jobs_total"] == 2
+        assert _recovery_status["jobs_done"] == 2
+        assert _recovery_status["rows_total"] == 4
+        assert _recovery_status["recovered"] == 2
+        assert _recovery_status["needs_review"] == 2
+        assert "finished_at" in _recovery_status
+
+    @pytest.mark.asyncio
+    async def test_leased_jobs_are_deferred_then_skipped(self) -> None:
+        """A job leased by a live worker is retried once, then left alone."""
+        mock_engine = AsyncMock()
+        mock_engine.recover_in_flight_rows = AsyncMock(
+            return_value={"recovered": 1, "needs_review": 0, "unresolved": 0, "details": []},
+        )
+        mock_ups_client = AsyncMock()
+
+        def _acquire(db, job_id, owner=None, ttl_s=None):
+            return job_id == "job-free"
+
+        mock_js = MagicMock()
+        mock_js.list_jobs.return_value = [MagicMock(id="job-free"), MagicMock(id="job-held")]
+        mock_js.get_rows_for_jobs_in_status.return_value = {
+            "job-free": [MagicMock(status="in_flight")],
+            "job-held": [MagicMock(status="in_flight")],
+        }
+
+        with patch(
+            "src.api.main.BatchEngine", return_value=mock_engine,
+        ), patch(
+            "src.api.main.BatchEngine.cleanup_staging", return_value=0,
+        ), patch(
+            "src.api.main.UPSMCPClient", return_value=mock_ups_client,
+        ), patch(
+            "src.api.main.acquire_lease", side_effect=_acquire,
+        ) as mock_acquire, patch(
+            "src.api.main.lease_expiries", return_value={"job-held": None},
+        ):
+            await run_startup_recovery(MagicMock(), mock_js)
+
+        recovered = [c.args[0] for c in mock_engine.recover_in_flight_rows.call_args_list]
+        assert recovered == ["job-free"]
+        assert [c.args[1] for c in mock_acquire.call_args_list] == [
+            "job-free", "job-held", "job-held",
+        ]
+        assert _recovery_status["jobs_done"] == _recovery_status["jobs_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_lease_is_reclaimed_at_its_expiry(self) -> None:
+        """A crashed worker's lease is waited out only until it expires."""
+        mock_engine = AsyncMock()
+        mock_engine.recover_in_flight_rows = AsyncMock(
+            return_value={"recovered": 1, "needs_review": 0, "unresolved": 0, "details": []},
+        )
+        claims = [False, True]
+
+        mock_js = MagicMock()
+        mock_js.get_rows_for_jobs_in_status.return_value = {
+            "job-stale": [MagicMock(status="in_flight")],
+        }
+        expires = datetime.now(UTC) + timedelta(seconds=2)
+
+        with patch(
+            "src.api.main.BatchEngine", return_value=mock_engine,
+        ), patch(
+            "src.api.main.BatchEngine.cleanup_staging", return_value=0,
+        ), patch(
+            "src.api.main.UPSMCPClient", return_value=AsyncMock(),
+        ), patch(
+            "src.api.main.acquire_lease", side_effect=lambda *a, **k: claims.pop(0),
+        ), patch(
+            "src.api.main.lease_expiries", return_value={"job-stale": expires},
+        ), patch(
+            "src.api.main.resolve_lease_ttl", return_value=60.0,
+        ), patch(
+            "src.api.main.asyncio.sleep", new_callable=AsyncMock,
+        ) as mock_sleep:
+            await run_startup_recovery(MagicMock(), mock_js)
+
+        (waited,) = [c.args[0] for c in mock_sleep.call_args_list]
+        assert 1.0 < waited <= 2.5
+        mock_engine.recover_in_flight_rows.assert_awaited_once()
+        assert _recovery_status["recovered"] == 1
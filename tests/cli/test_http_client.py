@@ -229,6 +229,48 @@ class TestJobAudit:
         assert events[0]["id"] == "evt-1"
 
 
+class TestStreamingExports:
+    """Tests for the NDJSON export iterators."""
+
+    @staticmethod
+    def _client(path: str, lines: list[dict]) -> tuple[HttpClient, list[httpx.Request]]:
+        seen: list[httpx.Request] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.url.path != path:
+                return httpx.Response(404, json={"detail": "Job not found"})
+            body = "".join(json.dumps(line) + "\n" for line in lines)
+            return httpx.Response(200, content=body.encode())
+
+        client = HttpClient(base_url="http://127.0.0.1:8000")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(_handler), base_url="http://127.0.0.1:8000",
+        )
+        return client, seen
+
+    @pytest.mark.asyncio
+    async def test_iter_job_audit_events_reads_jsonl(self):
+        """Decision events come from the job-filtered export."""
+        client, seen = self._client(
+            "/api/v1/agent-audit/export", [{"id": "e1"}, {"id": "e2"}],
+        )
+
+        events = [event async for event in client.iter_job_audit_events("job-1")]
+
+        assert [e["id"] for e in events] == ["e1", "e2"]
+        assert seen[0].url.params["job_id"] == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_iter_job_logs_raises_on_error(self):
+        """HTTP errors surface as ShipAgentClientError with the detail."""
+        client, _ = self._client("/elsewhere", [])
+
+        with pytest.raises(ShipAgentClientError, match="Job not found"):
+            async for _ in client.iter_job_logs("missing"):
+                pass
+
+
 class CapturingFakeTransport(httpx.AsyncBaseTransport):
     """Mock transport that captures requests and returns canned responses."""
 
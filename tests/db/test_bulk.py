@@ -0,0 +1,323 @@
+"""Tests for dialect-aware bulk writes.
+
+SQLite exercises the portable paths end to end. The Postgres paths are
+checked against the statements they compile to and against stand-in
+psycopg 3 / psycopg2 cursors, since no Postgres server is available in
+the test environment.
+"""
+
+import csv
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from src.db.bulk import copy_rows, update_rows, upsert_rows
+from src.db.connection import engine_pool_options
+from src.db.models import AddressValidation, AuditLog, Base, EventType, JobRow, LogLevel
+from src.services.audit_service import AuditService
+from src.services.job_service import JobService
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def job_id(db_session):
+    job = JobService(db_session).create_job(name="bulk", original_command="ship")
+    return job.id
+
+
+def _postgres_session(cursor):
+    """Session stand-in bound to the postgres dialect with a fake DBAPI cursor."""
+    dialect = postgresql.dialect()
+    session = MagicMock()
+    session.get_bind.return_value = SimpleNamespace(dialect=dialect)
+    session.connection.return_value.connection.dbapi_connection.cursor.return_value = cursor
+    return session
+
+
+class _Psycopg3Copy:
+    def __init__(self, sink):
+        self._sink = sink
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self._sink.append(row)
+
+
+class _Psycopg3Cursor:
+    def __init__(self):
+        self.statement = None
+        self.rows = []
+        self.closed = False
+
+    def copy(self, statement):
+        self.statement = statement
+        return _Psycopg3Copy(self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+class _Psycopg2Cursor:
+    def __init__(self):
+        self.statement = None
+        self.data = None
+
+    def copy_expert(self, statement, buffer):
+        self.statement = statement
+        self.data = buffer.read()
+
+    def close(self):
+        pass
+
+
+class TestCopyRows:
+    """COPY on Postgres, executemany INSERT elsewhere."""
+
+    def test_sqlite_inserts_and_fills_python_defaults(self, db_session, job_id):
+        count = copy_rows(
+            db_session,
+            JobRow.__table__,
+            [{"job_id": job_id, "row_number": i, "row_checksum": f"c{i}"} for i in (1, 2)],
+        )
+        db_session.commit()
+
+        rows = db_session.query(JobRow).order_by(JobRow.row_number).all()
+        assert count == 2
+        assert [r.status for r in rows] == ["pending", "pending"]
+        assert all(r.id and r.created_at for r in rows)
+        assert rows[0].recovery_attempt_count == 0
+
+    def test_psycopg3_uses_copy_write_row(self):
+        cursor = _Psycopg3Cursor()
+        session = _postgres_session(cursor)
+
+        copy_rows(
+            session,
+            JobRow.__table__,
+            [{"job_id": "j1", "row_number": 1, "row_checksum": "c1", "order_data": None}],
+        )
+
+        assert cursor.statement.startswith("COPY job_rows (id, job_id, row_number")
+        assert cursor.statement.endswith("FROM STDIN")
+        assert cursor.closed
+        (row,) = cursor.rows
+        assert "j1" in row and 1 in row and None in row
+        session.execute.assert_not_called()
+
+    def test_psycopg2_streams_csv_with_nulls(self):
+        cursor = _Psycopg2Cursor()
+        session = _postgres_session(cursor)
+
+        copy_rows(
+            session,
+            AuditLog.__table__,
+            [{
+                "job_id": "j1", "timestamp": "t", "level": "INFO", "event_type": "api_call",
+                "message": 'says "hi", twice', "details": None, "row_number": None,
+            }],
+        )
+
+        assert cursor.statement.endswith("FROM STDIN WITH (FORMAT csv)")
+        (fields,) = list(csv.reader(io.StringIO(cursor.data)))
+        assert 'says "hi", twice' in fields
+        # NULLs are bare empty fields; strings (even empty ones) are quoted.
+        assert cursor.data.endswith(",,\n")
+
+    def test_driver_without_copy_falls_back_to_insert(self):
+        cursor = MagicMock(spec=["close"])
+        session = _postgres_session(cursor)
+
+        copy_rows(session, JobRow.__table__, [{"job_id": "j1", "row_number": 1, "row_checksum": "c"}])
+
+        session.execute.assert_called_once()
+
+
+class TestUpdateRows:
+    """UPDATE ... FROM (VALUES ...) on Postgres, keyed executemany elsewhere."""
+
+    def test_sqlite_applies_each_rows_values(self, db_session, job_id):
+        rows = JobService(db_session).create_rows(
+            job_id, [{"row_number": i, "row_checksum": f"c{i}"} for i in (1, 2, 3)],
+        )
+
+        count = update_rows(
+            db_session,
+            JobRow.__table__,
+            "id",
+            [
+                {"id": rows[0].id, "status": "failed"},
+                {"id": rows[2].id, "status": "skipped"},
+            ],
+        )
+        db_session.commit()
+
+        statuses = [r.status for r in JobService(db_session).get_rows(job_id)]
+        assert count == 2
+        assert statuses == ["failed", "pending", "skipped"]
+
+    def test_postgres_compiles_to_update_from_values(self):
+        session = MagicMock()
+        session.get_bind.return_value = SimpleNamespace(dialect=postgresql.dialect())
+
+        update_rows(
+            session,
+            JobRow.__table__,
+            "id",
+            [{"id": "a", "status": "failed"}, {"id": "b", "status": "completed"}],
+        )
+
+        (stmt,), _ = session.execute.call_args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE job_rows SET status=v.status FROM (VALUES")
+        assert "AS v (id, status)" in sql
+        assert "WHERE job_rows.id = v.id" in sql
+
+    def test_mixed_column_sets_are_rejected(self, db_session):
+        with pytest.raises(ValueError, match="one column set"):
+            update_rows(
+                db_session,
+                JobRow.__table__,
+                "id",
+                [{"id": "a", "status": "failed"}, {"id": "b", "error_code": "E"}],
+            )
+
+
+
+class TestUpsertRows:
+    """Insert-or-replace keyed on a unique column."""
+
+    def _row(self, key: str, status: str) -> dict:
+        return {
+            "address_key": key,
+            "country_code": "US",
+            "status": status,
+            "candidates_json": "[]",
+            "residential": None,
+            "validated_at": "2026-01-01T00:00:00+00:00",
+        }
+
+    def test_sqlite_inserts_new_and_replaces_existing(self, db_session):
+        upsert_rows(db_session, AddressValidation.__table__, "address_key", [
+            self._row("a", "ambiguous"),
+        ])
+        written = upsert_rows(db_session, AddressValidation.__table__, "address_key", [
+            self._row("a", "valid"), self._row("b", "invalid"),
+        ])
+        db_session.commit()
+
+        statuses = {e.address_key: e.status for e in db_session.query(AddressValidation)}
+        assert written == 2
+        assert statuses == {"a": "valid", "b": "invalid"}
+
+    def test_postgres_compiles_to_on_conflict_do_update(self):
+        session = MagicMock()
+        session.get_bind.return_value = SimpleNamespace(dialect=postgresql.dialect())
+
+        upsert_rows(session, AddressValidation.__table__, "address_key", [self._row("a", "valid")])
+
+        (stmt, _), _ = session.execute.call_args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (address_key) DO UPDATE SET" in sql
+        assert "status = excluded.status" in sql
+
+
+class TestServiceBulkPaths:
+    """JobService and AuditService entry points built on the bulk layer."""
+
+    def test_create_rows_returns_rows_in_input_order(self, db_session, job_id):
+        rows = JobService(db_session).create_rows(
+            job_id, [{"row_number": n, "row_checksum": f"c{n}"} for n in (3, 1, 2)],
+        )
+
+        assert [r.row_number for r in rows] == [3, 1, 2]
+        assert rows[0].job.total_rows == 3
+
+    def test_transition_rows_groups_by_changed_columns(self, db_session, job_id):
+        service = JobService(db_session)
+        service.create_rows(job_id, [{"row_number": n, "row_checksum": f"c{n}"} for n in (1, 2, 3)])
+
+        updated = service.transition_rows(
+            job_id,
+            [
+                {"row_number": 1, "status": "failed", "error_code": "E-3001"},
+                {"row_number": 2, "status": "completed", "tracking_number": "1Z1"},
+                {"row_number": 9, "status": "failed"},
+            ],
+        )
+
+        rows = service.get_rows(job_id)
+        assert updated == 2
+        assert (rows[0].status, rows[0].error_code) == ("failed", "E-3001")
+        assert (rows[1].status, rows[1].tracking_number) == ("completed", "1Z1")
+        assert rows[2].status == "pending"
+
+    def test_reset_job_for_restart_resets_rows_in_one_statement(self, db_session, job_id):
+        service = JobService(db_session)
+        service.create_rows(job_id, [{"row_number": 1, "row_checksum": "c1"}])
+        service.transition_rows(
+            job_id, [{"row_number": 1, "status": "failed", "error_message": "boom"}],
+        )
+        statements = []
+
+        @event.listens_for(db_session.get_bind(), "before_cursor_execute")
+        def _count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        service.reset_job_for_restart(job_id)
+
+        (row,) = service.get_rows(job_id)
+        assert (row.status, row.error_message) == ("pending", None)
+        assert sum(s.startswith("UPDATE job_rows") for s in statements) == 1
+
+    def test_audit_log_many_redacts_and_inserts(self, db_session, job_id):
+        written = AuditService(db_session).log_many([
+            {
+                "job_id": job_id,
+                "level": LogLevel.INFO,
+                "event_type": EventType.api_call,
+                "message": "rate",
+                "details": {"email": "a@example.com", "amount": 5},
+            },
+            {"job_id": job_id, "level": "ERROR", "event_type": "error", "message": "x"},
+        ])
+
+        logs = AuditService(db_session).get_logs(job_id)
+        assert written == 2
+        assert {log.message for log in logs} == {"rate", "x"}
+        assert all("a@example.com" not in (log.details or "") for log in logs)
+
+
+class TestPoolOptions:
+    """Pool settings are only applied to server databases."""
+
+    def test_sqlite_keeps_defaults(self):
+        assert engine_pool_options("sqlite:///./x.db") == {}
+
+    def test_postgres_pool_follows_env(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "4")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "bad")
+
+        options = engine_pool_options("postgresql+psycopg://u@h/db")
+
+        assert options["pool_size"] == 4
+        assert options["max_overflow"] == 20
+        assert options["pool_pre_ping"] is True
+
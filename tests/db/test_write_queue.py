@@ -0,0 +1,221 @@
+"""Tests for the SQLite performance profile and single-writer queue."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from src.db import connection, write_queue
+from src.db.connection import _apply_sqlite_profile, sqlite_profile_pragmas
+from src.db.write_queue import WriteQueue, run_write, run_write_async
+
+_Base = declarative_base()
+
+
+class _Item(_Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"check_same_thread": False},
+    )
+    _Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(file_engine):
+    queue = WriteQueue(sessionmaker(bind=file_engine, autoflush=False, expire_on_commit=False))
+    yield queue
+    queue.close()
+
+
+def _insert(name):
+    def _write(db):
+        item = _Item(name=name)
+        db.add(item)
+        db.flush()
+        return item.id
+    return _write
+
+
+def _blocking_write(started, release):
+    def _write(db):
+        started.set()
+        release.wait(5)
+    return _write
+
+
+def _names(engine):
+    with engine.connect() as conn:
+        return sorted(row[0] for row in conn.execute(text("SELECT name FROM items")))
+
+
+class TestSqliteProfile:
+    """Pragmas applied under SQLITE_PROFILE=performance."""
+
+    def test_profile_requires_opt_in(self, monkeypatch):
+        monkeypatch.delenv("SQLITE_PROFILE", raising=False)
+        assert connection.sqlite_performance_profile_enabled() is False
+        monkeypatch.setenv("SQLITE_PROFILE", "performance")
+        assert connection.sqlite_performance_profile_enabled() is True
+
+    def test_unknown_profile_falls_back(self, monkeypatch):
+        monkeypatch.setenv("SQLITE_PROFILE", "turbo")
+        assert connection.sqlite_performance_profile_enabled() is False
+
+    def test_pragmas_follow_env(self, monkeypatch):
+        monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "250")
+        monkeypatch.setenv("SQLITE_MMAP_SIZE_MB", "1")
+        monkeypatch.setenv("SQLITE_CACHE_SIZE_MB", "not-a-number")
+
+        pragmas = sqlite_profile_pragmas()
+
+        assert "PRAGMA journal_mode=WAL" in pragmas
+        assert "PRAGMA synchronous=NORMAL" in pragmas
+        assert "PRAGMA busy_timeout=250" in pragmas
+        assert "PRAGMA mmap_size=1048576" in pragmas
+        assert "PRAGMA cache_size=-65536" in pragmas
+
+    def test_profile_switches_file_database_to_wal(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "wal.db")
+        try:
+            _apply_sqlite_profile(conn)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # NORMAL == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+
+class TestWriteQueue:
+    """Group commit on the writer thread."""
+
+    def test_queued_writes_commit_and_return_results(self, writer, file_engine):
+        futures = [writer.submit(_insert(f"item-{i}")) for i in range(20)]
+
+        ids = [future.result(timeout=5) for future in futures]
+
+        assert len(set(ids)) == 20
+        assert len(_names(file_engine)) == 20
+        assert writer.writes_committed == 20
+        assert writer.groups_committed <= 20
+
+    def test_writes_queued_during_a_commit_share_one_group(self, writer, file_engine):
+        started, release = threading.Event(), threading.Event()
+        blocker = writer.submit(_blocking_write(started, release))
+        assert started.wait(5)
+        futures = [writer.submit(_insert(f"item-{i}")) for i in range(5)]
+        release.set()
+
+        blocker.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+
+        # The blocker's group, then one group for everything queued behind it.
+        assert writer.groups_committed == 2
+        assert len(_names(file_engine)) == 5
+
+    def test_failing_write_does_not_discard_its_group(self, writer, file_engine):
+        started, release = threading.Event(), threading.Event()
+        blocker = writer.submit(_blocking_write(started, release))
+        assert started.wait(5)
+        first = writer.submit(_insert("a"))
+        duplicate = writer.submit(_insert("a"))
+        last = writer.submit(_insert("b"))
+        release.set()
+
+        blocker.result(timeout=5)
+        first.result(timeout=5)
+        last.result(timeout=5)
+        with pytest.raises(Exception, match="UNIQUE"):
+            duplicate.result(timeout=5)
+        assert _names(file_engine) == ["a", "b"]
+
+    def test_nested_run_executes_inline(self, writer, file_engine):
+        def _outer(db):
+            return writer.run(_insert("inner"))
+
+        assert writer.run(_outer) is not None
+        assert _names(file_engine) == ["inner"]
+
+    async def test_run_async_awaits_commit(self, writer, file_engine):
+        results = await asyncio.gather(*(writer.run_async(_insert(f"n{i}")) for i in range(3)))
+
+        assert len(results) == 3
+        assert _names(file_engine) == ["n0", "n1", "n2"]
+
+    def test_closed_queue_rejects_writes(self, writer):
+        writer.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(_insert("late"))
+
+
+class TestRunWrite:
+    """Routing between the queue and the caller's session."""
+
+    def test_profile_off_runs_inline_on_callers_session(self, monkeypatch, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: None)
+        db = sessionmaker(bind=file_engine)()
+        try:
+            run_write(_insert("inline"), db)
+            assert not db.in_transaction()
+        finally:
+            db.close()
+        assert _names(file_engine) == ["inline"]
+
+    def test_open_transaction_stays_on_callers_session(self, monkeypatch, writer, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: writer)
+        db = sessionmaker(bind=file_engine)()
+        try:
+            db.add(_Item(name="pending"))
+            run_write(_insert("audit"), db)
+        finally:
+            db.close()
+        # The caller's pending change was committed together with the write.
+        assert _names(file_engine) == ["audit", "pending"]
+        assert writer.writes_committed == 0
+
+    def test_fresh_session_goes_through_queue(self, monkeypatch, writer, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: writer)
+
+        run_write(_insert("queued"), sessionmaker(bind=file_engine)())
+
+        assert _names(file_engine) == ["queued"]
+        assert writer.writes_committed == 1
+
+    async def test_event_loop_caller_runs_inline(self, monkeypatch, writer, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: writer)
+
+        run_write(_insert("on-loop"), sessionmaker(bind=file_engine)())
+
+        # Waiting on the writer thread here would stall the loop.
+        assert _names(file_engine) == ["on-loop"]
+        assert writer.writes_committed == 0
+
+    async def test_run_write_async_awaits_queue(self, monkeypatch, writer, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: writer)
+
+        await run_write_async(_insert("awaited"))
+
+        assert _names(file_engine) == ["awaited"]
+        assert writer.writes_committed == 1
+
+    async def test_run_write_async_inline_when_profile_off(self, monkeypatch, file_engine):
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: None)
+        db = sessionmaker(bind=file_engine)()
+        try:
+            await run_write_async(_insert("inline"), db)
+            assert not db.in_transaction()
+        finally:
+            db.close()
+        assert _names(file_engine) == ["inline"]
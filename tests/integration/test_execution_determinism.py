@@ -108,6 +108,18 @@ SHIPPER = {
 }
 
 
+def _stage(
+    engine: BatchEngine, tracking_number: str, label_b64: str, job_id: str, row_number: int,
+) -> str:
+    """Stage a base64 label through the engine's storage backend."""
+    return engine._label_storage.save_staged(
+        tracking_number=tracking_number,
+        pdf_bytes=base64.b64decode(label_b64),
+        job_id=job_id,
+        row_number=row_number,
+    )
+
+
 @pytest.fixture()
 def engine(tmp_path: Path) -> BatchEngine:
     """Create a BatchEngine with mocked UPS client."""
@@ -360,13 +372,13 @@ class TestLabelAtomicity:
         label at final path, staging file gone."""
         label_b64 = base64.b64encode(b"%PDF-1.4 atomic test").decode()
 
-        staging_path = engine._save_label_staged(
-            "1Z999", label_b64, job_id="job-label", row_number=1,
+        staging_path = _stage(
+            engine, "1Z999", label_b64, job_id="job-label", row_number=1,
         )
         assert "/staging/" in staging_path
         assert os.path.exists(staging_path)
 
-        final_path = engine._promote_label(staging_path)
+        final_path = engine._label_storage.promote(staging_path)
         assert os.path.exists(final_path)
         assert not os.path.exists(staging_path)
         assert "/staging/" not in final_path
@@ -378,10 +390,10 @@ class TestLabelAtomicity:
         path, row is still in_flight. Recovery handles the row."""
         label_b64 = base64.b64encode(b"%PDF-1.4 crash test").decode()
 
-        staging_path = engine._save_label_staged(
-            "1Z999", label_b64, job_id="job-crash", row_number=1,
+        staging_path = _stage(
+            engine, "1Z999", label_b64, job_id="job-crash", row_number=1,
         )
-        final_path = engine._promote_label(staging_path)
+        final_path = engine._label_storage.promote(staging_path)
 
         # Simulate crash: label at final path, but DB never committed
         assert os.path.exists(final_path)
@@ -397,11 +409,11 @@ class TestLabelAtomicity:
         label_b64 = base64.b64encode(b"%PDF-1.4 orphan test").decode()
 
         # Create staging files for two jobs
-        engine._save_label_staged(
-            "1Z001", label_b64, job_id="resolved-job", row_number=1,
+        _stage(
+            engine, "1Z001", label_b64, job_id="resolved-job", row_number=1,
         )
-        engine._save_label_staged(
-            "1Z002", label_b64, job_id="unresolved-job", row_number=1,
+        _stage(
+            engine, "1Z002", label_b64, job_id="unresolved-job", row_number=1,
         )
 
         resolved_dir = Path(engine._labels_dir) / "staging" / "resolved-job"
@@ -412,19 +424,7 @@ class TestLabelAtomicity:
         # Mock job_service: resolved-job has no unresolved rows,
         # unresolved-job has an in_flight row
         mock_js = MagicMock()
-
-        def get_rows(job_id):
-            if job_id == "resolved-job":
-                row = MagicMock()
-                row.status = "completed"
-                return [row]
-            elif job_id == "unresolved-job":
-                row = MagicMock()
-                row.status = "in_flight"
-                return [row]
-            return []
-
-        mock_js.get_rows = get_rows
+        mock_js.get_job_ids_with_row_status.return_value = {"unresolved-job"}
 
         count = BatchEngine.cleanup_staging(
             mock_js, labels_dir=str(tmp_path / "labels"),
@@ -1,11 +1,15 @@
-"""Tests for FixedWidthAdapter (pure Python string slicing)."""
+"""Tests for FixedWidthAdapter (DuckDB substr projection) and auto-detection."""
+
+from unittest.mock import patch
 
 import duckdb
 import pytest
 
+from src.mcp.data_source.adapters import fixed_width_adapter
 from src.mcp.data_source.adapters.fixed_width_adapter import (
     FixedWidthAdapter,
     auto_detect_col_specs,
+    detect_fixed_width_layout,
 )
 
 
@@ -115,6 +119,71 @@ class TestFixedWidthAdapter:
         assert "error" in meta
 
 
+class TestSqlProjection:
+    """Columns are sliced and typed by DuckDB in one pass."""
+
+    SPECS = [(0, 8), (8, 14), (14, 20), (20, 27)]
+    NAMES = ["order", "qty", "weight", "zip"]
+
+    def test_types_values_and_order(self, conn, fwf_file):
+        content = (
+            'A-1, "x"    3   2.5  01234\n'
+            "ünïcode    12  10   90210\n"
+            "\n"
+            "A-3        -4  0.25 ABC12\n"
+        )
+        path = fwf_file(content)
+
+        result = FixedWidthAdapter().import_data(
+            conn, file_path=path, col_specs=self.SPECS, names=self.NAMES,
+        )
+
+        types = {c.name: c.type for c in result.columns}
+        assert types == {
+            "order": "VARCHAR", "qty": "BIGINT", "weight": "DOUBLE", "zip": "VARCHAR",
+        }
+        rows = conn.execute("SELECT * FROM imported_data ORDER BY 1").fetchall()
+        assert rows == [
+            (1, 'A-1, "x"', 3, 2.5, "01234"),
+            (2, "ünïcode", 12, 10.0, "90210"),
+            (3, "A-3", -4, 0.25, "ABC12"),
+        ]
+
+    def test_late_text_value_keeps_column_varchar(self, conn, fwf_file):
+        lines = [f"R{i:<7}{i:<6}" for i in range(300)] + ["R300    N/A   "]
+        path = fwf_file("\n".join(lines) + "\n")
+
+        result = FixedWidthAdapter().import_data(
+            conn, file_path=path, col_specs=[(0, 8), (8, 14)], names=["id", "qty"],
+        )
+
+        assert result.row_count == 301
+        assert {c.name: c.type for c in result.columns}["qty"] == "VARCHAR"
+
+    def test_blank_file_has_no_records(self, conn, fwf_file):
+        path = fwf_file("\n   \n")
+
+        result = FixedWidthAdapter().import_data(conn, file_path=path, col_specs=[(0, 4)])
+
+        assert result.row_count == 0
+        assert result.warnings == ["No records to import"]
+        assert conn.execute("SELECT COUNT(*) FROM imported_data").fetchone()[0] == 0
+
+    def test_detection_reads_sampled_prefix(self, fwf_file, monkeypatch):
+        monkeypatch.setenv("DATA_SOURCE_FWF_SAMPLE_LINES", "3")
+        path = fwf_file("NAME      CITY\n" + "John      Dallas\n" * 50)
+
+        with patch.object(
+            fixed_width_adapter, "auto_detect_col_specs", wraps=auto_detect_col_specs,
+        ) as detect:
+            detected, preview, line_count = detect_fixed_width_layout(path)
+
+        assert len(detect.call_args.args[0]) == 3
+        assert detected[1] == ["NAME", "CITY"]
+        assert line_count == 51
+        assert preview[0] == "NAME      CITY"
+
+
 class TestAutoDetectColSpecs:
     """Tests for the auto_detect_col_specs utility function."""
 
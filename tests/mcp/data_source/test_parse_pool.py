@@ -0,0 +1,168 @@
+"""Tests for the Data Source MCP parse pool."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import duckdb
+import pytest
+from openpyxl import Workbook
+
+import src.mcp.data_source.tools.import_tools as _import_mod
+from src.mcp.data_source import parse_pool
+from src.mcp.data_source.adapters.edi_adapter import discard_staged_edi
+from src.mcp.data_source.adapters.excel_adapter import ParsedSheet, read_sheet
+from src.mcp.data_source.tools.import_tools import import_excel
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool(monkeypatch):
+    """Each test gets its own pool and a short progress interval."""
+    monkeypatch.setenv("DATA_SOURCE_PARSE_WORKERS", "1")
+    monkeypatch.setenv("DATA_SOURCE_PARSE_PROGRESS_S", "0.1")
+    parse_pool.shutdown_parse_pool()
+    yield
+    parse_pool.shutdown_parse_pool()
+
+
+@pytest.fixture()
+def ctx():
+    """Mock FastMCP Context."""
+    mock = AsyncMock()
+    conn = duckdb.connect(":memory:")
+    mock.request_context.lifespan_context = {"db": conn, "current_source": None}
+    mock.info = AsyncMock()
+    yield mock
+    conn.close()
+
+
+@pytest.fixture()
+def xlsx_path(tmp_path, monkeypatch):
+    patched = list(_import_mod._ALLOWED_ROOTS) + [tmp_path.resolve()]
+    monkeypatch.setattr(_import_mod, "_ALLOWED_ROOTS", patched)
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["order_id", "city", "weight"])
+    ws.append(["A-1", "Dallas", 2.5])
+    ws.append([None, None, None])
+    ws.append(["A-2", "Austin", 3])
+    path = tmp_path / "orders.xlsx"
+    wb.save(path)
+    return str(path)
+
+
+class TestRunParse:
+    """run_parse() dispatch, progress and cancellation."""
+
+    async def test_inline_when_disabled(self, ctx, monkeypatch):
+        monkeypatch.setenv("DATA_SOURCE_PARSE_WORKERS", "0")
+
+        assert parse_pool.get_parse_pool() is None
+        assert await parse_pool.run_parse(ctx, "x", sorted, [3, 1, 2]) == [1, 2, 3]
+
+    async def test_runs_in_worker_process(self, ctx, xlsx_path):
+        parsed = await parse_pool.run_parse(ctx, "read", read_sheet, xlsx_path)
+
+        assert isinstance(parsed, ParsedSheet)
+        assert parsed.headers == ["order_id", "city", "weight"]
+        assert parsed.rows == [(1, "A-1", "Dallas", 2.5), (2, "A-2", "Austin", 3)]
+        assert parsed.skipped == 1
+
+    async def test_worker_errors_propagate(self, ctx, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await parse_pool.run_parse(
+                ctx, "read", read_sheet, str(tmp_path / "missing.xlsx"),
+            )
+
+    async def test_reports_progress_while_parsing(self, ctx):
+        await parse_pool.run_parse(ctx, "Reading big.xlsx", time.sleep, 0.5)
+
+        messages = [c.args[0] for c in ctx.info.await_args_list]
+        assert messages
+        assert all(m.startswith("Reading big.xlsx: still parsing") for m in messages)
+
+    async def test_cancel_drops_queued_parse(self, ctx):
+        busy = asyncio.create_task(parse_pool.run_parse(ctx, "a", time.sleep, 0.5))
+        queued = asyncio.create_task(parse_pool.run_parse(ctx, "b", time.sleep, 5))
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await busy
+
+        assert time.monotonic() - started < 2
+        # The pool stays usable after a cancellation.
+        assert await parse_pool.run_parse(ctx, "c", sorted, [2, 1]) == [1, 2]
+
+    async def test_cancel_hands_running_result_to_on_discard(self, ctx):
+        discarded = []
+        running = asyncio.create_task(parse_pool.run_parse(
+            ctx, "a", sorted, [2, 1], on_discard=discarded.append,
+        ))
+        slow = asyncio.create_task(parse_pool.run_parse(
+            ctx, "b", time.sleep, 0.5, on_discard=discarded.append,
+        ))
+        await asyncio.sleep(0)
+        await running
+        await asyncio.sleep(0.1)
+
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        for _ in range(50):
+            if discarded:
+                break
+            await asyncio.sleep(0.05)
+
+        # Only the cancelled parse's result is discarded, once it finishes.
+        assert discarded == [None]
+
+    def test_discard_staged_edi_removes_file(self, tmp_path):
+        staged = tmp_path / "edi-x.ndjson"
+        staged.write_text("{}\n")
+
+        discard_staged_edi((str(staged), 1))
+
+        assert not staged.exists()
+
+    def test_invalid_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv("DATA_SOURCE_PARSE_WORKERS", "lots")
+        monkeypatch.setenv("DATA_SOURCE_PARSE_PROGRESS_S", "-1")
+
+        assert parse_pool._resolve_parse_workers() == parse_pool.DEFAULT_PARSE_WORKERS
+        assert (
+            parse_pool._resolve_progress_interval()
+            == parse_pool.DEFAULT_PROGRESS_INTERVAL_S
+        )
+
+
+class TestImportToolsUsePool:
+    """Import tools parse off the loop and load on it."""
+
+    async def test_import_excel_through_pool(self, ctx, xlsx_path):
+        result = await import_excel(xlsx_path, ctx)
+
+        assert result["row_count"] == 2
+        assert result["warnings"] == ["Skipped 1 empty rows"]
+        db = ctx.request_context.lifespan_context["db"]
+        rows = db.execute(
+            "SELECT _source_row_num, order_id FROM imported_data ORDER BY 1"
+        ).fetchall()
+        assert rows == [(1, "A-1"), (2, "A-2")]
+
+    async def test_loop_stays_responsive_during_parse(self, ctx, monkeypatch):
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        await parse_pool.run_parse(ctx, "slow", time.sleep, 0.4)
+        ticker.cancel()
+
+        assert ticks >= 5
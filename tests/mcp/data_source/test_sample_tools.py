@@ -1,9 +1,14 @@
 """Tests for the get_column_samples MCP tool."""
 
+from unittest.mock import AsyncMock
+
 import duckdb
 import pytest
 
-from src.mcp.data_source.tools.sample_tools import get_column_samples_impl
+from src.mcp.data_source.tools.sample_tools import (
+    get_column_samples,
+    get_column_samples_impl,
+)
 
 
 @pytest.fixture
@@ -91,3 +96,34 @@ class TestColumnSamples:
         assert result["state"] == []
         assert result["weight"] == []
         conn.close()
+
+
+class TestColumnSampleSnapshot:
+    """Samples are computed once per imported source."""
+
+    @pytest.fixture
+    def ctx(self, db_with_data):
+        mock = AsyncMock()
+        mock.request_context.lifespan_context = {
+            "db": db_with_data,
+            "current_source": {"type": "csv", "path": "orders.csv"},
+        }
+        return mock
+
+    async def test_repeat_requests_reuse_the_snapshot(self, ctx, db_with_data):
+        first = await get_column_samples(ctx)
+        db_with_data.execute("UPDATE imported_data SET state = 'WA'")
+
+        assert await get_column_samples(ctx) == first
+        assert "column_samples" in ctx.request_context.lifespan_context["current_source"]
+
+    async def test_new_import_invalidates_the_snapshot(self, ctx, db_with_data):
+        await get_column_samples(ctx)
+        db_with_data.execute("UPDATE imported_data SET state = 'WA'")
+        ctx.request_context.lifespan_context["current_source"] = {"type": "csv"}
+
+        assert (await get_column_samples(ctx))["state"] == ["WA"]
+
+    async def test_snapshot_is_per_sample_limit(self, ctx):
+        assert len((await get_column_samples(ctx, max_samples=2))["state"]) == 2
+        assert len((await get_column_samples(ctx, max_samples=5))["state"]) == 4
@@ -0,0 +1,62 @@
+"""Tests for trace context propagation into data-source MCP tool calls."""
+
+from fastmcp import Client, FastMCP
+
+from src.mcp.data_source.trace_middleware import TraceContextMiddleware
+from src.utils.tracing import SPAN_KIND_SERVER, configure_tracing, current_traceparent
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.spans = []
+
+    def export(self, finished) -> None:
+        self.spans.append(finished)
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _server() -> FastMCP:
+    server = FastMCP("TraceTest")
+    server.add_middleware(TraceContextMiddleware())
+
+    @server.tool()
+    def echo_traceparent() -> str:
+        return current_traceparent() or ""
+
+    return server
+
+
+class TestTraceContextMiddleware:
+    """Server spans continue the traceparent sent in request _meta."""
+
+    async def test_tool_call_joins_caller_trace(self):
+        recorder = _Recorder()
+        configure_tracing(recorder)
+        traceparent = "00-" + "1" * 32 + "-" + "2" * 16 + "-01"
+        try:
+            async with Client(_server()) as client:
+                result = await client.call_tool(
+                    "echo_traceparent", {}, meta={"traceparent": traceparent},
+                )
+        finally:
+            configure_tracing()
+
+        (server_span,) = [s for s in recorder.spans if s.name == "data_source.tool.echo_traceparent"]
+        assert server_span.kind == SPAN_KIND_SERVER
+        assert server_span.trace_id == "1" * 32
+        assert server_span.parent_span_id == "2" * 16
+        assert result.data == server_span.traceparent
+
+    async def test_tool_call_without_meta_starts_new_trace(self):
+        recorder = _Recorder()
+        configure_tracing(recorder)
+        try:
+            async with Client(_server()) as client:
+                await client.call_tool("echo_traceparent", {})
+        finally:
+            configure_tracing()
+
+        (server_span,) = recorder.spans
+        assert server_span.parent_span_id is None
@@ -72,6 +72,43 @@ class TestCommodityImport:
         ).fetchone()[0]
         assert len(desc) == 35
 
+    def test_import_indexes_order_id_and_round_trips(self):
+        """Import builds the order_id index; lookups keep import order."""
+        from src.mcp.data_source.tools.commodity_tools import (
+            get_commodities_bulk_sync,
+            import_commodities_sync,
+        )
+
+        commodities = [
+            {"order_id": i % 50, "description": f"Item {i}", "commodity_code": "1",
+             "origin_country": "us", "quantity": i, "unit_value": "1.00"}
+            for i in range(500)
+        ]
+        import_commodities_sync(self.db, commodities)
+        import_commodities_sync(self.db, commodities)  # re-import replaces index too
+
+        indexes = self.db.execute(
+            "SELECT index_name FROM duckdb_indexes() "
+            "WHERE table_name = 'imported_commodities'"
+        ).fetchall()
+        assert indexes == [("idx_imported_commodities_order_id",)]
+
+        result = get_commodities_bulk_sync(self.db, [7, "49", 999])
+        assert set(result) == {"7", "49"}
+        assert [c["quantity"] for c in result["7"]] == list(range(7, 500, 50))
+        assert result["7"][0]["origin_country"] == "US"
+        assert result["7"][0]["unit_of_measure"] == "PCS"
+
+    def test_import_empty_list_creates_empty_table(self):
+        """Importing no commodities leaves an empty, queryable table."""
+        from src.mcp.data_source.tools.commodity_tools import (
+            get_commodities_bulk_sync,
+            import_commodities_sync,
+        )
+
+        assert import_commodities_sync(self.db, [])["row_count"] == 0
+        assert get_commodities_bulk_sync(self.db, [1]) == {}
+
 
 class TestGetCommoditiesBulk:
     """Verify bulk commodity retrieval grouped by order_id."""
@@ -0,0 +1,178 @@
+"""Test streaming EDI segment tokenizers and multi-envelope parsing."""
+
+import io
+import os
+import tempfile
+import warnings
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from src.mcp.data_source.adapters.edi_adapter import EDIAdapter
+from src.mcp.data_source.edi.edifact_parser import EDIFACTParser
+from src.mcp.data_source.edi.tokenizer import (
+    iter_edifact_segments,
+    iter_transactions,
+    iter_x12_segments,
+    read_x12_delimiters,
+)
+from src.mcp.data_source.edi.x12_parser import X12Parser
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "edi"
+
+ISA = (
+    "ISA*00*          *00*          *ZZ*SENDER         *ZZ*RECEIVER       "
+    "*260126*1200*U*00401*000000001*0*P*>~"
+)
+
+
+def _x12_850(control: str, po: str, name: str) -> str:
+    return (
+        f"ST*850*{control}~BEG*00*NE*{po}**20260126~N1*ST*{name}~"
+        "N3*1 Main St~N4*Dallas*TX*75201*US~PO1*1*2*EA*5.00**VP*SKU-1~"
+        f"SE*7*{control}~"
+    )
+
+
+def _x12_856(control: str, po: str) -> str:
+    return (
+        f"ST*856*{control}~BSN*00*ASN-{po}*20260126*1200~PRF*{po}~"
+        "N1*ST*Warehouse~N3*9 Dock Rd~N4*Austin*TX*78701*US~SN1*1*4*EA~"
+        f"SE*8*{control}~"
+    )
+
+
+class TestX12Tokenizer:
+    """X12 delimiter detection and chunked segment splitting."""
+
+    def test_delimiters_from_isa(self):
+        delimiters = read_x12_delimiters(ISA)
+        assert (delimiters.element, delimiters.component, delimiters.segment) == (
+            "*", ">", "~",
+        )
+
+    def test_non_default_delimiters(self):
+        content = ISA.replace("*", "|").replace("~", "\n") + "ST|850|1\nSE|1|1\n"
+        segments = list(iter_x12_segments(io.StringIO(content)))
+
+        assert [s[0] for s in segments] == ["ISA", "ST", "SE"]
+        assert segments[1][1] == ["850", "1"]
+
+    def test_not_x12(self):
+        with pytest.raises(ValueError, match="Not X12 format"):
+            list(iter_x12_segments(io.StringIO("UNB+UNOC:3'")))
+
+    def test_chunk_size_does_not_change_segments(self):
+        content = (FIXTURES / "sample_850.edi").read_text()
+        whole = list(iter_x12_segments(io.StringIO(content)))
+
+        assert list(iter_x12_segments(io.StringIO(content), chunk_size=7)) == whole
+        assert whole[2] == ("ST", ["850", "0001"])
+
+    def test_transactions_are_grouped(self):
+        content = ISA + _x12_850("1", "PO-1", "A") + _x12_850("2", "PO-2", "B")
+        transactions = list(
+            iter_transactions(iter_x12_segments(io.StringIO(content)), "ST", "SE")
+        )
+
+        assert len(transactions) == 2
+        assert all(t[0][0] == "ST" and t[-1][0] == "SE" for t in transactions)
+
+
+class TestEdifactTokenizer:
+    """EDIFACT segments match pydifact's shape."""
+
+    def test_matches_pydifact(self):
+        from pydifact.parser import Parser
+
+        content = (FIXTURES / "sample_orders.edi").read_text()
+        content += "FTX+AAI+++a?+b?'c:d??'"
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = [(s.tag, s.elements) for s in Parser().parse(content)]
+
+        for chunk_size in (5, 1 << 20):
+            ours = [
+                (s.tag, s.elements)
+                for s in iter_edifact_segments(io.StringIO(content), chunk_size)
+            ]
+            assert ours == expected
+
+    def test_una_service_string(self):
+        content = "UNA|*.# !UNB*UNOC|3*S*R!UNH*1*ORDERS|D!BGM*220*A#*B!"
+        segments = list(iter_edifact_segments(io.StringIO(content)))
+
+        assert segments[0].elements[0] == ["UNOC", "3"]
+        assert segments[2].elements == ["220", "A*B"]
+
+
+class TestMultiEnvelope:
+    """Every ST/SE and UNH/UNT envelope is parsed on its own type."""
+
+    def test_mixed_x12_transaction_types(self):
+        content = ISA + _x12_850("1", "PO-1", "A") + _x12_856("2", "PO-2")
+        orders = X12Parser().parse(content)
+
+        assert [o.po_number for o in orders] == ["PO-1", "PO-2"]
+        assert [o.source_document.transaction_type.value for o in orders] == [
+            "850", "856",
+        ]
+
+    def test_iter_orders_is_lazy(self):
+        content = ISA + "".join(
+            _x12_850(str(i), f"PO-{i}", "A") for i in range(2000)
+        )
+        stream = io.StringIO(content)
+
+        first = next(X12Parser().iter_orders(stream, chunk_size=512))
+
+        assert first.po_number == "PO-0"
+        assert stream.tell() < len(content) // 10
+
+    def test_edifact_multiple_messages(self):
+        message = (
+            "UNH+{n}+ORDERS:D:96A:UN'BGM+220+ORDER-{n}+9'"
+            "NAD+ST+++Jane+1 Oak+Chicago+IL+60601+US'LIN+1++SKU:VP'UNT+5+{n}'"
+        )
+        content = "UNB+UNOC:3+S+R+260126:1200+1'" + "".join(
+            message.format(n=n) for n in range(3)
+        ) + "UNZ+3+1'"
+
+        orders = EDIFACTParser().parse(content)
+
+        assert [o.po_number for o in orders] == ["ORDER-0", "ORDER-1", "ORDER-2"]
+
+    def test_adapter_bulk_loads_all_envelopes(self):
+        content = ISA + "".join(
+            _x12_850(str(i), f"PO-{i}", f"Name {i}") for i in range(250)
+        ) + "GE*250*1~IEA*1*000000001~"
+        with tempfile.NamedTemporaryFile("w", suffix=".edi", delete=False) as f:
+            f.write(content)
+        conn = duckdb.connect(":memory:")
+        try:
+            adapter = EDIAdapter()
+            staged_path, count = adapter.stage_orders(f.name)
+            result = adapter.load_staged(conn, staged_path, count, f.name)
+
+            assert result.row_count == 250
+            assert not os.path.exists(staged_path)
+            last = conn.execute(
+                "SELECT _source_row_num, po_number, recipient_name, "
+                "items->>'$[0].product_id' FROM imported_data "
+                "ORDER BY _source_row_num DESC LIMIT 1"
+            ).fetchone()
+            assert last == (250, "PO-249", "Name 249", "SKU-1")
+        finally:
+            conn.close()
+            os.unlink(f.name)
+
+    def test_staged_file_removed_on_parse_error(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        bad = tmp_path / "bad.edi"
+        bad.write_text(ISA + "ST*997*1~SE*1*1~")
+
+        with pytest.raises(ValueError, match="Unsupported X12 transaction type"):
+            EDIAdapter().stage_orders(str(bad))
+
+        assert list(tmp_path.glob("edi-*.ndjson")) == []
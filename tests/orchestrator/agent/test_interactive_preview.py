@@ -1521,6 +1521,14 @@ class TestExecutionUsesPersistedShipper:
     selects between persisted shipper_json, env shipper, and Shopify shipper.
     """
 
+    @pytest.fixture(autouse=True)
+    def _lease_always_granted(self):
+        """Mock DB sessions cannot run the lease UPDATE; grant every claim."""
+        with patch("src.services.batch_executor.acquire_lease", return_value=True), patch(
+            "src.services.batch_executor.release_lease",
+        ):
+            yield
+
     def _make_mock_db(self, mock_job):
         """Build a mock DB session with proper query chaining."""
         mock_db = MagicMock()
@@ -0,0 +1,99 @@
+"""Tests for system prompt memoization and prefix stability."""
+
+import pytest
+
+from src.orchestrator.agent import system_prompt
+from src.orchestrator.agent.system_prompt import build_system_prompt, clear_prompt_cache
+from src.services.data_source_mcp_client import DataSourceInfo, SchemaColumnInfo
+from src.services.metrics import SYSTEM_PROMPT_BUILD_SECONDS
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_prompt_cache()
+    yield
+    clear_prompt_cache()
+
+
+def _source(signature: str = "sig-a") -> DataSourceInfo:
+    return DataSourceInfo(
+        source_type="csv",
+        file_path="/tmp/orders.csv",
+        columns=[SchemaColumnInfo(name="state"), SchemaColumnInfo(name="weight", type="DOUBLE")],
+        row_count=10,
+        signature=signature,
+    )
+
+
+def _count_renders(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    render = system_prompt._render_prompt
+
+    def _counting(*args, **kwargs):
+        calls.append(1)
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(system_prompt, "_render_prompt", _counting)
+    return calls
+
+
+def test_same_template_is_rendered_once_and_byte_identical(monkeypatch):
+    renders = _count_renders(monkeypatch)
+    samples = {"state": ["CA", "NY"], "weight": [1.5]}
+    hits_before = sum(SYSTEM_PROMPT_BUILD_SECONDS.labels("hit")._counts)
+
+    first = build_system_prompt(source_info=_source(), column_samples=samples)
+    second = build_system_prompt(source_info=_source(), column_samples=dict(samples))
+
+    assert first == second
+    assert len(renders) == 1
+    assert sum(SYSTEM_PROMPT_BUILD_SECONDS.labels("hit")._counts) == hits_before + 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"source_info": _source("sig-b")},
+        {"column_samples": {"state": ["TX"]}},
+        {"interactive_shipping": True},
+        {"contacts": [{"handle": "acme", "display_name": "Acme"}]},
+    ],
+)
+def test_each_input_gets_its_own_entry(monkeypatch, change):
+    renders = _count_renders(monkeypatch)
+    base = {"source_info": _source(), "column_samples": {"state": ["CA"]}}
+
+    build_system_prompt(**base)
+    build_system_prompt(**{**base, **change})
+
+    assert len(renders) == 2
+
+
+def test_environment_settings_are_part_of_the_key(monkeypatch):
+    monkeypatch.delenv("INTERNATIONAL_ENABLED_LANES", raising=False)
+    domestic = build_system_prompt(source_info=_source())
+
+    monkeypatch.setenv("INTERNATIONAL_ENABLED_LANES", "US-CA")
+
+    enabled = "**Enabled destinations:** US-CA"
+    assert enabled in build_system_prompt(source_info=_source())
+    assert enabled not in domestic
+
+
+def test_resumed_session_appends_history_after_the_shared_prefix():
+    fresh = build_system_prompt(source_info=_source())
+    resumed = build_system_prompt(
+        source_info=_source(),
+        prior_conversation=[{"role": "user", "content": "Ship CA orders"}],
+    )
+
+    assert resumed.startswith(fresh)
+    assert "## Prior Conversation (Resumed Session)" in resumed[len(fresh):]
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(system_prompt, "_PROMPT_CACHE_MAX_ENTRIES", 2)
+    for signature in ("a", "b", "c"):
+        build_system_prompt(source_info=_source(signature))
+
+    assert len(system_prompt._prompt_cache) == 2
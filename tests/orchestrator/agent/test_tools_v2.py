@@ -1820,6 +1820,18 @@ async def test_e2e_landed_cost_flow_tool_to_event():
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_tracking_cache():
+    """Keep tracking tool tests off the shared tracking cache database."""
+    with patch(
+        "src.orchestrator.agent.tools.tracking._load_cached_status",
+        return_value=None,
+    ), patch(
+        "src.orchestrator.agent.tools.tracking._store_status",
+    ):
+        yield
+
+
 @pytest.mark.asyncio
 async def test_track_package_tool_matching_response():
     """track_package_tool emits tracking_result event with matching tracking number."""
@@ -1960,6 +1972,68 @@ async def test_track_package_tool_missing_tracking_number():
     assert result2["isError"] is True
 
 
+@pytest.mark.asyncio
+async def test_track_package_tool_serves_fresh_cache_without_ups_call():
+    """A fresh stored status is emitted without calling UPS."""
+    cached = {
+        "action": "tracked",
+        "success": True,
+        "trackingNumber": "1Z999AA10123456784",
+        "currentStatus": "D",
+        "statusDescription": "Delivered",
+        "activities": [],
+    }
+    mock_ups = AsyncMock()
+    bridge = EventEmitterBridge()
+    captured: list[tuple[str, dict]] = []
+    bridge.callback = lambda et, d: captured.append((et, d))
+
+    with patch(
+        "src.orchestrator.agent.tools.tracking._load_cached_status",
+        return_value=cached,
+    ), patch(
+        "src.orchestrator.agent.tools.tracking._get_ups_client",
+        return_value=mock_ups,
+    ):
+        from src.orchestrator.agent.tools.tracking import track_package_tool
+
+        result = await track_package_tool(
+            {"tracking_number": "1Z999AA10123456784"},
+            bridge=bridge,
+        )
+
+    assert result["isError"] is False
+    mock_ups.track_package.assert_not_called()
+    assert captured == [("tracking_result", cached)]
+
+
+@pytest.mark.asyncio
+async def test_track_package_tool_stores_live_lookup():
+    """A live lookup is written to the tracking cache."""
+    mock_ups = AsyncMock()
+    mock_ups.track_package.return_value = {
+        "trackResponse": {"shipment": [{"package": [{
+            "trackingNumber": "1Z999AA10123456784",
+            "currentStatus": {"code": "IT", "description": "In Transit"},
+        }]}]},
+    }
+
+    with patch(
+        "src.orchestrator.agent.tools.tracking._get_ups_client",
+        return_value=mock_ups,
+    ), patch(
+        "src.orchestrator.agent.tools.tracking._store_status",
+    ) as store:
+        from src.orchestrator.agent.tools.tracking import track_package_tool
+
+        await track_package_tool({"tracking_number": "1Z999AA10123456784"})
+
+    store.assert_called_once()
+    tracking_number, parsed = store.call_args.args
+    assert tracking_number == "1Z999AA10123456784"
+    assert parsed["state"] == "in_transit"
+
+
 def test_track_package_registered_in_definitions():
     """track_package appears in the tool definitions."""
     defs = get_all_tool_definitions()
@@ -6,6 +6,7 @@ Covers the three-tier recovery system in BatchEngine.recover_in_flight_rows():
   Tier 3: UPS lookup fails → increment counter → escalate after MAX_RECOVERY_ATTEMPTS
 """
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -320,3 +321,33 @@ class TestInFlightRecovery:
         # Only the one in_flight row should be processed
         assert result["needs_review"] == 1
         assert len(result["details"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_recovery_lookups_are_concurrent_and_bounded(
+        self, engine: BatchEngine,
+    ) -> None:
+        """track_package calls overlap but never exceed the concurrency cap."""
+        active = 0
+        peak = 0
+
+        async def _track(tracking_number: str) -> dict:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _make_empty_track_response()
+
+        engine._ups.track_package = AsyncMock(side_effect=_track)
+        rows = [
+            _make_inflight_row(row_number=i, ups_tracking_number=f"1Z{i:03d}")
+            for i in range(1, 11)
+        ]
+
+        result = await engine.recover_in_flight_rows(
+            job_id="job-abc", rows=rows, concurrency=3,
+        )
+
+        assert peak == 3
+        assert result["needs_review"] == 10
+        assert [d["row_number"] for d in result["details"]] == list(range(1, 11))
@@ -0,0 +1,98 @@
+"""Tests for progress fan-out between observers over a shared bus."""
+
+from src.orchestrator.batch.progress_bus import (
+    InProcessProgressBus,
+    LocalBroker,
+    build_progress_bus,
+)
+from src.orchestrator.batch.sse_observer import SSEProgressObserver
+
+
+def _drain(subscription) -> list[dict]:
+    events = []
+    while (event := subscription.get_nowait()) is not None:
+        events.append(event)
+    return events
+
+
+class TestSharedBus:
+    """Two observers standing in for two API workers."""
+
+    async def test_events_reach_subscribers_on_other_worker(self):
+        broker = LocalBroker()
+        worker_a = SSEProgressObserver(coalesce_interval_s=0, bus=broker.connect())
+        worker_b = SSEProgressObserver(coalesce_interval_s=0, bus=broker.connect())
+        on_a = worker_a.subscribe("job-1")
+        on_b = worker_b.subscribe("job-1")
+
+        await worker_a.on_batch_started("job-1", 3)
+        await worker_a.on_row_completed("job-1", 1, "1Z1", 500)
+        await worker_a.on_row_failed("job-1", 2, "E-3005", "bad address")
+        await worker_a.on_batch_completed("job-1", 3, 1, 500)
+
+        events_a = _drain(on_a)
+        events_b = _drain(on_b)
+        assert [e["event"] for e in events_b] == [
+            "batch_started", "row_completed", "row_failed", "batch_completed",
+        ]
+        assert [e["id"] for e in events_b] == [e["id"] for e in events_a] == [1, 2, 3, 4]
+
+    async def test_remote_snapshot_matches_origin_counters(self):
+        broker = LocalBroker()
+        worker_a = SSEProgressObserver(buffer_size=2, bus=broker.connect())
+        worker_b = SSEProgressObserver(buffer_size=2, bus=broker.connect())
+
+        await worker_a.on_batch_started("job-1", 10)
+        for row in range(1, 5):
+            await worker_a.on_row_failed("job-1", row, "E-3005", "bad")
+
+        # A client resuming on worker B from an evicted id gets a snapshot.
+        resumed = worker_b.subscribe("job-1", last_event_id=1)
+        snapshot = resumed.get_nowait()
+        assert snapshot["event"] == "batch_progress"
+        assert snapshot["data"]["failed"] == 4
+        assert snapshot["data"]["total_rows"] == 10
+
+    async def test_takeover_worker_continues_sequence(self):
+        broker = LocalBroker()
+        worker_a = SSEProgressObserver(coalesce_interval_s=0, bus=broker.connect())
+        worker_b = SSEProgressObserver(coalesce_interval_s=0, bus=broker.connect())
+        await worker_a.on_batch_started("job-1", 2)
+        await worker_a.on_row_completed("job-1", 1, "1Z1", 100)
+
+        on_a = worker_a.subscribe("job-1")
+        await worker_b.on_row_completed("job-1", 2, "1Z2", 100)
+
+        assert [e["id"] for e in _drain(on_a)] == [3]
+
+    async def test_duplicate_delivery_is_ignored(self):
+        bus = InProcessProgressBus()
+        observer = SSEProgressObserver(coalesce_interval_s=0, bus=bus)
+        subscription = observer.subscribe("job-1")
+        message = {
+            "origin": "other", "job_id": "job-1", "seq": 1,
+            "event": "row_failed", "data": {"row_number": 1},
+        }
+        bus.publish(message)
+        bus.publish(message)
+
+        assert len(_drain(subscription)) == 1
+
+
+class TestBuildProgressBus:
+    """PROGRESS_BUS_FACTORY resolution."""
+
+    def test_default_is_in_process(self, monkeypatch):
+        monkeypatch.delenv("PROGRESS_BUS_FACTORY", raising=False)
+        assert isinstance(build_progress_bus(), InProcessProgressBus)
+
+    def test_factory_path(self, monkeypatch):
+        monkeypatch.setenv(
+            "PROGRESS_BUS_FACTORY",
+            "src.orchestrator.batch.progress_bus:InProcessProgressBus",
+        )
+        assert isinstance(build_progress_bus(), InProcessProgressBus)
+
+    def test_invalid_factory_falls_back(self, monkeypatch):
+        monkeypatch.setenv("PROGRESS_BUS_FACTORY", "no.such.module:factory")
+        assert isinstance(build_progress_bus(), InProcessProgressBus)
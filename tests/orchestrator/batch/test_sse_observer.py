@@ -0,0 +1,228 @@
+"""Unit tests for the SSE progress broadcaster.
+
+Tests cover:
+- Fan-out of every event to every subscriber
+- Coalescing of row_completed bursts into batch_progress frames
+- Last-Event-ID resume and ring buffer overflow snapshots
+- Subscription cleanup
+"""
+
+import asyncio
+
+from src.orchestrator.batch.sse_observer import SSEProgressObserver
+
+
+def _drain(subscription) -> list[dict]:
+    """Collect all currently buffered events for a subscription."""
+    events = []
+    while (event := subscription.get_nowait()) is not None:
+        events.append(event)
+    return events
+
+
+class TestFanOut:
+    """Every subscriber receives every event."""
+
+    async def test_two_subscribers_each_receive_all_events(self) -> None:
+        """Two tabs on one job both see the full event sequence."""
+        observer = SSEProgressObserver(coalesce_interval_s=0)
+        tab_a = observer.subscribe("job-1")
+        tab_b = observer.subscribe("job-1")
+
+        await observer.on_batch_started("job-1", 2)
+        await observer.on_row_completed("job-1", 1, "1Z001", 1000)
+        await observer.on_row_failed("job-1", 2, "E-3005", "boom")
+
+        events_a = [e["event"] for e in _drain(tab_a)]
+        events_b = [e["event"] for e in _drain(tab_b)]
+        assert events_a == ["batch_started", "row_completed", "row_failed"]
+        assert events_b == events_a
+
+    async def test_get_waits_for_next_event(self) -> None:
+        """get() blocks until an event is published."""
+        observer = SSEProgressObserver()
+        subscription = observer.subscribe("job-1")
+
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await observer.on_batch_started("job-1", 5)
+        event = await asyncio.wait_for(waiter, timeout=1.0)
+        assert event["event"] == "batch_started"
+        assert event["id"] == 1
+
+    async def test_new_subscriber_starts_at_live_tail(self) -> None:
+        """A subscriber without Last-Event-ID only sees future events."""
+        observer = SSEProgressObserver()
+        await observer.on_batch_started("job-1", 3)
+
+        subscription = observer.subscribe("job-1")
+        assert _drain(subscription) == []
+
+    async def test_unsubscribe_leaves_other_subscribers(self) -> None:
+        """Closing one tab does not affect another."""
+        observer = SSEProgressObserver()
+        tab_a = observer.subscribe("job-1")
+        tab_b = observer.subscribe("job-1")
+
+        observer.unsubscribe("job-1", tab_a)
+        assert observer.subscriber_count("job-1") == 1
+
+        await observer.on_batch_started("job-1", 1)
+        assert [e["event"] for e in _drain(tab_b)] == ["batch_started"]
+
+        observer.unsubscribe("job-1", tab_b)
+        assert not observer.has_subscribers("job-1")
+
+
+class TestCoalescing:
+    """row_completed bursts collapse into cumulative progress frames."""
+
+    async def test_burst_collapses_into_single_progress_frame(self) -> None:
+        """Rows completed within one interval produce one frame."""
+        observer = SSEProgressObserver(coalesce_interval_s=60)
+        subscription = observer.subscribe("job-1")
+        await observer.on_batch_started("job-1", 100)
+
+        for i in range(1, 101):
+            await observer.on_row_completed("job-1", i, f"1Z{i:03d}", 100)
+        await observer.on_batch_completed("job-1", 100, 100, 10_000)
+
+        events = _drain(subscription)
+        names = [e["event"] for e in events]
+        # First completion flushes immediately; the rest flush before the
+        # terminal event so counters are never stale.
+        assert names == [
+            "batch_started",
+            "batch_progress",
+            "batch_progress",
+            "batch_completed",
+        ]
+        final = events[2]["data"]
+        assert final["processed"] == 100
+        assert final["successful"] == 100
+        assert final["total_cost_cents"] == 10_000
+        assert final["last_tracking_number"] == "1Z100"
+
+    async def test_pending_progress_flushes_on_timer(self) -> None:
+        """A deferred frame is published once the interval elapses."""
+        observer = SSEProgressObserver(coalesce_interval_s=0.01)
+        subscription = observer.subscribe("job-1")
+
+        await observer.on_row_completed("job-1", 1, "1Z001", 100)
+        await observer.on_row_completed("job-1", 2, "1Z002", 100)
+        assert [e["event"] for e in _drain(subscription)] == ["batch_progress"]
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1.0)
+        assert event["event"] == "batch_progress"
+        assert event["data"]["successful"] == 2
+
+    async def test_failure_counts_included_in_progress(self) -> None:
+        """Progress frames report failed rows alongside successes."""
+        observer = SSEProgressObserver(coalesce_interval_s=60)
+        subscription = observer.subscribe("job-1")
+
+        await observer.on_row_failed("job-1", 1, "E-3005", "bad")
+        await observer.on_row_completed("job-1", 2, "1Z002", 100)
+
+        events = _drain(subscription)
+        assert events[-1]["event"] == "batch_progress"
+        assert events[-1]["data"]["processed"] == 2
+        assert events[-1]["data"]["failed"] == 1
+
+    async def test_interleaved_batch_stays_coalesced(self) -> None:
+        """A real start/complete/fail interleave does not defeat coalescing.
+
+        The engine emits row_started before every row, so flushing progress
+        ahead of each event would degrade to one frame per row.
+        """
+        observer = SSEProgressObserver(coalesce_interval_s=60)
+        subscription = observer.subscribe("job-1")
+        await observer.on_batch_started("job-1", 500)
+
+        for i in range(1, 501):
+            await observer.on_row_started("job-1", i)
+            if i % 100 == 0:
+                await observer.on_row_failed("job-1", i, "E-3005", "bad address")
+            else:
+                await observer.on_row_completed("job-1", i, f"1Z{i:04d}", 100)
+        await observer.on_batch_completed("job-1", 500, 495, 49_500)
+
+        events = _drain(subscription)
+        names = [e["event"] for e in events]
+        assert "row_started" not in names
+        assert names.count("row_failed") == 5
+        # One immediate frame, then one flush ahead of each failure; the
+        # last row failed, so nothing is pending at the terminal event.
+        assert names.count("batch_progress") == 6
+        for index, event in enumerate(events):
+            if event["event"] == "row_failed":
+                row = event["data"]["row_number"]
+                before = events[index - 1]
+                assert before["event"] == "batch_progress"
+                assert before["data"]["successful"] == row - row // 100
+                assert before["data"]["current_row"] == row
+        final = [e for e in events if e["event"] == "batch_progress"][-1]["data"]
+        assert (final["successful"], final["failed"]) == (495, 5)
+        assert final["current_row"] == 500
+
+    async def test_row_started_sent_as_is_without_coalescing(self) -> None:
+        """With coalescing disabled every row_started is still delivered."""
+        observer = SSEProgressObserver(coalesce_interval_s=0)
+        subscription = observer.subscribe("job-1")
+
+        await observer.on_row_started("job-1", 1)
+
+        assert [e["event"] for e in _drain(subscription)] == ["row_started"]
+
+
+class TestReplay:
+    """Last-Event-ID resume and bounded replay buffer."""
+
+    async def test_resume_after_last_event_id(self) -> None:
+        """A reconnecting client receives only events it missed."""
+        observer = SSEProgressObserver(coalesce_interval_s=0)
+        first = observer.subscribe("job-1")
+        await observer.on_batch_started("job-1", 3)
+        await observer.on_row_completed("job-1", 1, "1Z001", 100)
+        seen = _drain(first)
+        observer.unsubscribe("job-1", first)
+
+        await observer.on_row_completed("job-1", 2, "1Z002", 100)
+        await observer.on_row_completed("job-1", 3, "1Z003", 100)
+
+        resumed = observer.subscribe("job-1", last_event_id=seen[-1]["id"])
+        rows = [e["data"]["row_number"] for e in _drain(resumed)]
+        assert rows == [2, 3]
+
+    async def test_resume_past_buffer_gets_snapshot(self) -> None:
+        """Resuming from an evicted id yields a progress snapshot first."""
+        observer = SSEProgressObserver(buffer_size=2, coalesce_interval_s=0)
+        await observer.on_batch_started("job-1", 5)
+        for i in range(1, 6):
+            await observer.on_row_completed("job-1", i, f"1Z{i:03d}", 100)
+
+        subscription = observer.subscribe("job-1", last_event_id=1)
+        events = _drain(subscription)
+
+        assert events[0]["event"] == "batch_progress"
+        assert events[0]["data"]["successful"] == 5
+        assert [e["data"]["row_number"] for e in events[1:]] == [4, 5]
+
+    async def test_buffer_is_bounded(self) -> None:
+        """The ring buffer never holds more than buffer_size events."""
+        observer = SSEProgressObserver(buffer_size=8, coalesce_interval_s=0)
+        for i in range(100):
+            await observer.on_row_started("job-1", i)
+
+        assert len(observer._channels["job-1"].events) == 8
+
+    async def test_finished_jobs_are_evicted(self) -> None:
+        """Only max_finished_jobs completed buffers are retained."""
+        observer = SSEProgressObserver(max_finished_jobs=2)
+        for i in range(5):
+            await observer.on_batch_started(f"job-{i}", 1)
+            await observer.on_batch_completed(f"job-{i}", 1, 1, 100)
+
+        assert list(observer._channels) == ["job-3", "job-4"]
@@ -0,0 +1,239 @@
+"""Tests for the address validation pre-flight.
+
+Covers:
+- Normalized address keys dedupe equivalent addresses
+- Persistent cache hits skip UPS; expired entries are revalidated
+- Only unique misses are validated
+- Corrections and residential flags written back into order_data
+- Enforce mode fails invalid addresses before any shipment is created
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import AddressValidation, Base
+from src.services.address_preflight import (
+    AddressPreflight,
+    AddressValidationCache,
+    address_key,
+    apply_validation,
+    normalized_address,
+)
+from src.services.batch_engine import BatchEngine
+
+VALID = {
+    "status": "valid",
+    "candidates": [{
+        "addressLines": ["123 MAIN ST"],
+        "city": "LOS ANGELES",
+        "stateProvinceCode": "CA",
+        "postalCode": "90001",
+        "residential": True,
+    }],
+}
+
+
+@pytest.fixture()
+def db_session():
+    """Create an in-memory SQLite database with schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _order(**overrides) -> dict:
+    order = {
+        "ship_to_name": "Jane",
+        "ship_to_address1": "123 Main St.",
+        "ship_to_city": "Los Angeles",
+        "ship_to_state": "CA",
+        "ship_to_postal_code": "90001-1234",
+        "ship_to_country": "US",
+        "weight": 2.0,
+    }
+    order.update(overrides)
+    return order
+
+
+class TestNormalization:
+    """Address keys used for dedupe and caching."""
+
+    def test_equivalent_addresses_share_key(self):
+        a = normalized_address(_order())
+        b = normalized_address(_order(
+            ship_to_address1="123  MAIN ST", ship_to_city="los angeles",
+            ship_to_postal_code="90001",
+        ))
+        assert address_key(a) == address_key(b)
+
+    def test_unsupported_country_skipped(self):
+        assert normalized_address(_order(ship_to_country="CA")) is None
+
+    def test_incomplete_address_skipped(self):
+        assert normalized_address(_order(ship_to_address1="")) is None
+
+
+class TestApplyValidation:
+    """Write-back of UPS results into order_data."""
+
+    def test_corrects_city_and_sets_residential(self):
+        order = _order(ship_to_city="Los Angles")
+
+        corrections = apply_validation(order, VALID)
+
+        assert corrections == [
+            {"field": "ship_to_city", "from": "Los Angles", "to": "LOS ANGELES"},
+        ]
+        assert order["ship_to_city"] == "LOS ANGELES"
+        assert order["ship_to_residential"] is True
+        assert order["address_validation"]["status"] == "valid"
+
+    def test_zip_plus_four_not_rewritten(self):
+        order = _order()
+        apply_validation(order, VALID)
+        assert order["ship_to_postal_code"] == "90001-1234"
+
+    def test_ambiguous_result_annotates_only(self):
+        order = _order(ship_to_city="Los Angles")
+        apply_validation(order, {"status": "ambiguous", "candidates": VALID["candidates"] * 2})
+
+        assert order["ship_to_city"] == "Los Angles"
+        assert "address_corrections" not in order
+
+    def test_explicit_residential_preserved(self):
+        order = _order(ship_to_residential=False)
+        apply_validation(order, VALID)
+        assert order["ship_to_residential"] is False
+
+
+class TestAddressPreflight:
+    """Dedupe, cache lookup and bulk validation."""
+
+    async def test_unique_misses_validated_once(self, db_session):
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(return_value=VALID)
+        preflight = AddressPreflight(ups, AddressValidationCache(db_session))
+        orders = [_order() for _ in range(5)] + [_order(ship_to_country="GB")]
+
+        stats = await preflight.run(orders)
+
+        assert ups.validate_address.call_count == 1
+        assert stats["unique"] == 1
+        assert stats["validated"] == 1
+        assert all(o["address_validation"]["status"] == "valid" for o in orders[:5])
+        assert "address_validation" not in orders[5]
+
+    async def test_cache_hit_skips_ups(self, db_session):
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(return_value=VALID)
+        await AddressPreflight(ups, AddressValidationCache(db_session)).run([_order()])
+        ups.validate_address.reset_mock()
+
+        order = _order()
+        stats = await AddressPreflight(ups, AddressValidationCache(db_session)).run([order])
+
+        ups.validate_address.assert_not_called()
+        assert stats["cache_hits"] == 1
+        assert order["ship_to_residential"] is True
+
+    async def test_expired_entry_revalidated(self, db_session):
+        key = address_key(normalized_address(_order()))
+        db_session.add(AddressValidation(
+            address_key=key,
+            country_code="US",
+            status="valid",
+            candidates_json=json.dumps(VALID["candidates"]),
+            validated_at=(datetime.now(UTC) - timedelta(days=60)).isoformat(),
+        ))
+        db_session.commit()
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(return_value=VALID)
+
+        await AddressPreflight(ups, AddressValidationCache(db_session, ttl_days=30)).run([_order()])
+
+        ups.validate_address.assert_called_once()
+
+    async def test_lookup_failure_is_not_fatal(self, db_session):
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(side_effect=RuntimeError("UPS down"))
+        order = _order()
+
+        stats = await AddressPreflight(ups, AddressValidationCache(db_session)).run([order])
+
+        assert stats["failed"] == 1
+        assert "address_validation" not in order
+        assert db_session.query(AddressValidation).count() == 0
+
+    async def test_cache_write_failure_rolls_back_and_keeps_results(
+        self, db_session, monkeypatch, caplog,
+    ):
+        def _boom(*_args, **_kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr("src.services.address_preflight.upsert_rows", _boom)
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(return_value=VALID)
+        order = _order()
+
+        stats = await AddressPreflight(ups, AddressValidationCache(db_session)).run([order])
+
+        assert stats["validated"] == 1
+        assert order["address_validation"]["status"] == "valid"
+        assert "Failed to cache 1 address validations" in caplog.text
+        # The session was rolled back and is still usable.
+        assert db_session.query(AddressValidation).count() == 0
+
+    def test_repeat_writes_of_a_key_replace_the_entry(self, db_session):
+        key = address_key(normalized_address(_order()))
+        first = AddressValidationCache(db_session)
+        second = AddressValidationCache(db_session)
+
+        assert first.put_many({key: ("US", {"status": "ambiguous"})})
+        assert second.put_many({key: ("US", VALID)})
+
+        (entry,) = db_session.query(AddressValidation).all()
+        assert entry.status == "valid"
+        assert json.loads(entry.candidates_json) == VALID["candidates"]
+
+
+class TestBatchEngineEnforce:
+    """Enforce mode fails invalid addresses before Phase 1."""
+
+    async def test_invalid_address_fails_without_shipment(self, db_session, monkeypatch):
+        monkeypatch.setenv("ADDRESS_PREFLIGHT_MODE", "enforce")
+        ups = MagicMock()
+        ups.validate_address = AsyncMock(
+            return_value={"status": "invalid", "candidates": []},
+        )
+        ups.create_shipment = AsyncMock()
+        engine = BatchEngine(
+            ups_service=ups, db_session=MagicMock(), account_number="ABC123",
+        )
+        row = MagicMock(
+            id="row-1", row_number=1, status="pending",
+            order_data=json.dumps(_order()), cost_cents=0,
+        )
+        preflight = AddressPreflight(ups, AddressValidationCache(db_session))
+
+        with patch(
+            "src.services.batch_engine.build_address_preflight",
+            return_value=preflight,
+        ):
+            result = await engine.execute(
+                job_id="job-1",
+                rows=[row],
+                shipper={"name": "Store", "countryCode": "US"},
+                write_back_enabled=False,
+            )
+
+        assert result["failed"] == 1
+        ups.create_shipment.assert_not_called()
+        assert "address validation" in row.error_message
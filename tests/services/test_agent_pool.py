@@ -0,0 +1,132 @@
+"""Tests for the warm agent pool."""
+
+import asyncio
+
+from src.services.agent_pool import AgentPool
+
+KEY = ("source-a", False)
+
+
+class _FakeAgent:
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.is_started = True
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+        self.is_started = False
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.made: list[_FakeAgent] = []
+
+    async def __call__(self) -> _FakeAgent:
+        agent = _FakeAgent(len(self.made))
+        self.made.append(agent)
+        return agent
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(clock=None, **kwargs) -> AgentPool:
+    options = {"max_size": 3, "min_size": 1, "window_s": 60, "max_idle_s": 600}
+    options.update(kwargs)
+    return AgentPool(clock=clock or _Clock(), **options)
+
+
+class TestAgentPool:
+    async def test_disabled_pool_never_warms(self):
+        pool = _pool(max_size=0)
+
+        assert pool.refill(KEY, _Factory()) is None
+        assert await pool.claim(KEY) is None
+        assert not pool.enabled
+
+    async def test_claim_returns_warm_agent_and_refill_tops_up(self):
+        pool = _pool()
+        factory = _Factory()
+        await pool.refill(KEY, factory)
+
+        claimed = await pool.claim(KEY)
+        assert claimed is factory.made[0]
+        assert pool.size == 0
+
+        await pool.refill(KEY, factory)
+        assert pool.size == 1
+        assert await pool.claim(("source-a", True)) is None
+
+    async def test_size_follows_recent_claims_within_bounds(self):
+        clock = _Clock()
+        pool = _pool(clock)
+        for _ in range(5):
+            await pool.claim(KEY)
+
+        assert pool.target_size(KEY) == 3
+        await pool.refill(KEY, _Factory())
+        assert pool.size == 3
+
+        clock.now += 61
+        assert pool.target_size(KEY) == 1
+        await pool.refill(KEY, _Factory())
+        await asyncio.sleep(0)
+        assert pool.size == 1
+
+    async def test_source_change_retires_agents_for_the_old_source(self):
+        pool = _pool()
+        old = _Factory()
+        await pool.refill(KEY, old)
+
+        assert await pool.claim(("source-b", False)) is None
+        await asyncio.sleep(0)
+
+        assert old.made[0].stopped
+        assert pool.size == 0
+
+    async def test_idle_agents_expire(self):
+        clock = _Clock()
+        pool = _pool(clock, max_idle_s=30)
+        factory = _Factory()
+        await pool.refill(KEY, factory)
+
+        clock.now += 31
+        assert await pool.claim(KEY) is None
+        await asyncio.sleep(0)
+        assert factory.made[0].stopped
+
+    async def test_failed_start_leaves_pool_short(self, caplog):
+        pool = _pool()
+
+        async def _broken():
+            raise RuntimeError("sdk missing")
+
+        await pool.refill(KEY, _broken)
+
+        assert pool.size == 0
+        assert "refill failed" in caplog.text
+
+    async def test_close_stops_warm_agents(self):
+        pool = _pool(min_size=2)
+        factory = _Factory()
+        await pool.refill(KEY, factory)
+
+        await pool.close()
+
+        assert pool.size == 0
+        assert all(agent.stopped for agent in factory.made)
+
+    def test_invalid_env_falls_back_to_defaults(self, monkeypatch):
+        monkeypatch.setenv("AGENT_POOL_MAX_SIZE", "-2")
+        monkeypatch.setenv("AGENT_POOL_WINDOW_S", "soon")
+
+        pool = AgentPool()
+
+        assert not pool.enabled
+        assert pool._window_s == 300.0
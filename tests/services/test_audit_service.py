@@ -0,0 +1,121 @@
+"""Tests for awaited audit writes, details compression and streaming export."""
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db import write_queue
+from src.db.models import AuditLog, Base
+from src.db.write_queue import WriteQueue
+from src.services import audit_service
+from src.services.audit_service import (
+    AsyncAuditService,
+    AuditService,
+    EventType,
+    LogLevel,
+    decode_details,
+)
+from src.services.job_service import JobService
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return tmp_path / "audit.db"
+
+
+@pytest.fixture()
+def db_session(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture()
+def job_id(db_session):
+    return JobService(db_session).create_job(name="audit", original_command="ship").id
+
+
+def _stored(db_session) -> list[AuditLog]:
+    db_session.expire_all()
+    return list(db_session.scalars(select(AuditLog).order_by(AuditLog.row_number)))
+
+
+class TestLogAsync:
+    """Coroutine callers await the write queue instead of blocking on it."""
+
+    async def test_awaits_the_writer_thread(self, db_session, job_id, monkeypatch):
+        writer = WriteQueue(sessionmaker(bind=db_session.get_bind(), expire_on_commit=False))
+        monkeypatch.setattr(write_queue, "get_write_queue", lambda: writer)
+        db_session.commit()
+        try:
+            entry = await AuditService(db_session).log_async(
+                job_id, LogLevel.INFO, EventType.row_event, "queued", {"row": 1},
+            )
+        finally:
+            writer.close()
+
+        assert writer.writes_committed == 1
+        assert entry.id is not None
+        assert [log.message for log in _stored(db_session)] == ["queued"]
+
+
+class TestDetailsCompression:
+    """Large details payloads are stored compressed and read back transparently."""
+
+    def test_large_payload_round_trips(self, db_session, job_id, monkeypatch):
+        monkeypatch.setenv("AUDIT_DETAILS_COMPRESS_MIN_BYTES", "256")
+        audit = AuditService(db_session)
+
+        big = audit.log_info(job_id, EventType.api_call, "big", {"body": "x" * 4096})
+        small = audit.log_info(job_id, EventType.api_call, "small", {"body": "x"})
+
+        assert big.details.startswith("zlib:")
+        assert len(big.details) < 1024
+        assert decode_details(big.details) == '{"body": "' + "x" * 4096 + '"}'
+        assert small.details == '{"body": "x"}'
+        assert '"body": "xxxx' in audit.export_logs_text(job_id)
+
+    def test_invalid_threshold_falls_back_to_uncompressed(self, monkeypatch):
+        monkeypatch.setenv("AUDIT_DETAILS_COMPRESS_MIN_BYTES", "lots")
+
+        assert audit_service.encode_details({"a": 1}) == '{"a": 1}'
+
+
+class TestStreamingExport:
+    """The text export streams every entry instead of the first page."""
+
+    def _seed(self, db_session, job_id, count):
+        AuditService(db_session).log_many([
+            {
+                "job_id": job_id,
+                "level": LogLevel.INFO,
+                "event_type": EventType.row_event,
+                "message": f"Row {n} completed",
+                "row_number": n,
+            }
+            for n in range(1, count + 1)
+        ])
+
+    def test_sync_export_covers_all_entries(self, db_session, job_id):
+        self._seed(db_session, job_id, 1205)
+
+        lines = list(AuditService(db_session).iter_logs_text(job_id, batch_size=100))
+
+        assert len(lines) == 1205
+        assert lines[0].endswith("[Row 1] Row 1 completed")
+
+    async def test_async_export_matches_sync(self, db_session, db_path, job_id):
+        self._seed(db_session, job_id, 30)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        try:
+            async with AsyncSession(engine) as session:
+                service = AsyncAuditService(session)
+                lines = [line async for line in service.iter_logs_text(job_id, batch_size=7)]
+        finally:
+            await engine.dispose()
+
+        assert "\n".join(lines) == AuditService(db_session).export_logs_text(job_id)
@@ -0,0 +1,107 @@
+"""Tests for the per-job BatchPayloadPlan.
+
+Covers:
+- order_data decoded once per row and shared across steps
+- Lane resolution memoized per (destination, requested service)
+- Shipper block normalization
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.batch_payload_plan import BatchPayloadPlan
+
+SHIPPER = {"name": "Acme", "countryCode": "US", "phone": ""}
+
+
+def _row(row_number: int, **order) -> SimpleNamespace:
+    """Build a minimal JobRow stand-in."""
+    return SimpleNamespace(row_number=row_number, order_data=json.dumps(order))
+
+
+class TestOrderData:
+    """order_data decoding and caching."""
+
+    def test_decodes_once_per_row(self):
+        """Repeat lookups return the same dict without re-parsing."""
+        plan = BatchPayloadPlan(SHIPPER)
+        row = _row(1, ship_to_country="US")
+
+        with patch(
+            "src.services.order_data_codec.json.loads", wraps=json.loads,
+        ) as loads:
+            first = plan.order_data(row)
+            second = plan.order_data(row)
+
+        assert first is second
+        assert loads.call_count == 1
+
+    def test_release_drops_cached_order(self):
+        """Released rows are decoded afresh."""
+        plan = BatchPayloadPlan(SHIPPER)
+        row = _row(1, ship_to_country="US")
+        first = plan.order_data(row)
+        plan.release(row)
+
+        assert plan.order_data(row) is not first
+
+    def test_empty_order_data(self):
+        """Rows without order_data yield an empty dict."""
+        plan = BatchPayloadPlan(SHIPPER)
+        row = SimpleNamespace(row_number=1, order_data=None)
+
+        assert plan.order_data(row) == {}
+
+    def test_invalid_json_raises_value_error(self):
+        """Malformed JSON surfaces as ValueError with the row number."""
+        plan = BatchPayloadPlan(SHIPPER)
+        row = SimpleNamespace(row_number=7, order_data="{not json")
+
+        with pytest.raises(ValueError, match="row 7"):
+            plan.order_data(row)
+
+
+class TestResolveLane:
+    """Service upgrade and lane requirements."""
+
+    def test_requirements_computed_once_per_lane(self):
+        """Rows on the same lane share one requirements lookup."""
+        plan = BatchPayloadPlan(SHIPPER)
+
+        with patch(
+            "src.services.batch_payload_plan.get_requirements",
+        ) as get_requirements:
+            for _ in range(50):
+                plan.resolve_lane({"ship_to_country": "US", "service_code": "03"})
+            plan.resolve_lane({"ship_to_country": "US", "service_code": "01"})
+
+        assert get_requirements.call_count == 2
+
+    def test_upgrades_domestic_service_for_international(self, monkeypatch):
+        """Ground to Canada resolves to UPS Standard."""
+        monkeypatch.setenv("INTERNATIONAL_ENABLED_LANES", "US-CA")
+        plan = BatchPayloadPlan(SHIPPER)
+
+        lane = plan.resolve_lane({"ship_to_country": "CA", "service_code": "03"})
+
+        assert lane.service_code == "11"
+        assert lane.dest_country == "CA"
+        assert lane.requirements.is_international
+
+    def test_job_service_override_wins(self):
+        """A job-level service code overrides the row's service."""
+        plan = BatchPayloadPlan(SHIPPER, service_code="02")
+
+        lane = plan.resolve_lane({"ship_to_country": "US", "service_code": "03"})
+
+        assert lane.service_code == "02"
+
+    def test_shipper_block_drops_empty_values(self):
+        """Empty shipper fields are stripped once for the whole job."""
+        plan = BatchPayloadPlan(SHIPPER)
+
+        assert plan.shipper == {"name": "Acme", "countryCode": "US"}
+        assert plan.origin_country == "US"
@@ -1,9 +1,16 @@
 """Tests for column mapping service."""
 
+import random
+
 from src.services.column_mapping import (
+    _AUTO_MAP_RULES,
     _FIELD_TO_ORDER_DATA,
+    _AutoMapMatcher,
+    _canonicalize_header,
+    _token_set,
     apply_mapping,
     auto_map_columns,
+    auto_map_columns_with_trace,
     validate_mapping,
 )
 
@@ -620,3 +627,62 @@ class TestFWFShortFormAliases:
         assert order_data.get("ship_to_city") == "Austin"
         assert order_data.get("ship_to_postal_code") == "78746"
         assert order_data.get("weight") == "2.3"
+
+
+def _reference_matches(canonical_header: str) -> set[tuple[int, int, int]]:
+    """Unindexed rule scan: (rule index, exact, substring) per matching rule."""
+    tokens = _token_set(canonical_header)
+
+    def quality(token: str) -> int:
+        normalized = _canonicalize_header(token)
+        if not normalized:
+            return 0
+        if normalized == canonical_header or normalized in tokens:
+            return 2
+        return 1 if normalized in canonical_header else 0
+
+    matches = set()
+    for index, (must_have, must_not, _) in enumerate(_AUTO_MAP_RULES):
+        scores = [quality(t) for t in must_have]
+        if any(score == 0 for score in scores):
+            continue
+        if any(quality(t) > 0 for t in must_not):
+            continue
+        matches.add((index, scores.count(2), scores.count(1)))
+    return matches
+
+
+class TestCompiledMatcher:
+    """The token-indexed matcher agrees with a full rule scan."""
+
+    WORDS = [
+        "ship", "to", "from", "name", "address", "line", "1", "2", "city",
+        "state", "status", "st", "zip", "postal", "country", "phone", "tel",
+        "hotel", "weight", "wt", "grams", "len", "length", "talent", "order",
+        "number", "id", "value", "declared", "total", "service", "date",
+        "created", "customer", "company", "pkg", "type", "newt", "email",
+    ]
+
+    def test_matches_full_scan_on_random_headers(self):
+        matcher = _AutoMapMatcher(_AUTO_MAP_RULES)
+        rng = random.Random(11)
+        for _ in range(2000):
+            words = rng.sample(self.WORDS, rng.randint(1, 4))
+            header = _canonicalize_header(rng.choice(["_", "", " "]).join(words))
+            got = {
+                (rule.priority, exact, substring)
+                for rule, exact, substring in matcher.match(header)
+            }
+            assert got == _reference_matches(header), header
+
+    def test_single_pass_returns_mapping_and_trace(self):
+        mapping, trace = auto_map_columns_with_trace(
+            ["Recipient Name", "Address 1", "City", "ST", "ZIP", "Country", "WT"],
+        )
+
+        assert mapping == auto_map_columns(
+            ["Recipient Name", "Address 1", "City", "ST", "ZIP", "Country", "WT"],
+        )
+        assert set(trace) == set(mapping)
+        assert trace["shipTo.stateProvinceCode"]["selected_source_column"] == "ST"
+
@@ -0,0 +1,170 @@
+"""Tests for the per-job commodity cache and chunked commodity prefetch."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.commodity_cache import JobCommodityCache
+
+COFFEE = [{"description": "Coffee", "commodity_code": "090111"}]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Give each test its own process-wide cache."""
+    with patch(
+        "src.services.commodity_cache._cache", JobCommodityCache(max_jobs=4),
+    ):
+        yield
+
+
+class TestJobCommodityCache:
+    """Lookup/store bookkeeping."""
+
+    def test_lookup_splits_found_and_missing(self):
+        cache = JobCommodityCache(max_jobs=2)
+        cache.store("job-1", ["A", "B"], {"A": COFFEE})
+
+        found, missing = cache.lookup("job-1", ["A", "B", "C", "C"])
+
+        assert found == {"A": COFFEE}
+        # B was looked up and had none: not cached, so a later import is seen.
+        assert missing == ["B", "C"]
+
+    def test_jobs_are_isolated_and_evicted_lru(self):
+        cache = JobCommodityCache(max_jobs=2)
+        cache.store("job-1", ["A"], {"A": COFFEE})
+        cache.store("job-2", ["A"], {"A": COFFEE})
+        cache.lookup("job-1", ["A"])
+        cache.store("job-3", ["A"], {"A": COFFEE})
+
+        assert len(cache) == 2
+        assert cache.lookup("job-1", ["A"])[0] == {"A": COFFEE}
+        assert cache.lookup("job-2", ["A"])[1] == ["A"]
+
+    def test_invalidate(self):
+        cache = JobCommodityCache(max_jobs=2)
+        cache.store("job-1", ["A"], {"A": COFFEE})
+        cache.invalidate("job-1")
+
+        assert cache.lookup("job-1", ["A"]) == ({}, ["A"])
+
+
+class TestPrefetch:
+    """BatchEngine fetches in chunks and reuses the job cache."""
+
+    @pytest.fixture
+    def engine(self):
+        from src.services.batch_engine import BatchEngine
+
+        return BatchEngine(
+            ups_service=AsyncMock(), db_session=MagicMock(), account_number="TEST",
+        )
+
+    @staticmethod
+    def _plan():
+        return SimpleNamespace(
+            order_data=lambda row: dict(row.order),
+            resolve_lane=lambda od: SimpleNamespace(
+                requirements=SimpleNamespace(
+                    requires_commodities=od["ship_to_country"] != "US",
+                ),
+            ),
+        )
+
+    @staticmethod
+    def _rows(count):
+        return [
+            SimpleNamespace(
+                row_number=i,
+                order={"order_id": f"O{i}", "ship_to_country": "CA" if i % 2 else "US"},
+            )
+            for i in range(1, count + 1)
+        ]
+
+    async def test_chunks_and_reuses_between_preview_and_execute(
+        self, engine, monkeypatch,
+    ):
+        monkeypatch.setenv("BATCH_COMMODITY_CHUNK_SIZE", "2")
+        gateway = AsyncMock()
+        gateway.get_commodities_bulk.side_effect = lambda ids: {
+            oid: COFFEE for oid in ids if oid != "O5"
+        }
+        rows = self._rows(6)
+
+        with patch(
+            "src.services.batch_engine.get_data_gateway", return_value=gateway,
+        ):
+            first, unavailable = await engine._prefetch_commodities(
+                "job-1", self._plan(), rows,
+            )
+            second, _ = await engine._prefetch_commodities(
+                "job-1", self._plan(), rows,
+            )
+
+        calls = [c.args[0] for c in gateway.get_commodities_bulk.call_args_list]
+        # O5 had no commodities, so execute looks it up again.
+        assert calls == [["O1", "O3"], ["O5"], ["O5"]]
+        assert first == second == {"O1": COFFEE, "O3": COFFEE}
+        assert unavailable == set()
+
+    async def test_failed_chunk_is_reported_and_retried(self, engine, monkeypatch):
+        monkeypatch.setenv("BATCH_COMMODITY_CHUNK_SIZE", "1")
+        gateway = AsyncMock()
+        gateway.get_commodities_bulk.side_effect = [
+            {"O1": COFFEE}, RuntimeError("MCP down"),
+        ]
+        rows = self._rows(3)
+
+        with patch(
+            "src.services.batch_engine.get_data_gateway", return_value=gateway,
+        ):
+            found, unavailable = await engine._prefetch_commodities(
+                "job-1", self._plan(), rows,
+            )
+            assert found == {"O1": COFFEE}
+            assert unavailable == {"O3"}
+
+            gateway.get_commodities_bulk.side_effect = [{"O3": COFFEE}]
+            found, unavailable = await engine._prefetch_commodities(
+                "job-1", self._plan(), rows,
+            )
+
+        assert found == {"O1": COFFEE, "O3": COFFEE}
+        assert unavailable == set()
+        assert gateway.get_commodities_bulk.call_args.args[0] == ["O3"]
+
+    async def test_orders_without_commodities_are_not_reported_unavailable(
+        self, engine, monkeypatch,
+    ):
+        """Completed lookups count even when the cache keeps nothing."""
+        gateway = AsyncMock()
+        gateway.get_commodities_bulk.return_value = {"O1": COFFEE}
+
+        with patch(
+            "src.services.commodity_cache._cache", JobCommodityCache(max_jobs=0),
+        ), patch(
+            "src.services.batch_engine.get_data_gateway", return_value=gateway,
+        ):
+            found, unavailable = await engine._prefetch_commodities(
+                "job-1", self._plan(), self._rows(3),
+            )
+
+        assert found == {"O1": COFFEE}
+        assert unavailable == set()
+
+    async def test_commodities_imported_after_preview_reach_execute(self, engine):
+        gateway = AsyncMock()
+        gateway.get_commodities_bulk.return_value = {}
+        rows = self._rows(1)
+
+        with patch(
+            "src.services.batch_engine.get_data_gateway", return_value=gateway,
+        ):
+            preview, _ = await engine._prefetch_commodities("job-1", self._plan(), rows)
+            gateway.get_commodities_bulk.return_value = {"O1": COFFEE}
+            execute, _ = await engine._prefetch_commodities("job-1", self._plan(), rows)
+
+        assert preview == {}
+        assert execute == {"O1": COFFEE}
@@ -175,3 +175,22 @@ class TestExport:
 
     def test_export_missing_returns_none(self, svc, db_session):
         assert svc.export_session_json("nope") is None
+
+    def test_streamed_export_matches_document(self, svc, db_session):
+        svc.create_session(session_id="s1", mode="batch", context_data={"source": "orders.csv"})
+        for n in range(5):
+            svc.save_message("s1", role="user", content=f"message {n}", metadata={"n": n})
+
+        streamed = "".join(svc.iter_export_json("s1", batch_size=2))
+
+        export = svc.export_session_json("s1")
+        export["exported_at"] = json.loads(streamed)["exported_at"]
+        assert streamed == json.dumps(export, indent=2)
+
+    def test_streamed_export_of_empty_session(self, svc, db_session):
+        svc.create_session(session_id="s1", mode="batch")
+
+        document = json.loads("".join(svc.iter_export_json("s1")))
+
+        assert document["messages"] == []
+        assert "".join(svc.iter_export_json("nope")) == ""
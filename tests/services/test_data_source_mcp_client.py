@@ -80,8 +80,8 @@ async def test_import_csv_skips_invalidation_when_fingerprint_unchanged(client,
 
 
 @pytest.mark.asyncio
-async def test_import_csv_invalidates_when_fingerprint_changes(client, mock_mcp):
-    """import_csv should invalidate cache when the new fingerprint differs."""
+async def test_import_csv_keeps_cache_when_fingerprint_changes(client, mock_mcp):
+    """import_csv should keep other sources' mappings when switching sources."""
     mapping_cache.invalidate()
     mapping_cache.get_or_compute_mapping(
         source_columns=["Name", "Address", "City", "State", "ZIP", "Country", "Weight"],
@@ -102,7 +102,7 @@ async def test_import_csv_invalidates_when_fingerprint_changes(client, mock_mcp)
             invalidate,
         )
         await client.import_csv("/tmp/orders.csv")
-        invalidate.assert_called_once_with()
+        invalidate.assert_not_called()
     mapping_cache.invalidate()
 
 
@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from src.db.models import Base
+from src.db.write_queue import WriteQueue
 from src.services.decision_audit_service import DecisionAuditService
 
 
@@ -174,3 +175,96 @@ def test_redaction_on_message_and_payload(monkeypatch, tmp_path):
     assert payload["email"] == "[REDACTED]"
     assert payload["client_secret"] == "[REDACTED]"
     assert payload["nested"]["phone"] == "[REDACTED]"
+
+
+def test_iter_export_events_streams_in_batches(monkeypatch, tmp_path):
+    """The JSONL export iterates a cursor and matches the list export."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    @contextmanager
+    def _ctx():
+        db = SessionLocal()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    monkeypatch.setattr("src.services.decision_audit_service.get_db_context", _ctx)
+    monkeypatch.setenv("AGENT_AUDIT_ENABLED", "true")
+    monkeypatch.setenv("AGENT_AUDIT_JSONL_PATH", str(tmp_path / "decision.jsonl"))
+
+    run_id = DecisionAuditService.start_run(
+        session_id="s4",
+        user_message="Ship it",
+        model="test-model",
+        interactive_shipping=False,
+    )
+    DecisionAuditService.set_run_job_id(run_id, "job-4")
+    for n in range(7):
+        DecisionAuditService.log_event(
+            run_id=run_id, phase="pipeline", event_name=f"event.{n}", actor="tool",
+        )
+
+    streamed = DecisionAuditService.iter_export_events(job_id="job-4", batch_size=3)
+
+    assert next(streamed)["event_name"] == "event.0"
+    rest = list(streamed)
+    assert [e["seq"] for e in rest] == list(range(2, 8))
+    assert {e["job_id"] for e in rest} == {"job-4"}
+    assert DecisionAuditService.export_events(job_id="job-4")[1:] == rest
+
+
+async def test_log_event_on_event_loop_is_queued_without_waiting(monkeypatch, tmp_path):
+    """On the event loop the append is submitted to the writer, not awaited."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'audit.db'}", connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    @contextmanager
+    def _ctx():
+        db = SessionLocal()
+        try:
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    writer = WriteQueue(SessionLocal)
+    monkeypatch.setattr("src.services.decision_audit_service.get_db_context", _ctx)
+    monkeypatch.setattr("src.services.decision_audit_service.get_write_queue", lambda: writer)
+    monkeypatch.setenv("AGENT_AUDIT_ENABLED", "true")
+    monkeypatch.setenv("AGENT_AUDIT_JSONL_PATH", str(tmp_path / "decision.jsonl"))
+    submitted = []
+    original_submit = writer.submit
+    monkeypatch.setattr(
+        writer, "submit", lambda fn: submitted.append(original_submit(fn)) or submitted[-1],
+    )
+    try:
+        run_id = DecisionAuditService.start_run(
+            session_id="s5", user_message="Ship it", model="test-model",
+            interactive_shipping=False,
+        )
+        event_ids = [
+            DecisionAuditService.log_event(
+                run_id=run_id, phase="pipeline", event_name=f"event.{n}", actor="tool",
+            )
+            for n in range(2)
+        ]
+        for future in submitted[-2:]:
+            future.result(timeout=5)
+    finally:
+        writer.close()
+
+    events = DecisionAuditService.list_events(run_id=run_id, limit=10)["events"]
+    assert [e["id"] for e in events] == event_ids
+    assert events[1]["prev_event_hash"] == events[0]["event_hash"]
+    engine.dispose()
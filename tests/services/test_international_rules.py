@@ -3,8 +3,12 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from src.services.international_rules import (
     SUPPORTED_INTERNATIONAL_SERVICES,
+    _compiled_requirements,
+    clear_requirements_cache,
     get_requirements,
     is_lane_enabled,
     validate_international_readiness,
@@ -443,3 +447,31 @@ class TestLaneEnabled:
             assert is_lane_enabled("US", "GB") is True
             assert is_lane_enabled("DE", "FR") is True
             assert is_lane_enabled("JP", "AU") is True
+
+
+class TestRequirementsCache:
+    """Compiled requirement sets are shared and invalidated by config."""
+
+    def test_repeat_lookup_returns_shared_instance(self):
+        with patch.dict(os.environ, {"INTERNATIONAL_ENABLED_LANES": "US-CA"}, clear=False):
+            first = get_requirements("US", "CA", "11")
+            second = get_requirements(" us ", "ca", "11 ")
+            assert first is second
+
+    def test_requirement_set_is_immutable_and_hashable(self):
+        req = get_requirements("US", "US", "03")
+        with pytest.raises(AttributeError):
+            req.is_international = True  # type: ignore[misc]
+        assert hash(req) == hash(get_requirements("US", "US", "03"))
+
+    def test_env_change_invalidates(self):
+        with patch.dict(os.environ, {"INTERNATIONAL_ENABLED_LANES": ""}, clear=False):
+            assert get_requirements("US", "CA", "11").not_shippable_reason
+        with patch.dict(os.environ, {"INTERNATIONAL_ENABLED_LANES": "US-CA"}, clear=False):
+            assert get_requirements("US", "CA", "11").not_shippable_reason is None
+
+    def test_clear_requirements_cache(self):
+        get_requirements("US", "US", "03")
+        assert _compiled_requirements.cache_info().currsize > 0
+        clear_requirements_cache()
+        assert _compiled_requirements.cache_info().currsize == 0
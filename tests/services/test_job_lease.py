@@ -0,0 +1,152 @@
+"""Tests for DB job leases and the lease heartbeat."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, Job, JobStatus
+from src.services.job_lease import (
+    LeaseHeartbeat,
+    acquire_lease,
+    lease_expiries,
+    leased_job_ids,
+    release_lease,
+    renew_lease,
+)
+
+
+@pytest.fixture()
+def session_factory():
+    """Sessions over one in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture()
+def db_session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+def _create_job(db_session) -> str:
+    job = Job(name="Lease Job", original_command="ship", status=JobStatus.running.value)
+    db_session.add(job)
+    db_session.commit()
+    return job.id
+
+
+class TestLeases:
+    """Conditional claim, renew and release."""
+
+    def test_only_one_owner_can_hold(self, db_session):
+        job_id = _create_job(db_session)
+
+        assert acquire_lease(db_session, job_id, "worker-a", ttl_s=60)
+        assert acquire_lease(db_session, job_id, "worker-a", ttl_s=60)
+        assert not acquire_lease(db_session, job_id, "worker-b", ttl_s=60)
+        assert leased_job_ids(db_session) == {job_id}
+
+        release_lease(db_session, job_id, "worker-b")  # not the owner: no-op
+        assert leased_job_ids(db_session, [job_id]) == {job_id}
+        release_lease(db_session, job_id, "worker-a")
+        assert leased_job_ids(db_session) == set()
+        assert acquire_lease(db_session, job_id, "worker-b", ttl_s=60)
+
+    def test_expired_lease_can_be_taken_over(self, db_session):
+        job_id = _create_job(db_session)
+        acquire_lease(db_session, job_id, "worker-a", ttl_s=60)
+        job = db_session.get(Job, job_id)
+        job.lease_expires_at = (datetime.now(UTC) - timedelta(seconds=1)).isoformat()
+        db_session.commit()
+
+        assert leased_job_ids(db_session) == set()
+        assert acquire_lease(db_session, job_id, "worker-b", ttl_s=60)
+        assert not renew_lease(db_session, job_id, "worker-a", ttl_s=60)
+        assert renew_lease(db_session, job_id, "worker-b", ttl_s=60)
+
+    def test_missing_job_is_not_acquired(self, db_session):
+        assert not acquire_lease(db_session, "no-such-job", "worker-a", ttl_s=60)
+        assert leased_job_ids(db_session, []) == set()
+
+    def test_lease_expiries_report_held_and_free_jobs(self, db_session):
+        held = _create_job(db_session)
+        free = _create_job(db_session)
+        acquire_lease(db_session, held, "worker-a", ttl_s=60)
+
+        expiries = lease_expiries(db_session, [held, free, "no-such-job"])
+
+        assert set(expiries) == {held, free}
+        assert expiries[free] is None
+        remaining = (expiries[held] - datetime.now(UTC)).total_seconds()
+        assert 50 < remaining <= 60
+
+
+class TestLeaseHeartbeat:
+    """Heartbeat renews while held and stops the batch when lost."""
+
+    @staticmethod
+    def _factory(session_factory):
+        @contextmanager
+        def _session():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        return _session
+
+    async def test_renews_while_held(self, session_factory, db_session):
+        job_id = _create_job(db_session)
+        acquire_lease(db_session, job_id, "worker-a", ttl_s=0.3)
+        first_expiry = db_session.get(Job, job_id).lease_expires_at
+
+        async with LeaseHeartbeat(
+            job_id, "worker-a", ttl_s=0.3, session_factory=self._factory(session_factory),
+        ) as heartbeat:
+            await asyncio.sleep(0.25)
+
+        db_session.expire_all()
+        assert not heartbeat.lost
+        assert db_session.get(Job, job_id).lease_expires_at > first_expiry
+
+    async def test_lost_lease_cancels_owner_task(self, session_factory, db_session):
+        job_id = _create_job(db_session)
+        acquire_lease(db_session, job_id, "worker-a", ttl_s=0.3)
+        heartbeat = LeaseHeartbeat(
+            job_id, "worker-a", ttl_s=0.3, session_factory=self._factory(session_factory),
+        )
+
+        async def _batch():
+            async with heartbeat:
+                release_lease(db_session, job_id, "worker-a")
+                acquire_lease(db_session, job_id, "worker-b", ttl_s=60)
+                await asyncio.sleep(5)
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(asyncio.create_task(_batch()), timeout=2)
+        assert heartbeat.lost
+
+
+class TestActiveJobIds:
+    """JobService.get_active_job_ids treats running and leased jobs as live."""
+
+    def test_running_or_leased_jobs_are_active(self, db_session):
+        from src.services.job_service import JobService
+
+        service = JobService(db_session)
+        running = _create_job(db_session)
+        leased = service.create_job(name="Leased", original_command="ship").id
+        idle = service.create_job(name="Idle", original_command="ship").id
+        acquire_lease(db_session, leased, "worker-a", ttl_s=60)
+
+        assert service.get_active_job_ids([running, leased, idle]) == {running, leased}
+        assert service.get_active_job_ids([]) == set()
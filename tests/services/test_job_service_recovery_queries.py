@@ -0,0 +1,102 @@
+"""Tests for the filtered row queries used by startup recovery.
+
+Verifies that:
+- get_rows_for_jobs_in_status() returns only matching rows of matching jobs
+- get_job_ids_with_row_status() answers for many jobs in one call
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, Job, JobRow, JobStatus, RowStatus
+from src.services.job_service import JobService
+
+
+@pytest.fixture()
+def db_session():
+    """Create an in-memory SQLite database with schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _create_job(db_session, job_status: JobStatus, row_statuses: list[str]) -> str:
+    """Create a job with one row per status and return its id."""
+    now = datetime.now(UTC).isoformat()
+    job_id = str(uuid4())
+    db_session.add(Job(
+        id=job_id,
+        name="Test Job",
+        original_command="test",
+        status=job_status.value,
+        total_rows=len(row_statuses),
+        created_at=now,
+        updated_at=now,
+    ))
+    for i, status in enumerate(row_statuses, start=1):
+        db_session.add(JobRow(
+            id=str(uuid4()),
+            job_id=job_id,
+            row_number=i,
+            row_checksum=f"checksum-{i}",
+            status=status,
+        ))
+    db_session.commit()
+    return job_id
+
+
+class TestGetRowsForJobsInStatus:
+    """Recovery loads only in_flight rows of running jobs."""
+
+    def test_filters_by_job_and_row_status(self, db_session) -> None:
+        running = _create_job(
+            db_session, JobStatus.running, ["completed", "in_flight", "pending", "in_flight"],
+        )
+        _create_job(db_session, JobStatus.completed, ["in_flight"])
+        _create_job(db_session, JobStatus.running, ["completed"])
+
+        result = JobService(db_session).get_rows_for_jobs_in_status(
+            JobStatus.running, (RowStatus.in_flight,),
+        )
+
+        assert list(result) == [running]
+        assert [r.row_number for r in result[running]] == [2, 4]
+
+    def test_empty_when_nothing_matches(self, db_session) -> None:
+        _create_job(db_session, JobStatus.running, ["completed"])
+
+        result = JobService(db_session).get_rows_for_jobs_in_status(
+            JobStatus.running, (RowStatus.in_flight,),
+        )
+
+        assert result == {}
+
+
+class TestGetJobIdsWithRowStatus:
+    """Staging cleanup eligibility in one aggregated query."""
+
+    def test_returns_only_jobs_with_unresolved_rows(self, db_session) -> None:
+        in_flight = _create_job(db_session, JobStatus.running, ["completed", "in_flight"])
+        review = _create_job(db_session, JobStatus.completed, ["needs_review"])
+        resolved = _create_job(db_session, JobStatus.completed, ["completed", "failed"])
+
+        result = JobService(db_session).get_job_ids_with_row_status(
+            [in_flight, review, resolved, "missing-job"],
+            (RowStatus.in_flight, RowStatus.needs_review),
+        )
+
+        assert result == {in_flight, review}
+
+    def test_empty_job_ids(self, db_session) -> None:
+        result = JobService(db_session).get_job_ids_with_row_status(
+            [], (RowStatus.in_flight,),
+        )
+
+        assert result == set()
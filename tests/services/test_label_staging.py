@@ -1,13 +1,17 @@
 """Tests for label staging directory with atomic promote."""
 
 import base64
+import json
 import os
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.services import batch_engine
 from src.services.batch_engine import BatchEngine
+from src.services.label_storage import AsyncLabelStorage, build_async_label_storage
 
 
 @pytest.fixture()
@@ -27,15 +31,27 @@ def sample_label_b64() -> str:
     return base64.b64encode(b"%PDF-1.4 sample label content").decode()
 
 
+def _stage(
+    engine: BatchEngine, tracking_number: str, label_b64: str, job_id: str, row_number: int,
+) -> str:
+    """Stage a base64 label through the engine's storage backend."""
+    return engine._label_storage.save_staged(
+        tracking_number=tracking_number,
+        pdf_bytes=base64.b64decode(label_b64),
+        job_id=job_id,
+        row_number=row_number,
+    )
+
+
 class TestLabelStaging:
     """Verify label staging, promote, and cleanup behavior."""
 
-    def test_save_label_staged_writes_to_staging_dir(
+    def test_staged_label_writes_to_staging_dir(
         self, engine: BatchEngine, sample_label_b64: str, tmp_path: Path,
     ) -> None:
         """Label is saved to labels/staging/{job_id}/, not final path."""
-        path = engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
+        path = _stage(
+            engine, "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
         )
         assert "/staging/" in path
         assert "job-abc" in path
@@ -43,40 +59,40 @@ class TestLabelStaging:
         # Verify it's NOT in the final labels dir root
         assert not (tmp_path / "labels" / Path(path).name).exists()
 
-    def test_promote_label_moves_to_final_path(
+    def test_promote_moves_to_final_path(
         self, engine: BatchEngine, sample_label_b64: str,
     ) -> None:
         """After promote, label exists at final path and staging file is gone."""
-        staging_path = engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
+        staging_path = _stage(
+            engine, "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
         )
         assert os.path.exists(staging_path)
 
-        final_path = engine._promote_label(staging_path)
+        final_path = engine._label_storage.promote(staging_path)
         assert os.path.exists(final_path)
         assert not os.path.exists(staging_path)
         assert "/staging/" not in final_path
 
-    def test_promote_label_preserves_content(
+    def test_promote_preserves_content(
         self, engine: BatchEngine, sample_label_b64: str,
     ) -> None:
         """Promoted label has same content as staged."""
-        staging_path = engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
+        staging_path = _stage(
+            engine, "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
         )
         original_content = Path(staging_path).read_bytes()
 
-        final_path = engine._promote_label(staging_path)
+        final_path = engine._label_storage.promote(staging_path)
         assert Path(final_path).read_bytes() == original_content
 
     def test_crash_before_promote_leaves_orphan_in_staging(
         self, engine: BatchEngine, sample_label_b64: str,
     ) -> None:
         """If promote never runs, staging file exists but final path does not."""
-        staging_path = engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
+        staging_path = _stage(
+            engine, "1Z999", sample_label_b64, job_id="job-abc", row_number=1,
         )
-        # Simulate crash: never call _promote_label
+        # Simulate crash: never promote
         assert os.path.exists(staging_path)
         labels_root = Path(engine._labels_dir)
         # No file in root labels dir
@@ -88,18 +104,15 @@ class TestLabelStaging:
     ) -> None:
         """cleanup_staging removes staging dirs for jobs with no unresolved rows."""
         # Create a staged label
-        engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="completed-job", row_number=1,
+        _stage(
+            engine, "1Z999", sample_label_b64, job_id="completed-job", row_number=1,
         )
         staging_dir = Path(engine._labels_dir) / "staging" / "completed-job"
         assert staging_dir.exists()
 
         # Mock DB: job has no in_flight or needs_review rows
-        MagicMock()
-        mock_row = MagicMock()
-        mock_row.status = "completed"
         mock_js = MagicMock()
-        mock_js.get_rows.return_value = [mock_row]
+        mock_js.get_job_ids_with_row_status.return_value = set()
 
         count = BatchEngine.cleanup_staging(
             mock_js, labels_dir=str(tmp_path / "labels"),
@@ -111,17 +124,15 @@ class TestLabelStaging:
         self, engine: BatchEngine, sample_label_b64: str, tmp_path: Path,
     ) -> None:
         """cleanup_staging does NOT delete staging files for jobs with in_flight rows."""
-        engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="inflight-job", row_number=1,
+        _stage(
+            engine, "1Z999", sample_label_b64, job_id="inflight-job", row_number=1,
         )
         staging_dir = Path(engine._labels_dir) / "staging" / "inflight-job"
         assert staging_dir.exists()
 
         # Mock DB: job has an in_flight row
-        mock_row = MagicMock()
-        mock_row.status = "in_flight"
         mock_js = MagicMock()
-        mock_js.get_rows.return_value = [mock_row]
+        mock_js.get_job_ids_with_row_status.return_value = {"inflight-job"}
 
         count = BatchEngine.cleanup_staging(
             mock_js, labels_dir=str(tmp_path / "labels"),
@@ -133,16 +144,14 @@ class TestLabelStaging:
         self, engine: BatchEngine, sample_label_b64: str, tmp_path: Path,
     ) -> None:
         """cleanup_staging preserves staging files for needs_review rows."""
-        engine._save_label_staged(
-            "1Z999", sample_label_b64, job_id="review-job", row_number=1,
+        _stage(
+            engine, "1Z999", sample_label_b64, job_id="review-job", row_number=1,
         )
         staging_dir = Path(engine._labels_dir) / "staging" / "review-job"
         assert staging_dir.exists()
 
-        mock_row = MagicMock()
-        mock_row.status = "needs_review"
         mock_js = MagicMock()
-        mock_js.get_rows.return_value = [mock_row]
+        mock_js.get_job_ids_with_row_status.return_value = {"review-job"}
 
         count = BatchEngine.cleanup_staging(
             mock_js, labels_dir=str(tmp_path / "labels"),
@@ -150,6 +159,61 @@ class TestLabelStaging:
         assert count == 0
         assert staging_dir.exists()
 
+    def test_cleanup_staging_skips_running_or_leased_jobs(
+        self, tmp_path: Path,
+    ) -> None:
+        """A live batch's staging dir survives even with no unresolved rows."""
+        staging_dir = tmp_path / "labels" / "staging" / "live-job"
+        staging_dir.mkdir(parents=True)
+        (staging_dir / "1Z999.pdf").write_bytes(b"%PDF")
+
+        mock_js = MagicMock()
+        mock_js.get_job_ids_with_row_status.return_value = set()
+        mock_js.get_active_job_ids.return_value = {"live-job"}
+
+        count = BatchEngine.cleanup_staging(
+            mock_js, labels_dir=str(tmp_path / "labels"),
+        )
+        assert count == 0
+        assert (staging_dir / "1Z999.pdf").exists()
+
+    def test_cleanup_staging_tolerates_concurrent_changes(
+        self, tmp_path: Path,
+    ) -> None:
+        """Files promoted or staged while cleanup runs do not abort it."""
+        staging_root = tmp_path / "labels" / "staging"
+        for job_id in ("job-a", "job-b", "job-c"):
+            (staging_root / job_id).mkdir(parents=True)
+            (staging_root / job_id / "label.pdf").write_bytes(b"%PDF")
+
+        def _race(_names):
+            # Between the directory listing and the deletes, one job's dir
+            # is removed and another job stages a second label.
+            (staging_root / "job-a" / "label.pdf").unlink()
+            (staging_root / "job-a").rmdir()
+            return set()
+
+        mock_js = MagicMock()
+        mock_js.get_job_ids_with_row_status.return_value = set()
+        mock_js.get_active_job_ids.side_effect = _race
+
+        original_unlink = Path.unlink
+
+        def _unlink_then_stage(path: Path, *args, **kwargs):
+            original_unlink(path, *args, **kwargs)
+            if path.parent.name == "job-b":
+                (path.parent / "late.pdf").write_bytes(b"%PDF")
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(Path, "unlink", _unlink_then_stage)
+            count = BatchEngine.cleanup_staging(
+                mock_js, labels_dir=str(tmp_path / "labels"),
+            )
+
+        assert count == 2
+        assert (staging_root / "job-b" / "late.pdf").exists()
+        assert not (staging_root / "job-c").exists()
+
     def test_cleanup_staging_returns_zero_when_no_staging_dir(
         self, tmp_path: Path,
     ) -> None:
@@ -159,3 +223,74 @@ class TestLabelStaging:
             mock_js, labels_dir=str(tmp_path / "nonexistent"),
         )
         assert count == 0
+
+
+class TestExecutePersistsLabels:
+    """BatchEngine.execute writes labels through the label storage pool."""
+
+    async def test_labels_are_staged_and_promoted_on_the_pool(
+        self, engine: BatchEngine, sample_label_b64: str, monkeypatch,
+    ) -> None:
+        """Each label lands at its final path, written by a pool thread."""
+        engine._ups.create_shipment = AsyncMock(return_value={
+            "trackingNumbers": ["1Z999AA10123456784"],
+            "labelData": [sample_label_b64],
+            "totalCharges": {"monetaryValue": "15.50"},
+        })
+        storage = engine._label_storage
+        threads: list[str] = []
+        promote = storage.promote
+
+        def _recording_promote(staged_ref: str) -> str:
+            threads.append(threading.current_thread().name)
+            return promote(staged_ref)
+
+        monkeypatch.setattr(storage, "promote", _recording_promote)
+        pools: list[AsyncLabelStorage] = []
+
+        def _build(backend):
+            pools.append(build_async_label_storage(backend))
+            return pools[-1]
+
+        monkeypatch.setattr(batch_engine, "build_async_label_storage", _build)
+        rows = [
+            MagicMock(
+                id=f"row-{n}",
+                row_number=n,
+                status="pending",
+                order_data=json.dumps({
+                    "ship_to_name": "John",
+                    "ship_to_address1": "123 Main",
+                    "ship_to_city": "LA",
+                    "ship_to_state": "CA",
+                    "ship_to_postal_code": "90001",
+                    "weight": 2.0,
+                }),
+                cost_cents=0,
+            )
+            for n in (1, 2)
+        ]
+
+        result = await engine.execute(
+            job_id="job-pool",
+            rows=rows,
+            shipper={
+                "name": "Store",
+                "addressLine1": "456 Oak",
+                "city": "SF",
+                "stateProvinceCode": "CA",
+                "postalCode": "94102",
+                "countryCode": "US",
+            },
+            write_back_enabled=False,
+        )
+
+        assert result["successful"] == 2
+        for row in rows:
+            assert "/staging/" not in row.label_path
+            assert Path(row.label_path).read_bytes() == base64.b64decode(sample_label_b64)
+        assert len(threads) == 2
+        assert all(name.startswith("label-storage") for name in threads)
+        staging_dir = Path(engine._labels_dir) / "staging" / "job-pool"
+        assert not any(staging_dir.glob("*.pdf"))
+        assert len(pools) == 1 and pools[0]._executor is None
@@ -1,10 +1,19 @@
-"""Tests for label storage backend selection."""
+"""Tests for label storage backends and the async storage facade."""
 
+import asyncio
+import threading
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.services.label_storage import LocalLabelStorage, build_label_storage
+from src.services.label_storage import (
+    AsyncLabelStorage,
+    LocalLabelStorage,
+    S3LabelStorage,
+    build_label_storage,
+)
 
 
 def test_build_label_storage_defaults_to_local(tmp_path: Path, monkeypatch):
@@ -20,3 +29,87 @@ def test_build_label_storage_requires_bucket_for_s3(tmp_path: Path, monkeypatch)
     monkeypatch.delenv("LABEL_STORAGE_S3_BUCKET", raising=False)
     with pytest.raises(RuntimeError):
         build_label_storage(tmp_path / "labels")
+
+
+async def test_async_persist_local_promotes_from_staging(tmp_path: Path):
+    """Local backend persists via staging + promote and leaves no staged file."""
+    storage = LocalLabelStorage(tmp_path / "labels")
+    label_io = AsyncLabelStorage(storage)
+    try:
+        ref = await label_io.persist(
+            tracking_number="1Z999", pdf_bytes=b"%PDF", job_id="job-abc",
+            row_number=1,
+        )
+    finally:
+        label_io.close()
+
+    final = Path(ref)
+    assert final.parent == tmp_path / "labels"
+    assert final.read_bytes() == b"%PDF"
+    assert list((tmp_path / "labels" / "staging" / "job-abc").iterdir()) == []
+
+
+async def test_async_persist_atomic_backend_writes_final_directly():
+    """Backends with atomic final writes skip the staging copy + delete."""
+    storage = MagicMock()
+    storage.atomic_final_writes = True
+    storage.save_final.return_value = "s3://bucket/labels/final.pdf"
+    label_io = AsyncLabelStorage(storage)
+    try:
+        ref = await label_io.persist(
+            tracking_number="1Z999", pdf_bytes=b"%PDF", job_id="job-abc",
+            row_number=2,
+        )
+    finally:
+        label_io.close()
+
+    assert ref == "s3://bucket/labels/final.pdf"
+    storage.save_final.assert_called_once_with(
+        tracking_number="1Z999", pdf_bytes=b"%PDF", job_id="job-abc",
+        row_number=2,
+    )
+    storage.save_staged.assert_not_called()
+    storage.promote.assert_not_called()
+
+
+async def test_async_storage_bounds_pending_operations(tmp_path: Path):
+    """No more than max_pending storage calls run at once."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _slow_exists(ref: str) -> bool:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return True
+
+    storage = MagicMock()
+    storage.exists.side_effect = _slow_exists
+    label_io = AsyncLabelStorage(storage, max_workers=8, max_pending=2)
+    try:
+        results = await asyncio.gather(
+            *[label_io.exists(f"ref-{i}") for i in range(8)]
+        )
+    finally:
+        label_io.close()
+
+    assert all(results)
+    assert peak <= 2
+
+
+def test_s3_large_label_uses_multipart_upload():
+    """Labels above the threshold go through upload_fileobj (multipart)."""
+    pytest.importorskip("boto3")
+    storage = S3LabelStorage(bucket="b", prefix="labels", multipart_threshold=4)
+    client = MagicMock()
+    storage._client = client
+
+    storage.save_final("1Z999", b"%PDF-large", job_id="job-abc", row_number=1)
+
+    client.put_object.assert_not_called()
+    client.upload_fileobj.assert_called_once()
@@ -56,13 +56,13 @@ def test_cache_miss_computes_and_persists(_cache_env):
 
 def test_cache_hit_returns_memory_cached_mapping(monkeypatch):
     calls = {"count": 0}
-    real = mapping_cache.auto_map_columns
+    real = mapping_cache.auto_map_columns_with_trace
 
     def _counting(columns):
         calls["count"] += 1
         return real(columns)
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _counting)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _counting)
     first = mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-2",
@@ -102,14 +102,12 @@ def test_cold_process_loads_from_disk_cache(monkeypatch):
         sample_rows=_sample_rows(),
     )
 
-    mapping_cache._cached_fingerprint = None
-    mapping_cache._cached_columns = None
-    mapping_cache._cached_mapping = None
+    mapping_cache._clear_memory()
 
     def _fail(_columns):
-        raise AssertionError("auto_map_columns should not run for disk cache hit")
+        raise AssertionError("auto_map_columns_with_trace should not run for disk cache hit")
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _fail)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _fail)
     second = mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-3",
@@ -121,13 +119,13 @@ def test_cold_process_loads_from_disk_cache(monkeypatch):
 
 def test_fingerprint_change_forces_recompute(monkeypatch):
     calls = {"count": 0}
-    real = mapping_cache.auto_map_columns
+    real = mapping_cache.auto_map_columns_with_trace
 
     def _counting(columns):
         calls["count"] += 1
         return real(columns)
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _counting)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _counting)
     mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-a",
@@ -148,13 +146,13 @@ def test_invalid_cache_file_is_ignored_and_recomputed(_cache_env, monkeypatch):
     path.write_text("not-json")
 
     calls = {"count": 0}
-    real = mapping_cache.auto_map_columns
+    real = mapping_cache.auto_map_columns_with_trace
 
     def _counting(columns):
         calls["count"] += 1
         return real(columns)
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _counting)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _counting)
     mapping = mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-4",
@@ -170,9 +168,9 @@ def test_verification_failure_is_not_persisted(_cache_env, monkeypatch):
 
     def _bad_mapping(_columns):
         calls["count"] += 1
-        return {"shipTo.name": "Name"}  # missing required paths
+        return {"shipTo.name": "Name"}, {}  # missing required paths
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _bad_mapping)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _bad_mapping)
     first = mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-bad",
@@ -186,8 +184,17 @@ def test_verification_failure_is_not_persisted(_cache_env, monkeypatch):
 
     assert first == {"shipTo.name": "Name"}
     assert second == {"shipTo.name": "Name"}
-    assert calls["count"] == 2
+    # The failed entry is remembered in memory, so the mapping is not
+    # recomputed, but it is never written to disk.
+    assert calls["count"] == 1
     assert not any(_cache_env.glob("*.json"))
+    _, _, diagnostics = mapping_cache.get_or_compute_mapping_with_diagnostics(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-bad",
+        sample_rows=[],
+    )
+    assert diagnostics["cache_source"] == "verification_failed"
+    assert diagnostics["cache_hit"] is False
 
 
 def test_valid_mapping_persists_even_when_sample_values_are_blank(_cache_env, monkeypatch):
@@ -203,9 +210,9 @@ def test_valid_mapping_persists_even_when_sample_values_are_blank(_cache_env, mo
             "shipTo.postalCode": "ZIP",
             "shipTo.countryCode": "Country",
             "packages[0].weight": "Weight",
-        }
+        }, {}
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _mapping)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _mapping)
     blank_sample = [
         {
             "Name": "",
@@ -319,16 +326,12 @@ def test_disk_hit_for_previously_evicted_memory_session(monkeypatch):
         sample_rows=_sample_rows(),
     )
 
-    mapping_cache._cached_fingerprint = None
-    mapping_cache._cached_columns = None
-    mapping_cache._cached_mapping = None
-    mapping_cache._cached_mapping_hash = None
-    mapping_cache._cached_selection_trace = None
+    mapping_cache._clear_memory()
 
     def _fail(_columns):
-        raise AssertionError("auto_map_columns should not run for disk cache hit")
+        raise AssertionError("auto_map_columns_with_trace should not run for disk cache hit")
 
-    monkeypatch.setattr(mapping_cache, "auto_map_columns", _fail)
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _fail)
     second = mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="sig-disk-A",
@@ -364,7 +367,7 @@ def test_eviction_removes_oldest_file_when_limit_exceeded(monkeypatch, _cache_en
     assert fingerprints == {"sig-evict-2", "sig-evict-3"}
 
 
-def test_should_invalidate_returns_false_for_matching_fingerprint():
+def test_should_invalidate_only_without_fingerprint():
     mapping_cache.get_or_compute_mapping(
         source_columns=_source_columns(),
         schema_fingerprint="fp-1",
@@ -372,11 +375,108 @@ def test_should_invalidate_returns_false_for_matching_fingerprint():
     )
 
     assert mapping_cache.should_invalidate("fp-1") is False
-    assert mapping_cache.should_invalidate("fp-2") is True
+    assert mapping_cache.should_invalidate("fp-2") is False
     assert mapping_cache.should_invalidate(None) is True
     assert mapping_cache.should_invalidate("") is True
 
 
-def test_should_invalidate_returns_true_when_cache_empty():
-    mapping_cache.invalidate()
-    assert mapping_cache.should_invalidate("any-fp") is True
+def test_alternating_fingerprints_stay_in_memory(monkeypatch):
+    mapping_cache.get_or_compute_mapping(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-alt-A",
+        sample_rows=_sample_rows(),
+    )
+    mapping_cache.get_or_compute_mapping(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-alt-B",
+        sample_rows=_sample_rows(),
+    )
+
+    def _fail(_columns):
+        raise AssertionError("auto_map_columns_with_trace should not run for memory hit")
+
+    def _no_disk(*_args):
+        raise AssertionError("disk should not be read for memory hit")
+
+    monkeypatch.setattr(mapping_cache, "auto_map_columns_with_trace", _fail)
+    monkeypatch.setattr(mapping_cache, "_load_from_disk", _no_disk)
+    before = mapping_cache.cache_stats()["memory_hits"]
+    for fingerprint in ("sig-alt-A", "sig-alt-B", "sig-alt-A"):
+        _, _, diagnostics = mapping_cache.get_or_compute_mapping_with_diagnostics(
+            source_columns=_source_columns(),
+            schema_fingerprint=fingerprint,
+            sample_rows=_sample_rows(),
+        )
+        assert diagnostics["cache_source"] == "memory"
+
+    assert mapping_cache.cache_stats()["memory_hits"] == before + 3
+
+
+def test_memory_lru_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setenv("COLUMN_MAPPING_CACHE_MAX_ENTRIES", "2")
+    before = mapping_cache.cache_stats()["evictions"]
+    for fingerprint in ("sig-lru-1", "sig-lru-2", "sig-lru-1", "sig-lru-3"):
+        mapping_cache.get_or_compute_mapping(
+            source_columns=_source_columns(),
+            schema_fingerprint=fingerprint,
+            sample_rows=_sample_rows(),
+        )
+
+    stats = mapping_cache.cache_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == before + 1
+    _, _, diagnostics = mapping_cache.get_or_compute_mapping_with_diagnostics(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-lru-2",
+        sample_rows=_sample_rows(),
+    )
+    assert diagnostics["cache_source"] == "disk"
+
+
+def test_disk_eviction_follows_index_last_use(monkeypatch, _cache_env):
+    monkeypatch.setenv("COLUMN_MAPPING_MAX_DISK_CACHE_FILES", "2")
+    for fingerprint in ("sig-idx-1", "sig-idx-2"):
+        mapping_cache.get_or_compute_mapping(
+            source_columns=_source_columns(),
+            schema_fingerprint=fingerprint,
+            sample_rows=_sample_rows(),
+        )
+    # A disk hit refreshes sig-idx-1, so sig-idx-2 is evicted next.
+    mapping_cache._clear_memory()
+    mapping_cache.get_or_compute_mapping(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-idx-1",
+        sample_rows=_sample_rows(),
+    )
+    mapping_cache.get_or_compute_mapping(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-idx-3",
+        sample_rows=_sample_rows(),
+    )
+
+    fingerprints = {
+        json.loads(path.read_text())["schema_fingerprint"]
+        for path in _cache_env.glob("*.json")
+    }
+    assert fingerprints == {"sig-idx-1", "sig-idx-3"}
+    index = json.loads((_cache_env / "mappings.idx").read_text())
+    assert len(index["files"]) == 2
+
+
+def test_missing_index_is_rebuilt_from_files(monkeypatch, _cache_env):
+    monkeypatch.setenv("COLUMN_MAPPING_MAX_DISK_CACHE_FILES", "2")
+    for fingerprint in ("sig-old-1", "sig-old-2"):
+        mapping_cache.get_or_compute_mapping(
+            source_columns=_source_columns(),
+            schema_fingerprint=fingerprint,
+            sample_rows=_sample_rows(),
+        )
+    (_cache_env / "mappings.idx").unlink()
+
+    mapping_cache.get_or_compute_mapping(
+        source_columns=_source_columns(),
+        schema_fingerprint="sig-old-3",
+        sample_rows=_sample_rows(),
+    )
+
+    assert len(list(_cache_env.glob("*.json"))) == 2
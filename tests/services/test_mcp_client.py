@@ -234,6 +234,40 @@ class TestMCPClientCallTool:
         assert result == expected
         mock_session.call_tool.assert_awaited_once_with("test_tool", {"arg": "val"})
 
+    @pytest.mark.asyncio
+    async def test_propagates_trace_context_in_meta(self):
+        """With an active span, the request _meta carries its traceparent."""
+        from src.utils.tracing import configure_tracing, span
+
+        class _Recorder:
+            def __init__(self):
+                self.spans = []
+
+            def export(self, finished):
+                self.spans.append(finished)
+
+            def shutdown(self):
+                pass
+
+        recorder = _Recorder()
+        mock_session = AsyncMock()
+        mock_session.call_tool = AsyncMock(return_value=_make_call_result('{"ok": true}'))
+        client = MCPClient(_make_server_params(), max_retries=0)
+        client._session = mock_session
+
+        configure_tracing(recorder)
+        try:
+            with span("turn") as turn:
+                await client.call_tool("test_tool", {"arg": "val"})
+        finally:
+            configure_tracing()
+
+        call_span = next(s for s in recorder.spans if s.name == "mcp.call_tool")
+        assert call_span.trace_id == turn.trace_id
+        assert call_span.parent_span_id == turn.span_id
+        meta = mock_session.call_tool.await_args.kwargs["meta"]
+        assert meta == {"traceparent": call_span.traceparent}
+
     @pytest.mark.asyncio
     async def test_raises_on_no_session(self):
         """call_tool without context raises MCPConnectionError."""
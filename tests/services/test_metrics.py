@@ -0,0 +1,83 @@
+"""Tests for the metrics registry and its Prometheus text rendering."""
+
+import pytest
+
+from src.services.metrics import MetricsRegistry
+
+
+class TestHistogram:
+    """Bucket placement and exposition."""
+
+    def test_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("t_seconds", "Test latency.", ("tool",), buckets=(0.1, 1.0))
+        hist.labels("rate").observe(0.05)
+        hist.labels("rate").observe(0.1)
+        hist.labels("rate").observe(0.5)
+        hist.labels("rate").observe(5)
+
+        text = registry.render()
+
+        assert "# TYPE t_seconds histogram" in text
+        assert 't_seconds_bucket{tool="rate",le="0.1"} 2' in text
+        assert 't_seconds_bucket{tool="rate",le="1"} 3' in text
+        assert 't_seconds_bucket{tool="rate",le="+Inf"} 4' in text
+        assert 't_seconds_count{tool="rate"} 4' in text
+        assert 't_seconds_sum{tool="rate"} 5.65' in text
+
+    def test_label_arity_is_checked(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("t_seconds", "Test latency.", ("tool", "outcome"))
+        with pytest.raises(ValueError, match="expects labels"):
+            hist.labels("rate")
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("t_calls", "Test calls.", ("tool",)).labels('a"b\\c').inc()
+        assert 't_calls_total{tool="a\\"b\\\\c"} 1' in registry.render()
+
+
+class TestCounterAndGauge:
+    """Counters, set gauges and scrape-time gauges."""
+
+    def test_counter_renders_total_suffix(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("t_retries", "Test retries.", ("tool",))
+        counter.labels("rate").inc()
+        counter.labels("rate").inc(2)
+        text = registry.render()
+        assert "# TYPE t_retries counter" in text
+        assert 't_retries_total{tool="rate"} 3' in text
+
+    def test_gauge_function_is_sampled_on_render(self):
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("t_depth", "Test depth.").set_function(lambda: depth[0])
+        assert "t_depth 3" in registry.render()
+        depth[0] = 7
+        assert "t_depth 7" in registry.render()
+
+    def test_failing_gauge_function_renders_nan(self):
+        registry = MetricsRegistry()
+        registry.gauge("t_depth", "Test depth.").set_function(lambda: 1 / 0)
+        assert "t_depth NaN" in registry.render()
+
+    def test_set_gauge(self):
+        registry = MetricsRegistry()
+        registry.gauge("t_level", "Test level.").set(2.5)
+        assert "t_level 2.5" in registry.render()
+
+
+class TestRegistry:
+    """Get-or-create semantics."""
+
+    def test_same_name_returns_same_metric(self):
+        registry = MetricsRegistry()
+        first = registry.counter("t_calls", "Test calls.")
+        assert registry.counter("t_calls", "Test calls.") is first
+
+    def test_kind_conflict_raises(self):
+        registry = MetricsRegistry()
+        registry.counter("t_calls", "Test calls.")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("t_calls", "Test calls.")
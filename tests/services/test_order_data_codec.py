@@ -0,0 +1,146 @@
+"""Tests for compact order_data encoding and the per-job decode cache."""
+
+import hashlib
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.db.models import JobStatus
+from src.services import order_data_codec
+from src.services.batch_payload_plan import BatchPayloadPlan
+from src.services.job_service import JobService
+from src.services.order_data_codec import (
+    ParsedOrderCache,
+    decode_order_data,
+    encode_order_data,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Give each test its own process-wide cache."""
+    with patch(
+        "src.services.order_data_codec._cache", ParsedOrderCache(max_rows=100),
+    ):
+        yield
+
+
+class TestEncode:
+    """Compact, deterministic serialization."""
+
+    def test_compact_and_sorted(self):
+        text, checksum = encode_order_data({"b": 1, "a": "x"})
+
+        assert text == '{"a":"x","b":1}'
+        assert len(checksum) == 32
+
+    def test_key_order_does_not_change_checksum(self):
+        assert encode_order_data({"a": 1, "b": 2}) == encode_order_data({"b": 2, "a": 1})
+
+    def test_checksum_matches_legacy_serialization(self):
+        order = {"order_id": "1001", "weight": 2.5}
+        legacy = json.dumps(order, sort_keys=True, default=str)
+
+        _, checksum = encode_order_data(order)
+
+        assert checksum == hashlib.md5(legacy.encode()).hexdigest()
+
+    def test_smaller_than_default_json(self):
+        order = {f"ship_to_field_{i}": f"value {i}" for i in range(20)}
+        text, _ = encode_order_data(order)
+        assert len(text) < len(json.dumps(order, sort_keys=True))
+        assert json.loads(text) == order
+
+
+class TestDecodeCache:
+    """Per-job cached decoding."""
+
+    def test_decodes_once_per_job(self):
+        raw = '{"order_id":"1001"}'
+        with patch(
+            "src.services.order_data_codec.json.loads", wraps=json.loads,
+        ) as loads:
+            first = decode_order_data(raw, job_id="job-1")
+            second = decode_order_data(raw, job_id="job-1")
+
+        assert loads.call_count == 1
+        assert first == second == {"order_id": "1001"}
+
+    def test_returns_independent_copies(self):
+        raw = '{"ship_to_state":"CA"}'
+        first = decode_order_data(raw, job_id="job-1")
+        first["ship_to_state"] = "NV"
+
+        assert decode_order_data(raw, job_id="job-1")["ship_to_state"] == "CA"
+
+    def test_empty_and_invalid(self):
+        assert decode_order_data(None, job_id="job-1") == {}
+        with pytest.raises(ValueError):
+            decode_order_data("{bad", job_id="job-1")
+        with pytest.raises(ValueError):
+            decode_order_data("[1, 2]")
+
+    def test_evicts_least_recent_job(self):
+        cache = ParsedOrderCache(max_rows=2)
+        cache.get("job-a", '{"n":1}')
+        cache.get("job-a", '{"n":2}')
+        cache.get("job-b", '{"n":3}')
+
+        assert len(cache) == 1
+        cache.invalidate("job-b")
+        assert len(cache) == 0
+
+    def test_oversized_job_does_not_thrash(self):
+        cache = ParsedOrderCache(max_rows=2)
+        for n in range(5):
+            cache.get("job-a", json.dumps({"n": n}))
+
+        assert len(cache) == 2
+        assert cache.get("job-a", '{"n": 4}') == {"n": 4}
+
+    def test_idle_jobs_expire(self):
+        clock = _Clock()
+        cache = ParsedOrderCache(max_rows=10, ttl_s=60, clock=clock)
+        cache.get("job-a", '{"n":1}')
+        clock.now += 30
+        cache.get("job-b", '{"n":2}')
+
+        clock.now += 31
+        cache.get("job-b", '{"n":2}')
+
+        assert len(cache) == 1
+
+    def test_terminal_status_drops_job(self):
+        job = MagicMock(status=JobStatus.running.value, started_at="t0")
+        service = JobService(MagicMock())
+        decode_order_data('{"n":1}', job_id="job-1")
+
+        with patch.object(service, "get_job", return_value=job):
+            service.update_status("job-1", JobStatus.completed)
+
+        assert len(order_data_codec._cache) == 0
+
+
+class TestPlanUsesCache:
+    """BatchPayloadPlan reuses decodes across preview and execute."""
+
+    def test_second_batch_reuses_decode(self):
+        row = MagicMock(job_id="job-1", row_number=1, order_data='{"weight":2.0}')
+        BatchPayloadPlan({"countryCode": "US"}).order_data(row)
+
+        with patch(
+            "src.services.order_data_codec.json.loads", wraps=json.loads,
+        ) as loads:
+            order = BatchPayloadPlan({"countryCode": "US"}).order_data(row)
+
+        loads.assert_not_called()
+        assert order == {"weight": 2.0}
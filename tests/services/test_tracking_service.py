@@ -0,0 +1,291 @@
+"""Tests for the tracking status cache and refresher.
+
+Covers:
+- UPS response normalization and state classification
+- Adaptive polling schedule (terminal states stop, exceptions poll faster)
+- Cache freshness for agent lookups
+- Registration of shipped rows and bounded bulk refresh
+- Job-level delivery summary
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, Job, JobRow, JobStatus, TrackingState
+from src.services.tracking_service import (
+    POLL_INTERVALS,
+    TrackingRefresher,
+    TrackingService,
+    classify_state,
+    next_check_at,
+    parse_tracking_response,
+)
+
+
+@pytest.fixture()
+def db_session():
+    """Create an in-memory SQLite database with schema."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _track_response(number: str, code: str = "", description: str = "", type_: str = "") -> dict:
+    """Build a minimal UPS track_package response."""
+    activity = [{"status": {"type": type_, "description": description}}] if type_ else []
+    return {
+        "trackResponse": {"shipment": [{"package": [{
+            "trackingNumber": number,
+            "currentStatus": {"code": code, "description": description},
+            "activity": activity,
+        }]}]},
+    }
+
+
+def _create_job(db_session, tracking_numbers: list[str | None]) -> str:
+    """Create a completed job with one row per tracking number."""
+    now = datetime.now(UTC).isoformat()
+    job = Job(
+        name="Tracking Job",
+        original_command="ship",
+        status=JobStatus.completed.value,
+        total_rows=len(tracking_numbers),
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add(job)
+    db_session.flush()
+    for i, number in enumerate(tracking_numbers, start=1):
+        db_session.add(JobRow(
+            job_id=job.id,
+            row_number=i,
+            row_checksum=f"c{i}",
+            status="completed" if number else "failed",
+            tracking_number=number,
+        ))
+    db_session.commit()
+    return job.id
+
+
+class TestNormalization:
+    """UPS response parsing and state mapping."""
+
+    def test_parse_extracts_fields(self):
+        raw = _track_response("1Z001", "011", "Delivered", "D")
+        raw["trackResponse"]["shipment"][0]["package"][0]["deliveryDate"] = [{"date": "20260301"}]
+
+        parsed = parse_tracking_response(raw)
+
+        assert parsed["returned_number"] == "1Z001"
+        assert parsed["delivery_date"] == "20260301"
+        assert parsed["state"] == TrackingState.delivered
+
+    @pytest.mark.parametrize(("code", "desc", "type_", "expected"), [
+        ("", "", "X", TrackingState.exception),
+        ("021", "Out For Delivery Today", "", TrackingState.out_for_delivery),
+        ("IT", "In Transit", "", TrackingState.in_transit),
+        ("", "Shipper created a label", "", TrackingState.label_created),
+        ("", "", "", TrackingState.unknown),
+    ])
+    def test_classify_state(self, code, desc, type_, expected):
+        assert classify_state(code, desc, type_) == expected
+
+    def test_terminal_states_stop_polling(self):
+        assert next_check_at(TrackingState.delivered) is None
+        assert next_check_at(TrackingState.returned) is None
+
+    def test_exceptions_poll_faster_than_in_transit(self):
+        assert POLL_INTERVALS[TrackingState.exception] < POLL_INTERVALS[TrackingState.in_transit]
+
+
+class TestCache:
+    """Freshness rules for agent lookups."""
+
+    def test_fresh_within_ttl(self, db_session):
+        service = TrackingService(db_session)
+        service.record("1Z001", parse_tracking_response(_track_response("1Z001", "IT", "In Transit")))
+
+        assert service.get_fresh("1Z001", ttl_seconds=60) is not None
+
+    def test_stale_after_ttl(self, db_session):
+        service = TrackingService(db_session)
+        old = datetime.now(UTC) - timedelta(hours=2)
+        service.record("1Z001", parse_tracking_response(_track_response("1Z001", "IT", "In Transit")), now=old)
+
+        assert service.get_fresh("1Z001", ttl_seconds=60) is None
+
+    def test_delivered_never_stale(self, db_session):
+        service = TrackingService(db_session)
+        old = datetime.now(UTC) - timedelta(days=30)
+        service.record("1Z001", parse_tracking_response(_track_response("1Z001", "D", "Delivered")), now=old)
+
+        status = service.get_fresh("1Z001", ttl_seconds=60)
+        assert status is not None
+        assert status.next_check_at is None
+
+    def test_record_error_backs_off(self, db_session):
+        _create_job(db_session, ["1Z001"])
+        service = TrackingService(db_session)
+        service.register_shipments()
+
+        first = datetime.fromisoformat(service.record_error("1Z001", "boom").next_check_at)
+        second = datetime.fromisoformat(service.record_error("1Z001", "boom").next_check_at)
+
+        assert second > first
+        assert service.get("1Z001").error_count == 2
+
+
+class TestPollingLimits:
+    """Only job shipments are polled, and only for a bounded time."""
+
+    def test_ad_hoc_lookup_is_cached_but_not_scheduled(self, db_session):
+        service = TrackingService(db_session)
+        status = service.record("1Z999", parse_tracking_response(_track_response("1Z999", "IT", "In Transit")))
+
+        assert status.job_id is None
+        assert status.next_check_at is None
+        assert service.get_fresh("1Z999", ttl_seconds=60) is not None
+
+    def test_lookup_of_job_shipment_attaches_job_and_schedules(self, db_session):
+        job_id = _create_job(db_session, ["1Z001"])
+        service = TrackingService(db_session)
+
+        status = service.record("1Z001", parse_tracking_response(_track_response("1Z001", "IT", "In Transit")))
+
+        assert (status.job_id, status.row_number) == (job_id, 1)
+        assert status.next_check_at is not None
+        assert service.register_shipments() == 0
+
+    def test_polling_stops_after_max_age(self, db_session, monkeypatch):
+        monkeypatch.setenv("TRACKING_MAX_AGE_DAYS", "7")
+        _create_job(db_session, ["1Z001"])
+        service = TrackingService(db_session)
+        service.register_shipments()
+        service.get("1Z001").created_at = (datetime.now(UTC) - timedelta(days=8)).isoformat()
+        db_session.commit()
+
+        status = service.record("1Z001", parse_tracking_response(_track_response("1Z001", "IT", "In Transit")))
+
+        assert status.next_check_at is None
+
+    def test_polling_stops_after_max_errors(self, db_session, monkeypatch):
+        monkeypatch.setenv("TRACKING_MAX_ERRORS", "3")
+        _create_job(db_session, ["1Z001"])
+        service = TrackingService(db_session)
+        service.register_shipments()
+
+        for _ in range(2):
+            assert service.record_error("1Z001", "boom").next_check_at is not None
+        assert service.record_error("1Z001", "boom").next_check_at is None
+
+    def test_old_shipments_are_not_registered(self, db_session, monkeypatch):
+        monkeypatch.setenv("TRACKING_MAX_AGE_DAYS", "7")
+        job_id = _create_job(db_session, ["1Z001", "1Z002"])
+        old = (datetime.now(UTC) - timedelta(days=30)).isoformat()
+        db_session.query(JobRow).filter(
+            JobRow.job_id == job_id, JobRow.row_number == 1,
+        ).update({"processed_at": old})
+        db_session.commit()
+
+        assert TrackingService(db_session).register_shipments() == 1
+
+
+class TestRefresh:
+    """Registration, bulk refresh and job summary."""
+
+    def test_register_shipments_once(self, db_session):
+        _create_job(db_session, ["1Z001", "1Z002", None])
+        service = TrackingService(db_session)
+
+        assert service.register_shipments() == 2
+        assert service.register_shipments() == 0
+        assert len(service.due(10)) == 2
+
+    async def test_refresh_due_bounded_concurrency(self, db_session):
+        _create_job(db_session, [f"1Z{i:03d}" for i in range(10)])
+        service = TrackingService(db_session)
+        service.register_shipments()
+        active = 0
+        peak = 0
+
+        async def _track(tracking_number: str) -> dict:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _track_response(tracking_number, "D", "Delivered")
+
+        ups = AsyncMock()
+        ups.track_package = AsyncMock(side_effect=_track)
+
+        counts = await service.refresh_due(ups, limit=10, concurrency=3, rate_per_second=0)
+
+        assert counts == {"refreshed": 10, "failed": 0}
+        assert peak == 3
+        assert service.due(10) == []
+
+    async def test_refresh_failure_is_recorded(self, db_session):
+        _create_job(db_session, ["1Z001"])
+        service = TrackingService(db_session)
+        service.register_shipments()
+        ups = AsyncMock()
+        ups.track_package = AsyncMock(side_effect=RuntimeError("UPS down"))
+
+        counts = await service.refresh_due(ups, rate_per_second=0)
+
+        assert counts == {"refreshed": 0, "failed": 1}
+        assert service.get("1Z001").last_error == "UPS down"
+
+    def test_job_summary_counts_states(self, db_session):
+        job_id = _create_job(db_session, ["1Z001", "1Z002", "1Z003"])
+        service = TrackingService(db_session)
+        service.record("1Z001", parse_tracking_response(_track_response("1Z001", "D", "Delivered")))
+        service.record("1Z002", parse_tracking_response(_track_response("1Z002", "", "", "X")))
+
+        summary = service.job_summary(job_id)
+
+        assert summary["total"] == 3
+        assert summary["counts"] == {"delivered": 1, "exception": 1, "unknown": 1}
+        assert [s["tracking_number"] for s in summary["shipments"]] == ["1Z001", "1Z002", "1Z003"]
+
+    async def test_refresher_run_once_skips_ups_when_nothing_due(self, db_session):
+        @contextmanager
+        def _session():
+            yield db_session
+
+        factory = AsyncMock()
+        refresher = TrackingRefresher(_session, factory)
+
+        result = await refresher.run_once()
+
+        assert result == {"registered": 0, "refreshed": 0, "failed": 0}
+        factory.assert_not_called()
+
+    async def test_refresher_run_once_refreshes_registered(self, db_session):
+        _create_job(db_session, ["1Z001"])
+
+        @contextmanager
+        def _session():
+            yield db_session
+
+        ups = AsyncMock()
+        ups.track_package = AsyncMock(return_value=_track_response("1Z001", "D", "Delivered"))
+        refresher = TrackingRefresher(_session, AsyncMock(return_value=ups), rate_per_second=0)
+
+        result = await refresher.run_once()
+
+        assert result == {"registered": 1, "refreshed": 1, "failed": 0}
+        stored = TrackingService(db_session).get("1Z001")
+        assert stored.state == "delivered"
+        assert json.loads(stored.activities_json) == []
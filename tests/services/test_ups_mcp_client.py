@@ -370,6 +370,31 @@ class TestValidateAddress:
         assert len(result["candidates"]) == 1
         assert result["candidates"][0]["city"] == "LOS ANGELES"
 
+    @pytest.mark.asyncio
+    async def test_reads_residential_classification(self, ups_client, mock_mcp_client):
+        """AddressClassification code 2 maps to residential=True."""
+        mock_mcp_client.call_tool.return_value = {
+            "XAVResponse": {
+                "ValidAddressIndicator": "",
+                "AddressClassification": {"Code": "2", "Description": "Residential"},
+                "Candidate": {
+                    "AddressClassification": {"Code": "1", "Description": "Commercial"},
+                    "AddressKeyFormat": {"PostcodePrimaryLow": "90001"},
+                },
+            },
+        }
+
+        result = await ups_client.validate_address(
+            addressLine1="123 Main St",
+            city="Los Angeles",
+            stateProvinceCode="CA",
+            postalCode="90001",
+            countryCode="US",
+        )
+
+        assert result["residential"] is True
+        assert result["candidates"][0]["residential"] is False
+
 
 # ---------------------------------------------------------------------------
 # Error translation
@@ -263,3 +263,18 @@ class TestWriteBackQueue:
         assert result["processed"] == 0
         assert result["failed"] == 0
         assert result["dead_letter"] == 0
+
+    def test_completion_records_queue_lag(self, db_session: Session) -> None:
+        """Completing tasks observes their enqueue-to-completion lag."""
+        from src.services.metrics import WRITE_BACK_LAG_SECONDS
+
+        before = WRITE_BACK_LAG_SECONDS.labels()._counts[:]
+        enqueue_write_back(db_session, "job-abc", 1, "1Z001", "2026-02-17T00:00:00Z")
+        enqueue_write_back(db_session, "job-abc", 2, "1Z002", "2026-02-17T00:00:00Z")
+
+        mark_tasks_completed(db_session, "job-abc")
+
+        after = WRITE_BACK_LAG_SECONDS.labels()._counts
+        assert sum(after) - sum(before) == 2
+        # Both lags land in the smallest bucket (well under 100ms).
+        assert after[0] - before[0] == 2
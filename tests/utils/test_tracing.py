@@ -0,0 +1,142 @@
+"""Tests for spans, trace propagation and exporters."""
+
+import json
+
+import pytest
+from sqlalchemy import text
+
+from src.utils.tracing import (
+    JsonlSpanExporter,
+    configure_tracing,
+    current_traceparent,
+    parse_traceparent,
+    span,
+    start_child_span,
+)
+
+
+class RecordingExporter:
+    """Keeps finished spans in memory."""
+
+    def __init__(self) -> None:
+        self.spans = []
+
+    def export(self, finished) -> None:
+        self.spans.append(finished)
+
+    def shutdown(self) -> None:
+        pass
+
+    def named(self, name: str):
+        return next(s for s in self.spans if s.name == name)
+
+
+@pytest.fixture()
+def recorder():
+    exporter = RecordingExporter()
+    configure_tracing(exporter)
+    yield exporter
+    configure_tracing()
+
+
+class TestSpans:
+    """Nesting, remote parents and status."""
+
+    def test_disabled_tracing_yields_noop(self, monkeypatch):
+        monkeypatch.delenv("TRACING_EXPORTER", raising=False)
+        configure_tracing()
+        with span("quiet") as s:
+            s.set_attribute("k", "v")
+            assert current_traceparent() is None
+        assert s.traceparent is None
+
+    def test_nested_spans_share_trace(self, recorder):
+        with span("outer") as outer, span("inner") as inner:
+            assert current_traceparent() == inner.traceparent
+
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id is None
+        assert [s.name for s in recorder.spans] == ["inner", "outer"]
+        assert current_traceparent() is None
+
+    def test_remote_parent_continues_trace(self, recorder):
+        traceparent = "00-" + "a" * 32 + "-" + "b" * 16 + "-01"
+        with span("server", parent=traceparent) as s:
+            pass
+        assert (s.trace_id, s.parent_span_id) == ("a" * 32, "b" * 16)
+
+    def test_active_span_wins_over_remote_parent(self, recorder):
+        with span("outer") as outer, span("inner", parent="00-" + "a" * 32 + "-" + "b" * 16 + "-01") as inner:
+            pass
+        assert inner.trace_id == outer.trace_id
+
+    def test_error_is_recorded(self, recorder):
+        with pytest.raises(RuntimeError), span("failing"):
+            raise RuntimeError("boom")
+        failed = recorder.named("failing").to_otlp()
+        assert failed["status"] == {"code": 2, "message": "RuntimeError: boom"}
+
+    def test_invalid_traceparent_is_ignored(self):
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(None) is None
+        assert parse_traceparent(object()) is None
+
+    def test_child_span_requires_active_span(self, recorder):
+        assert start_child_span("db.query") is None
+
+
+class TestPropagation:
+    """Agent tool and SQL spans join the turn's trace."""
+
+    async def test_bridge_bound_tool_continues_turn_trace(self, recorder):
+        from src.orchestrator.agent.tools.core import EventEmitterBridge, _bind_bridge
+
+        async def sample_tool(args, bridge=None):
+            return current_traceparent()
+
+        bridge = EventEmitterBridge()
+        with span("agent.turn") as turn:
+            bridge.traceparent = turn.traceparent
+        # Handlers run outside the turn's context; only the bridge links them.
+        inner_traceparent = await _bind_bridge(sample_tool, bridge)({})
+
+        tool = recorder.named("agent.tool.sample")
+        assert tool.trace_id == turn.trace_id
+        assert tool.parent_span_id == turn.span_id
+        assert inner_traceparent == tool.traceparent
+
+    def test_sql_statements_are_child_spans(self, recorder):
+        from src.db.connection import engine
+
+        with span("request") as request, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        query = recorder.named("db.query")
+        assert query.parent_span_id == request.span_id
+        assert query.attributes["db.operation"] == "SELECT"
+
+
+class TestJsonlExporter:
+    """OTLP/JSON lines output."""
+
+    def test_writes_one_export_request_per_span(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        configure_tracing(JsonlSpanExporter(path, service_name="test-svc"))
+        try:
+            with span("outer", {"job.id": "j1", "row.number": 3, "ok": True}):
+                pass
+        finally:
+            configure_tracing()
+
+        (line,) = path.read_text().splitlines()
+        request = json.loads(line)
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "test-svc"}},
+        ]
+        exported = resource_spans["scopeSpans"][0]["spans"][0]
+        assert exported["name"] == "outer"
+        assert {"key": "row.number", "value": {"intValue": "3"}} in exported["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in exported["attributes"]
+        assert int(exported["endTimeUnixNano"]) >= int(exported["startTimeUnixNano"])